@@ -0,0 +1 @@
+Search.setIndex({"docnames": ["app", "app.qa", "docs/de/GQA-Tests", "docs/de/Installation", "docs/de/Konfiguration", "docs/de/Konfiguration-QA", "docs/de/MacDummies", "index", "install-resources", "isp", "modules", "pygqa", "version"], "filenames": ["app.rst", "app.qa.rst", "docs/de/GQA-Tests.md", "docs/de/Installation.md", "docs/de/Konfiguration.md", "docs/de/Konfiguration-QA.md", "docs/de/MacDummies.md", "index.rst", "install-resources.rst", "isp.rst", "modules.rst", "pygqa.rst", "version.rst"], "titles": ["app package", "app.qa package", "MT_4.1.2 - Linearit\u00e4t des Dosismonitorsystems bei kleinen Dosismonitorwerten", "Installation", "Konfiguration", "Konfiguration Ger\u00e4te QA", "Installation des Skeletts f\u00fcr Mac User ohne jegliche Ahnung", "Dokumentation", "install-resources module", "isp package", "package", "pygqa module", "version module"], "terms": {"qa": [0, 2, 3, 7, 10], "field": [0, 5, 7, 9, 10], "checkfield": [0, 1, 7, 10], "_dofield_one2n": [0, 1, 7], "dojt_10_3": [0, 1], "dojt_4_1_3": [0, 1], "dojt_7_2": [0, 1], "dojt_7_3": [0, 1], "dojt_7_4": [0, 1], "dojt_7_5": [0, 1, 7], "dojt_7_5_pre2020": [0, 1, 7], "dojt_9_1_2": [0, 1, 7], "dojt_end2end": [0, 1], "domt_4_1_2": [0, 1, 7], "domt_8_02_5": [0, 1], "domt_vmat_0_1": [0, 1], "qa_field": [0, 1, 7], "_plot_field_edg": [0, 1, 7], "_plot_profil": [0, 1], "find4qdata": [0, 1, 7], "plot4qprofil": [0, 1, 7], "plotprofil": [0, 1, 7], "mlc": [0, 2, 5, 7, 10], "checkmlc": [0, 1, 7], "_dolamellenpositioniergenauigkeit": [0, 1], "_domlc_vmat": [0, 1, 7], "dojt_10_3_1": [0, 1, 7], "dojt_4_2_2_1_a": [0, 1], "dojt_4_2_2_1_b": [0, 1], "dojt_4_2_2_1_c": [0, 1], "dojt_leafspe": [0, 1, 7], "domt_8_02_1_2": [0, 1], "domt_8_02_3": [0, 1], "domt_8_02_4": [0, 1], "domt_leafspe": [0, 1, 7], "domt_vmat_0_2": [0, 1], "domt_vmat_1_1": [0, 1], "domt_vmat_1_2": [0, 1], "qa_mlc": [0, 1, 7], "basefield": [0, 1, 10], "normal": [0, 1, 7, 9, 10], "kennung": [0, 1], "cach": [0, 1, 3, 4, 7, 9, 10], "fwhm_findleaf": [0, 1, 7], "fwhm_plot_error": [0, 1, 7], "data": [0, 1, 3, 4, 7, 9, 10], "size": [0, 1, 4, 7, 9], "plottitl": [0, 1], "leaf_from": [0, 1], "fwhm_plot_errorbox": [0, 1, 7], "_add_leaf_error_subplot": [0, 1, 7], "abs_mean_error": [0, 1, 7], "findtransmiss": [0, 1, 7], "posit": [0, 1, 5, 7, 9], "getleafcenterposit": [0, 1], "isotransmiss": [0, 1], "picketfence_plotimag": [0, 1, 7], "picketfence_result": [0, 1, 7], "plottransmiss": [0, 1, 7], "set": [0, 1, 4, 7, 9, 10], "transmissionstoplot": [0, 1], "vmat": [0, 7, 10], "checkvmat": [0, 1], "domt_vmat": [0, 1], "domt_vmat_2": [0, 1], "domt_vmat_3": [0, 1], "qa_seg": [0, 1, 7], "r_corr": [0, 1, 7], "qa_vmat": [0, 1, 7], "debug": [0, 1, 4, 7, 9], "analys": [0, 1], "metadata": [0, 1, 7, 10], "_construct_seg": [0, 1], "draw_seg": [0, 1], "getresult": [0, 1], "plotchart": [0, 1, 7], "wl": [0, 7, 10], "checkwl": [0, 1], "domt_wl": [0, 1], "qa_wl": [0, 1], "center": [0, 1, 7], "mergearrai": [0, 1], "roi": [0, 1, 7], "colfield": [0, 1], "virtualcent": [0, 1], "virtualcenterdot": [0, 1], "_axischart": [0, 1], "_axisimag": [0, 1], "_findarrayisocalcent": [0, 1], "_findisocalcent": [0, 1, 7], "_getthresholdmask": [0, 1], "_mergearrai": [0, 1], "findcenterbal": [0, 1, 7], "findcollicent": [0, 1, 7], "plotmergeimag": [0, 1, 7], "server": [0, 3, 6, 7, 9, 10], "info": [0, 1, 4, 5, 7, 9, 10], "year": [0, 1, 7, 9, 10], "run": [0, 1, 3, 7, 9, 10], "class": [0, 1, 7, 9], "gqa": [0, 1, 3, 4, 7, 10, 11], "arg": [0, 1, 9], "kwarg": [0, 9], "ispsafrsdummi": [0, 9, 10], "descript": [0, 3, 9], "ger\u00e4t": [0, 3, 4], "und": [0, 1, 5, 6, 9], "durchf\u00fchrung": [0, 4, 7], "object": [0, 1, 9], "initi": [0, 3, 9], "call": [0, 7, 9], "from": [0, 4, 7, 9], "backend": [0, 9], "_s_post": [0, 9], "name": [0, 1, 3, 4, 5, 7, 9, 10], "attribut": [0, 9], "add": [0, 1, 4, 7, 9, 10], "databas": [0, 3, 7, 9], "creat": [0, 9, 10], "relationship": [0, 9], "param": [0, 9, 10], "model": [0, 9], "column": [0, 3, 7, 9, 10], "valu": [0, 1, 4, 5, 7, 9], "api_get": [0, 9, 10], "swagger": [0, 4, 10], "summari": [0, 9], "fortschritt": 0, "f\u00fcr": [0, 1, 2, 5, 7, 9], "ein": [0, 1, 2, 3, 4, 5, 7, 9], "jahr": [0, 3, 4, 9], "all": [0, 1, 2, 3, 7, 9], "deren": [0, 5, 9], "paramet": [0, 1, 3, 4, 5, 7, 9], "gqaid": 0, "path": [0, 4, 7, 9, 10], "type": [0, 1, 3, 7, 9], "integ": [0, 1, 9], "requir": [0, 3, 6, 7, 9], "true": [0, 1, 4, 9], "da": [0, 1, 2, 3, 4, 5, 7, 9, 11], "die": [0, 1, 2, 3, 4, 5, 7, 9], "informationen": [0, 2, 7, 9], "geholt": [0, 4, 9], "werden": [0, 1, 2, 3, 5, 7, 9], "sollen": [0, 1, 3, 4, 9], "pid": [0, 9], "queri": [0, 1, 5, 7, 9, 10], "fals": [0, 1, 4, 9], "id": [0, 3, 4, 5, 7, 9, 10], "de": [0, 1, 3, 4, 5, 7, 9], "im": [0, 1, 2, 4, 5, 6, 7, 9], "_xxxqa": 0, "tb": 0, "vb": 0, "tag": [0, 2, 4, 5, 7, 9, 10], "zu": [0, 1, 2, 3, 4, 5, 7, 9], "suchend": [0, 9], "unit": [0, 1, 2, 3, 5, 7, 10], "wird": [0, 1, 2, 3, 4, 5, 7, 9], "nach": [0, 1, 3, 4, 7, 9], "umgewandelt": 0, "auch": [0, 2, 3, 4, 9], "dort": [0, 3, 9], "gesetzt": [0, 2, 3, 4, 9], "refresh": [0, 7, 9], "boolean": [0, 1, 5, 9], "default": [0, 1, 3, 4, 5, 7, 9, 10], "bilder": [0, 1, 4, 7], "neu": [0, 1, 3, 4, 9], "au": [0, 1, 3, 4, 7, 9], "statt": [0, 1, 7, 9], "dem": [0, 1, 2, 4, 7, 9], "lokalen": [0, 3, 4, 9], "spiegel": [0, 4], "api_list": [0, 9, 10], "aufruf": [0, 3, 4, 6, 7, 9], "denen": [0, 1, 4, 9], "gemacht": [0, 3, 5], "wurden": [0, 3], "none": [0, 1, 4, 9], "classmethod": [0, 9], "konfigurationen": [0, 3, 9], "holt": [0, 1, 9], "allen": [0, 1, 4, 9], "al": [0, 1, 2, 4, 5, 7, 9], "json": [0, 3, 4, 7, 9], "oder": [0, 1, 2, 3, 4, 7, 9], "stellt": [0, 1], "sie": [0, 4, 9], "einer": [0, 1, 2, 3, 4, 5, 7, 9], "tabel": [0, 1], "dar": 0, "format": [0, 1, 3, 4, 9], "der": [0, 1, 4, 5, 7, 9, 11], "html": [0, 9, 10], "export": [0, 10], "cl": [0, 9], "return": [0, 1, 7, 9], "resultdaten": 0, "jahresbasiert": 0, "exportieren": 0, "exportierend": 0, "id_typ": [0, 9, 10], "alia": [0, 9], "gqa_id": 0, "durchgef\u00fchrt": [0, 3], "soll": [0, 1, 3, 5], "init": [0, 3, 7, 9, 10], "dict": [0, 1, 7, 9], "von": [0, 1, 4, 5, 7, 9], "den": [0, 1, 2, 4, 5, 6, 7, 9, 11], "jsonapi_rpc": [0, 9], "funktionen": [0, 4, 7, 9], "aufgerufen": [0, 9], "option": [0, 1, 9], "The": [0, 1, 9], "i": [0, 1, 3, 7, 9], "matrix": [0, 10], "verwendeten": [0, 3, 4, 5, 9], "erfolgen": 0, "month": [0, 1, 7, 9, 10], "monat": 0, "zur\u00fcckgeben": [0, 9], "testid": [0, 1, 4, 5, 7, 10], "anzuzeigend": 0, "energi": [0, 1, 4, 5, 7, 10], "angezeigt": [0, 2, 3, 5], "anzeig": 0, "0": [0, 1, 3, 4, 5, 6, 10], "einen": [0, 2, 3, 4, 6, 7, 9], "angegebenen": [0, 1, 4, 7, 9], "durchzuf\u00fchrend": [0, 1], "_qa": [0, 4, 9], "linac1": [0, 4, 9], "linac2": [0, 4], "dai": [0, 7, 9], "getal": 0, "bei": [0, 1, 3, 4, 5, 7, 9], "nicht": [0, 1, 3, 4, 9], "nur": [0, 1, 3, 4, 9], "ergebni": [0, 4, 9], "sondern": [0, 9], "zur\u00fcckgegeben": [0, 9], "unittest": [0, 3, 4, 7, 9], "reloaddicom": [0, 4, 7], "gespeichert": [0, 3], "dicomdaten": [0, 1], "verwenden": [0, 1, 2, 5, 9], "laden": [0, 1, 9], "art": [0, 1, 9], "full": [0, 1, 4, 7, 9], "sum": [0, 7], "ausgeben": [0, 1, 9], "test_result": [0, 10], "datenbank": [0, 2, 3, 4, 7, 9], "m\u00f6glichen": [0, 1], "angegeben": [0, 1, 3, 4, 5, 9], "connet": [0, 9], "pygqa": [0, 4, 7, 9, 10], "ariaclass": [0, 7, 9, 10], "str": [0, 1, 9], "ispmssql": [0, 9, 10], "see": [0, 9], "connect": [0, 3, 4, 7, 9, 10], "ar": [0, 1, 7, 9], "borrow": [0, 7, 9], "share": [0, 3, 7, 9], "ispmssqlpool": [0, 7, 9, 10], "getimag": [0, 4, 7, 10], "gettag": [0, 4, 7, 10], "held": [0, 7, 9], "ispmssqlresultcach": [0, 7, 9, 10], "past": [0, 7], "chang": [0, 1, 7, 9], "rare": 0, "longer": [0, 7, 9], "initialis": [0, 9], "us": [0, 1, 7, 9], "get": [0, 3, 4, 7, 9, 10], "configur": [0, 4, 7, 9], "dot": [0, 9], "an": [0, 1, 3, 5, 7, 9], "instanc": [0, 3, 7, 9, 10], "ispconfig": [0, 4, 9, 10], "executeparallel": [0, 7, 9, 10], "func": [0, 9], "list": [0, 1, 3, 4, 5, 7, 9], "mehrer": [0, 2, 4, 9], "abfragen": [0, 4, 9], "gleichzeitig": [0, 4], "ausf\u00fchren": [0, 6], "jede": [0, 1, 9], "mit": [0, 1, 2, 4, 5, 6, 7, 9], "eigenen": [0, 4, 9], "verbindung": [0, 3, 4, 7, 9], "pool": [0, 4, 7, 9], "worker": [0, 7, 9], "thread": [0, 4, 7, 9], "setzen": [0, 9], "lastexecutesql": [0, 7, 9, 10], "lastexecuteparam": [0, 7, 9, 10], "w\u00fcrden": 0, "sich": [0, 3, 4, 7, 9], "sonst": [0, 4, 9], "gegenseitig": 0, "\u00fcberschreiben": [0, 9], "callabl": [0, 9], "aufzurufend": [0, 4], "funktion": [0, 9], "z": [0, 2, 4, 5, 6, 9], "b": [0, 1, 2, 4, 5, 6, 9], "jeden": [0, 2], "r\u00fcckgaben": 0, "reihenfolg": [0, 1, 9], "getimageinfo": [0, 7, 10], "imagerow": 0, "bestimmt": [0, 1, 3, 9], "aufnahm": [0, 4, 9], "imageinfo": 0, "string": [0, 1, 4, 9], "studyid": 0, "filenam": [0, 1, 4, 9, 10], "filepath": [0, 9], "gantri": [0, 1], "float": [0, 1, 9], "1": [0, 1, 3, 4, 5, 6, 10], "1f": 0, "collim": [0, 1, 7], "offen": [0, 1, 4], "kamm": 0, "x1zu": [0, 1], "x2zu": [0, 1], "tip": [0, 1, 5], "dateinamen": [0, 9], "patientid": [0, 4, 7, 9], "courseid": [0, 7], "jahrestest": [0, 1, 2, 4], "plansetupid": [0, 7], "4quadrant": 0, "radiationid": 0, "x6": [0, 1, 9], "q1": 0, "6000": 0, "gantryangl": 0, "01990341513203": 0, "collrtn": 0, "359": 0, "999840036008": 0, "acquisitiondatetim": [0, 7, 9], "datetim": [0, 9], "2019": 0, "3": [0, 1, 3, 5, 10], "20": [0, 4, 7, 9], "19": [0, 6, 10], "7": [0, 1, 3, 4, 10], "9": [0, 1, 4, 9], "510000": 0, "sliceuid": [0, 7, 9, 10], "2": [0, 1, 3, 4, 5, 10], "246": 0, "352": 0, "62": 0, "5343640968774208147": 0, "13210826594556886954": 0, "resources": 0, "1301": 0, "patientsupportangl": 0, "03125": 0, "imagedir1patients_716slicert1820744_id1432516": 0, "slicert": 0, "doser": [0, 1], "metersetexposur": 0, "getimageinfosfram": [0, 7, 10], "aller": [0, 1, 2, 4, 9], "aufnahmen": [0, 1, 2, 4, 9], "abfrag": [0, 4, 9], "spaltenweis": 0, "wie": [0, 1, 3, 9], "zeil": 0, "aber": [0, 1, 4, 7, 9], "datafram": [0, 1, 7, 9], "pro": [0, 1, 2, 4, 9], "gener": [0, 4, 9], "einem": [0, 1, 2, 3, 4, 5, 7, 9], "mode": [0, 7, 9], "stream": [0, 7, 9], "frame": [0, 7, 9, 10], "spalten": [0, 1, 9], "infofield": [0, 10], "sowi": [0, 1, 9], "is_fff": [0, 7], "tabl": [0, 1, 9], "x1": [0, 1, 9], "x2": [0, 1], "y1": 0, "y2": 0, "acquisitionyear": [0, 4, 7, 9, 10], "acquisitionmonth": [0, 4], "me": 0, "int": [0, 1, 9], "bool": [0, 1, 9], "testtag": [0, 4, 7, 10], "subtag": [0, 7, 9], "varianten": 0, "radiations": 0, "acquisitiondai": 0, "addwher": 0, "addparam": 0, "sql": [0, 3, 4, 7, 9], "anweisung": 0, "um": [0, 1, 2, 3, 4, 5, 7, 9], "felder": [0, 1, 2, 9], "auswertungen": [0, 4, 7], "ben\u00f6tigt": [0, 1, 3, 6, 9], "patienten": [0, 2, 3, 4], "feld": [0, 1, 2, 4, 5], "comment": [0, 3], "ganz": [0, 9], "wort": 0, "vorkommend": 0, "zus\u00e4tzlich": [0, 1, 4, 5, 7, 9], "where": [0, 9, 10], "filter": [0, 7, 9, 10], "platzhalt": 0, "r\u00fcckgabe": [0, 1, 9], "execut": [0, 7, 9, 10], "verwendung": [0, 3, 4, 5, 7, 9], "verwendet": [0, 1, 2, 3, 4, 5, 7, 9], "getmirror": [0, 10], "lokal": [0, 4], "bild": [0, 1, 4, 9], "metadaten": [0, 1, 4], "fall": [0, 3], "mirror": [0, 4, 7], "getparallel": [0, 10], "anzahl": [0, 4, 5, 9], "gleichzeitigen": [0, 4, 9], "parallel": [0, 4, 7, 9, 10], "4": [0, 1, 3, 4, 5, 6, 10], "begrenzt": 0, "durch": [0, 3, 4, 7, 9], "gr\u00f6\u00dfe": [0, 1, 4, 9], "verbindungspool": [0, 4], "ohn": [0, 1, 4, 9], "split": [0, 7, 9], "zeilen": [0, 4], "aufteilen": 0, "komplett": [0, 9], "dictonari": 0, "follow": [0, 9], "nummer": [0, 1, 4, 9], "gettestdata": [0, 7, 10], "aufbereiten": [0, 1, 9], "per": [0, 3, 7, 9], "gettestmap": [0, 7, 10], "einmal": [0, 1, 4, 9], "bestimmten": [0, 3, 4], "zuordnungen": 0, "inaktiv": [0, 5, 7, 10], "energyfield": [0, 5, 7, 10], "gqatestmap": [0, 7, 10], "resultcachettl": [0, 9, 10], "300": [0, 4, 9], "images_past": [0, 4, 9], "86400": [0, 4, 9], "600": [0, 4], "usepool": [0, 9, 10], "ariadicomclass": [0, 10], "vmsdbd": [0, 3, 4, 9], "ispdicom": [0, 9, 10], "zentral": 0, "klass": [0, 1, 9], "konfigur": [0, 3, 9], "variabl": [0, 1, 3, 9, 10], "infofeld": 0, "dicomfil": [0, 9, 10], "geladen": [0, 2, 9], "dicom": [0, 2, 3, 7, 10], "dateien": [0, 3, 4, 7, 9], "pd_result": [0, 10], "testergebniss": [0, 1, 3, 7], "panda": [0, 1, 4, 5, 7, 9, 10], "pd": [0, 7], "resultfil": [0, 10], "datei": [0, 1, 4, 9], "ergebnissen": 0, "file": [0, 3, 4, 7, 9], "lastsql": [0, 10], "letzt": [0, 3], "dicomclass": 0, "initialisieren": [0, 1, 9], "dotesttyp": [0, 7, 10], "payload": [0, 9], "tupl": [0, 9], "retriev": [0, 7, 9, 10], "dabei": [0, 1, 3, 4, 6, 9], "passend": [0, 9], "durchzuf\u00fchrenden": 0, "erweitert": [0, 1, 7, 9], "self": [0, 1, 9], "schon": [0, 4, 9], "retrievetestimag": [0, 7, 10], "signal": [0, 7, 9, 10], "sobald": 0, "sind": [0, 1, 3, 4, 9], "pdf_filepath": [0, 9], "erzeugten": [0, 1, 4, 9], "testauswertung": [0, 5], "pdfdata": 0, "getallgqa": [0, 4, 7, 10], "withresult": 0, "patientenid": [0, 4, 9], "cours": 0, "angaben": [0, 1, 5, 7, 9], "radiat": 0, "wertet": 0, "entsprechend": [0, 2, 3], "search": [0, 7, 9], "mounth": 0, "aufbau": [0, 1, 2, 9], "infotyp": 0, "readi": [0, 9], "count": [0, 7, 9, 10], "item": [0, 9], "di": [0, 3, 4, 9], "seri": [0, 4, 7, 9, 10], "getmatrix": [0, 10], "output_format": 0, "gibt": [0, 1, 3, 4, 7, 9], "testbeschreibungen": 0, "anleitungen": 0, "aufrufparamet": 0, "code": [0, 3, 6, 7, 9], "getrundata": [0, 7, 10], "runtest": [0, 4, 7, 10], "verwendenden": 0, "verwendend": [0, 9], "feldern": [0, 1, 5, 9], "tabellen": [0, 4, 5, 7], "angab": [0, 1, 3, 4, 5, 9], "patientsid": 0, "initresultspath": [0, 10], "ablegeort": 0, "bestimmen": [0, 1, 2, 3, 9], "befindet": [0, 3, 7], "jetzt": [0, 6, 7], "resultspath": 0, "ggf": [0, 1, 9], "angeh\u00e4ngten": 0, "dirnam": 0, "aktuel": [0, 1, 5, 9], "pfad": [0, 3, 4, 5, 9], "prefetchtestimag": [0, 7, 10], "overrid": [0, 1, 7, 9, 10], "subpath": [0, 9], "hintergrund": [0, 3], "bilddaten": [0, 1, 4, 9], "bi": [0, 1, 4, 9], "prefetchbyt": 0, "dekodieren": 0, "vorhanden": [0, 3, 4, 9], "erg\u00e4nzt": [0, 9], "ablageort": [0, 9], "concurr": [0, 7, 9], "futur": [0, 9, 10], "preparegqa": [0, 7, 10], "imagedata": 0, "withdicomdata": 0, "auswertung": [0, 1, 2, 3, 4, 5, 7], "vorbereiten": [0, 9], "noch": [0, 1, 3, 5, 7, 9], "ergebniss": [0, 1, 4, 7, 9], "einf\u00fcgen": [0, 9], "ben\u00f6tig": 0, "linac": [0, 4, 5], "auflistungen": 0, "bildinformationen": 0, "ablegen": [0, 4, 9], "f\u00fcllen": [0, 9], "testnam": 0, "anleitung": [0, 3, 5], "todo": [0, 1, 4, 5], "toler": [0, 1, 5], "n": [0, 9], "prepare_toler": [0, 10], "pr\u00fcft": [0, 4, 9], "ob": [0, 3, 4, 9], "e": [0, 1, 2, 3, 4, 7, 9], "conig": 0, "wenn": [0, 3, 4, 5, 9], "f": [0, 3, 5], "wurd": [0, 2, 3, 6, 7, 9], "formel": [0, 1, 5, 9], "zusammen": 0, "so": [0, 2, 3, 4, 9], "dies": [0, 1, 2, 3, 4, 5, 6, 7, 9], "grundlag": [0, 5], "energien": [0, 4, 5], "zweig": [0, 9], "wert": [0, 1, 3, 5, 9], "rang": [0, 7, 9], "min": [0, 1, 7], "max": [0, 1, 7, 9], "oper": [0, 9], "eq": [0, 9], "ne": 0, "lt": 0, "gt": 0, "le": 0, "ge": 0, "verarbeitenden": 0, "bereich": [0, 1, 4, 9], "augab": 0, "zus\u00e4tzlichen": [0, 9], "beispiel": [0, 3, 4, 5, 9], "warn": [0, 4, 5, 7, 9, 10], "ab": [0, 3, 4, 5, 9], "error": [0, 1, 4, 5, 9, 10], "diff": [0, 1], "100": [0, 4, 9], "mu_20": 0, "5": [0, 1, 3, 4, 10], "progress": [0, 9], "retrievemani": [0, 7, 9, 10], "erhaltenen": [0, 9], "datens\u00e4tz": [0, 4, 5, 9], "sopinstanceuid": [0, 4, 7, 9], "dataset": [0, 4, 7, 9], "speziel": [0, 4, 9], "modu": [0, 2, 4], "bereit": [0, 1, 3], "sqlite": [0, 4, 7, 9], "enth\u00e4lt": [0, 3, 4, 9], "je": [0, 1, 3, 9], "inkrementel": 0, "\u00fcber": [0, 1, 2, 4, 6, 7, 9], "high": 0, "water": 0, "mark": 0, "auf": [0, 1, 3, 4, 6, 7, 9], "slice": [0, 7, 9], "slices": 0, "abgeglichen": [0, 4], "dann": [0, 1, 2, 3, 9], "beantwortet": [0, 3], "base_dir": [0, 4, 9], "max_ag": [0, 4], "overlap_dai": [0, 4], "31": [0, 4, 9], "verzeichni": [0, 3, 4, 7, 9], "sekunden": [0, 4, 9], "erneut": [0, 3, 4, 9], "tage": [0, 4], "vor": [0, 2, 4, 5, 9], "letzten": [0, 4, 9], "nachtr\u00e4glich": 0, "ge\u00e4ndert": [0, 4, 9], "kommentar": [0, 2, 4, 5], "\u00fcbernehmen": [0, 4, 7, 9], "vorgaben": [0, 3, 4, 9], "In": [0, 1, 3, 9], "gel\u00f6scht": 0, "erst": [0, 3, 4, 7, 9], "entfernt": [0, 4, 9], "fromsql": [0, 9, 10], "maxag": [0, 10], "overlapdai": 0, "abgleich": [0, 4], "overlap": [0, 10], "zeitraum": 0, "timedelta": 0, "_patientlock": [0, 10], "lock": [0, 7], "dieser": [0, 2, 3, 4, 9], "_syncpati": [0, 10], "forc": [0, 3, 7], "gehaltenem": 0, "aufrufen": [0, 1, 6, 9], "schreiben": [0, 4, 9], "h\u00e4lt": [0, 9], "_valu": [0, 10], "umwandeln": [0, 9], "neue": [0, 4, 6, 9], "zur": [0, 3, 4, 9], "datumsfeld": 0, "geliefert": 0, "datecolumn": [0, 10], "creationd": 0, "bound": [0, 7, 9], "fromconfig": [0, 10], "spiegelnd": 0, "teil": [0, 3, 5], "ist": [0, 1, 2, 3, 4, 5, 7, 9], "getstat": [0, 9, 10], "stand": [0, 3, 9], "sync": [0, 7, 10], "row": [0, 7, 9], "builder": [0, 7, 9], "ariamirrorqueri": [0, 10], "abgleichen": 0, "abzugleichend": 0, "geholten": 0, "ispmssqlqueri": [0, 7, 9, 10], "bedingungen": [0, 2], "umgesetzt": 0, "select": [0, 7, 9, 10], "duplic": [0, 7, 9], "skip": [0, 9], "like": [0, 9], "chain": [0, 9], "condit": [0, 9, 10], "placehold": [0, 7, 9], "mirrorcolumn": [0, 10], "spaltennamen": 0, "basi": [0, 1, 4], "ispbas": [0, 1, 10], "dicomdata": [0, 1, 10], "_config": [0, 9, 10], "testconfig": 0, "\u00fcbergebenen": [0, 9], "filecount": [0, 10], "icon": [0, 1, 9, 10], "vorbelegt": [0, 9], "imagecach": [0, 1, 7, 10], "darau": 0, "abgeleitet": [0, 1], "arrai": [0, 1, 7, 9, 10], "lauf": [0, 1, 4, 9], "sieh": [0, 1, 3, 9], "ispcheckclass": [0, 1, 7, 10], "initialisiert": [0, 1, 9], "bearbeitend": [0, 1], "__del__": [0, 9, 10], "ausf\u00fchrung": [0, 9], "beim": [0, 3, 4, 9], "l\u00f6schen": [0, 3], "instanz": 0, "vorhandenen": [0, 9], "figur": [0, 9], "entfernen": [0, 9], "meta": [0, 4, 9], "fieldlen": 0, "stimmen": 0, "muss": [0, 3, 4, 5, 9], "ermittelten": [0, 9], "passenden": [0, 2, 9], "ben\u00f6tigten": 0, "warung": 0, "logger": [0, 4, 9, 10], "msg": [0, 9], "messag": [0, 7, 9], "output": [0, 1, 7, 9], "empti": [0, 9], "check_accept": [0, 10], "df": [0, 1, 3, 9], "md": [0, 1, 5], "withsol": 0, "\u00fcberpr\u00fcft": [0, 1, 3, 9], "erf\u00fcllung": 0, "toleranz": [0, 1], "_accept": 0, "_pass": 0, "gesamt": 0, "zur\u00fcck": [0, 1, 9], "bezeichn": [0, 9], "current": [0, 1, 3, 7, 9], "green": [0, 9], "veri": [0, 9], "good": [0, 9], "yellow": [0, 9], "suffici": [0, 9], "orang": [0, 9], "insuffici": [0, 9], "red": [0, 7, 9], "fail": [0, 7, 9], "999": 0, "Not": [0, 9], "applic": [0, 4, 9], "accept": [0, 7, 9, 10], "check_acceptance_ext": [0, 10], "angewandt": 0, "entwed": [0, 9], "\u00fcbergeben": [0, 9], "erstellt": [0, 1, 3, 4, 9], "ok": [0, 1, 9], "nan": 0, "check_toler": [0, 10], "toleranzangaben": 0, "pr\u00fcfen": [0, 7], "real": 0, "pr\u00fcfender": 0, "dotmap": [0, 1, 9], "testaufruf": 0, "check_tolerance_ext": [0, 10], "ci": 0, "specif": [0, 9], "eval": 0, "one": [0, 7, 9], "identifi": [0, 9], "specifi": [0, 9], "appli": 0, "formula": 0, "entri": [0, 9], "createresult": [0, 10], "date": [0, 7, 9, 10], "group": [0, 3, 7, 9, 10], "datum": [0, 1, 4, 9], "notwendig": [0, 3, 4], "mehrfach": [0, 1, 9], "immer": [0, 1, 4, 7, 9], "gewandelt": 0, "evaluationcalcul": [0, 7, 10], "calcul": [0, 7], "testfield": 0, "need": [0, 5, 9], "evalu": [0, 7, 9], "addit": [0, 7, 9], "evaluation_text": 0, "displai": [0, 9], "thi": [0, 9], "text": [0, 1, 3, 7, 9, 10], "instead": [0, 7, 9], "autom": [0, 4, 7, 9], "table_sort_values_bi": 0, "table_sort_values_ascend": 0, "evaluation_table_pdf": 0, "area": [0, 1, 7, 9], "attr": [0, 9], "evaluation_replac": 0, "replac": [0, 1, 9], "simpl": [0, 3, 9], "total": 0, "evaluationprepar": [0, 7, 10], "printmanu": 0, "pre": 0, "number": [0, 1, 7, 9], "printout": 0, "manual": 0, "engin": [0, 3, 4, 7, 9, 10], "print": [0, 4, 9], "sub": 0, "without": [0, 3, 7, 9], "df_base": 0, "df_field": 0, "evaluationresult": [0, 7, 10], "printresulticon": 0, "tolerance_pdf": 0, "end": [0, 9], "page": [0, 4, 7, 9], "getfulldata": [0, 10], "beid": [0, 4, 7], "ordereddict": [0, 9], "classnam": [0, 9], "enthalten": 0, "_type": [0, 9], "geticon": [0, 10], "entspricht": [0, 1], "htmlcode": 0, "getimagestack": [0, 7, 10], "dicomimagestack": [0, 7, 10], "bereitstellen": [0, 4, 9], "mittler": 0, "dosi": [0, 2], "usw": 0, "mm": [0, 1, 7, 9], "bereichen": 0, "roistat": [0, 7, 10], "grupp": [0, 3, 9], "index": [0, 4, 9, 10], "getmetaerrorstr": [0, 10], "erzeugt": [0, 4, 9], "fehler": [0, 1, 3, 9], "meta_str": 0, "pdf_error_result": [0, 10], "group_len": 0, "fehlermeldung": 0, "erzeugen": [0, 3, 9], "testdatum": 0, "ergebnisl\u00e4ng": 0, "normalserweis": 0, "ausgabetext": 0, "fehlern": [0, 4, 9], "dicomimag": [0, 1, 7, 10], "baseimag": [0, 1, 7, 10], "hilfsfunktionen": 0, "zum": [0, 1, 2, 3, 4, 9], "normalisieren": [0, 1, 4], "bildinformatioen": 0, "auszuwertend": [0, 1], "parametern": [0, 1, 5, 9], "basereciproc": [0, 7, 10], "dtype": [0, 4, 9], "000001": 0, "berechnet": [0, 1], "np": [0, 4, 9], "static": [0, 9], "schreibgesch\u00fctzt": [0, 9], "getmeandos": [0, 7, 10], "ermitteln": [0, 1], "x": [0, 3, 7, 9], "y": [0, 1, 4, 7, 9], "mittelwert": [0, 1], "keeporigin": [0, 7], "normalisiert": 0, "liegen": [0, 2, 4, 9], "anschlie\u00dfend": [0, 3, 9], "normalisierten": 0, "gerechnet": 0, "computedtyp": [0, 7, 10], "kehrwert": [0, 1], "bleibt": [0, 9], "unver\u00e4ndert": [0, 9], "normalisierung": 0, "kein": [0, 3, 4, 5, 7, 9], "open": [0, 1, 7, 9], "prozent": 0, "kopi": [0, 1, 4, 9], "arrayorigin": [0, 7, 10], "plotimag": [0, 7, 10], "origin": [0, 9], "behalten": 0, "beschreibbar": [0, 3], "direkt": [0, 3], "\u00fcberschrieben": [0, 4, 9], "gqa_config": [0, 10], "_basedir": [0, 9, 10], "absolutepfad": 0, "parent": 0, "dir": 0, "eingelesen": [0, 4, 9], "configdateien": 0, "festlegen": 0, "sortiert": [0, 1, 9], "read": [0, 7, 9, 10], "einlesen": [0, 4, 9], "gqadb": [0, 10], "ispsafrsmodel": [0, 9, 10], "__bind_key__": 0, "same": [0, 7, 9], "main": [0, 4, 6, 9], "onetest": 0, "damit": [0, 3], "m\u00f6glich": [0, 1, 4, 7, 9], "updat": [0, 7, 9, 10], "method": [0, 9], "dictionari": [0, 9], "getyearquerystr": [0, 10], "update_valu": [0, 10], "upsert": [0, 10], "_summary_": [0, 9], "_description_": [0, 1, 9], "eingef\u00fcgt": [0, 1, 9], "datensatz": [0, 9], "_type_": [0, 9], "infoonli": 0, "rtimag": [0, 9], "zusammenstellung": 0, "wichtigsten": 0, "vorgenommen": [0, 3, 9], "isresc": [0, 10], "rescal": [0, 7], "geometri": [0, 9, 10], "dpmm": [0, 4], "sid": [0, 1, 4], "cax": [0, 4], "abgelegt": [0, 1, 4, 9], "pixelcach": [0, 10], "float32": [0, 4, 7], "npy": [0, 4, 7, 9], "neben": [0, 4, 9], "weiteren": [0, 3, 4, 5, 9], "\u00f6ffnen": [0, 3, 4, 6, 9], "pixel_cach": [0, 4, 7], "datasetcach": [0, 9, 10], "prozessweiten": 0, "halten": 0, "dataset_cach": [0, 4, 7, 9], "ispdicomdatasetcach": [0, 7, 9, 10], "compute_dtyp": [0, 4, 7], "integralminroi": [0, 7, 10], "mehr": [0, 7, 9], "summ": 0, "varianz": 0, "berechneten": 0, "summentabel": 0, "integr": [0, 2, 9], "integralimag": [0, 7, 10], "dicombild": 0, "rescaleslop": [0, 4], "_cumsum2d": [0, 10], "f\u00fchrenden": 0, "spalt": 0, "cachepixel": [0, 10], "ge\u00f6ffnet": [0, 3], "cropfield": [0, 7, 10], "beschneiden": 0, "zentrum": [0, 1], "200": 0, "dorescaleslop": [0, 7, 10], "anwenden": 0, "rt": 0, "storag": [0, 9], "setzt": [0, 9], "kopiert": [0, 3, 9], "skaliert": 0, "pixel_arrai": 0, "getdotsstat": [0, 1, 7, 10], "stat": [0, 7, 9, 10], "mean": [0, 1, 7, 9], "var": [0, 7], "std": [0, 7], "pixel": [0, 1, 4, 7, 9], "getroi": [0, 7, 10], "o": [0, 3, 4, 7, 9], "getfielddot": [0, 7, 10], "orient": [0, 7], "pixelangaben": 0, "feldgr\u00f6\u00df": 0, "ber\u00fccksichtigt": 0, "kollim": [0, 1], "rotat": [0, 1, 7], "fixm": [0, 1], "iso": [0, 1, 9], "beziehen": 0, "crop": 0, "positionen": [0, 1, 9], "orientedarrai": [0, 7, 10], "getfieldroi": [0, 10], "region": 0, "interest": 0, "getfields": [0, 10], "echten": 0, "feldma\u00df": 0, "d": [0, 1, 3, 4, 7, 9], "getlin": [0, 10], "reih": 0, "getroistat": [0, 7, 10], "initmemorydicom": [0, 10], "l\u00e4dt": [0, 9], "speicher": [0, 4], "pydicom": [0, 9], "filedataset": [0, 9], "squar": 0, "ihren": 0, "verschoben": [0, 9], "float64": [0, 4], "aufsummiert": 0, "quadrat": 0, "ersetzt": [0, 3, 9], "\u00e4nderungen": [0, 3, 4], "selbst": [0, 9], "integralreset": [0, 10], "gilt": [0, 2], "offset": [0, 1], "verschiebung": [0, 1], "shape": 0, "verwerfen": 0, "plotcax": 0, "plotfield": 0, "plottick": 0, "invert": 0, "getplot": [0, 1, 9, 10], "cmap": 0, "arg_funct": 0, "arg_dict": 0, "dicominformationen": 0, "messpositionen": 0, "anzeigen": [0, 1, 2, 3, 9], "standarm\u00e4\u00dfig": 0, "plotten": [0, 1, 9], "normaliesiert": 0, "titel": [0, 1, 4, 9], "zentrumskreuz": 0, "einzeichnen": 0, "achsenschriftung": 0, "invertieren": 0, "diesen": [0, 2, 4, 5, 9], "bildbereich": 0, "element": [0, 9], "xstep": 0, "ystep": 0, "border": 0, "beschriftung": 0, "zus\u00e4tzlichem": 0, "rand": 0, "imgsiz": [0, 9], "width": [0, 1, 7, 9], "90": [0, 1, 9], "height": [0, 1, 9], "cm": 0, "grai": 0, "cmaps_list": 0, "kei": [0, 1, 4, 7, 9, 10], "magma": 0, "magma_r": 0, "inferno": 0, "inferno_r": 0, "plasma": 0, "plasma_r": 0, "viridi": 0, "viridis_r": 0, "cividi": 0, "cividis_r": 0, "twilight": 0, "twilight_r": 0, "twilight_shift": 0, "twilight_shifted_r": 0, "ax": [0, 1, 9, 10], "plt": [0, 1, 9], "viewfield": 0, "funktionsparamet": 0, "initplot": [0, 7, 9, 10], "subplot": [0, 1, 9], "fig": [0, 9, 10], "savepixelcach": [0, 7, 9, 10], "danach": [0, 3, 4, 6, 9], "hier": [0, 3, 5, 9], "gleichen": [0, 1, 4, 9], "rechnet": [0, 4], "gleicher": 0, "zusammenh\u00e4ngenden": [0, 9], "3d": 0, "umgerechnet": 0, "lage": 0, "ausgewertet": [0, 3], "instanzen": [0, 9], "stack": [0, 7], "_cumsum3d": [0, 10], "summentabellen": [0, 1], "bildachsen": 0, "_integralstat": [0, 10], "box": [0, 9], "statistik": [0, 9], "leerer": 0, "auswahl": 0, "name_stat": 0, "bytesio": [0, 9], "bufferedread": 0, "dpi": [0, 9], "sad": 0, "1000": 0, "raw_pixel": 0, "plotclass": [0, 7, 9, 10], "erweiterung": [0, 1, 9], "pyplot": [0, 9], "_plotposit": [0, 9, 10], "plotposit": [0, 9], "cast": 0, "If": [0, 1, 9], "whatev": [0, 9], "raw": [0, 9], "inch": 0, "defin": [0, 9], "isocent": 0, "found": [0, 1, 9], "otherwis": [0, 9], "sourc": [0, 3, 7, 9], "distanc": 0, "axi": [0, 1, 7, 9], "whether": [0, 9], "intens": 0, "correct": 0, "typic": 0, "slope": 0, "intercept": 0, "other": [0, 9], "includ": [0, 4, 9], "meant": 0, "which": [0, 9], "potenti": 0, "compress": 0, "scenario": 0, "when": [0, 9], "you": [0, 3, 9], "want": [0, 9], "match": [0, 9], "behavior": [0, 9], "older": 0, "differ": [0, 7, 9], "softwar": 0, "axlimit": [0, 10], "limit": [0, 7, 9], "achsen": [0, 1], "\u00e4ndern": [0, 9], "hinzuf\u00fcgen": [0, 6], "axtick": [0, 7, 10], "achsenbeschriftung": 0, "po": 0, "label": [0, 9], "abstand": [0, 1], "breit": [0, 1], "step": [0, 9], "gebildet": 0, "ander": [0, 3, 5, 9], "auto": [0, 9], "achs": [0, 1], "dots2mm": [0, 10], "point": [0, 1], "wandelt": 0, "dots2mm_x": [0, 10], "dots2mm_i": [0, 10], "mm2dot": [0, 10], "mm2dots_x": [0, 7, 10], "gr\u00f6\u00dfer": [0, 3], "gleich": 0, "mm2dots_i": [0, 7, 10], "ansicht": 0, "rot90": 0, "liefert": [0, 9], "view": [0, 7], "vertauschten": 0, "stride": 0, "n\u00e4chsten": [0, 3, 4], "\u00e4nderung": [0, 4, 7, 9], "wiederverwendet": 0, "orientedcax": [0, 10], "viewrot": [0, 10], "drehungen": 0, "180": [0, 1], "270": [0, 1], "speicherung": 0, "bereitstellung": 0, "bereitgestellt": 0, "ispresult": [0, 10], "verarbeitet": [0, 9], "definierten": [0, 9], "abschnitt": [0, 3, 9], "datenbankverbindung": [0, 4], "speichern": [0, 4, 9], "dateiendung": [0, 9], "wrapper": 0, "bind": [0, 7, 9, 10], "exportyear": [0, 10], "exportiert": 0, "seper": [0, 7, 9], "jahresordn": 0, "getyeardata": [0, 10], "filternd": 0, "getyear": [0, 10], "geladenen": [0, 4, 9], "scandir": 0, "gefunden": [0, 1, 2, 4, 9], "erfolgreichen": [0, 3], "to_db": [0, 10], "aktuellen": [0, 4, 9], "import_from_json": 0, "insert": [0, 9], "befehl": [0, 3, 9], "objekten": 0, "war": [0, 3, 9], "usedb": [0, 10], "usefil": [0, 10], "write": [0, 7, 9, 10], "genauigkeit": 0, "doubl": [0, 1, 7], "10": [0, 1, 4, 10], "nachkommastellen": 0, "schema": [0, 4], "primarykei": 0, "pandas_vers": 0, "mt_wl": 0, "vitalbeamsn2674": 0, "20191110": 0, "20191111": 0, "tagtest": [0, 10], "gqatagindex": [0, 7, 10], "abfrageergebni": 0, "zugriff": [0, 2, 3, 4, 9], "testmap": [0, 10], "valid": [0, 9], "erstellen": [0, 1, 4, 7, 9], "datumsflag": 0, "jt": [0, 1, 4], "dateflag": 0, "inactiv": [0, 7, 10], "inaktiven": [0, 3], "properti": [0, 1, 7, 9], "period": [0, 10], "g\u00fcltigen": 0, "vorkommen": 0, "diesem": [0, 3, 5, 9], "tagnotfound": [0, 7, 10], "keinen": 0, "testnotfound": [0, 7, 10], "pfade": [0, 9], "fehlenden": [0, 9], "inakt": 0, "eigentlich": [0, 9], "starten": [0, 4, 6, 7, 9], "erledigt": 0, "exportpanda": [0, 10], "conn": 0, "importpanda": [0, 10], "migratedicomarch": [0, 10], "copi": [0, 4, 7, 9], "verteilt": [0, 4, 9], "eintrag": [0, 3, 4, 9], "servernam": [0, 3, 4], "kopieren": [0, 3, 6, 9], "verschieben": [0, 9], "overlai": [0, 1, 4, 9], "additionalmodel": 0, "startet": [0, 9, 11], "ispbasewebapp": [0, 9, 10], "load_tests_db": 0, "load": [0, 4, 7, 9], "also": [0, 9], "testdb": 0, "webapp": [0, 4, 7, 10], "gestartet": [0, 3, 9], "webappl": [0, 9], "system": [0, 3, 4, 7, 9, 10], "_extendedsystemcheck": [0, 7, 9, 10], "fill": [0, 9], "stub": [0, 9], "function": [0, 1, 7, 9], "systeminformationen": [0, 9], "config": [1, 4, 7, 10], "base": [1, 2, 7, 9, 10], "pdf": [1, 3, 7, 9, 10], "filedata": 1, "passedon": 1, "withoffset": 1, "openfieldqueri": 1, "check": [1, 4, 5, 7, 9, 10], "fieldqueri": 1, "pdffilenam": 1, "pdfdatei": 1, "result": [1, 3, 7, 9, 10], "isp": [1, 4, 7, 10], "vierquadrantentest": 1, "zusammengesetzt": 1, "vergleichen": [1, 9], "5cm": 1, "profil": [1, 7], "mitt": 1, "zwei": [1, 7], "davon": 1, "wobei": [1, 3], "kommt": [1, 9], "\u00fcberg\u00e4ngen": 1, "ca": 1, "70": 1, "vollen": 1, "http": [1, 3, 6, 7, 9], "192": [1, 4], "168": 1, "131": 1, "66": 1, "5010": 1, "api": [1, 4, 7, 9, 10], "2024": [1, 10], "truebeamsn2898": 1, "4_1_3": 1, "6x": [1, 5], "gruppiert": [1, 9], "mu": [1, 2], "abh\u00e4ngigkeit": 1, "kalibrierfaktoren": 1, "monitorr": 1, "vom": [1, 4, 9], "dosismonitorwert": 1, "abh\u00e4ngikeit": 1, "tragarm": 1, "rotationswinkel": 1, "10x10": 1, "unter": [1, 2, 4, 5, 6, 9], "10mmx10mm": 1, "test": [1, 2, 3, 4, 5, 7, 9, 10], "konstanz": 1, "vier": [1, 9], "winkelsegmenten": 1, "jeweil": 1, "45": 1, "segment": 1, "erhalten": [1, 9], "maxim": [1, 4], "bzw": [1, 9], "minim": 1, "winkelbezogenen": 1, "6mv": 1, "bspw": [1, 2], "900mu": 1, "dr600": 1, "3mu": 1, "dr20": 1, "variat": 1, "dosisquerprofil": 1, "din": [1, 3, 5, 7], "6847": 1, "2013": 1, "en": [1, 9], "60976": 1, "2011": 1, "02": 1, "30x30": 1, "80": [1, 7], "feldbreit": 1, "zentralstrahl": 1, "2mm": 1, "monatstest": [1, 2, 3, 4], "jeweilig": 1, "kolliwinkel": 1, "\u00fcbereinanderlegen": 1, "offenem": 1, "picketf": 1, "dmlc": 1, "dosimetri": 1, "40x100": 1, "gro\u00dfen": 1, "fieldanalysi": [1, 7], "aufbereitet": [1, 9], "singleprofil": [1, 7], "pylinac": [1, 3, 7], "line": [1, 7, 9], "field_ratio": 1, "8": [1, 10], "grid": 1, "inspir": [1, 9], "_plot_horiz": 1, "_plot_vert": 1, "plot": [1, 7, 10], "transmiss": 1, "quadranten": 1, "angegebenem": 1, "q2q1": 1, "q2q3": 1, "q3q4": 1, "q1q4": 1, "4q": 1, "horizontal": 1, "vertikal": 1, "profilachs": 1, "profiles": 1, "profiletitl": 1, "ersetzungen": 1, "fieldtick": 1, "lamellenpositioniergenauigkeit": 1, "mt_8_02_1_2": 1, "mt_8_02_3": 1, "overridemd": 1, "angeben": [1, 4], "analyz": [1, 7], "wann": 1, "vmat_1_2": 1, "er": [1, 9], "drucken": 1, "peak": 1, "50": [1, 4, 9], "peakh\u00f6h": 1, "leafpaar": 1, "fwhm": 1, "leafgap": 1, "tips_0_0": 1, "6": [1, 3, 4, 5, 6, 10], "A": [1, 9], "leaf": [1, 2], "reicht": 1, "betrachten": 1, "messen": 1, "10mm": 1, "70mm": 1, "colli": 1, "positon": 1, "kreuz": 1, "interleaf": 1, "x6_kamm_0_0": 1, "1cm": 1, "abst\u00e4nden": [1, 3], "kolli": 1, "messort": 1, "variant": 1, "c": [1, 7, 9], "gap": 1, "40": [1, 4, 9], "img_x6_tips_0_0": 1, "img_x6_tipsx1_0_0": 1, "img_x6_tipsx2_0_0": 1, "lamellengeschwindigkeit": 1, "kompletten": 1, "12x40": 1, "v1": 1, "OF": 1, "geschwindigkeiten": 1, "v2": 1, "v3": 1, "dosiswerten": 1, "sucht": 1, "leav": [1, 9], "gegen\u00fcberliegenden": 1, "paar": [1, 3], "hysteres": 1, "gro\u00dfem": 1, "kleinen": [1, 7], "picket": 1, "fenc": 1, "schlitzbreit": 1, "plan": [1, 9], "leafspe": [1, 5], "jt_leafspe": 1, "gate": [1, 2, 5], "statisch": [1, 4], "80x100": 1, "rot": 1, "absichtlichen": 1, "mlcarrang": 1, "millennium": 1, "eigen": [1, 7, 9], "welch": [1, 3, 9], "dessen": [1, 4, 9], "lfd": 1, "\u00f6ffungsbreit": 1, "\u00f6ffnugsbreit": 1, "positionsabweichung": 1, "halbschatten": 1, "leafnummern": 1, "60": [1, 4, 9], "testvariant": 1, "checkposit": 1, "gepr\u00fcften": 1, "richtung": 1, "klein": [1, 4], "gro\u00df": [1, 4], "fwxm": 1, "shift": 1, "barchart": 1, "leafpaaren": 1, "\u00f6ffnungsbreit": 1, "barplot": 1, "angelegt": [1, 2, 4, 6, 9], "chart": [1, 7], "ersten": [1, 3, 4, 9], "auzuwertenden": 1, "errorbox": 1, "bar": 1, "show": [1, 7], "modif": [1, 7], "up_down": [1, 7], "draw": [1, 7, 9], "leafnumb": [1, 7], "action_toler": [1, 7], "color": [1, 7], "gridlin": [1, 7], "onli": [1, 4, 7, 9], "maximum": 1, "quer": 1, "ermittelt": [1, 3], "guard_rail": 1, "mlc_peak": 1, "leaf_error_subplot": 1, "imag": [1, 2, 3, 4, 7, 9, 10], "do": [1, 3, 7, 9], "don": 1, "t": [1, 9], "guard": 1, "rail": 1, "around": 1, "ideal": 1, "alpha": 1, "statu": [1, 4, 7, 9, 10], "new": [1, 4, 7, 9], "version": [1, 3, 4, 6, 7, 9, 10], "link": [1, 10], "adjac": 1, "pf": 1, "averag": 1, "standard": 1, "deviat": 1, "error_hist": 1, "daten": [1, 3, 4, 9, 10], "mlc_mea": 1, "results_data": [1, 7], "chartsiz": 1, "showinterleafmean": 1, "showleafmean": 1, "showinterleafpeak": 1, "showleafpeak": 1, "hilfsfunkt": 1, "linien": 1, "messorten": 1, "mt_vmat_0": 1, "mt_vmat_1": 1, "mt_vmat_2": 1, "variationen": 1, "speed": [1, 2, 7], "mt_vmat_3": 1, "drg": 1, "drmlc": 1, "center_point": 1, "open_imag": 1, "dmlc_imag": 1, "vmatbas": 1, "abgefragt": [1, 9], "kommen": 1, "rectangl": [1, 7], "must": [1, 9], "iter": [1, 7, 9, 10], "as_int": 1, "input": 1, "left": [1, 4, 9], "convert": [1, 9, 10], "ratio": [1, 7], "vmat_typ": 1, "bildern": [1, 7], "result_head": 1, "onto": [1, 9], "matplotlib": [1, 7, 9], "f\u00fcllt": 1, "jeweiligen": [1, 2, 3, 5], "header": [1, 4, 7, 9], "maximum_devi": 1, "r_dev": 1, "draw_height": 1, "draw_width": 1, "draw_corn": 1, "segment_obj": 1, "median": 1, "stx": 1, "radiu": 1, "isozentrumskugel": 1, "winston": 1, "lutz": 1, "g": [1, 3, 9], "sorteddict": 1, "axisid": 1, "titl": [1, 4, 9], "rmscolor": 1, "markern": 1, "imagearrai": 1, "cal": 1, "einschub": 1, "phantom": 1, "augeben": 1, "ruft": [1, 9], "findarrayisocalcent": 1, "img": 1, "proz": 1, "bildmask": 1, "addieren": 1, "wa": [1, 3, 5, 9], "unterschiedlichen": 1, "gr\u00f6\u00dfen": 1, "kugel": 1, "isozentrum": 1, "drehzentrum": 1, "isocalpl": 1, "endwinkel": 1, "175": 1, "185": 1, "punkt": 1, "zusammengefasst": [1, 9], "images": 1, "wir": [2, 3, 4, 7], "nutzen": 2, "folgenden": [2, 3, 5], "unser": [2, 7], "testpl\u00e4n": [2, 7], "beschleunig": 2, "patient": [2, 4, 9, 10], "aria": [2, 3, 5, 7, 9, 10], "vitalbeam": [2, 7], "behandlungsreihen": 2, "testfrequenz": 2, "innerhalb": [2, 9], "bestrahlungspl\u00e4n": 2, "einzelnen": [2, 5], "mv": [2, 7], "portal": 2, "teilweis": 2, "genannt": 2, "aufgenommen": [2, 9], "liegt": [2, 4, 7, 9], "dosiskalibr": 2, "dass": [2, 3, 6, 9], "zusammenhang": 2, "zwischen": [2, 7], "mittleren": 2, "pixelwert": 2, "kalibrierten": 2, "einheiten": 2, "ke": 2, "calibr": 2, "cu": 2, "wasser": 2, "energiedosi": 2, "gy": 2, "besteht": [2, 7], "regelm\u00e4\u00dfig": [2, 3], "kalibr": 2, "bildeinheit": 2, "servic": [2, 4, 9], "beachten": [2, 3], "durchgef\u00fchrten": 2, "zuzuordnen": [2, 4], "bestrahlungsfeld": [2, 5], "feldeigenschaften": [2, 5], "festgelegt": 2, "monatlichen": [2, 7], "geschwindigkeitstest": 2, "geh\u00f6renden": 2, "geschrieben": [2, 3, 4, 9], "dazu": [2, 3], "modul": [2, 4, 6, 10], "planparamet": 2, "eigenschaften": [2, 9], "lassen": [2, 7, 9], "tab": [2, 9], "eintragen": [2, 3], "dienen": 2, "kann": [2, 3, 4, 5, 7, 9], "einfach": [2, 3, 4, 7, 9], "entsprechenden": [2, 3], "kommentarfeld": 2, "zeilenweis": 2, "untereinand": 2, "notieren": 2, "dar\u00fcber": [2, 3], "hinau": 2, "besonderen": 2, "markierung": 2, "versehen": 2, "beispielsweis": 2, "weil": 2, "referenzfeld": 2, "anderen": [2, 7], "daf\u00fcr": [2, 3], "hinter": [2, 3], "doppelpunkt": 2, "bezeichnung": 2, "100mu": 2, "kennzeichnet": 2, "basisfeld": 2, "abgestrahlt": 2, "strahlentherapi": [3, 7], "m\u00fcssen": [3, 4, 7], "bestrahlungsger\u00e4t": 3, "gepr\u00fcft": [3, 4, 7, 9], "korrekt": 3, "pr\u00e4zise": 3, "bestrahlung": 3, "gew\u00e4hrleisten": 3, "verschieden": [3, 4], "welchen": 3, "regelm\u00e4\u00dfigen": 3, "verschiedenen": [3, 7], "gemessen": 3, "h\u00e4ufig": 3, "normen": 3, "vorgegeben": [3, 5], "messungen": [3, 7], "abweichungen": 3, "\u00fcberschreiten": 3, "messergebniss": 3, "vereinfachen": 3, "daran": 3, "gearbeitet": 3, "automatisieren": 3, "am": [3, 4, 7, 9], "klinikum": [3, 7], "dortmund": [3, 7], "projekt": [3, 6, 7], "basierend": 3, "entwickelt": [3, 7], "hierbei": [3, 9], "genutzt": 3, "auszuwerten": 3, "nutzung": [3, 4], "weiterentwicklung": 3, "zun\u00e4chst": 3, "einig": [3, 7, 9], "installationen": 3, "installationsanleitung": 3, "github": [3, 7, 9], "seit": [3, 6, 7], "medphydo": [3, 6], "schritt": [3, 9], "miniconda": 3, "installiert": 3, "verf\u00fcgbar": [3, 7], "geklonet": 3, "vorausgesetzt": 3, "pillow": 3, "pyodbc": [3, 4, 7, 9], "cargo": 3, "vorinstalliert": 3, "13": [3, 9], "microsoft": [3, 9], "bislang": 3, "funktionalit\u00e4t": 3, "17": [3, 4, 10], "getestet": 3, "weshalb": 3, "empfehlenswert": 3, "nun": 3, "mitgeliefertem": 3, "skript": 3, "einigen": 3, "datenbanken": [3, 4], "zugegriffen": 3, "eingef\u00fcgten": 3, "aufgef\u00fchrt": 3, "ausstehend": 3, "grau": 3, "gelb": 3, "fertig": [3, 7], "gr\u00fcn": 3, "hinterlegt": 3, "k\u00f6nnen": [3, 4, 9], "mausklick": 3, "schwellwert": 3, "warnung": [3, 9], "ausgewerteten": 3, "ersichtlich": 3, "entsprechen": [3, 4], "folgend": 3, "empfehlen": [3, 4], "visual": 3, "studio": [3, 4], "spyder": [3, 7], "bearbeitung": 3, "note": [3, 9], "stellen": [3, 9], "befehlen": 3, "etwa": 3, "spitzen": 3, "klammern": 3, "passwort": [3, 4], "individuel": 3, "beschrieben": [3, 4, 7], "geklont": 3, "konsol": [3, 7, 9], "arbeitsverzeichni": 3, "angelgt": 3, "dorthin": [3, 9], "gewechselt": 3, "mkdir": 3, "name_des_arbeitsverzeichni": 3, "cd": [3, 6, 7], "gr\u00fcne": 3, "button": [3, 6], "ordnern": 3, "datein": 3, "angeklickt": 3, "url": [3, 7, 9], "indem": [3, 7], "git": 3, "clone": 3, "ordner": [3, 4, 6, 7], "welchem": 3, "geklonten": 3, "befinden": [3, 4, 7, 9], "genauso": 3, "benannt": [3, 4, 5], "name_des_repositori": 3, "zip": [3, 6], "gedownloadet": 3, "erstellten": [3, 4], "entpackt": 3, "hierzu": 3, "eingegeben": 3, "wget": 3, "repo": [3, 6], "anaconda": [3, 6], "com": [3, 6, 9], "miniconda3": [3, 6], "py311_23": 3, "x86_64": [3, 6], "sh": 3, "miniconda311": 3, "23": [3, 10], "beinhaltet": [3, 9], "11": [3, 7, 10], "\u00fcberpr\u00fcfen": 3, "checksumm": 3, "sha256sum": 3, "sollt": 3, "folgt": 3, "lauten": 3, "61a5c087893f6210176045931b89ee6e8760c17abd9c862b2cab4c1b7d00f7c8": 3, "installationsdatei": 3, "entspechend": 3, "flag": [3, 9], "chmod": 3, "eingab": 3, "lizenzen": 3, "akzeptiert": 3, "installationsort": 3, "beibehalten": 3, "frage": 3, "wish": 3, "conda": 3, "bin": [3, 6], "Such": 3, "integriert": 3, "erfolgreich": 3, "beiden": 3, "ausgegeben": 3, "pip": [3, 6, 9], "neuer": [3, 6], "your": [3, 7, 9], "binpath": 3, "gew\u00e4hlten": 3, "speicherort": [3, 4], "ersetzen": [3, 9], "bevor": [3, 4, 9], "bibliothek": 3, "bildverarbeitungsfunktionen": 3, "bereitstellt": 3, "unixodbc": [3, 9], "dev": 3, "abh\u00e4ngigkeitsprozess": 3, "sudo": [3, 9], "apt": 3, "libtiff5": 3, "libjpeg8": 3, "libopenjp2": 3, "zlib1g": 3, "libfreetype6": 3, "liblcms2": 3, "libwebp": 3, "tcl8": 3, "tk8": 3, "python3": 3, "tk": 3, "libharfbuzz": 3, "libfribidi": 3, "libxcb1": 3, "unterordn": 3, "welcher": [3, 5, 9], "abh\u00e4ngigen": 3, "r": [3, 4, 6, 9], "txt": [3, 6, 7, 9], "editor": 3, "requirements_spyd": 3, "notwendigen": 3, "resourc": [3, 4, 5, 6, 7, 10], "py": [3, 4, 6, 7, 9], "cp": 3, "vendor": 3, "font": [3, 4, 6, 9], "materialdesignicon": [3, 6, 9], "webfont": [3, 6, 9], "ttf": [3, 6], "usr": 3, "truetyp": 3, "materialdesignicons_webfont": 3, "644": 3, "h\u00f6her": 3, "herstellen": [3, 9], "erfolgt": [3, 4, 9], "driver": [3, 4], "darauf": 3, "geachtet": 3, "editiert": 3, "dsn": [3, 4], "dbname": [3, 4, 9, 10], "varian": [3, 4, 7], "host": [3, 4, 9], "ip": [3, 4], "adress": 3, "user": [3, 4, 7, 9], "password": [3, 4, 9, 10], "tempor\u00e4r": [3, 4, 9], "definieren": 3, "stehen": [3, 4], "mssqlserverdatabas": 3, "my": 3, "trace": 3, "No": 3, "genau": [3, 9], "oben": 3, "cat": 3, "etc": [3, 4], "odbcinst": 3, "ini": [3, 4], "opt": 3, "msodbcsql17": 3, "lib64": 3, "libmsodbcsql": 3, "usagecount": 3, "eckigen": 3, "steht": [3, 4], "nachdem": 3, "inform": [3, 9], "registriert": 3, "": [3, 4, 9], "tempor\u00e4ren": 3, "l": 3, "ausgab": [3, 7, 9, 10], "beinhalten": 3, "sqlcmd": 3, "smssqlserverdatabas": 3, "u": 3, "p": [3, 4, 9], "anbindung": [3, 4, 9], "funktioniert": 3, "import": [3, 4, 7, 9], "uid": 3, "pwd": 3, "web": [3, 6], "browser": [3, 9], "reiter": 3, "systeminfo": 3, "kontrolliert": 3, "zuerst": [3, 9], "testpatienten": 3, "darunt": 3, "vmscom": 3, "local_dir": [3, 4, 9], "n\u00e4chste": 3, "resultpath": 3, "beshreibbbar": 3, "kontrol": [3, 7], "mqtt": [3, 4, 7, 10], "ebenfal": 3, "schluss": 3, "installierten": 3, "lizenz": 3, "nano": 3, "lib": 3, "systemd": 3, "inhalt": [3, 4, 9], "sieht": [3, 9], "wiefolgt": 3, "netzwerk": 3, "www": [3, 7, 9], "after": [3, 7, 9], "network": 3, "target": 3, "execstart": 3, "locat": [3, 9], "webserv": [3, 4, 7, 9, 11], "workingdirectori": 3, "standardinput": 3, "tty": 3, "wantedbi": 3, "multi": 3, "systemctl": 3, "restart": 3, "stop": [3, 9], "neugestartet": 3, "beendet": [3, 9], "systemstart": 3, "aktivieren": 3, "enabl": [3, 7, 9], "sichergestellt": [3, 9], "neuen": [3, 6, 7, 9], "programm": [3, 7, 9], "kompatibel": 3, "neust": 3, "packagenam": 3, "pigar": 3, "aktualisieren": 3, "referenc": 3, "requirements_upgrad": [3, 7], "n\u00f6tig": [3, 7], "neusten": 3, "gebracht": [3, 4, 9], "upgrad": 3, "veralteten": 3, "auflisten": 3, "outdat": 3, "bringen": 3, "sphinx": [3, 7, 9], "problem": [3, 9], "auftreten": 3, "wodurch": 3, "verz\u00f6gert": [3, 9], "auskommentiert": 3, "namen": [3, 9], "auskommentierung": 3, "sp\u00e4ter": [3, 9], "r\u00fcckg\u00e4ngig": 3, "globalen": [3, 4], "umgebungen": 3, "hilfreich": 3, "sein": [3, 9], "proxi": 3, "httpproxi": 3, "port": [3, 4, 9, 10], "httpsproxi": 3, "dockerfil": 3, "compos": 3, "yml": 3, "up": [3, 7, 9], "\u00e4ndernd": [3, 9], "env": [3, 9], "schl\u00fcssel": 3, "definiert": 3, "n\u00fctzlich": 3, "beschreibung": [3, 5, 7], "build": [3, 7, 9, 10], "rebuild": [3, 9], "durchf\u00fchren": [3, 4, 7, 9, 10], "composefil": 3, "inspect": 3, "rm": 3, "container_nam": 3, "stoppen": [3, 9], "laufenden": [3, 9], "gestoppten": 3, "speicherplatz": 3, "containern": 3, "volum": 3, "prune": 3, "gestoppt": 3, "unbenutzt": [3, 4], "down": 3, "remov": [3, 7, 9, 10], "orphan": 3, "entfern": 3, "verweist": 3, "enstpricht": 3, "app": [3, 4, 6, 7, 9, 10], "conatin": 3, "abrufen": [3, 9], "netstat": 3, "tulpen": 3, "belegt": [3, 4, 9], "ansehen": 3, "dateisystem": [3, 4], "gruppen": [3, 9], "exampl": [3, 9], "use_uid": 3, "user_id": 3, "use_gid": 3, "gruppen_id": 3, "darin": [3, 7], "beschriebenen": 3, "einstellungen": 3, "wichtig": 3, "pygqa_0": 3, "weiter": [3, 4, 6, 7, 9], "grundkonfigur": 4, "lautet": 4, "anh\u00e4ngen": 4, "zahlen": 4, "\u00fcberlagern": 4, "03": [4, 10], "15": [4, 9], "jeder": [4, 9], "nachfolgenden": 4, "beginnend": 4, "\u00fcberlagert": [4, 9], "initialisierung": 4, "overlaylast": 4, "stoppt": [4, 9], "datumsangab": 4, "m": 4, "20181205": 4, "aktuellem": [4, 9], "erm\u00f6glicht": 4, "content": [4, 7, 10], "20180101": 4, "20180501": 4, "verbindungen": [4, 9], "dicomserv": [4, 9], "erstellung": [4, 7, 9], "basispfad": [4, 9], "\u00fcbernommen": [4, 9], "127": [4, 6, 7], "localhost": [4, 9], "webserverport": 4, "8085": 4, "basetop": [4, 9], "applik": 4, "resourcen": 4, "texten": 4, "javascript": [4, 6, 7, 9], "bibliotheken": 4, "stylesheet": 4, "global": [4, 9], "ui": [4, 7, 9], "websit": 4, "aktiviert": 4, "flask": [4, 7, 9], "reload": 4, "use_reload": 4, "w\u00e4hrend": [4, 9], "laufzeit": [4, 9], "program": [4, 7], "checknetarea": 4, "subnetz": 4, "secret_kei": [4, 9], "urandom": [4, 9], "prefix": [4, 9], "schnittstel": [4, 7], "dbadmin": [4, 9], "db": [4, 7, 9, 10], "admin": 4, "coverag": 4, "bericht": 4, "modulnutzung": 4, "fehlerfreien": 4, "all_unittest": [4, 7], "custom_swagger_config": 4, "erg\u00e4nzend": 4, "sawgger": 4, "klassen": [4, 9], "log": [4, 7, 10], "level": [4, 7, 9, 10], "notset": [4, 9], "30": [4, 9], "critic": [4, 9], "root": [4, 9], "safr": [4, 7, 10], "sqlalchemi": [4, 7, 9], "datenbankmodul": 4, "handler": [4, 9], "verwend": 4, "protokol": [4, 7, 9], "websocket": [4, 7, 9, 10], "1883": [4, 9], "webclient_port": 4, "9001": 4, "usernam": [4, 9, 10], "autentifizierung": 4, "topic": [4, 9], "beginnt": 4, "datenbanknam": 4, "pytd": [4, 7, 9], "aria_gener": [4, 7, 9], "synthetisch": 4, "lasttest": 4, "ausreichend": 4, "lese": 4, "statement_cach": [4, 9], "vorbereiteten": 4, "anweisungen": 4, "schaltet": [4, 9], "fetch_siz": [4, 9], "streamen": 4, "fetchmani": [4, 9], "500": [4, 9], "min_siz": [4, 9], "gehalten": 4, "max_siz": [4, 9], "maximal": 4, "idle_timeout": [4, 7, 9], "geschlossen": [4, 9], "timeout": [4, 7, 9, 10], "freie": 4, "gewartet": [4, 9], "check_aft": [4, 9], "h\u00f6chsten": [4, 9], "result_cach": [4, 7, 9], "max_byt": [4, 9], "gesch\u00e4tzt": [4, 9], "l\u00e4ngsten": [4, 9], "67108864": [4, 9], "64": [4, 9], "mb": [4, 9], "ttl": [4, 9, 10], "abfrageart": 4, "g\u00fcltig": 4, "abgeschlossen": [4, 7], "geleert": 4, "datenspeicherung": 4, "lesen": [4, 9], "to_json": 4, "hat": [4, 7, 9], "vorrang": 4, "odbc": [4, 9], "login_timeout": 4, "server_ip": 4, "manag": 4, "rechten": [4, 9], "db_dataread": 4, "public": [4, 9], "dbo": [4, 9], "instal": [4, 9, 10], "servereintrag": 4, "aec": 4, "ae": [4, 9, 10], "server_port": 4, "listen": 4, "105": 4, "aet": 4, "aufrufend": 4, "listen_port": 4, "50300": 4, "request_mod": 4, "requestmod": 4, "c_move": 4, "c_get": 4, "request_query_model": 4, "retrieve_batch": [4, 7, 9], "h\u00f6chstzahl": 4, "holen": [4, 9, 10], "abgebrochen": [4, 9], "wiederholt": [4, 9], "retri": [4, 7, 9, 10], "wiederholungen": [4, 9], "vor\u00fcbergehenden": [4, 9], "0xa7xx": [4, 7, 9], "0xc5xx": [4, 7, 9], "retry_backoff": [4, 7, 9], "wiederholung": [4, 9], "doppelt": [4, 9], "lang": [4, 9], "dahin": 4, "schlie\u00dft": [4, 9], "automatisch": [4, 7, 9], "archive_index": [4, 7], "archiv": [4, 7, 9, 10], "dcm": [4, 9], "unabh\u00e4ngig": [4, 9], "verzeichnissen": 4, "python": [4, 9], "read_mod": [4, 7, 9], "lazi": [4, 7, 9], "liest": [4, 9], "wieder": [4, 9], "frei": 4, "aufbereiteten": [4, 9], "mmap_mod": [4, 9], "prefetch_byt": [4, 7], "mehreren": [4, 9], "byte": [4, 9], "dekodiert": [4, 9], "268435456": [4, 9], "256": [4, 9], "write_queu": [4, 7], "empfangenen": [4, 9], "warten": [4, 9], "empfang": [4, 9], "wartet": [4, 9], "platt": [4, 9], "schreibt": [4, 9], "sofort": [4, 9], "fsync_batch": [4, 7], "gemeinsam": [4, 9], "fsync": [4, 9], "umbenannt": [4, 9], "prozessweit": [4, 9], "gelesenen": [4, 9], "trefferquot": 4, "zeigt": [4, 9], "eintr\u00e4g": [4, 9], "offenen": 4, "genauer": 4, "doppelten": 4, "daemon": 4, "wizard": 4, "dicomcontrol": 4, "ex": 4, "secur": 4, "trust": 4, "address": [4, 9], "vm": 4, "dicomservic": 4, "werkzeug": 4, "symbol": [4, 9], "anlegen": [4, 6, 9], "charact": 4, "unicod": 4, "iso_ir": 4, "ausw\u00e4hlen": [4, 6], "testauswertungen": 4, "anzulegen": 4, "test_app": 4, "zus\u00e4tzich": 4, "testenden": 4, "units_testsapp": [4, 7], "style": [4, 9], "mpdf_page": [4, 9], "css": [4, 6, 9], "mpdf_overlai": [4, 9], "04d": 4, "betreff": 4, "mt": [4, 5], "02d": 4, "tmpl": [4, 9], "mpdf_header": 4, "footer": [4, 9], "mpdf_footer": 4, "jinja": [4, 9], "page_styl": [4, 9], "mpdf_page_styl": 4, "overlay_styl": [4, 9], "mpdf_overlay_styl": 4, "pfaden": 4, "verf\u00fcgung": 4, "gestarteten": 4, "script": 4, "__version__": 4, "serverhost": [4, 9], "logopath": 4, "logo": [4, 9], "develop": [4, 9], "dises": 4, "unterverzeichniss": 4, "product": [4, 9], "start": [4, 9], "dokument": [4, 6, 9], "dateinam": [4, 9], "png": [4, 9], "nonam": 4, "klinik": 4, "seitenkopf": 4, "abteilung": 4, "schl\u00fcsselw\u00f6rter": 4, "datenausgab": 4, "now": [4, 7], "strftime": 4, "erstelldatum": 4, "fu\u00dfzeil": 4, "erstellt_von": 4, "g\u00fcltig_ab": 4, "freigegeben_von": 4, "a4": 4, "portrait": 4, "right": [4, 9], "top": [4, 9], "bottom": [4, 9], "12": [4, 10], "margin": [4, 9], "konfigurationsm\u00f6glichkeiten": 5, "finden": 5, "einzugebend": 5, "kurz": 5, "testlist": 5, "allgemeinen": 5, "men\u00fc": 5, "testmatrix": 5, "toleranzen": 5, "gelten": 5, "sollwert": 5, "einheit": 5, "warnschwel": 5, "warnwert": 5, "berechnung": 5, "fehlerschwel": 5, "fehlerwert": 5, "toleranzpr\u00fcfung": 5, "einzuschr\u00e4nken": 5, "zeitpunkt": [5, 9], "ausgeschlossen": 5, "mind": [5, 9], "18": [5, 10], "15x": 5, "series_groupbi": 5, "intern": [5, 9], "mt_leafspe": 5, "geschwindigkeit": [5, 7], "lamellen": [5, 7], "6875": 5, "75": 5, "paket": 6, "14": [6, 7, 9], "macosx": 6, "pkg": 6, "gef\u00fchrt": 6, "assist": 6, "benutzerordn": 6, "macintosh": 6, "hd": 6, "benutz": 6, "deinnam": 6, "pr\u00fcfe": 6, "finder": 6, "deinem": 6, "termin": [6, 9], "du": 6, "befindest": 6, "dich": 6, "versionen": 6, "higher": [6, 9], "deinordn": 6, "skeleton": 6, "klick": [6, 7], "gr\u00fcnen": 6, "entpacken": 6, "deinen": 6, "navigier": 6, "repositori": [6, 7], "installier": 6, "templarian": 6, "materialdesign": 6, "blob": 6, "master": 6, "schriftsammlung": 6, "anwendungen": [6, 7], "5000": [6, 7], "dein": 6, "l\u00e4uft": [6, 9], "qualit\u00e4tssicherung": 7, "linearbeschleunigern": 7, "verbessern": 7, "zeitalt": 7, "digitalisierung": 7, "viel": 7, "zeit": 7, "ressourcensparend": 7, "ger\u00e4teeigenen": 7, "detektor": 7, "hilft": 7, "durchsucht": 7, "analysiert": 7, "ergebi": 7, "tauglich": 7, "report": 7, "interakt": 7, "\u00fcbersicht": 7, "anstehend": 7, "konstanzpr\u00fcfungen": 7, "ampel": 7, "pass": [7, 9], "anwend": 7, "voll": 7, "auswertungsmethod": 7, "fehlergrenzen": 7, "basiert": 7, "gro\u00dfartigen": 7, "featur": 7, "tg": 7, "142": 7, "bequem": 7, "bedienung": 7, "webbrows": 7, "automatisiert": 7, "datenabfrag": 7, "bildexport": 7, "skelett": 7, "institut": 7, "medizinisch": 7, "strahlenphysik": 7, "strahlenschutz": 7, "kooper": 7, "praxi": 7, "technischen": 7, "universit\u00e4t": 7, "worden": 7, "haben": 7, "un": [7, 9], "arbeit": 7, "erleichtern": 7, "ver\u00f6ffentlichung": 7, "gedacht": 7, "nachfragen": 7, "kliniken": 7, "erreichten": 7, "dementsprechend": 7, "stadium": 7, "learn": 7, "halbvollst\u00e4ndig": 7, "deutsch": 7, "englisch": 7, "mix": [7, 9], "konzipierten": 7, "linearit\u00e4t": 7, "dosismonitorsystem": 7, "dosismonitorwerten": 7, "geschwindigkeits\u00e4nderung": 7, "derzeit": 7, "hard": 7, "softwarekonstel": 7, "abgestimmt": 7, "truebeam": 7, "v": [7, 9], "120er": 7, "eclips": 7, "linux": 7, "auswertungssoftwar": 7, "intranet": 7, "erfahrung": 7, "kur": 7, "eu": 7, "php": [7, 9], "guten": 7, "einstieg": 7, "programmierung": 7, "wer": 7, "einzeln": [7, 9], "vornehmen": 7, "m\u00f6chte": 7, "sei": 7, "tool": 7, "pyqaserv": 7, "empfohlen": 7, "bewertung": 7, "verantwortung": 7, "zust\u00e4ndigen": 7, "medizinphysik": 7, "experten": 7, "sorgf\u00e4ltig": 7, "ermessen": 7, "keinerlei": 7, "korrektheit": 7, "bearbeiten": 7, "konfigurationsdateien": 7, "anpassen": 7, "allgemein": 7, "anpassungen": 7, "mac": 7, "macdummi": 7, "wechseln": 7, "pythonpath": 7, "oberfl\u00e4ch": 7, "erreichbar": 7, "interfac": 7, "document": [7, 9], "access": [7, 9], "schnitstel": 7, "doc": [7, 9], "testdaten": 7, "weboberfl\u00e4ch": 7, "weasyprint": [7, 9], "ausgaben": 7, "gruppierung": [7, 9], "pr\u00fcfung": [7, 9], "internen": [7, 9], "abl\u00e4uf": 7, "besond": 7, "programm\u00e4nderugen": 7, "\u00fcbertragen": 7, "node": 7, "meldungen": [7, 9], "verarbeiten": [7, 9], "weiterzuleiten": 7, "inlin": 7, "generieren": 7, "systemlauf": 7, "aktualisiert": 7, "implement": [7, 9], "beschreiben": 7, "trend": 7, "templatesystem": 7, "fester": 7, "oberf\u00e4ch": 7, "vuej": [7, 9], "socket": [7, 10], "fortschrittsanzeig": 7, "best": 7, "weg": 7, "erreichen": 7, "issu": [7, 9], "packag": 7, "subpackag": [7, 10], "submodul": [7, 10], "ariadicom": [7, 10], "ariamirror": [7, 10], "tagindex": [7, 10], "dicomarch": [7, 10], "mpdf": [7, 10], "mssql": [7, 10], "prepar": [7, 9, 10], "statement": [7, 9, 10], "hit": [7, 9], "miss": [7, 9], "counter": [7, 9], "getstatementstat": [7, 9, 10], "process": [7, 9], "wide": [7, 9], "idl": [7, 9], "evict": [7, 9], "live": [7, 9], "reconnect": [7, 9], "ispmssqlconnect": [7, 9, 10], "hold": [7, 9], "IN": [7, 9], "half": [7, 9], "token": [7, 9], "whole": [7, 9], "word": [7, 9], "benchmark_aria_queri": 7, "local": [7, 9], "increment": 7, "answer": 7, "fetch": [7, 9], "built": 7, "onc": [7, 9], "each": [7, 9], "time": [7, 9], "lru": [7, 9], "estim": [7, 9], "getresultcach": [7, 9, 10], "invalidatecach": [7, 9, 10], "invalid": [7, 9, 10], "befor": [7, 9], "setlastexecut": [7, 9, 10], "synthet": [7, 9], "benchmark_aria_load": 7, "openassoci": [7, 9, 10], "associ": [7, 9], "move": [7, 9], "request": [7, 9], "renegoti": [7, 9], "abort": [7, 9], "releas": [7, 9], "close": [7, 9, 10], "second": [7, 9], "getinfo": [7, 9, 10], "receiv": [7, 9], "store": [7, 9], "rout": [7, 9], "wait": [7, 9], "deliv": [7, 9], "order": [7, 9], "ispdicomarch": [7, 9, 10], "acquisit": 7, "sha1": [7, 9], "checksum": [7, 9], "shard": [7, 9], "directori": [7, 9], "layout": [7, 9], "migrat": [7, 9, 10], "exist": [7, 9], "archive_hassopinstanceuid": [7, 9, 10], "readdataset": [7, 9, 10], "archive_loadsopinstanceuid": [7, 9, 10], "demand": 7, "them": [7, 9], "loadpixelcach": [7, 9, 10], "next": 7, "memori": [7, 9], "map": 7, "retrieveasync": [7, 9, 10], "ispdicomrequest": [7, 9, 10], "cancel": [7, 9, 10], "assign": [7, 9], "moveoriginatormessageid": [7, 9], "blinker": [7, 9], "event": [7, 9], "while": 7, "decod": 7, "ispdicomwrit": [7, 9, 10], "behind": [7, 9], "queue": [7, 9], "temp": 7, "renam": 7, "handle_stor": [7, 9, 10], "hand": 7, "disk": [7, 9], "statist": [7, 9], "keep": 7, "unchang": 7, "place": 7, "comput": 7, "buffer": 7, "kept": [7, 9], "twice": [7, 9], "rewrit": 7, "pixeldata": [7, 9], "its": [7, 9], "reciproc": 7, "comparison": 7, "dose": 7, "delta": 7, "more": [7, 9], "than": [7, 9], "reset": 7, "take": [7, 9], "mani": [7, 9], "four": 7, "edg": 7, "__init__": [7, 9], "some": [7, 9], "cleanup": [7, 9], "logginghandlerclass": [7, 9, 10], "modifi": [7, 9], "handl": [7, 9], "support": [7, 9], "getlogg": [7, 9], "fsimag": 7, "pointrot": 7, "refactor": 7, "refer": [7, 9], "swap": 7, "set_tick": 7, "set_ticklabel": 7, "prevent": 7, "fwxmprofilephys": 7, "multiprofil": 7, "pfimag": 7, "_leaves_in_view": 7, "mathtext": [7, 9, 10], "_get_connect": [7, 9, 10], "db_bind": [7, 9], "rqlqueri": [7, 9, 10], "compat": [7, 9], "sinc": [7, 9], "newer": [7, 9], "rqlalchemi": [7, 9], "depend": [7, 9], "suppress": 7, "appinfo": [7, 9, 10], "apperror": [7, 9, 10], "_s_get": [7, 9], "_s_count": [7, 9], "_create_app": [7, 9, 10], "openapi": [7, 9], "explor": 7, "flask_swagger_ui": [7, 9], "concat": [7, 9], "append": [7, 9], "fullcheck": 7, "inherit": 7, "alwai": [7, 9], "greater": 7, "equal": [7, 9], "crope": 7, "flatsym": 7, "getprofiledata": 7, "flatness_calcul": 7, "arrang": 7, "find_peak": 7, "fwxm_data": 7, "analysi": 7, "roi_config": 7, "better": [7, 9], "null": [7, 9], "phtml": [7, 9], "gqa_view": 7, "unus": [7, 9], "_int_json_respons": [7, 9, 10], "separ": [7, 9], "fixedformatt": 7, "get_subtag_from_mlcplantyp": 7, "give": [7, 9], "cor": [7, 9], "json_dump": 7, "client": [7, 9], "via": [7, 9], "pynetdicom": [7, 9], "allow": [7, 9], "multipl": [7, 9], "markdown": [7, 9, 10], "first": [7, 9], "setlevel": 9, "merg": [9, 10], "mergedeep": 9, "collet": 9, "_configload": [9, 10], "scheme": 9, "use_as_vari": 9, "fromisoformat": 9, "datetimeformat": 9, "jsondump": 9, "secret": 9, "token_hex": 9, "dict_merg": [9, 10], "dct": 9, "merge_dct": 9, "recurs": 9, "untouch": 9, "lastoverlai": 9, "rootlevel": 9, "isplevel": 9, "basedir": 9, "konfiguar": 9, "au\u00dfer": 9, "haupt": 9, "konfig": 9, "eingebunden": 9, "intialisierung": 9, "_lastoverlai": [9, 10], "_rootlevel": [9, 10], "fehlerlevel": 9, "consol": 9, "_isplevel": [9, 10], "verzeichniss": 9, "aufgerufenen": 9, "_name": [9, 10], "_develop": [9, 10], "entwicklungszweig": 9, "_loaderror": [9, 10], "listet": 9, "kam": 9, "_handler": [9, 10], "zahlenwert": 9, "20230514": 9, "unterverzeichni": 9, "autm": 9, "__getattr__": [9, 10], "k": 9, "nonexist": 9, "_": 9, "doesn": 9, "gesuchten": 9, "__getitem__": [9, 10], "klassenattribut": 9, "notat": 9, "part": 9, "both": 9, "mutabl": 9, "immut": 9, "contain": 9, "protocol": 9, "It": 9, "should": 9, "rais": 9, "appropri": 9, "except": 9, "typeerror": 9, "wrong": 9, "keyerror": 9, "correspond": 9, "__repr__": [9, 10], "repr": 9, "major": 9, "between": 9, "intend": 9, "audienc": 9, "produc": 9, "mostli": 9, "machin": 9, "readabl": 9, "case": 9, "could": 9, "even": 9, "wherea": 9, "human": 9, "__setattr__": [9, 10], "unlik": 9, "encapsul": 9, "solut": 9, "regardless": 9, "can": 9, "custom": 9, "rule": 9, "ani": 9, "howev": 9, "have": 9, "care": 9, "how": 9, "setzend": 9, "__setitem__": [9, 10], "nkei": 9, "again": 9, "99999999": 9, "_overlaylast": 9, "gebildeten": 9, "replacevari": 9, "complet": 9, "whose": 9, "out": 9, "depth": 9, "jinjaenv": [9, 10], "environ": 9, "extens": 9, "jpsca": 9, "f\u00fchrt": 9, "ausgelesen": 9, "tief": 9, "mischend": 9, "mqttcleanup": [9, 10], "shutdown": [9, 10], "mqttgethandl": [9, 10], "mqttinitloggerhandl": [9, 10], "handlernam": 9, "perform": 9, "render_templ": [9, 10], "tpl": 9, "deep_replac": 9, "templat": 9, "render": [9, 10], "rootinitlogg": [9, 10], "setkei": 9, "setvari": [9, 10], "There": 9, "two": 9, "scp": [9, 10], "provid": 9, "thought": 9, "scu": 9, "reus": 9, "closea": [9, 10], "associationstat": [9, 10], "_retriev": [9, 10], "send": [9, 10], "respons": 9, "under": 9, "_assoclock": 9, "ignor": 9, "_scheduleretriev": [9, 10], "archive_deletesopinstanceuid": [9, 10], "writer": 9, "written": 9, "dicompath": [9, 10], "entiti": 9, "assoc": [9, 10], "subklass": 9, "empfangen": 9, "messageid": [9, 10], "idletimeout": [9, 10], "ge\u00f6ffneten": 9, "wiederverwendeten": 9, "ausgehandelten": 9, "wegen": 9, "geschlossenen": 9, "retrievetimeout": [9, 10], "retrybackoff": [9, 10], "wartezeit": 9, "verdoppelt": 9, "retrievework": [9, 10], "gemeinsamen": 9, "abgeschaltet": 9, "sicherstellen": 9, "g\u00fcltiger": 9, "query_model": 9, "studi": [9, 10], "suche": 9, "hex": 9, "r\u00fcckgabecod": 9, "send_c_find": 9, "delet": 9, "destructor": 9, "_associ": [9, 10], "inita": [9, 10], "0x0000": 9, "0xc0ff": 9, "fehlgeschlagen": 9, "_getretrievepool": [9, 10], "_idlecheck": [9, 10], "schlie\u00dfen": 9, "_istransi": [9, 10], "vor\u00fcbergehend": 9, "relat": 9, "0xc5f2": 9, "_newassoci": [9, 10], "aufgebaut": 9, "_replaceassoci": [9, 10], "old": 9, "_runrequest": [9, 10], "studyinstanceuid": 9, "seriesinstanceuid": 9, "externen": 9, "machen": 9, "getdicom": 9, "nimmt": 9, "gelesen": 9, "evt_c_stor": 9, "0xc5f1": 9, "0xc512": 9, "0xc515": 9, "alreadi": 9, "0xfe00": 9, "verlorenen": 9, "zuletzt": 9, "_runretriev": [9, 10], "_pend": 9, "seiner": 9, "zugeordnet": 9, "_sendrequest": [9, 10], "senden": 9, "_sendretriev": [9, 10], "antworten": 9, "auswerten": 9, "abbrechen": 9, "letzter": 9, "antwort": 9, "_touch": [9, 10], "merken": 9, "timer": 9, "l\u00f6scht": 9, "gesucht": 9, "verteilten": 9, "dicomdatei": 9, "grund": 9, "mitgeben": 9, "echo": [9, 10], "419": 9, "obj": 9, "handle_ev": [9, 10], "verarbeitung": 9, "protokolliert": 9, "evt_handl": 9, "zuordnung": 9, "evt": 9, "gesendet": 9, "io": 9, "stabl": 9, "0xc500": 9, "0xc5ff": 9, "0xc511": 9, "unhandl": 9, "evt_c_mov": 9, "non": 9, "0xc000": 9, "evt_establish": 9, "evt_reject": 9, "evt_releas": 9, "bestehend": 9, "verbunden": 9, "Suche": 9, "find": 9, "0xc300": 9, "0xc3ff": 9, "0xc3f1": 9, "ihr": 9, "\u00fcbrigen": 9, "wartenden": 9, "nachgeholt": 9, "queryretrievelevel": 9, "solang": 9, "wartend": 9, "ausgef\u00fchrt": 9, "done": [9, 10], "timeouterror": 9, "aa": 9, "bb": 9, "relativ": 9, "dateigr\u00f6\u00df": 9, "dateiinhalt": 9, "ad": 9, "unterverzeichnissen": 9, "loadpixeldata": [9, 10], "bedarf": 9, "\u00f6ffnet": 9, "copydataset": [9, 10], "datasets": [9, 10], "atom": 9, "batch": 9, "removepixelcach": [9, 10], "releasepixeldata": [9, 10], "_sourcekei": [9, 10], "\u00e4nderungszeit": 9, "veraltet": 9, "erkennen": 9, "acquisitiond": 9, "contentd": 9, "studyd": 9, "z\u00e4hlen": 9, "_pixel_arrai": 9, "filechecksum": [9, 10], "hexdigest": 9, "basisverzeichni": 9, "_datasetinfo": [9, 10], "aufnehmen": 9, "pr\u00fcfend": 9, "verzeichnisnamen": 9, "ziffern": 9, "absolut": 9, "shardfilenam": [9, 10], "shardpath": [9, 10], "verifi": [9, 10], "fehlt": 9, "ver\u00e4ndert": 9, "maxbyt": [9, 10], "\u00fcbersteigt": 9, "getdataset": [9, 10], "elementen": 9, "\u00e4ndert": 9, "putpixel": [9, 10], "getcach": [9, 10], "discard": [9, 10], "getpixel": [9, 10], "ndarrai": 9, "z\u00e4hler": 9, "hit_ratio": 9, "haspixel": [9, 10], "putdataset": [9, 10], "maxsiz": [9, 10], "fsyncbatch": [9, 10], "tmp": 9, "leser": 9, "nie": 9, "halb": 9, "put": [9, 10], "geschriebenen": 9, "warteschlang": 9, "voller": 9, "aufrufenden": 9, "queu": 9, "_fsync": [9, 10], "window": 9, "_run": [9, 10], "eingereihten": 9, "_writebatch": [9, 10], "synchronisiert": 9, "benennt": 9, "datens\u00e4tzen": 9, "flush": [9, 10], "einreihen": 9, "ziel": 9, "konnt": 9, "memmap": 9, "lesbar": 9, "abgelegten": 9, "nachladen": 9, "pixelcachefilenam": [9, 10], "pixeldatadef": [9, 10], "freigeben": 9, "eingesetzt": 9, "dataelem": 9, "rawdatael": 9, "npynam": 9, "basic": 9, "formatt": 9, "addloggerhandl": [9, 10], "progressstart": 9, "progressreadi": 9, "decodemsgobj": [9, 10], "msgobj": 9, "basetopicreplac": 9, "mqttmessag": 9, "umzuwandelnd": 9, "_fulltop": 9, "teilen": 9, "aufgeteilt": 9, "_decodeerror": 9, "aufgetaucht": 9, "docmnd": [9, 10], "cmnd": 9, "domessag": [9, 10], "nachrichten": 9, "doprocess": [9, 10], "processnam": 9, "cwd": 9, "memory_rss": 9, "num_thread": 9, "dopublish": [9, 10], "publish": [9, 10], "qualiti": 9, "dosign": [9, 10], "weiterleiten": 9, "beliebig": 9, "dostatu": [9, 10], "emit": [9, 10], "record": 9, "actual": 9, "subclass": 9, "notimplementederror": 9, "org": 9, "librari": 9, "logrecord": 9, "auszugebend": 9, "nachricht": 9, "getloggerhandl": [9, 10], "loog": 9, "onconnect": [9, 10], "userdata": 9, "rc": 9, "erfolgreichem": 9, "ondisconnect": [9, 10], "onmessag": [9, 10], "incom": 9, "callback": 9, "privat": 9, "userdata_set": 9, "progress_readi": [9, 10], "bearbeitungsfortschritt": 9, "maxprogress": 9, "progress_run": [9, 10], "sendet": 9, "progress_start": [9, 10], "removeloggerhandl": [9, 10], "seperat": 9, "sendend": 9, "nachrichteninhalt": 9, "disconnect": 9, "startup": [9, 10], "onev": 9, "html5lib": 9, "automat": 9, "svg": 9, "graphic": 9, "long": 9, "cairo": 9, "cairograph": 9, "1120": 9, "790": 9, "53": 9, "1123": 9, "794": 9, "header_html": 9, "footer_html": 9, "render_pdf": [9, 10], "render_png": 9, "render_pdf_and_png": 9, "finish": [9, 10], "switch": 9, "onthefli": [9, 10], "wich": 9, "printdebugpag": [9, 10], "pdfgener": [9, 10], "autorend": 9, "With": 9, "possibl": 9, "nice": 9, "goe": 9, "though": 9, "sever": 9, "intermedi": 9, "here": 9, "we": 9, "deal": 9, "represent": 9, "henc": 9, "get_el": [9, 10], "For": 9, "readthedoc": 9, "hack": 9, "dive": 9, "structur": 9, "logic": 9, "reli": 9, "heavili": 9, "snippet": 9, "47": 9, "might": 9, "break": 9, "bit": 9, "discuss": 9, "kozea": 9, "92": 9, "_variabl": 9, "bodi": 9, "pad": 9, "5mm": 9, "head": 9, "body_html": 9, "pagecont": 9, "subpag": 9, "contentnam": 9, "addcont": 9, "pandas_table_id": 9, "sequenti": 9, "just": 9, "erg\u00e4nzen": 9, "schl\u00fcsselw\u00f6rtern": 9, "rendern": 9, "_getfilepath": [9, 10], "ext": 9, "ensur": 9, "presenc": 9, "_getpandasfield": [9, 10], "zusammenstellen": 9, "untersuchend": 9, "field_format": 9, "table_styl": 9, "_gettemplatefromfil": [9, 10], "_get_area_styl": [9, 10], "_get_attr": [9, 10], "attributen": 9, "_id": 9, "_class": 9, "_style": 9, "_html": [9, 10], "anf\u00fcgen": 9, "anzuf\u00fcgend": 9, "_page_overlai": [9, 10], "exchang": 9, "element_bodi": 9, "overlay_html": 9, "_text": [9, 10], "8pt": 9, "replacenewlin": 9, "textabsatz": 9, "br": 9, "einzuf\u00fcgend": 9, "ersetzten": 9, "newlin": 9, "element_html": 9, "addtemplatecont": [9, 10], "template_fil": 9, "pdf_data": 9, "about": 9, "given": 9, "repres": 9, "dom": 9, "wai": 9, "look": 9, "detail": 9, "insid": 9, "boxen": 9, "materi": 9, "design": 9, "mdi": 9, "outlin": 9, "x4": 9, "imagetyp": 9, "cursor": 9, "recht": 9, "xml": 9, "markdowntext": 9, "fontsiz": 9, "rendert": 9, "tex": 9, "tutori": 9, "anfangen": 9, "enden": 9, "newpag": [9, 10], "seitenumbruch": 9, "rendermod": 9, "render_mod": 9, "auszugebenden": 9, "align": 9, "pandasplot": [9, 10], "debugpag": 9, "therebi": 9, "summar": 9, "individu": 9, "were": 9, "hidden": 9, "h1": 9, "main_doc": 9, "gerendert": 9, "gerenderten": 9, "gerendertern": 9, "pdf_filenam": 9, "resulticon": [9, 10], "icononli": 9, "addclass": 9, "iba": 9, "unteren": 9, "eck": 9, "setcontentnam": [9, 10], "autonumb": 9, "seitenbereich": 9, "umzuschalten": 9, "zusammengeh\u00f6rigen": 9, "contentbereicht": 9, "set_class_default": [9, 10], "set_page_default": [9, 10], "einfachen": 9, "textfil": [9, 10], "_data": 9, "add_text": 9, "ersetztung": 9, "ladend": 9, "psutil": 9, "mqttclass": [9, 10], "mqtt_base": 9, "melden": 9, "meldung": 9, "prosess": 9, "17964": 9, "_msgid": 9, "6db09cdf": 9, "064324": 9, "lastwil": 9, "c2c88bb5": 9, "57b208": 9, "most": 9, "verbindungsunterbrechung": 9, "m\u00f6glicherweis": 9, "least": 9, "best\u00e4tigt": 9, "empf\u00e4nger": 9, "ankommen": 9, "exactli": 9, "ankommt": 9, "angewiesen": 9, "zwischenzuspeichern": 9, "abonnieren": 9, "bekommen": 9, "zwischengespeichert": 9, "zugestellt": 9, "hivemq": 9, "blog": 9, "paho": 9, "voranstellen": 9, "_progress": [9, 10], "signalisierung": 9, "\u00fcberschreibt": 9, "loglevel": 9, "abbonieren": 9, "subscrib": 9, "topicname1": 9, "topicname2": 9, "broker": 9, "determin": 9, "success": 9, "refus": 9, "incorrect": 9, "unavail": 9, "bad": 9, "authoris": 9, "255": 9, "eingehend": 9, "forev": 9, "loop_forev": 9, "loop_start": 9, "td": 9, "msdb": 9, "mssqlclass": 9, "konfigurationnam": 9, "getdbvers": [9, 10], "parameter": 9, "disabl": 9, "free": 9, "ping": [9, 10], "checkout": [9, 10], "recent": 9, "safe": 9, "statementstat": [9, 10], "configkei": [9, 10], "connectdatabas": [9, 10], "connectsqlit": [9, 10], "declar": 9, "avail": 9, "sqlite3": 9, "databaseengin": 9, "last": 9, "statementcaches": [9, 10], "own": 9, "overwritten": 9, "_cursor": [9, 10], "pend": 9, "_emptyresult": [9, 10], "_execut": [9, 10], "_fetch": [9, 10], "cur": 9, "_loaddatabaseconfig": [9, 10], "broken": 9, "repeat": 9, "taken": 9, "sqlqueri": 9, "fetchal": 9, "yield": 9, "doe": 9, "ask": 9, "getpool": [9, 10], "queryclass": 9, "batchsiz": 9, "until": 9, "exhaust": 9, "opendatabas": [9, 10], "sp_executesql": 9, "let": 9, "_connect": [9, 10], "join": 9, "_worker": 9, "would": 9, "overwrit": 9, "thei": 9, "togeth": 9, "monoton": 9, "lastus": [9, 10], "checkin": [9, 10], "clearstat": [9, 10], "aliv": 9, "minsiz": [9, 10], "checkaft": [9, 10], "_evict": [9, 10], "abov": 9, "acquir": 9, "_condit": 9, "_releas": [9, 10], "slot": 9, "closepool": [9, 10], "scan": 9, "wherein": [9, 10], "slicemod": 9, "whered": [9, 10], "combin": 9, "AND": 9, "tokenexpress": [9, 10], "express": 9, "whitespac": 9, "space": 9, "over": 9, "compar": 9, "whererang": [9, 10], "inclus": 9, "lower": 9, "exclus": 9, "upper": 9, "wheretoken": [9, 10], "substr": 9, "belong": 9, "exce": 9, "expir": 9, "defaultttl": [9, 10], "getttl": [9, 10], "collaps": 9, "exceed": 9, "sizeof": [9, 10], "bytecod": 9, "plotbereich": 9, "ioff": 9, "showplot": [9, 10], "begin": 9, "docstr": 9, "restdoc": 9, "further": 9, "post": 9, "argument": 9, "pageabl": 9, "help": 9, "current_app": 9, "feld1": 9, "feld2": 9, "aktiv": 9, "rapp": 9, "sa43": 9, "groupbi": [9, 10], "geraet": 9, "ersatz": 9, "24": 9, "_get_engin": [9, 10], "flat": 9, "_int_queri": [9, 10], "_ispcp": 9, "ispsafr": [9, 10], "undefin": [9, 10], "_int_groupbi": [9, 10], "order_bi": [9, 10], "_log_queri": [9, 10], "_int_add_meta": [9, 10], "wrapped_fn": 9, "jsonifi": 9, "_rql_cmp": [9, 10], "groupsplit": [9, 10], "avoid": 9, "diffrent": 9, "dialect": 9, "revis": 9, "expand": 9, "iso2d": [9, 10], "_as_dict": [9, 10], "getconnect": 9, "python_typ": [9, 10], "isodatetyp": [9, 10], "isodatetimetyp": [9, 10], "delimit": 9, "rql_pars": [9, 10], "__abstract__": 9, "sequenc": 9, "_columnsclauseargu": 9, "session": 9, "rqlquerymixin": 9, "construct": 9, "_queri": 9, "directli": 9, "q": 9, "some_sess": 9, "equival": 9, "with_sess": 9, "well": 9, "op": 9, "beetween": 9, "rql": 9, "_rql_where_claus": 9, "todat": 9, "strptime": 9, "try": 9, "convers": 9, "tri": 9, "2018": 9, "36": 9, "25": 9, "20180415": 9, "typedecor": 9, "8601": 9, "sent": 9, "constructor": 9, "impl": [9, 10], "assum": 9, "thu": 9, "unusu": 9, "those": 9, "entir": 9, "cache_ok": [9, 10], "indic": 9, "externaltyp": 9, "being": 9, "state": 9, "mytyp": 9, "def": 9, "choic": 9, "internal_onli": 9, "_static_cache_kei": 9, "__main__": 9, "extract": 9, "becom": 9, "becaus": 9, "cacheabl": 9, "hashabl": 9, "everi": 9, "To": 9, "accommod": 9, "datatyp": 9, "unhash": 9, "made": 9, "lookup": 9, "mai": 9, "sort": 9, "previous": 9, "lookuptyp": 9, "userdefinedtyp": 9, "get_col_spec": 9, "kw": 9, "varchar": 9, "bind_processor": 9, "work": 9, "abl": 9, "type_": 9, "stdin": 9, "sawarn": 9, "no_cach": 9, "did": 9, "wouldn": 9, "usabl": 9, "cannot": 9, "itself": 9, "aren": 9, "some_cach": 9, "traceback": 9, "themselv": 9, "_lookup": 9, "mixin": 9, "sql_cach": 9, "process_bind_param": [9, 10], "liter": 9, "anyth": 9, "desir": 9, "transform": 9, "serial": 9, "hook": 9, "upon": 9, "expect": 9, "types_typedecor": 9, "process_result_valu": 9, "known": 9, "enforc": 9, "across": 9, "board": 9, "common": 9, "dbapi": 9, "back": 9, "practic": 9, "safrsbas": 9, "rtype": 9, "_engin": 9, "_get_sess": [9, 10], "status_cod": 9, "dialog": 9, "ddetail": 9, "_int_get_empty_record": [9, 10], "leeren": 9, "werten": 9, "datenbankfeld": 9, "ober": 9, "generiert": 9, "defaultwert": 9, "empty_record": 9, "tablenam": 9, "field1": 9, "fieldx": 9, "fieldname1": 9, "label1": 9, "label2": 9, "_s_queri": 9, "group_ent": 9, "_int_groupby_queri": [9, 10], "fieldnamex": 9, "_int_init": [9, 10], "_resultupd": 9, "_configoverlai": 9, "ispsafrs_decor": [9, 10], "formatiertem": 9, "safrsformattedrespons": 9, "_int_parse_arg": [9, 10], "swagger_path": 9, "pars": 9, "_swagger_path": 9, "has_arg": 9, "requestpars": 9, "flask_restplu": 9, "parser": 9, "pagin": 9, "bisherig": 9, "flach": 9, "_asdict": 9, "add_column": 9, "_int_rqlfilt": [9, 10], "querystr": 9, "_int_search": [9, 10], "_s_column_by_nam": [9, 10], "access_cl": [9, 10], "appdialog": [9, 10], "myclassnam": 9, "custom_decor": [9, 10], "exclude_attr": [9, 10], "exclude_rel": [9, 10], "whenev": 9, "jsonapi_filt": 9, "filterangab": 9, "ausgewerten": 9, "letter": 9, "_s_filter": 9, "val": 9, "dbtest": 9, "lgruppea": 9, "lgruppeb": 9, "haschildren": 9, "gruppierungsfeld": 9, "getrennt": 9, "feldnamen": 9, "orderedmap": 9, "fieldnam": 9, "WITH": 9, "AS": 9, "altern": 9, "categori": 9, "1234444": 9, "wofuer": 9, "union": 9, "instr": 9, "BY": 9, "ispsafrs_id": 9, "datenbankanbindung": 9, "expose_object": [9, 10], "_s_type": 9, "__name__": 9, "_api": 9, "_s_collection_nam": 9, "__tablename__": 9, "expose_method": 9, "url_prefix": [9, 10], "parse_object_doc": 9, "objectid": 9, "_s_get_jsonapi_rpc_method": [9, 10], "dummi": 9, "_s_jsonapi_attr": [9, 10], "expos": 9, "_s_relationship": [9, 10], "jsonapi": 9, "_s_sample_dict": [9, 10], "sampl": 9, "_s_sample_id": [9, 10], "_s_url": [9, 10], "endpoint": 9, "class_": [9, 10], "http_method": [9, 10], "ispsafrsdummy_id": 9, "no_flask_admin": [9, 10], "fn": 9, "decor": 9, "safrsrestapi": 9, "systeminform": 9, "show_latest": 9, "h\u00f6chste": 9, "system_id": 9, "zahl": 9, "typenlo": 9, "typenlos": 9, "flask_socket": 9, "flaskw": 9, "flask_socketio": 9, "j": 9, "implementieren": 9, "socketio": 9, "flask_sock": 9, "ws4py": 9, "websocketclass": [9, 10], "exploer": 9, "vue": 9, "add_extens": 9, "safrs_object": 9, "datanbankanbindung": 9, "__qualname__": 9, "__http_method": 9, "__rest_doc": 9, "form": 9, "api_decor": 9, "class_api": 9, "safrsobject": 9, "collectionnam": 9, "m\u00f6glichkeiten": 9, "safsbas": 9, "fsbase": 9, "rest": 9, "webconfig": 9, "apiconfig": 9, "_urlcontentparamskei": [9, 10], "querykei": 9, "jsonstr": 9, "response_head": [9, 10], "safrsapi": 9, "apiurl": [9, 10], "bereitzustellen": 9, "_checknetarea": [9, 10], "subnetwork": 9, "_create_api": [9, 10], "create_api": 9, "addrout": [9, 10], "\u00fcberschreibbar": 9, "routen": 9, "einzubinden": 9, "test_rout": 9, "testrout": 9, "createdoc": [9, 10], "docs_path": 9, "erneuern": 9, "parserequestparam": [9, 10], "queryparam": 9, "routerend": [9, 10], "routeapi": [9, 10], "spec": 9, "routecoverag": [9, 10], "htmlcov": 9, "angepasst": 9, "fuktioniert": 9, "ruckgab": 9, "send_fil": 9, "routedoc": [9, 10], "ifram": 9, "src": 9, "routefil": [9, 10], "routeifram": [9, 10], "apifram": 9, "dbadminfram": 9, "div": 9, "routeindex": [9, 10], "umgeleitet": 9, "is_vu": 9, "template_fold": 9, "changelog": 10, "05": 10, "2023": 10, "04": 10, "2022": 10, "16": 10, "28": 10, "2021": 10, "01": 10, "2026": 10, "06": 10, "27": 10, "29": 10, "qo": 10, "retain": 10, "09": 10, "yaml": 10, "definit": 10, "08": 10, "hauptmodul": 11, "ger\u00e4teqa": 11}, "objects": {"": [[0, 0, 0, "-", "app"], [9, 0, 0, "-", "isp"], [11, 0, 0, "-", "pygqa"], [12, 0, 0, "-", "version"]], "app": [[0, 0, 0, "-", "api"], [0, 0, 0, "-", "aria"], [0, 0, 0, "-", "ariadicom"], [0, 0, 0, "-", "ariamirror"], [0, 0, 0, "-", "base"], [0, 0, 0, "-", "check"], [0, 0, 0, "-", "config"], [0, 0, 0, "-", "db"], [0, 4, 1, "", "exportPandas"], [0, 0, 0, "-", "image"], [0, 4, 1, "", "importPandas"], [0, 4, 1, "", "migrateDicomArchive"], [1, 0, 0, "-", "qa"], [0, 0, 0, "-", "results"], [0, 4, 1, "", "run"], [0, 1, 1, "", "system"], [0, 0, 0, "-", "tagindex"]], "app.api": [[0, 1, 1, "", "gqa"]], "app.api.gqa": [[0, 2, 1, "", "api_get"], [0, 2, 1, "", "api_list"], [0, 3, 1, "", "ariaDicom"], [0, 3, 1, "", "config"], [0, 2, 1, "", "configs"], [0, 2, 1, "", "export"], [0, 3, 1, "", "id_type"], [0, 2, 1, "", "info"], [0, 2, 1, "", "init"], [0, 2, 1, "", "matrix"], [0, 2, 1, "", "pdf"], [0, 2, 1, "", "run"], [0, 2, 1, "", "tagging"], [0, 2, 1, "", "test_result"], [0, 2, 1, "", "units"], [0, 2, 1, "", "years"]], "app.aria": [[0, 1, 1, "", "ariaClass"]], "app.aria.ariaClass": [[0, 2, 1, "", "executeParallel"], [0, 2, 1, "", "getImageInfos"], [0, 2, 1, "", "getImageInfosFrame"], [0, 2, 1, "", "getImages"], [0, 2, 1, "", "getMirror"], [0, 2, 1, "", "getParallel"], [0, 2, 1, "", "getTags"], [0, 2, 1, "", "getTestData"], [0, 2, 1, "", "getTestMap"], [0, 3, 1, "", "resultCacheTTL"], [0, 3, 1, "", "usePool"]], "app.ariadicom": [[0, 1, 1, "", "ariaDicomClass"]], "app.ariadicom.ariaDicomClass": [[0, 3, 1, "", "config"], [0, 3, 1, "", "dicomfiles"], [0, 2, 1, "", "doTestType"], [0, 2, 1, "", "getAllGQA"], [0, 2, 1, "", "getMatrix"], [0, 2, 1, "", "getRunData"], [0, 2, 1, "", "getTagging"], [0, 3, 1, "", "infoFields"], [0, 2, 1, "", "initResultsPath"], [0, 3, 1, "", "lastSQL"], [0, 3, 1, "", "pd_results"], [0, 2, 1, "", "prefetchTestImages"], [0, 2, 1, "", "prepareGQA"], [0, 2, 1, "", "prepare_tolerance"], [0, 3, 1, "", "resultfile"], [0, 2, 1, "", "retrieveTestImages"], [0, 2, 1, "", "runTests"], [0, 3, 1, "", "variables"]], "app.ariamirror": [[0, 1, 1, "", "ariaMirror"], [0, 1, 1, "", "ariaMirrorQuery"], [0, 4, 1, "", "mirrorColumn"]], "app.ariamirror.ariaMirror": [[0, 2, 1, "", "_patientLock"], [0, 2, 1, "", "_syncPatient"], [0, 2, 1, "", "_value"], [0, 3, 1, "", "aria"], [0, 3, 1, "", "columns"], [0, 2, 1, "", "connect"], [0, 3, 1, "", "dateColumns"], [0, 2, 1, "", "execute"], [0, 3, 1, "", "filename"], [0, 2, 1, "", "fromConfig"], [0, 2, 1, "", "getStats"], [0, 3, 1, "", "maxAge"], [0, 3, 1, "", "overlap"], [0, 2, 1, "", "query"], [0, 2, 1, "", "sync"]], "app.ariamirror.ariaMirrorQuery": [[0, 2, 1, "", "select"], [0, 2, 1, "", "where"]], "app.base": [[0, 1, 1, "", "ispBase"]], "app.base.ispBase": [[0, 2, 1, "", "__del__"], [0, 3, 1, "", "_config"], [0, 2, 1, "", "checkFields"], [0, 2, 1, "", "check_acceptance"], [0, 2, 1, "", "check_acceptance_ext"], [0, 2, 1, "", "check_tolerance"], [0, 2, 1, "", "check_tolerance_ext"], [0, 2, 1, "", "createResult"], [0, 3, 1, "", "dicomData"], [0, 2, 1, "", "evaluationCalculate"], [0, 2, 1, "", "evaluationPrepare"], [0, 2, 1, "", "evaluationResult"], [0, 3, 1, "", "fileCount"], [0, 2, 1, "", "getFullData"], [0, 2, 1, "", "getIcon"], [0, 2, 1, "", "getImageStack"], [0, 2, 1, "", "getMetaErrorString"], [0, 3, 1, "", "icons"], [0, 3, 1, "", "imageCache"], [0, 3, 1, "", "metadata"], [0, 3, 1, "", "pdf"], [0, 2, 1, "", "pdf_error_result"]], "app.check": [[0, 1, 1, "", "ispCheckClass"]], "app.check.ispCheckClass": [[0, 3, 1, "", "baseField"], [0, 3, 1, "", "baseImage"], [0, 2, 1, "", "baseReciprocal"], [0, 3, 1, "", "cache"], [0, 3, 1, "", "checkField"], [0, 2, 1, "", "getImage"], [0, 2, 1, "", "getMeanDose"], [0, 3, 1, "", "image"], [0, 3, 1, "", "infos"], [0, 2, 1, "", "normalize"]], "app.config": [[0, 1, 1, "", "gqa_config"]], "app.config.gqa_config": [[0, 3, 1, "", "_basedir"], [0, 3, 1, "", "configs"], [0, 2, 1, "", "matrix"], [0, 2, 1, "", "read"]], "app.db": [[0, 1, 1, "", "gqadb"]], "app.db.gqadb": [[0, 3, 1, "", "acceptance"], [0, 3, 1, "", "data"], [0, 3, 1, "", "date"], [0, 3, 1, "", "energy"], [0, 2, 1, "", "getYearQueryString"], [0, 3, 1, "", "group"], [0, 3, 1, "", "id"], [0, 3, 1, "", "metadata"], [0, 3, 1, "", "month"], [0, 3, 1, "", "test"], [0, 3, 1, "", "unit"], [0, 2, 1, "", "update_values"], [0, 2, 1, "", "upsert"], [0, 3, 1, "", "year"], [0, 2, 1, "", "years"]], "app.image": [[0, 1, 1, "", "DicomImage"], [0, 1, 1, "", "DicomImageStack"], [0, 1, 1, "", "plotImage"]], "app.image.DicomImage": [[0, 2, 1, "", "_cumsum2d"], [0, 3, 1, "", "arrayOriginal"], [0, 2, 1, "", "cachePixels"], [0, 3, 1, "id0", "computeDtype"], [0, 2, 1, "", "cropField"], [0, 3, 1, "id1", "datasetCache"], [0, 2, 1, "", "doRescaleSlope"], [0, 3, 1, "", "geometry"], [0, 2, 1, "", "getDotsStat"], [0, 2, 1, "", "getFieldDots"], [0, 2, 1, "", "getFieldRoi"], [0, 2, 1, "", "getFieldSize"], [0, 2, 1, "", "getLine"], [0, 2, 1, "", "getRoi"], [0, 2, 1, "", "getRoiStat"], [0, 3, 1, "", "infoFields"], [0, 3, 1, "", "infos"], [0, 2, 1, "", "initMemoryDicom"], [0, 2, 1, "", "integralImage"], [0, 3, 1, "id2", "integralMinRois"], [0, 2, 1, "", "integralReset"], [0, 3, 1, "", "isRescaled"], [0, 3, 1, "id3", "pixelCache"], [0, 2, 1, "", "plotImage"], [0, 2, 1, "", "savePixelCache"]], "app.image.DicomImageStack": [[0, 2, 1, "", "_cumsum3d"], [0, 2, 1, "", "_integralStat"], [0, 3, 1, "", "array"], [0, 3, 1, "", "images"], [0, 3, 1, "", "index"], [0, 2, 1, "", "integralImage"], [0, 2, 1, "", "roiStats"], [0, 3, 1, "", "stats"]], "app.image.plotImage": [[0, 3, 1, "", "_plotPosition"], [0, 3, 1, "", "ax"], [0, 2, 1, "", "axLimit"], [0, 2, 1, "", "axTicks"], [0, 2, 1, "", "dots2mm"], [0, 2, 1, "", "dots2mm_X"], [0, 2, 1, "", "dots2mm_Y"], [0, 3, 1, "", "fig"], [0, 2, 1, "", "mm2dots"], [0, 2, 1, "", "mm2dots_X"], [0, 2, 1, "", "mm2dots_Y"], [0, 2, 1, "", "orientedArray"], [0, 2, 1, "", "orientedCax"], [0, 2, 1, "", "viewRotation"]], "app.qa": [[1, 0, 0, "-", "field"], [1, 0, 0, "-", "mlc"], [1, 0, 0, "-", "vmat"], [1, 0, 0, "-", "wl"]], "app.qa.field": [[1, 1, 1, "", "checkField"], [1, 1, 1, "", "qa_field"]], "app.qa.field.checkField": [[1, 2, 1, "", "_doField_one2n"], [1, 2, 1, "", "doJT_10_3"], [1, 2, 1, "", "doJT_4_1_3"], [1, 2, 1, "", "doJT_7_2"], [1, 2, 1, "", "doJT_7_3"], [1, 2, 1, "", "doJT_7_4"], [1, 2, 1, "", "doJT_7_5"], [1, 2, 1, "", "doJT_7_5_pre2020"], [1, 2, 1, "", "doJT_9_1_2"], [1, 2, 1, "", "doJT_end2end"], [1, 2, 1, "", "doMT_4_1_2"], [1, 2, 1, "", "doMT_8_02_5"], [1, 2, 1, "", "doMT_VMAT_0_1"]], "app.qa.field.qa_field": [[1, 2, 1, "", "_plot_field_edges"], [1, 2, 1, "", "_plot_profile"], [1, 2, 1, "", "find4Qdata"], [1, 2, 1, "", "plot4Qprofile"], [1, 2, 1, "", "plotProfile"]], "app.qa.mlc": [[1, 1, 1, "", "checkMlc"], [1, 1, 1, "", "qa_mlc"], [1, 4, 1, "", "transmissionsToPlot"]], "app.qa.mlc.checkMlc": [[1, 2, 1, "", "_doLamellenpositioniergenauigkeit"], [1, 2, 1, "", "_doMLC_VMAT"], [1, 2, 1, "", "doJT_10_3_1"], [1, 2, 1, "", "doJT_4_2_2_1_A"], [1, 2, 1, "", "doJT_4_2_2_1_B"], [1, 2, 1, "", "doJT_4_2_2_1_C"], [1, 2, 1, "", "doJT_LeafSpeed"], [1, 2, 1, "", "doMT_8_02_1_2"], [1, 2, 1, "", "doMT_8_02_3"], [1, 2, 1, "", "doMT_8_02_4"], [1, 2, 1, "", "doMT_LeafSpeed"], [1, 2, 1, "", "doMT_VMAT_0_2"], [1, 2, 1, "", "doMT_VMAT_1_1"], [1, 2, 1, "", "doMT_VMAT_1_2"]], "app.qa.mlc.qa_mlc": [[1, 2, 1, "", "FWHM_findLeafs"], [1, 2, 1, "", "FWHM_plot_error"], [1, 2, 1, "", "FWHM_plot_errorBox"], [1, 2, 1, "", "_add_leaf_error_subplot"], [1, 5, 1, "", "abs_mean_error"], [1, 3, 1, "", "baseField"], [1, 3, 1, "", "cache"], [1, 3, 1, "", "checkField"], [1, 3, 1, "id0", "data"], [1, 2, 1, "", "findTransmissions"], [1, 2, 1, "", "getLeafCenterPositions"], [1, 2, 1, "", "isoTransmissions"], [1, 3, 1, "", "kennung"], [1, 3, 1, "", "leaf_from"], [1, 3, 1, "", "normalize"], [1, 2, 1, "", "picketfence_plotImage"], [1, 2, 1, "", "picketfence_results"], [1, 3, 1, "", "plotTitle"], [1, 2, 1, "", "plotTransmission"], [1, 3, 1, "", "position"], [1, 3, 1, "", "positions"], [1, 3, 1, "", "setting"], [1, 3, 1, "id1", "size"]], "app.qa.vmat": [[1, 1, 1, "", "checkVMAT"], [1, 1, 1, "", "qa_segment"], [1, 1, 1, "", "qa_vmat"]], "app.qa.vmat.checkVMAT": [[1, 2, 1, "", "doMT_VMAT"], [1, 2, 1, "", "doMT_VMAT_2"], [1, 2, 1, "", "doMT_VMAT_3"]], "app.qa.vmat.qa_segment": [[1, 5, 1, "", "r_corr"]], "app.qa.vmat.qa_vmat": [[1, 2, 1, "", "_construct_segments"], [1, 3, 1, "", "analysed"], [1, 3, 1, "", "debug"], [1, 2, 1, "", "draw_segments"], [1, 2, 1, "", "getResults"], [1, 3, 1, "", "metadata"], [1, 2, 1, "", "plotChart"]], "app.qa.wl": [[1, 1, 1, "", "checkWL"], [1, 1, 1, "", "qa_wl"]], "app.qa.wl.checkWL": [[1, 2, 1, "", "doMT_WL"]], "app.qa.wl.qa_wl": [[1, 2, 1, "", "_axisChart"], [1, 2, 1, "", "_axisImage"], [1, 2, 1, "", "_findArrayIsoCalCenter"], [1, 2, 1, "", "_findIsoCalCenter"], [1, 2, 1, "", "_getThresholdMask"], [1, 2, 1, "", "_mergeArray"], [1, 3, 1, "", "centers"], [1, 3, 1, "", "colFields"], [1, 3, 1, "", "data"], [1, 3, 1, "", "debug"], [1, 3, 1, "", "fields"], [1, 2, 1, "", "findCenterBall"], [1, 2, 1, "", "findColliCenter"], [1, 3, 1, "", "mergeArray"], [1, 2, 1, "", "plotChart"], [1, 2, 1, "", "plotMergeImage"], [1, 3, 1, "", "roi"], [1, 3, 1, "", "virtualCenter"], [1, 3, 1, "", "virtualCenterDots"]], "app.results": [[0, 1, 1, "", "ispResults"]], "app.results.ispResults": [[0, 3, 1, "", "bind"], [0, 3, 1, "", "columns"], [0, 3, 1, "", "config"], [0, 3, 1, "", "errors"], [0, 2, 1, "", "exportYear"], [0, 3, 1, "", "filename"], [0, 2, 1, "", "getYearData"], [0, 2, 1, "", "getYears"], [0, 3, 1, "", "gqa"], [0, 3, 1, "", "gqadb"], [0, 3, 1, "", "index"], [0, 2, 1, "", "read"], [0, 2, 1, "", "to_db"], [0, 2, 1, "", "upsert"], [0, 3, 1, "", "useDB"], [0, 3, 1, "", "useFile"], [0, 2, 1, "", "write"]], "app.system": [[0, 2, 1, "", "_extendedSystemCheck"]], "app.tagindex": [[0, 1, 1, "", "gqaTagIndex"], [0, 1, 1, "", "gqaTestMap"]], "app.tagindex.gqaTagIndex": [[0, 3, 1, "", "columns"], [0, 2, 1, "", "counts"], [0, 3, 1, "", "frame"], [0, 2, 1, "", "inactiv"], [0, 5, 1, "", "index"], [0, 2, 1, "", "periods"], [0, 2, 1, "", "sliceUIDs"], [0, 2, 1, "", "tagNotFound"], [0, 3, 1, "", "testMap"], [0, 2, 1, "", "testNotFound"]], "app.tagindex.gqaTestMap": [[0, 3, 1, "", "energyFields"], [0, 3, 1, "", "inaktiv"], [0, 3, 1, "", "tagTests"], [0, 2, 1, "", "testId"], [0, 3, 1, "", "testTags"]], "isp": [[9, 0, 0, "-", "config"], [9, 0, 0, "-", "dicom"], [9, 0, 0, "-", "dicomarchive"], [9, 0, 0, "-", "logging"], [9, 0, 0, "-", "mpdf"], [9, 0, 0, "-", "mqtt"], [9, 0, 0, "-", "mssql"], [9, 0, 0, "-", "plot"], [9, 0, 0, "-", "safrs"], [9, 0, 0, "-", "socket"], [9, 0, 0, "-", "webapp"]], "isp.config": [[9, 4, 1, "", "dict_merge"], [9, 1, 1, "", "ispConfig"]], "isp.config.ispConfig": [[9, 2, 1, "", "__getattr__"], [9, 2, 1, "", "__getitem__"], [9, 2, 1, "", "__repr__"], [9, 2, 1, "", "__setattr__"], [9, 2, 1, "", "__setitem__"], [9, 3, 1, "", "_basedir"], [9, 3, 1, "", "_config"], [9, 2, 1, "", "_configLoad"], [9, 3, 1, "", "_configs"], [9, 3, 1, "", "_development"], [9, 3, 1, "", "_handler"], [9, 3, 1, "", "_isplevel"], [9, 3, 1, "", "_lastOverlay"], [9, 3, 1, "", "_loadErrors"], [9, 3, 1, "", "_name"], [9, 3, 1, "", "_rootlevel"], [9, 2, 1, "", "get"], [9, 2, 1, "", "jinjaEnv"], [9, 2, 1, "", "merge"], [9, 2, 1, "", "mqttCleanup"], [9, 2, 1, "", "mqttGetHandler"], [9, 2, 1, "", "mqttInitLoggerHandler"], [9, 2, 1, "", "render_template"], [9, 2, 1, "", "rootInitLogger"], [9, 2, 1, "", "set"], [9, 2, 1, "", "setVariables"], [9, 2, 1, "", "update"]], "isp.dicom": [[9, 1, 1, "", "ispDicom"], [9, 1, 1, "", "ispDicomRequest"]], "isp.dicom.ispDicom": [[9, 2, 1, "", "IMAGE"], [9, 2, 1, "", "PATIENT"], [9, 2, 1, "", "SERIES"], [9, 2, 1, "", "STUDY"], [9, 2, 1, "", "__del__"], [9, 2, 1, "", "_associate"], [9, 2, 1, "", "_getRetrievePool"], [9, 2, 1, "", "_idleCheck"], [9, 2, 1, "", "_isTransient"], [9, 2, 1, "", "_newAssociation"], [9, 2, 1, "", "_replaceAssociation"], [9, 2, 1, "", "_retrieve"], [9, 2, 1, "", "_runRequest"], [9, 2, 1, "", "_runRetrieve"], [9, 2, 1, "", "_scheduleRetrieve"], [9, 2, 1, "", "_sendRequest"], [9, 2, 1, "", "_sendRetrieve"], [9, 2, 1, "", "_touch"], [9, 3, 1, "", "ae"], [9, 2, 1, "", "archive_deleteSOPInstanceUID"], [9, 2, 1, "", "archive_hasSOPInstanceUID"], [9, 2, 1, "", "archive_loadSOPInstanceUID"], [9, 3, 1, "", "assoc"], [9, 3, 1, "", "associationStats"], [9, 2, 1, "", "closeAE"], [9, 3, 1, "", "datasetCache"], [9, 3, 1, "", "dicomPath"], [9, 2, 1, "", "echo"], [9, 2, 1, "", "getInfo"], [9, 2, 1, "", "handle_EVENT"], [9, 2, 1, "", "handle_STORE"], [9, 3, 1, "", "idleTimeout"], [9, 2, 1, "", "initAE"], [9, 3, 1, "", "messageId"], [9, 2, 1, "", "openAssociation"], [9, 3, 1, "", "override"], [9, 3, 1, "", "parallel"], [9, 2, 1, "", "query"], [9, 3, 1, "", "retries"], [9, 2, 1, "", "retrieve"], [9, 2, 1, "", "retrieveAsync"], [9, 2, 1, "", "retrieveMany"], [9, 3, 1, "", "retrieveTimeout"], [9, 3, 1, "id0", "retrieveWorkers"], [9, 3, 1, "", "retryBackoff"], [9, 3, 1, "", "scp"], [9, 3, 1, "", "server"]], "isp.dicom.ispDicomRequest": [[9, 2, 1, "", "cancel"], [9, 2, 1, "", "cancelled"], [9, 2, 1, "", "done"], [9, 3, 1, "", "future"], [9, 3, 1, "", "instances"], [9, 3, 1, "", "params"], [9, 2, 1, "", "result"], [9, 3, 1, "", "signals"], [9, 3, 1, "", "status"], [9, 3, 1, "", "timeout"]], "isp.dicomarchive": [[9, 4, 1, "", "_sourceKey"], [9, 4, 1, "", "acquisitionYear"], [9, 4, 1, "", "copyDataset"], [9, 4, 1, "", "datasetSize"], [9, 4, 1, "", "fileChecksum"], [9, 1, 1, "", "ispDicomArchive"], [9, 1, 1, "", "ispDicomDatasetCache"], [9, 1, 1, "", "ispDicomWriter"], [9, 4, 1, "", "loadPixelCache"], [9, 4, 1, "", "loadPixelData"], [9, 4, 1, "", "pixelCacheFilename"], [9, 4, 1, "", "pixelDataDeferred"], [9, 4, 1, "", "readDataset"], [9, 4, 1, "", "releasePixelData"], [9, 4, 1, "", "removePixelCache"], [9, 4, 1, "", "savePixelCache"]], "isp.dicomarchive.ispDicomArchive": [[9, 2, 1, "", "_datasetInfo"], [9, 2, 1, "", "add"], [9, 2, 1, "", "cached"], [9, 2, 1, "", "close"], [9, 3, 1, "", "columns"], [9, 3, 1, "", "dicomPath"], [9, 3, 1, "", "filename"], [9, 2, 1, "", "get"], [9, 2, 1, "", "getStats"], [9, 2, 1, "", "migrate"], [9, 2, 1, "", "path"], [9, 2, 1, "", "remove"], [9, 2, 1, "", "shardFilename"], [9, 2, 1, "", "shardPath"], [9, 2, 1, "", "verify"]], "isp.dicomarchive.ispDicomDatasetCache": [[9, 2, 1, "", "discard"], [9, 2, 1, "", "getCache"], [9, 2, 1, "", "getDataset"], [9, 2, 1, "", "getPixels"], [9, 2, 1, "", "getStats"], [9, 2, 1, "", "hasPixels"], [9, 2, 1, "", "invalidate"], [9, 2, 1, "", "invalidateCaches"], [9, 3, 1, "", "maxBytes"], [9, 3, 1, "", "name"], [9, 2, 1, "", "putDataset"], [9, 2, 1, "", "putPixels"], [9, 3, 1, "", "stats"]], "isp.dicomarchive.ispDicomWriter": [[9, 2, 1, "", "_fsync"], [9, 2, 1, "", "_run"], [9, 2, 1, "", "_writeBatch"], [9, 3, 1, "", "archive"], [9, 2, 1, "", "flush"], [9, 3, 1, "", "fsyncBatch"], [9, 3, 1, "", "idleTimeout"], [9, 3, 1, "", "maxsize"], [9, 2, 1, "", "put"], [9, 3, 1, "", "stats"]], "isp.logging": [[9, 1, 1, "", "loggingHandlerClass"]], "isp.logging.loggingHandlerClass": [[9, 2, 1, "", "addLoggerHandler"], [9, 2, 1, "", "decodeMsgObj"], [9, 2, 1, "", "doCmnd"], [9, 2, 1, "", "doMessage"], [9, 2, 1, "", "doProcess"], [9, 2, 1, "", "doPublish"], [9, 2, 1, "", "doSignal"], [9, 2, 1, "", "doStatus"], [9, 2, 1, "", "emit"], [9, 2, 1, "", "error"], [9, 2, 1, "", "getLoggerHandler"], [9, 2, 1, "", "info"], [9, 3, 1, "", "level"], [9, 2, 1, "", "onConnect"], [9, 2, 1, "", "onDisconnect"], [9, 2, 1, "", "onMessage"], [9, 2, 1, "", "progress_ready"], [9, 2, 1, "", "progress_run"], [9, 2, 1, "", "progress_start"], [9, 2, 1, "", "publish"], [9, 2, 1, "", "removeLoggerHandler"], [9, 2, 1, "", "send"], [9, 2, 1, "", "shutdown"], [9, 2, 1, "", "startup"], [9, 2, 1, "", "warning"]], "isp.mpdf": [[9, 1, 1, "", "PdfGenerator"]], "isp.mpdf.PdfGenerator": [[9, 2, 1, "", "_getFilePath"], [9, 2, 1, "", "_getPandasFields"], [9, 2, 1, "", "_getTemplateFromFile"], [9, 2, 1, "", "_get_area_style"], [9, 2, 1, "", "_get_attrs"], [9, 2, 1, "", "_html"], [9, 2, 1, "", "_page_overlays"], [9, 2, 1, "", "_text"], [9, 2, 1, "", "addTemplateContent"], [9, 2, 1, "", "finish"], [9, 2, 1, "", "get_element"], [9, 2, 1, "", "html"], [9, 2, 1, "", "icon"], [9, 2, 1, "", "image"], [9, 2, 1, "", "markdown"], [9, 2, 1, "", "mathtext"], [9, 2, 1, "", "newPage"], [9, 2, 1, "", "onTheFly"], [9, 2, 1, "", "pandas"], [9, 2, 1, "", "pandasPlot"], [9, 2, 1, "", "printDebugPage"], [9, 2, 1, "", "render"], [9, 2, 1, "", "render_pdf"], [9, 2, 1, "", "resultIcon"], [9, 2, 1, "", "setContentName"], [9, 2, 1, "", "set_class_defaults"], [9, 2, 1, "", "set_page_defaults"], [9, 2, 1, "", "text"], [9, 2, 1, "", "textFile"]], "isp.mqtt": [[9, 1, 1, "", "MQTTclass"]], "isp.mqtt.MQTTclass": [[9, 3, 1, "", "_handler"], [9, 3, 1, "", "_progress"], [9, 3, 1, "", "defaults"], [9, 2, 1, "", "doPublish"], [9, 3, 1, "", "logger"], [9, 3, 1, "", "logging"], [9, 2, 1, "", "onConnect"], [9, 2, 1, "", "onMessage"], [9, 3, 1, "", "password"], [9, 3, 1, "", "port"], [9, 3, 1, "", "server"], [9, 2, 1, "", "shutdown"], [9, 3, 1, "", "signal"], [9, 2, 1, "", "startup"], [9, 3, 1, "", "username"]], "isp.mssql": [[9, 4, 1, "", "configKey"], [9, 4, 1, "", "connectDatabase"], [9, 4, 1, "", "connectSqlite"], [9, 1, 1, "", "ispMssql"], [9, 1, 1, "", "ispMssqlConnection"], [9, 1, 1, "", "ispMssqlPool"], [9, 1, 1, "", "ispMssqlQuery"], [9, 1, 1, "", "ispMssqlResultCache"]], "isp.mssql.ispMssql": [[9, 2, 1, "", "_cursor"], [9, 2, 1, "", "_emptyResult"], [9, 2, 1, "", "_execute"], [9, 2, 1, "", "_fetch"], [9, 2, 1, "", "_loadDatabaseConfig"], [9, 2, 1, "", "close"], [9, 3, 1, "", "config"], [9, 3, 1, "", "connect"], [9, 3, 1, "", "dbname"], [9, 3, 1, "", "engine"], [9, 2, 1, "", "execute"], [9, 2, 1, "", "getDbVersion"], [9, 2, 1, "", "getPool"], [9, 2, 1, "", "getResultCache"], [9, 2, 1, "", "getStatementStats"], [9, 2, 1, "", "invalidateCache"], [9, 2, 1, "", "iterate"], [9, 3, 1, "", "lastExecuteParams"], [9, 3, 1, "", "lastExecuteSql"], [9, 3, 1, "", "name"], [9, 2, 1, "", "openDatabase"], [9, 2, 1, "", "prepare"], [9, 2, 1, "", "query"], [9, 3, 1, "id41", "resultCacheTTL"], [9, 2, 1, "", "setLastExecute"], [9, 3, 1, "", "statementCacheSize"], [9, 3, 1, "", "statementStats"], [9, 3, 1, "id42", "usePool"]], "isp.mssql.ispMssqlConnection": [[9, 2, 1, "", "clearStatements"], [9, 2, 1, "", "close"], [9, 3, 1, "", "connect"], [9, 3, 1, "", "created"], [9, 3, 1, "", "engine"], [9, 3, 1, "", "lastUsed"], [9, 2, 1, "", "ping"], [9, 3, 1, "", "statements"]], "isp.mssql.ispMssqlPool": [[9, 2, 1, "", "_connect"], [9, 2, 1, "", "_evict"], [9, 2, 1, "", "_release"], [9, 3, 1, "", "checkAfter"], [9, 2, 1, "", "checkin"], [9, 2, 1, "", "checkout"], [9, 2, 1, "", "close"], [9, 2, 1, "", "closePools"], [9, 2, 1, "", "getPool"], [9, 2, 1, "", "getStats"], [9, 3, 1, "", "idleTimeout"], [9, 3, 1, "", "maxSize"], [9, 3, 1, "", "minSize"], [9, 3, 1, "", "name"], [9, 3, 1, "", "stats"], [9, 3, 1, "", "timeout"]], "isp.mssql.ispMssqlQuery": [[9, 2, 1, "", "build"], [9, 3, 1, "", "columns"], [9, 3, 1, "", "conditions"], [9, 3, 1, "", "engine"], [9, 3, 1, "", "fromSql"], [9, 3, 1, "", "params"], [9, 2, 1, "", "select"], [9, 2, 1, "", "tokenExpression"], [9, 2, 1, "", "where"], [9, 2, 1, "", "whereDate"], [9, 2, 1, "", "whereIn"], [9, 2, 1, "", "whereRange"], [9, 2, 1, "", "whereTokens"]], "isp.mssql.ispMssqlResultCache": [[9, 2, 1, "", "convert"], [9, 3, 1, "", "defaultTTL"], [9, 2, 1, "", "discard"], [9, 2, 1, "", "get"], [9, 2, 1, "", "getCache"], [9, 2, 1, "", "getStats"], [9, 2, 1, "", "getTTL"], [9, 2, 1, "", "invalidate"], [9, 2, 1, "", "invalidateCaches"], [9, 2, 1, "", "key"], [9, 3, 1, "", "maxBytes"], [9, 3, 1, "", "name"], [9, 2, 1, "", "put"], [9, 2, 1, "", "sizeOf"], [9, 3, 1, "", "stats"], [9, 3, 1, "", "ttl"]], "isp.plot": [[9, 1, 1, "", "plotClass"]], "isp.plot.plotClass": [[9, 3, 1, "", "_plotPosition"], [9, 3, 1, "", "ax"], [9, 3, 1, "", "fig"], [9, 2, 1, "", "getPlot"], [9, 2, 1, "", "initPlot"], [9, 2, 1, "", "showPlot"]], "isp.safrs": [[9, 1, 1, "", "RQLQuery"], [9, 4, 1, "", "iso2date"], [9, 1, 1, "", "isoDateTimeType"], [9, 1, 1, "", "isoDateType"], [9, 1, 1, "", "ispSAFRS"], [9, 1, 1, "", "ispSAFRSDummy"], [9, 1, 1, "", "ispSAFRSModel"], [9, 4, 1, "", "ispSAFRS_decorator"], [9, 1, 1, "", "system"]], "isp.safrs.RQLQuery": [[9, 2, 1, "", "_rql_cmp"], [9, 2, 1, "", "rql_parse"]], "isp.safrs.isoDateTimeType": [[9, 3, 1, "", "cache_ok"], [9, 3, 1, "", "impl"], [9, 2, 1, "", "process_bind_param"], [9, 5, 1, "", "python_type"]], "isp.safrs.isoDateType": [[9, 3, 1, "", "cache_ok"], [9, 3, 1, "", "impl"], [9, 2, 1, "", "process_bind_param"], [9, 5, 1, "", "python_type"]], "isp.safrs.ispSAFRS": [[9, 2, 1, "", "_as_dict"], [9, 2, 1, "", "_get_connection"], [9, 2, 1, "", "_get_engine"], [9, 2, 1, "", "_get_session"], [9, 2, 1, "", "_int_add_meta"], [9, 2, 1, "", "_int_get_empty_record"], [9, 2, 1, "", "_int_groupby"], [9, 2, 1, "", "_int_groupby_query"], [9, 2, 1, "", "_int_init"], [9, 2, 1, "", "_int_json_response"], [9, 2, 1, "", "_int_parse_args"], [9, 2, 1, "", "_int_query"], [9, 2, 1, "", "_int_rqlfilter"], [9, 2, 1, "", "_int_search"], [9, 2, 1, "", "_log_query"], [9, 2, 1, "", "_s_column_by_name"], [9, 2, 1, "", "access_cls"], [9, 2, 1, "", "appDialog"], [9, 2, 1, "", "appError"], [9, 2, 1, "", "appInfo"], [9, 3, 1, "", "custom_decorators"], [9, 3, 1, "", "exclude_attrs"], [9, 3, 1, "", "exclude_rels"], [9, 2, 1, "", "filter"], [9, 2, 1, "", "groupby"], [9, 2, 1, "", "groupsplit"], [9, 3, 1, "", "id_type"], [9, 2, 1, "", "undefined"]], "isp.safrs.ispSAFRSDummy": [[9, 2, 1, "", "_s_get_jsonapi_rpc_methods"], [9, 3, 1, "", "_s_jsonapi_attrs"], [9, 3, 1, "", "_s_relationships"], [9, 2, 1, "", "_s_sample_dict"], [9, 2, 1, "", "_s_sample_id"], [9, 3, 1, "", "_s_url"], [9, 3, 1, "", "class_"], [9, 3, 1, "", "http_methods"], [9, 3, 1, "", "id"], [9, 3, 1, "", "id_type"], [9, 3, 1, "", "no_flask_admin"], [9, 3, 1, "", "order_by"]], "isp.safrs.system": [[9, 2, 1, "", "_extendedSystemCheck"], [9, 2, 1, "", "api_get"], [9, 2, 1, "", "api_list"], [9, 3, 1, "", "http_methods"], [9, 3, 1, "", "id_type"], [9, 2, 1, "", "test"], [9, 3, 1, "", "url_prefix"]], "isp.socket": [[9, 1, 1, "", "WebSocketClass"]], "isp.socket.WebSocketClass": [[9, 2, 1, "", "doPublish"], [9, 2, 1, "", "onMessage"], [9, 2, 1, "", "shutdown"], [9, 2, 1, "", "startup"]], "isp.webapp": [[9, 4, 1, "", "expose_object"], [9, 1, 1, "", "ispBaseWebApp"]], "isp.webapp.ispBaseWebApp": [[9, 2, 1, "", "_checkNetarea"], [9, 3, 1, "", "_config"], [9, 2, 1, "", "_create_api"], [9, 2, 1, "", "_create_app"], [9, 3, 1, "", "_urlContentParamsKey"], [9, 2, 1, "", "addRoutes"], [9, 3, 1, "", "api"], [9, 3, 1, "", "apiurl"], [9, 3, 1, "", "app"], [9, 2, 1, "", "createDocs"], [9, 2, 1, "", "parseRequestParams"], [9, 3, 1, "", "response_headers"], [9, 2, 1, "", "routeApi"], [9, 2, 1, "", "routeCoverage"], [9, 2, 1, "", "routeDocs"], [9, 2, 1, "", "routeFile"], [9, 2, 1, "", "routeIFrame"], [9, 2, 1, "", "routeIndex"], [9, 2, 1, "", "routeRender"], [9, 3, 1, "", "webSocket"]]}, "objtypes": {"0": "py:module", "1": "py:class", "2": "py:method", "3": "py:attribute", "4": "py:function", "5": "py:property"}, "objnames": {"0": ["py", "module", "Python module"], "1": ["py", "class", "Python class"], "2": ["py", "method", "Python method"], "3": ["py", "attribute", "Python attribute"], "4": ["py", "function", "Python function"], "5": ["py", "property", "Python property"]}, "titleterms": {"app": [0, 1], "packag": [0, 1, 9, 10], "subpackag": 0, "submodul": [0, 1, 9], "api": 0, "modul": [0, 1, 3, 7, 8, 9, 11, 12], "daten": 0, "holen": 0, "test": 0, "durchf\u00fchren": 0, "pdf": [0, 4], "ausgab": 0, "aria": [0, 4], "ariadicom": 0, "ariamirror": 0, "base": 0, "check": 0, "config": [0, 3, 9], "db": 0, "imag": 0, "result": 0, "tagindex": 0, "content": [0, 1, 9], "qa": [1, 5], "field": 1, "mlc": 1, "vmat": 1, "wl": 1, "mt_4": 2, "1": [2, 7, 9], "2": [2, 7, 9], "linearit\u00e4t": 2, "de": [2, 6], "dosismonitorsystem": 2, "bei": 2, "kleinen": 2, "dosismonitorwerten": 2, "mt_leafspe": 2, "geschwindigkeit": 2, "und": [2, 3, 4, 7], "geschwindigkeits\u00e4nderung": 2, "der": [2, 3, 6], "lamellen": 2, "instal": [3, 6, 7, 8], "repositori": 3, "klonen": 3, "alternativ": 3, "download": [3, 6], "unpack": 3, "variant": 3, "A": 3, "lokal": 3, "python": [3, 6, 7], "resourcen": 3, "datenbankverbindung": 3, "mit": 3, "odbc": 3, "datei": 3, "vom": 3, "rechner": 3, "von": [3, 6], "pygqa": [3, 11], "erster": [3, 7], "testlauf": 3, "zus\u00e4tzlich": 3, "informationen": 3, "al": 3, "servic": 3, "unter": 3, "linux": 3, "ubuntu": 3, "ausf\u00fchren": 3, "paket": 3, "updat": 3, "b": 3, "im": 3, "dockercontain": 3, "docker": 3, "\u00fcber": 3, "snap": 3, "installieren": [3, 6], "verwenden": 3, "anpassungen": 3, "vor": 3, "dem": 3, "start": [3, 7], "recht": 3, "f\u00fcr": [3, 4, 6], "den": 3, "aktuellen": 3, "nutzer": 3, "setzen": 3, "configdatei": 3, "anpassen": 3, "contain": 3, "erstellen": [3, 6], "starten": 3, "konfigur": [4, 5, 7], "optionen": [4, 5], "server": 4, "databas": 4, "13": 4, "x": 4, "16": [4, 7, 9], "dicom": [4, 9], "resultspath": 4, "unit": 4, "templat": 4, "werden": 4, "zuerst": 4, "eingef\u00fcgt": 4, "dann": 4, "all": 4, "variabl": 4, "ersetzt": 4, "use_as_vari": 4, "angaben": 4, "variablen": 4, "ger\u00e4t": 5, "gqa": 5, "skelett": 6, "mac": 6, "user": 6, "ohn": 6, "jeglich": 6, "ahnung": 6, "miniconda": 6, "enth\u00e4lt": 6, "3": [6, 7, 9], "7": [6, 7, 9], "etc": 6, "pr\u00fcfen": 6, "ein": 6, "arbeitsordn": 6, "github": 6, "ben\u00f6tigten": 6, "modulen": 6, "schriftart": 6, "symbol": 6, "da": 6, "loslaufen": 6, "lassen": 6, "dokument": 7, "haftungsausschluss": 7, "zugriff": 7, "wichtig": 7, "komponenten": 7, "zukunft": 7, "fehler": 7, "anmerkungen": 7, "index": 7, "indic": 7, "tabl": 7, "todo": 7, "changelog": [7, 9], "0": [7, 9], "unreleas": 7, "2024": [7, 9], "04": [7, 9], "23": [7, 9], "03": [7, 9], "19": [7, 9], "2023": [7, 9], "09": [7, 9], "05": [7, 9], "9": 7, "31": 7, "8": [7, 9], "2022": [7, 9], "30": 7, "28": [7, 9], "6": [7, 9], "2021": [7, 9], "12": [7, 9], "5": [7, 9], "08": [7, 9], "26": 7, "4": [7, 9], "06": [7, 9], "02": 7, "27": [7, 9], "01": [7, 9], "resourc": [8, 9], "isp": 9, "log": 9, "17": 9, "2026": 9, "10": 9, "18": 9, "dicomarch": 9, "mpdf": 9, "29": 9, "mqtt": 9, "qo": 9, "retain": 9, "link": 9, "mssql": 9, "plot": 9, "safr": 9, "swagger": 9, "yaml": 9, "definit": 9, "socket": 9, "webapp": 9, "11": 9, "version": 12}, "envversion": {"sphinx.domains.c": 3, "sphinx.domains.changeset": 1, "sphinx.domains.citation": 1, "sphinx.domains.cpp": 9, "sphinx.domains.index": 1, "sphinx.domains.javascript": 3, "sphinx.domains.math": 2, "sphinx.domains.python": 4, "sphinx.domains.rst": 2, "sphinx.domains.std": 2, "sphinx.ext.todo": 2, "sphinx": 58}, "alltitles": {"app package": [[0, "app-package"]], "Subpackages": [[0, "subpackages"]], "Submodules": [[0, "submodules"], [1, "submodules"], [9, "submodules"]], "app.api module": [[0, "module-app.api"]], "Daten holen": [[0, "daten-holen"]], "Test durchf\u00fchren": [[0, "test-durchfuhren"]], "PDF Ausgabe": [[0, "pdf-ausgabe"]], "app.aria module": [[0, "module-app.aria"]], "app.ariadicom module": [[0, "module-app.ariadicom"]], "app.ariamirror module": [[0, "module-app.ariamirror"]], "app.base module": [[0, "module-app.base"]], "app.check module": [[0, "module-app.check"]], "app.config module": [[0, "module-app.config"]], "app.db module": [[0, "module-app.db"]], "app.image module": [[0, "module-app.image"]], "app.results module": [[0, "module-app.results"]], "app.tagindex module": [[0, "module-app.tagindex"]], "Module contents": [[0, "module-app"], [1, "module-app.qa"], [9, "module-isp"]], "app.qa package": [[1, "app-qa-package"]], "app.qa.field module": [[1, "module-app.qa.field"]], "app.qa.mlc module": [[1, "module-app.qa.mlc"]], "app.qa.vmat module": [[1, "module-app.qa.vmat"]], "app.qa.wl module": [[1, "module-app.qa.wl"]], "MT_4.1.2 - Linearit\u00e4t des Dosismonitorsystems bei kleinen Dosismonitorwerten": [[2, "mt-4-1-2-linearitat-des-dosismonitorsystems-bei-kleinen-dosismonitorwerten"]], "MT_LeafSpeed - Geschwindigkeit und Geschwindigkeits\u00e4nderung der Lamellen": [[2, "mt-leafspeed-geschwindigkeit-und-geschwindigkeitsanderung-der-lamellen"]], "Installation": [[3, "installation"]], "Repository klonen": [[3, "repository-klonen"]], "Alternativ download / unpack repository": [[3, "alternativ-download-unpack-repository"]], "Variante A - lokale Python-Installation": [[3, "variante-a-lokale-python-installation"]], "Installation der Module und Resourcen": [[3, "installation-der-module-und-resourcen"]], "Datenbankverbindung mit ODBC": [[3, "datenbankverbindung-mit-odbc"]], "Config-Datei": [[3, "config-datei"]], "Datenbankverbindung vom Rechner": [[3, "datenbankverbindung-vom-rechner"]], "Datenbankverbindung von pygqa": [[3, "datenbankverbindung-von-pygqa"]], "Erster Testlauf": [[3, "erster-testlauf"]], "Zus\u00e4tzliche Informationen": [[3, "zusatzliche-informationen"]], "Als service unter linux ubuntu ausf\u00fchren": [[3, "als-service-unter-linux-ubuntu-ausfuhren"]], "Installation zus\u00e4tzlicher Pakete": [[3, "installation-zusatzlicher-pakete"]], "Update": [[3, "update"]], "Variante B - Installation im Dockercontainer": [[3, "variante-b-installation-im-dockercontainer"]], "Docker \u00fcber snap installieren (Ubuntu)": [[3, "docker-uber-snap-installieren-ubuntu"]], "Docker verwenden": [[3, "docker-verwenden"]], "Anpassungen vor dem Start": [[3, "anpassungen-vor-dem-start"]], "Rechte f\u00fcr den aktuellen Nutzer setzen": [[3, "rechte-fur-den-aktuellen-nutzer-setzen"]], "Configdatei anpassen": [[3, "configdatei-anpassen"]], "Container erstellen und starten": [[3, "container-erstellen-und-starten"]], "Konfiguration": [[4, "konfiguration"]], "Optionen": [[4, "optionen"]], "Optionen server": [[4, "optionen-server"]], "Optionen database": [[4, "optionen-database"]], "Aria 13.x": [[4, "aria-13-x"], [4, "id1"]], "Aria 16.x": [[4, "aria-16-x"], [4, "id2"]], "Optionen dicom": [[4, "optionen-dicom"]], "Optionen resultsPath": [[4, "optionen-resultspath"]], "Optionen units": [[4, "optionen-units"]], "Optionen pdf": [[4, "optionen-pdf"]], "Optionen templates": [[4, "optionen-templates"]], "templates werden zuerst eingef\u00fcgt und dann alle variables ersetzt": [[4, "templates-werden-zuerst-eingefugt-und-dann-alle-variables-ersetzt"]], "use_as_variables Angaben": [[4, "use-as-variables-angaben"]], "variables Variablen f\u00fcr templates": [[4, "variables-variablen-fur-templates"]], "Konfiguration Ger\u00e4te QA": [[5, "konfiguration-gerate-qa"]], "Optionen GQA": [[5, "optionen-gqa"]], "Installation des Skeletts f\u00fcr Mac User ohne jegliche Ahnung": [[6, "installation-des-skeletts-fur-mac-user-ohne-jegliche-ahnung"]], "Installation von Miniconda (enth\u00e4lt Python 3.7 etc.)": [[6, "installation-von-miniconda-enthalt-python-3-7-etc"]], "Pr\u00fcfen der Installation": [[6, "prufen-der-installation"]], "Erstellen eines Arbeitsordners": [[6, "erstellen-eines-arbeitsordners"]], "Download des Skeletts von GitHub": [[6, "download-des-skeletts-von-github"]], "Installieren von ben\u00f6tigten Modulen": [[6, "installieren-von-benotigten-modulen"]], "Schriftart f\u00fcr Symbole installieren": [[6, "schriftart-fur-symbole-installieren"]], "Das Skelett loslaufen lassen": [[6, "das-skelett-loslaufen-lassen"]], "Dokumentation": [[7, "dokumentation"]], "Haftungsausschluss:": [[7, "haftungsausschluss"]], "Installation und Konfiguration": [[7, "installation-und-konfiguration"]], "Erster Start": [[7, "erster-start"]], "Zugriff": [[7, "zugriff"]], "Wichtige Komponenten": [[7, "wichtige-komponenten"]], "Zukunft": [[7, "zukunft"]], "Fehler und Anmerkungen": [[7, "fehler-und-anmerkungen"]], "Python Module Index": [[7, "python-module-index"]], "Indices and tables": [[7, "indices-and-tables"]], "Python Module TODO": [[7, "python-module-todo"]], "CHANGELOG": [[7, "changelog"], [9, "changelog"], [9, "id8"], [9, "id14"], [9, "id21"], [9, "id28"], [9, "id31"], [9, "id43"], [9, "id45"], [9, "id51"]], "0.2.3 / unreleased": [[7, "unreleased"]], "0.2.2 / 2024-04-23": [[7, "id1"]], "0.2.1 / 2024-03-19": [[7, "id2"]], "0.2.0 / 2023-09-05": [[7, "id3"]], "0.1.9 / 2023-05-31": [[7, "id4"]], "0.1.8 / 2022-05-30": [[7, "id5"]], "0.1.7 / 2022-03-28": [[7, "id6"]], "0.1.6 / 2021-12-28": [[7, "id7"]], "0.1.5 / 2021-08-26": [[7, "id8"]], "0.1.4 / 2021-06-02": [[7, "id9"]], "0.1.3 / 2021-05-19": [[7, "id10"]], "0.1.2 / 2021-04-30": [[7, "id11"]], "0.1.1 / 2021-04-27": [[7, "id12"], [9, "id12"], [9, "id26"]], "0.1.0 / 2021-01-16": [[7, "id13"], [9, "id5"], [9, "id13"], [9, "id27"], [9, "id30"], [9, "id40"], [9, "id44"], [9, "id48"], [9, "id60"]], "install-resources module": [[8, "install-resources-module"]], "isp package": [[9, "isp-package"]], "isp.config module": [[9, "module-isp.config"]], "config": [[9, "config"]], "logging": [[9, "logging"], [9, "id20"]], "0.1.4 / 2024-03-05": [[9, "id1"]], "0.1.3 / 2023-04-17": [[9, "id2"]], "0.1.2 / 2022-05-16": [[9, "id3"]], "0.1.1 / 2022-03-28": [[9, "id4"]], "isp.dicom module": [[9, "module-isp.dicom"]], "0.1.4 / 2026-10-18": [[9, "id9"], [9, "id15"], [9, "id36"]], "0.1.3 / 2022-06-01": [[9, "id10"]], "0.1.2 / 2022-03-28": [[9, "id11"]], "isp.dicomarchive module": [[9, "module-isp.dicomarchive"]], "0.1.3 / 2026-10-18": [[9, "id16"], [9, "id37"]], "0.1.2 / 2026-10-18": [[9, "id17"]], "0.1.1 / 2026-10-18": [[9, "id18"]], "0.1.0 / 2026-10-18": [[9, "id19"]], "isp.logging module": [[9, "module-isp.logging"]], "isp.mpdf module": [[9, "module-isp.mpdf"]], "mpdf": [[9, "mpdf"]], "resources": [[9, "resources"]], "0.1.5 / 2024-03-06": [[9, "id22"]], "0.1.4 / 2022-06-01": [[9, "id23"]], "0.1.3 / 2022-05-23": [[9, "id24"]], "0.1.2 / 2022-03-29": [[9, "id25"]], "isp.mqtt module": [[9, "module-isp.mqtt"]], "mqtt": [[9, "mqtt"]], "qos": [[9, "qos"]], "retain": [[9, "retain"]], "Links": [[9, "links"]], "0.2.0 / 2024-04-18": [[9, "id29"]], "isp.mssql module": [[9, "module-isp.mssql"]], "0.1.8 / 2026-10-18": [[9, "id32"]], "0.1.7 / 2026-10-18": [[9, "id33"]], "0.1.6 / 2026-10-18": [[9, "id34"]], "0.1.5 / 2026-10-18": [[9, "id35"]], "0.1.2 / 2024-03-18": [[9, "id38"]], "0.1.1 / 2021-09-03": [[9, "id39"]], "isp.plot module": [[9, "module-isp.plot"]], "plot": [[9, "plot"]], "isp.safrs module": [[9, "module-isp.safrs"]], "safrs": [[9, "safrs"]], "swagger yaml definition": [[9, "swagger-yaml-definition"]], "0.1.2 / 2021-12-28": [[9, "id46"]], "0.1.1 / 2021-05-19": [[9, "id47"], [9, "id59"]], "isp.socket module": [[9, "module-isp.socket"]], "isp.webapp module": [[9, "module-isp.webapp"]], "webapp": [[9, "webapp"]], "0.1.8 / 2023-09-01": [[9, "id52"]], "0.1.7 / 2023-01-11": [[9, "id53"]], "0.1.6 / 2022-05-16": [[9, "id54"]], "0.1.5 / 2022-04-04": [[9, "id55"]], "0.1.4 / 2022-04-04": [[9, "id56"]], "0.1.3 / 2022-03-28": [[9, "id57"]], "0.1.2 / 2021-12-08": [[9, "id58"]], "package": [[10, "package"]], "pygqa module": [[11, "module-pygqa"]], "version module": [[12, "module-version"]]}, "indexentries": {"dicomimage (class in app.image)": [[0, "app.image.DicomImage"]], "dicomimagestack (class in app.image)": [[0, "app.image.DicomImageStack"]], "__del__() (app.base.ispbase method)": [[0, "app.base.ispBase.__del__"]], "_basedir (app.config.gqa_config attribute)": [[0, "app.config.gqa_config._basedir"]], "_config (app.base.ispbase attribute)": [[0, "app.base.ispBase._config"]], "_cumsum2d() (app.image.dicomimage static method)": [[0, "app.image.DicomImage._cumsum2d"]], "_cumsum3d() (app.image.dicomimagestack static method)": [[0, "app.image.DicomImageStack._cumsum3d"]], "_extendedsystemcheck() (app.system class method)": [[0, "app.system._extendedSystemCheck"]], "_integralstat() (app.image.dicomimagestack method)": [[0, "app.image.DicomImageStack._integralStat"]], "_patientlock() (app.ariamirror.ariamirror method)": [[0, "app.ariamirror.ariaMirror._patientLock"]], "_plotposition (app.image.plotimage attribute)": [[0, "app.image.plotImage._plotPosition"]], "_syncpatient() (app.ariamirror.ariamirror method)": [[0, "app.ariamirror.ariaMirror._syncPatient"]], "_value() (app.ariamirror.ariamirror method)": [[0, "app.ariamirror.ariaMirror._value"]], "acceptance (app.db.gqadb attribute)": [[0, "app.db.gqadb.acceptance"]], "api_get() (app.api.gqa method)": [[0, "app.api.gqa.api_get"]], "api_list() (app.api.gqa method)": [[0, "app.api.gqa.api_list"]], "app": [[0, "module-app"]], "app.api": [[0, "module-app.api"]], "app.aria": [[0, "module-app.aria"]], "app.ariadicom": [[0, "module-app.ariadicom"]], "app.ariamirror": [[0, "module-app.ariamirror"]], "app.base": [[0, "module-app.base"]], "app.check": [[0, "module-app.check"]], "app.config": [[0, "module-app.config"]], "app.db": [[0, "module-app.db"]], "app.image": [[0, "module-app.image"]], "app.results": [[0, "module-app.results"]], "app.tagindex": [[0, "module-app.tagindex"]], "aria (app.ariamirror.ariamirror attribute)": [[0, "app.ariamirror.ariaMirror.aria"]], "ariaclass (class in app.aria)": [[0, "app.aria.ariaClass"]], "ariadicom (app.api.gqa attribute)": [[0, "app.api.gqa.ariaDicom"]], "ariadicomclass (class in app.ariadicom)": [[0, "app.ariadicom.ariaDicomClass"]], "ariamirror (class in app.ariamirror)": [[0, "app.ariamirror.ariaMirror"]], "ariamirrorquery (class in app.ariamirror)": [[0, "app.ariamirror.ariaMirrorQuery"]], "array (app.image.dicomimagestack attribute)": [[0, "app.image.DicomImageStack.array"]], "arrayoriginal (app.image.dicomimage attribute)": [[0, "app.image.DicomImage.arrayOriginal"]], "ax (app.image.plotimage attribute)": [[0, "app.image.plotImage.ax"]], "axlimit() (app.image.plotimage method)": [[0, "app.image.plotImage.axLimit"]], "axticks() (app.image.plotimage method)": [[0, "app.image.plotImage.axTicks"]], "basefield (app.check.ispcheckclass attribute)": [[0, "app.check.ispCheckClass.baseField"]], "baseimage (app.check.ispcheckclass attribute)": [[0, "app.check.ispCheckClass.baseImage"]], "basereciprocal() (app.check.ispcheckclass method)": [[0, "app.check.ispCheckClass.baseReciprocal"]], "bind (app.results.ispresults attribute)": [[0, "app.results.ispResults.bind"]], "cache (app.check.ispcheckclass attribute)": [[0, "app.check.ispCheckClass.cache"]], "cachepixels() (app.image.dicomimage method)": [[0, "app.image.DicomImage.cachePixels"]], "checkfield (app.check.ispcheckclass attribute)": [[0, "app.check.ispCheckClass.checkField"]], "checkfields() (app.base.ispbase method)": [[0, "app.base.ispBase.checkFields"]], "check_acceptance() (app.base.ispbase method)": [[0, "app.base.ispBase.check_acceptance"]], "check_acceptance_ext() (app.base.ispbase method)": [[0, "app.base.ispBase.check_acceptance_ext"]], "check_tolerance() (app.base.ispbase method)": [[0, "app.base.ispBase.check_tolerance"]], "check_tolerance_ext() (app.base.ispbase method)": [[0, "app.base.ispBase.check_tolerance_ext"]], "columns (app.ariamirror.ariamirror attribute)": [[0, "app.ariamirror.ariaMirror.columns"]], "columns (app.results.ispresults attribute)": [[0, "app.results.ispResults.columns"]], "columns (app.tagindex.gqatagindex attribute)": [[0, "app.tagindex.gqaTagIndex.columns"]], "computedtype (app.image.dicomimage attribute)": [[0, "app.image.DicomImage.computeDtype"], [0, "id0"]], "config (app.api.gqa attribute)": [[0, "app.api.gqa.config"]], "config (app.ariadicom.ariadicomclass attribute)": [[0, "app.ariadicom.ariaDicomClass.config"]], "config (app.results.ispresults attribute)": [[0, "app.results.ispResults.config"]], "configs (app.config.gqa_config attribute)": [[0, "app.config.gqa_config.configs"]], "configs() (app.api.gqa class method)": [[0, "app.api.gqa.configs"]], "connect() (app.ariamirror.ariamirror method)": [[0, "app.ariamirror.ariaMirror.connect"]], "counts() (app.tagindex.gqatagindex method)": [[0, "app.tagindex.gqaTagIndex.counts"]], "createresult() (app.base.ispbase method)": [[0, "app.base.ispBase.createResult"]], "cropfield() (app.image.dicomimage method)": [[0, "app.image.DicomImage.cropField"]], "data (app.db.gqadb attribute)": [[0, "app.db.gqadb.data"]], "datasetcache (app.image.dicomimage attribute)": [[0, "app.image.DicomImage.datasetCache"], [0, "id1"]], "date (app.db.gqadb attribute)": [[0, "app.db.gqadb.date"]], "datecolumns (app.ariamirror.ariamirror attribute)": [[0, "app.ariamirror.ariaMirror.dateColumns"]], "dicomdata (app.base.ispbase attribute)": [[0, "app.base.ispBase.dicomData"]], "dicomfiles (app.ariadicom.ariadicomclass attribute)": [[0, "app.ariadicom.ariaDicomClass.dicomfiles"]], "dorescaleslope() (app.image.dicomimage method)": [[0, "app.image.DicomImage.doRescaleSlope"]], "dotesttype() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.doTestType"]], "dots2mm() (app.image.plotimage method)": [[0, "app.image.plotImage.dots2mm"]], "dots2mm_x() (app.image.plotimage method)": [[0, "app.image.plotImage.dots2mm_X"]], "dots2mm_y() (app.image.plotimage method)": [[0, "app.image.plotImage.dots2mm_Y"]], "energy (app.db.gqadb attribute)": [[0, "app.db.gqadb.energy"]], "energyfields (app.tagindex.gqatestmap attribute)": [[0, "app.tagindex.gqaTestMap.energyFields"]], "errors (app.results.ispresults attribute)": [[0, "app.results.ispResults.errors"]], "evaluationcalculate() (app.base.ispbase method)": [[0, "app.base.ispBase.evaluationCalculate"]], "evaluationprepare() (app.base.ispbase method)": [[0, "app.base.ispBase.evaluationPrepare"]], "evaluationresult() (app.base.ispbase method)": [[0, "app.base.ispBase.evaluationResult"]], "execute() (app.ariamirror.ariamirror method)": [[0, "app.ariamirror.ariaMirror.execute"]], "executeparallel() (app.aria.ariaclass method)": [[0, "app.aria.ariaClass.executeParallel"]], "export() (app.api.gqa class method)": [[0, "app.api.gqa.export"]], "exportpandas() (in module app)": [[0, "app.exportPandas"]], "exportyear() (app.results.ispresults method)": [[0, "app.results.ispResults.exportYear"]], "fig (app.image.plotimage attribute)": [[0, "app.image.plotImage.fig"]], "filecount (app.base.ispbase attribute)": [[0, "app.base.ispBase.fileCount"]], "filename (app.ariamirror.ariamirror attribute)": [[0, "app.ariamirror.ariaMirror.filename"]], "filename (app.results.ispresults attribute)": [[0, "app.results.ispResults.filename"]], "frame (app.tagindex.gqatagindex attribute)": [[0, "app.tagindex.gqaTagIndex.frame"]], "fromconfig() (app.ariamirror.ariamirror class method)": [[0, "app.ariamirror.ariaMirror.fromConfig"]], "geometry (app.image.dicomimage attribute)": [[0, "app.image.DicomImage.geometry"]], "getallgqa() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.getAllGQA"]], "getdotsstat() (app.image.dicomimage method)": [[0, "app.image.DicomImage.getDotsStat"]], "getfielddots() (app.image.dicomimage method)": [[0, "app.image.DicomImage.getFieldDots"]], "getfieldroi() (app.image.dicomimage method)": [[0, "app.image.DicomImage.getFieldRoi"]], "getfieldsize() (app.image.dicomimage method)": [[0, "app.image.DicomImage.getFieldSize"]], "getfulldata() (app.base.ispbase method)": [[0, "app.base.ispBase.getFullData"]], "geticon() (app.base.ispbase method)": [[0, "app.base.ispBase.getIcon"]], "getimage() (app.check.ispcheckclass static method)": [[0, "app.check.ispCheckClass.getImage"]], "getimageinfos() (app.aria.ariaclass method)": [[0, "app.aria.ariaClass.getImageInfos"]], "getimageinfosframe() (app.aria.ariaclass method)": [[0, "app.aria.ariaClass.getImageInfosFrame"]], "getimagestack() (app.base.ispbase method)": [[0, "app.base.ispBase.getImageStack"]], "getimages() (app.aria.ariaclass method)": [[0, "app.aria.ariaClass.getImages"]], "getline() (app.image.dicomimage method)": [[0, "app.image.DicomImage.getLine"]], "getmatrix() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.getMatrix"]], "getmeandose() (app.check.ispcheckclass method)": [[0, "app.check.ispCheckClass.getMeanDose"]], "getmetaerrorstring() (app.base.ispbase method)": [[0, "app.base.ispBase.getMetaErrorString"]], "getmirror() (app.aria.ariaclass method)": [[0, "app.aria.ariaClass.getMirror"]], "getparallel() (app.aria.ariaclass method)": [[0, "app.aria.ariaClass.getParallel"]], "getroi() (app.image.dicomimage method)": [[0, "app.image.DicomImage.getRoi"]], "getroistat() (app.image.dicomimage method)": [[0, "app.image.DicomImage.getRoiStat"]], "getrundata() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.getRunData"]], "getstats() (app.ariamirror.ariamirror method)": [[0, "app.ariamirror.ariaMirror.getStats"]], "gettagging() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.getTagging"]], "gettags() (app.aria.ariaclass method)": [[0, "app.aria.ariaClass.getTags"]], "gettestdata() (app.aria.ariaclass method)": [[0, "app.aria.ariaClass.getTestData"]], "gettestmap() (app.aria.ariaclass method)": [[0, "app.aria.ariaClass.getTestMap"]], "getyeardata() (app.results.ispresults method)": [[0, "app.results.ispResults.getYearData"]], "getyearquerystring() (app.db.gqadb class method)": [[0, "app.db.gqadb.getYearQueryString"]], "getyears() (app.results.ispresults method)": [[0, "app.results.ispResults.getYears"]], "gqa (app.results.ispresults attribute)": [[0, "app.results.ispResults.gqa"]], "gqa (class in app.api)": [[0, "app.api.gqa"]], "gqatagindex (class in app.tagindex)": [[0, "app.tagindex.gqaTagIndex"]], "gqatestmap (class in app.tagindex)": [[0, "app.tagindex.gqaTestMap"]], "gqa_config (class in app.config)": [[0, "app.config.gqa_config"]], "gqadb (app.results.ispresults attribute)": [[0, "app.results.ispResults.gqadb"]], "gqadb (class in app.db)": [[0, "app.db.gqadb"]], "group (app.db.gqadb attribute)": [[0, "app.db.gqadb.group"]], "icons (app.base.ispbase attribute)": [[0, "app.base.ispBase.icons"]], "id (app.db.gqadb attribute)": [[0, "app.db.gqadb.id"]], "id_type (app.api.gqa attribute)": [[0, "app.api.gqa.id_type"]], "image (app.check.ispcheckclass attribute)": [[0, "app.check.ispCheckClass.image"]], "imagecache (app.base.ispbase attribute)": [[0, "app.base.ispBase.imageCache"]], "images (app.image.dicomimagestack attribute)": [[0, "app.image.DicomImageStack.images"]], "importpandas() (in module app)": [[0, "app.importPandas"]], "inactiv() (app.tagindex.gqatagindex method)": [[0, "app.tagindex.gqaTagIndex.inactiv"]], "inaktiv (app.tagindex.gqatestmap attribute)": [[0, "app.tagindex.gqaTestMap.inaktiv"]], "index (app.image.dicomimagestack attribute)": [[0, "app.image.DicomImageStack.index"]], "index (app.results.ispresults attribute)": [[0, "app.results.ispResults.index"]], "index (app.tagindex.gqatagindex property)": [[0, "app.tagindex.gqaTagIndex.index"]], "info() (app.api.gqa class method)": [[0, "app.api.gqa.info"]], "infofields (app.ariadicom.ariadicomclass attribute)": [[0, "app.ariadicom.ariaDicomClass.infoFields"]], "infofields (app.image.dicomimage attribute)": [[0, "app.image.DicomImage.infoFields"]], "infos (app.check.ispcheckclass attribute)": [[0, "app.check.ispCheckClass.infos"]], "infos (app.image.dicomimage attribute)": [[0, "app.image.DicomImage.infos"]], "init() (app.api.gqa class method)": [[0, "app.api.gqa.init"]], "initmemorydicom() (app.image.dicomimage method)": [[0, "app.image.DicomImage.initMemoryDicom"]], "initresultspath() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.initResultsPath"]], "integralimage() (app.image.dicomimage method)": [[0, "app.image.DicomImage.integralImage"]], "integralimage() (app.image.dicomimagestack method)": [[0, "app.image.DicomImageStack.integralImage"]], "integralminrois (app.image.dicomimage attribute)": [[0, "app.image.DicomImage.integralMinRois"], [0, "id2"]], "integralreset() (app.image.dicomimage method)": [[0, "app.image.DicomImage.integralReset"]], "isrescaled (app.image.dicomimage attribute)": [[0, "app.image.DicomImage.isRescaled"]], "ispbase (class in app.base)": [[0, "app.base.ispBase"]], "ispcheckclass (class in app.check)": [[0, "app.check.ispCheckClass"]], "ispresults (class in app.results)": [[0, "app.results.ispResults"]], "lastsql (app.ariadicom.ariadicomclass attribute)": [[0, "app.ariadicom.ariaDicomClass.lastSQL"]], "matrix() (app.api.gqa class method)": [[0, "app.api.gqa.matrix"]], "matrix() (app.config.gqa_config method)": [[0, "app.config.gqa_config.matrix"]], "maxage (app.ariamirror.ariamirror attribute)": [[0, "app.ariamirror.ariaMirror.maxAge"]], "metadata (app.base.ispbase attribute)": [[0, "app.base.ispBase.metadata"]], "metadata (app.db.gqadb attribute)": [[0, "app.db.gqadb.metadata"]], "migratedicomarchive() (in module app)": [[0, "app.migrateDicomArchive"]], "mirrorcolumn() (in module app.ariamirror)": [[0, "app.ariamirror.mirrorColumn"]], "mm2dots() (app.image.plotimage method)": [[0, "app.image.plotImage.mm2dots"]], "mm2dots_x() (app.image.plotimage method)": [[0, "app.image.plotImage.mm2dots_X"]], "mm2dots_y() (app.image.plotimage method)": [[0, "app.image.plotImage.mm2dots_Y"]], "module": [[0, "module-app"], [0, "module-app.api"], [0, "module-app.aria"], [0, "module-app.ariadicom"], [0, "module-app.ariamirror"], [0, "module-app.base"], [0, "module-app.check"], [0, "module-app.config"], [0, "module-app.db"], [0, "module-app.image"], [0, "module-app.results"], [0, "module-app.tagindex"], [1, "module-app.qa"], [1, "module-app.qa.field"], [1, "module-app.qa.mlc"], [1, "module-app.qa.vmat"], [1, "module-app.qa.wl"], [9, "module-isp"], [9, "module-isp.config"], [9, "module-isp.dicom"], [9, "module-isp.dicomarchive"], [9, "module-isp.logging"], [9, "module-isp.mpdf"], [9, "module-isp.mqtt"], [9, "module-isp.mssql"], [9, "module-isp.plot"], [9, "module-isp.safrs"], [9, "module-isp.socket"], [9, "module-isp.webapp"], [11, "module-pygqa"], [12, "module-version"]], "month (app.db.gqadb attribute)": [[0, "app.db.gqadb.month"]], "normalize() (app.check.ispcheckclass method)": [[0, "app.check.ispCheckClass.normalize"]], "orientedarray() (app.image.plotimage method)": [[0, "app.image.plotImage.orientedArray"]], "orientedcax() (app.image.plotimage method)": [[0, "app.image.plotImage.orientedCax"]], "overlap (app.ariamirror.ariamirror attribute)": [[0, "app.ariamirror.ariaMirror.overlap"]], "pd_results (app.ariadicom.ariadicomclass attribute)": [[0, "app.ariadicom.ariaDicomClass.pd_results"]], "pdf (app.base.ispbase attribute)": [[0, "app.base.ispBase.pdf"]], "pdf() (app.api.gqa class method)": [[0, "app.api.gqa.pdf"]], "pdf_error_result() (app.base.ispbase method)": [[0, "app.base.ispBase.pdf_error_result"]], "periods() (app.tagindex.gqatagindex method)": [[0, "app.tagindex.gqaTagIndex.periods"]], "pixelcache (app.image.dicomimage attribute)": [[0, "app.image.DicomImage.pixelCache"], [0, "id3"]], "plotimage (class in app.image)": [[0, "app.image.plotImage"]], "plotimage() (app.image.dicomimage method)": [[0, "app.image.DicomImage.plotImage"]], "prefetchtestimages() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.prefetchTestImages"]], "preparegqa() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.prepareGQA"]], "prepare_tolerance() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.prepare_tolerance"]], "query() (app.ariamirror.ariamirror method)": [[0, "app.ariamirror.ariaMirror.query"]], "read() (app.config.gqa_config method)": [[0, "app.config.gqa_config.read"]], "read() (app.results.ispresults method)": [[0, "app.results.ispResults.read"]], "resultcachettl (app.aria.ariaclass attribute)": [[0, "app.aria.ariaClass.resultCacheTTL"]], "resultfile (app.ariadicom.ariadicomclass attribute)": [[0, "app.ariadicom.ariaDicomClass.resultfile"]], "retrievetestimages() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.retrieveTestImages"]], "roistats() (app.image.dicomimagestack method)": [[0, "app.image.DicomImageStack.roiStats"]], "run() (app.api.gqa class method)": [[0, "app.api.gqa.run"]], "run() (in module app)": [[0, "app.run"]], "runtests() (app.ariadicom.ariadicomclass method)": [[0, "app.ariadicom.ariaDicomClass.runTests"]], "savepixelcache() (app.image.dicomimage method)": [[0, "app.image.DicomImage.savePixelCache"]], "select() (app.ariamirror.ariamirrorquery method)": [[0, "app.ariamirror.ariaMirrorQuery.select"]], "sliceuids() (app.tagindex.gqatagindex method)": [[0, "app.tagindex.gqaTagIndex.sliceUIDs"]], "stats (app.image.dicomimagestack attribute)": [[0, "app.image.DicomImageStack.stats"]], "sync() (app.ariamirror.ariamirror method)": [[0, "app.ariamirror.ariaMirror.sync"]], "system (class in app)": [[0, "app.system"]], "tagnotfound() (app.tagindex.gqatagindex method)": [[0, "app.tagindex.gqaTagIndex.tagNotFound"]], "tagtests (app.tagindex.gqatestmap attribute)": [[0, "app.tagindex.gqaTestMap.tagTests"]], "tagging() (app.api.gqa class method)": [[0, "app.api.gqa.tagging"]], "test (app.db.gqadb attribute)": [[0, "app.db.gqadb.test"]], "testid() (app.tagindex.gqatestmap method)": [[0, "app.tagindex.gqaTestMap.testId"]], "testmap (app.tagindex.gqatagindex attribute)": [[0, "app.tagindex.gqaTagIndex.testMap"]], "testnotfound() (app.tagindex.gqatagindex method)": [[0, "app.tagindex.gqaTagIndex.testNotFound"]], "testtags (app.tagindex.gqatestmap attribute)": [[0, "app.tagindex.gqaTestMap.testTags"]], "test_result() (app.api.gqa class method)": [[0, "app.api.gqa.test_result"]], "to_db() (app.results.ispresults method)": [[0, "app.results.ispResults.to_db"]], "unit (app.db.gqadb attribute)": [[0, "app.db.gqadb.unit"]], "units() (app.api.gqa class method)": [[0, "app.api.gqa.units"]], "update_values() (app.db.gqadb method)": [[0, "app.db.gqadb.update_values"]], "upsert() (app.db.gqadb class method)": [[0, "app.db.gqadb.upsert"]], "upsert() (app.results.ispresults method)": [[0, "app.results.ispResults.upsert"]], "usedb (app.results.ispresults attribute)": [[0, "app.results.ispResults.useDB"]], "usefile (app.results.ispresults attribute)": [[0, "app.results.ispResults.useFile"]], "usepool (app.aria.ariaclass attribute)": [[0, "app.aria.ariaClass.usePool"]], "variables (app.ariadicom.ariadicomclass attribute)": [[0, "app.ariadicom.ariaDicomClass.variables"]], "viewrotation() (app.image.plotimage method)": [[0, "app.image.plotImage.viewRotation"]], "where() (app.ariamirror.ariamirrorquery method)": [[0, "app.ariamirror.ariaMirrorQuery.where"]], "write() (app.results.ispresults method)": [[0, "app.results.ispResults.write"]], "year (app.db.gqadb attribute)": [[0, "app.db.gqadb.year"]], "years() (app.api.gqa class method)": [[0, "app.api.gqa.years"]], "years() (app.db.gqadb class method)": [[0, "app.db.gqadb.years"]], "fwhm_findleafs() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc.FWHM_findLeafs"]], "fwhm_plot_error() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc.FWHM_plot_error"]], "fwhm_plot_errorbox() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc.FWHM_plot_errorBox"]], "_add_leaf_error_subplot() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc._add_leaf_error_subplot"]], "_axischart() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl._axisChart"]], "_axisimage() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl._axisImage"]], "_construct_segments() (app.qa.vmat.qa_vmat method)": [[1, "app.qa.vmat.qa_vmat._construct_segments"]], "_dofield_one2n() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField._doField_one2n"]], "_dolamellenpositioniergenauigkeit() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc._doLamellenpositioniergenauigkeit"]], "_domlc_vmat() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc._doMLC_VMAT"]], "_findarrayisocalcenter() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl._findArrayIsoCalCenter"]], "_findisocalcenter() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl._findIsoCalCenter"]], "_getthresholdmask() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl._getThresholdMask"]], "_mergearray() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl._mergeArray"]], "_plot_field_edges() (app.qa.field.qa_field method)": [[1, "app.qa.field.qa_field._plot_field_edges"]], "_plot_profile() (app.qa.field.qa_field method)": [[1, "app.qa.field.qa_field._plot_profile"]], "abs_mean_error (app.qa.mlc.qa_mlc property)": [[1, "app.qa.mlc.qa_mlc.abs_mean_error"]], "analysed (app.qa.vmat.qa_vmat attribute)": [[1, "app.qa.vmat.qa_vmat.analysed"]], "app.qa": [[1, "module-app.qa"]], "app.qa.field": [[1, "module-app.qa.field"]], "app.qa.mlc": [[1, "module-app.qa.mlc"]], "app.qa.vmat": [[1, "module-app.qa.vmat"]], "app.qa.wl": [[1, "module-app.qa.wl"]], "basefield (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.baseField"]], "cache (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.cache"]], "centers (app.qa.wl.qa_wl attribute)": [[1, "app.qa.wl.qa_wl.centers"]], "checkfield (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.checkField"]], "checkfield (class in app.qa.field)": [[1, "app.qa.field.checkField"]], "checkmlc (class in app.qa.mlc)": [[1, "app.qa.mlc.checkMlc"]], "checkvmat (class in app.qa.vmat)": [[1, "app.qa.vmat.checkVMAT"]], "checkwl (class in app.qa.wl)": [[1, "app.qa.wl.checkWL"]], "colfields (app.qa.wl.qa_wl attribute)": [[1, "app.qa.wl.qa_wl.colFields"]], "data (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.data"], [1, "id0"]], "data (app.qa.wl.qa_wl attribute)": [[1, "app.qa.wl.qa_wl.data"]], "debug (app.qa.vmat.qa_vmat attribute)": [[1, "app.qa.vmat.qa_vmat.debug"]], "debug (app.qa.wl.qa_wl attribute)": [[1, "app.qa.wl.qa_wl.debug"]], "dojt_10_3() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doJT_10_3"]], "dojt_10_3_1() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doJT_10_3_1"]], "dojt_4_1_3() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doJT_4_1_3"]], "dojt_4_2_2_1_a() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doJT_4_2_2_1_A"]], "dojt_4_2_2_1_b() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doJT_4_2_2_1_B"]], "dojt_4_2_2_1_c() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doJT_4_2_2_1_C"]], "dojt_7_2() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doJT_7_2"]], "dojt_7_3() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doJT_7_3"]], "dojt_7_4() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doJT_7_4"]], "dojt_7_5() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doJT_7_5"]], "dojt_7_5_pre2020() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doJT_7_5_pre2020"]], "dojt_9_1_2() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doJT_9_1_2"]], "dojt_leafspeed() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doJT_LeafSpeed"]], "dojt_end2end() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doJT_end2end"]], "domt_4_1_2() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doMT_4_1_2"]], "domt_8_02_1_2() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doMT_8_02_1_2"]], "domt_8_02_3() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doMT_8_02_3"]], "domt_8_02_4() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doMT_8_02_4"]], "domt_8_02_5() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doMT_8_02_5"]], "domt_leafspeed() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doMT_LeafSpeed"]], "domt_vmat() (app.qa.vmat.checkvmat method)": [[1, "app.qa.vmat.checkVMAT.doMT_VMAT"]], "domt_vmat_0_1() (app.qa.field.checkfield method)": [[1, "app.qa.field.checkField.doMT_VMAT_0_1"]], "domt_vmat_0_2() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doMT_VMAT_0_2"]], "domt_vmat_1_1() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doMT_VMAT_1_1"]], "domt_vmat_1_2() (app.qa.mlc.checkmlc method)": [[1, "app.qa.mlc.checkMlc.doMT_VMAT_1_2"]], "domt_vmat_2() (app.qa.vmat.checkvmat method)": [[1, "app.qa.vmat.checkVMAT.doMT_VMAT_2"]], "domt_vmat_3() (app.qa.vmat.checkvmat method)": [[1, "app.qa.vmat.checkVMAT.doMT_VMAT_3"]], "domt_wl() (app.qa.wl.checkwl method)": [[1, "app.qa.wl.checkWL.doMT_WL"]], "draw_segments() (app.qa.vmat.qa_vmat method)": [[1, "app.qa.vmat.qa_vmat.draw_segments"]], "fields (app.qa.wl.qa_wl attribute)": [[1, "app.qa.wl.qa_wl.fields"]], "find4qdata() (app.qa.field.qa_field method)": [[1, "app.qa.field.qa_field.find4Qdata"]], "findcenterball() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl.findCenterBall"]], "findcollicenter() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl.findColliCenter"]], "findtransmissions() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc.findTransmissions"]], "getleafcenterpositions() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc.getLeafCenterPositions"]], "getresults() (app.qa.vmat.qa_vmat method)": [[1, "app.qa.vmat.qa_vmat.getResults"]], "isotransmissions() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc.isoTransmissions"]], "kennung (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.kennung"]], "leaf_from (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.leaf_from"]], "mergearray (app.qa.wl.qa_wl attribute)": [[1, "app.qa.wl.qa_wl.mergeArray"]], "metadata (app.qa.vmat.qa_vmat attribute)": [[1, "app.qa.vmat.qa_vmat.metadata"]], "normalize (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.normalize"]], "picketfence_plotimage() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc.picketfence_plotImage"]], "picketfence_results() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc.picketfence_results"]], "plot4qprofile() (app.qa.field.qa_field method)": [[1, "app.qa.field.qa_field.plot4Qprofile"]], "plotchart() (app.qa.vmat.qa_vmat method)": [[1, "app.qa.vmat.qa_vmat.plotChart"]], "plotchart() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl.plotChart"]], "plotmergeimage() (app.qa.wl.qa_wl method)": [[1, "app.qa.wl.qa_wl.plotMergeImage"]], "plotprofile() (app.qa.field.qa_field method)": [[1, "app.qa.field.qa_field.plotProfile"]], "plottitle (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.plotTitle"]], "plottransmission() (app.qa.mlc.qa_mlc method)": [[1, "app.qa.mlc.qa_mlc.plotTransmission"]], "position (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.position"]], "positions (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.positions"]], "qa_field (class in app.qa.field)": [[1, "app.qa.field.qa_field"]], "qa_mlc (class in app.qa.mlc)": [[1, "app.qa.mlc.qa_mlc"]], "qa_segment (class in app.qa.vmat)": [[1, "app.qa.vmat.qa_segment"]], "qa_vmat (class in app.qa.vmat)": [[1, "app.qa.vmat.qa_vmat"]], "qa_wl (class in app.qa.wl)": [[1, "app.qa.wl.qa_wl"]], "r_corr (app.qa.vmat.qa_segment property)": [[1, "app.qa.vmat.qa_segment.r_corr"]], "roi (app.qa.wl.qa_wl attribute)": [[1, "app.qa.wl.qa_wl.roi"]], "setting (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.setting"]], "size (app.qa.mlc.qa_mlc attribute)": [[1, "app.qa.mlc.qa_mlc.size"], [1, "id1"]], "transmissionstoplot() (in module app.qa.mlc)": [[1, "app.qa.mlc.transmissionsToPlot"]], "virtualcenter (app.qa.wl.qa_wl attribute)": [[1, "app.qa.wl.qa_wl.virtualCenter"]], "virtualcenterdots (app.qa.wl.qa_wl attribute)": [[1, "app.qa.wl.qa_wl.virtualCenterDots"]], "image() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.IMAGE"]], "mqttclass (class in isp.mqtt)": [[9, "isp.mqtt.MQTTclass"]], "patient() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.PATIENT"]], "pdfgenerator (class in isp.mpdf)": [[9, "isp.mpdf.PdfGenerator"]], "rqlquery (class in isp.safrs)": [[9, "isp.safrs.RQLQuery"]], "series() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.SERIES"]], "study() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.STUDY"]], "websocketclass (class in isp.socket)": [[9, "isp.socket.WebSocketClass"]], "__del__() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.__del__"]], "__getattr__() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.__getattr__"]], "__getitem__() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.__getitem__"]], "__repr__() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.__repr__"]], "__setattr__() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.__setattr__"]], "__setitem__() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.__setitem__"]], "_as_dict() (isp.safrs.ispsafrs method)": [[9, "isp.safrs.ispSAFRS._as_dict"]], "_associate() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._associate"]], "_basedir (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._basedir"]], "_checknetarea() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp._checkNetarea"]], "_config (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._config"]], "_config (isp.webapp.ispbasewebapp attribute)": [[9, "isp.webapp.ispBaseWebApp._config"]], "_configload() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig._configLoad"]], "_configs (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._configs"]], "_connect() (isp.mssql.ispmssqlpool method)": [[9, "isp.mssql.ispMssqlPool._connect"]], "_create_api() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp._create_api"]], "_create_app() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp._create_app"]], "_cursor() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql._cursor"]], "_datasetinfo() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive._datasetInfo"]], "_development (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._development"]], "_emptyresult() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql._emptyResult"]], "_evict() (isp.mssql.ispmssqlpool method)": [[9, "isp.mssql.ispMssqlPool._evict"]], "_execute() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql._execute"]], "_extendedsystemcheck() (isp.safrs.system class method)": [[9, "isp.safrs.system._extendedSystemCheck"]], "_fetch() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql._fetch"]], "_fsync() (isp.dicomarchive.ispdicomwriter method)": [[9, "isp.dicomarchive.ispDicomWriter._fsync"]], "_getfilepath() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator._getFilePath"]], "_getpandasfields() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator._getPandasFields"]], "_getretrievepool() (isp.dicom.ispdicom class method)": [[9, "isp.dicom.ispDicom._getRetrievePool"]], "_gettemplatefromfile() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator._getTemplateFromFile"]], "_get_area_style() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator._get_area_style"]], "_get_attrs() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator._get_attrs"]], "_get_connection() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._get_connection"]], "_get_engine() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._get_engine"]], "_get_session() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._get_session"]], "_handler (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._handler"]], "_handler (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass._handler"]], "_html() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator._html"]], "_idlecheck() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._idleCheck"]], "_int_add_meta() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_add_meta"]], "_int_get_empty_record() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_get_empty_record"]], "_int_groupby() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_groupby"]], "_int_groupby_query() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_groupby_query"]], "_int_init() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_init"]], "_int_json_response() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_json_response"]], "_int_parse_args() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_parse_args"]], "_int_query() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_query"]], "_int_rqlfilter() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_rqlfilter"]], "_int_search() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._int_search"]], "_istransient() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._isTransient"]], "_isplevel (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._isplevel"]], "_lastoverlay (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._lastOverlay"]], "_loaddatabaseconfig() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql._loadDatabaseConfig"]], "_loaderrors (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._loadErrors"]], "_log_query() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._log_query"]], "_name (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._name"]], "_newassociation() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._newAssociation"]], "_page_overlays() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator._page_overlays"]], "_plotposition (isp.plot.plotclass attribute)": [[9, "isp.plot.plotClass._plotPosition"]], "_progress (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass._progress"]], "_release() (isp.mssql.ispmssqlpool method)": [[9, "isp.mssql.ispMssqlPool._release"]], "_replaceassociation() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._replaceAssociation"]], "_retrieve() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._retrieve"]], "_rootlevel (isp.config.ispconfig attribute)": [[9, "isp.config.ispConfig._rootlevel"]], "_rql_cmp() (isp.safrs.rqlquery method)": [[9, "isp.safrs.RQLQuery._rql_cmp"]], "_run() (isp.dicomarchive.ispdicomwriter method)": [[9, "isp.dicomarchive.ispDicomWriter._run"]], "_runrequest() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._runRequest"]], "_runretrieve() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._runRetrieve"]], "_s_column_by_name() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS._s_column_by_name"]], "_s_get_jsonapi_rpc_methods() (isp.safrs.ispsafrsdummy class method)": [[9, "isp.safrs.ispSAFRSDummy._s_get_jsonapi_rpc_methods"]], "_s_jsonapi_attrs (isp.safrs.ispsafrsdummy attribute)": [[9, "isp.safrs.ispSAFRSDummy._s_jsonapi_attrs"]], "_s_relationships (isp.safrs.ispsafrsdummy attribute)": [[9, "isp.safrs.ispSAFRSDummy._s_relationships"]], "_s_sample_dict() (isp.safrs.ispsafrsdummy class method)": [[9, "isp.safrs.ispSAFRSDummy._s_sample_dict"]], "_s_sample_id() (isp.safrs.ispsafrsdummy class method)": [[9, "isp.safrs.ispSAFRSDummy._s_sample_id"]], "_s_url (isp.safrs.ispsafrsdummy attribute)": [[9, "isp.safrs.ispSAFRSDummy._s_url"]], "_scheduleretrieve() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._scheduleRetrieve"]], "_sendrequest() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._sendRequest"]], "_sendretrieve() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._sendRetrieve"]], "_sourcekey() (in module isp.dicomarchive)": [[9, "isp.dicomarchive._sourceKey"]], "_text() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator._text"]], "_touch() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom._touch"]], "_urlcontentparamskey (isp.webapp.ispbasewebapp attribute)": [[9, "isp.webapp.ispBaseWebApp._urlContentParamsKey"]], "_writebatch() (isp.dicomarchive.ispdicomwriter method)": [[9, "isp.dicomarchive.ispDicomWriter._writeBatch"]], "access_cls() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS.access_cls"]], "acquisitionyear() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.acquisitionYear"]], "add() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.add"]], "addloggerhandler() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.addLoggerHandler"]], "addroutes() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.addRoutes"]], "addtemplatecontent() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.addTemplateContent"]], "ae (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.ae"]], "api (isp.webapp.ispbasewebapp attribute)": [[9, "isp.webapp.ispBaseWebApp.api"]], "api_get() (isp.safrs.system method)": [[9, "isp.safrs.system.api_get"]], "api_list() (isp.safrs.system method)": [[9, "isp.safrs.system.api_list"]], "apiurl (isp.webapp.ispbasewebapp attribute)": [[9, "isp.webapp.ispBaseWebApp.apiurl"]], "app (isp.webapp.ispbasewebapp attribute)": [[9, "isp.webapp.ispBaseWebApp.app"]], "appdialog() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS.appDialog"]], "apperror() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS.appError"]], "appinfo() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS.appInfo"]], "archive (isp.dicomarchive.ispdicomwriter attribute)": [[9, "isp.dicomarchive.ispDicomWriter.archive"]], "archive_deletesopinstanceuid() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.archive_deleteSOPInstanceUID"]], "archive_hassopinstanceuid() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.archive_hasSOPInstanceUID"]], "archive_loadsopinstanceuid() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.archive_loadSOPInstanceUID"]], "assoc (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.assoc"]], "associationstats (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.associationStats"]], "ax (isp.plot.plotclass attribute)": [[9, "isp.plot.plotClass.ax"]], "build() (isp.mssql.ispmssqlquery method)": [[9, "isp.mssql.ispMssqlQuery.build"]], "cache_ok (isp.safrs.isodatetimetype attribute)": [[9, "isp.safrs.isoDateTimeType.cache_ok"]], "cache_ok (isp.safrs.isodatetype attribute)": [[9, "isp.safrs.isoDateType.cache_ok"]], "cached() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.cached"]], "cancel() (isp.dicom.ispdicomrequest method)": [[9, "isp.dicom.ispDicomRequest.cancel"]], "cancelled() (isp.dicom.ispdicomrequest method)": [[9, "isp.dicom.ispDicomRequest.cancelled"]], "checkafter (isp.mssql.ispmssqlpool attribute)": [[9, "isp.mssql.ispMssqlPool.checkAfter"]], "checkin() (isp.mssql.ispmssqlpool method)": [[9, "isp.mssql.ispMssqlPool.checkin"]], "checkout() (isp.mssql.ispmssqlpool method)": [[9, "isp.mssql.ispMssqlPool.checkout"]], "class_ (isp.safrs.ispsafrsdummy attribute)": [[9, "isp.safrs.ispSAFRSDummy.class_"]], "clearstatements() (isp.mssql.ispmssqlconnection method)": [[9, "isp.mssql.ispMssqlConnection.clearStatements"]], "close() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.close"]], "close() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.close"]], "close() (isp.mssql.ispmssqlconnection method)": [[9, "isp.mssql.ispMssqlConnection.close"]], "close() (isp.mssql.ispmssqlpool method)": [[9, "isp.mssql.ispMssqlPool.close"]], "closeae() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.closeAE"]], "closepools() (isp.mssql.ispmssqlpool class method)": [[9, "isp.mssql.ispMssqlPool.closePools"]], "columns (isp.dicomarchive.ispdicomarchive attribute)": [[9, "isp.dicomarchive.ispDicomArchive.columns"]], "columns (isp.mssql.ispmssqlquery attribute)": [[9, "isp.mssql.ispMssqlQuery.columns"]], "conditions (isp.mssql.ispmssqlquery attribute)": [[9, "isp.mssql.ispMssqlQuery.conditions"]], "config (isp.mssql.ispmssql attribute)": [[9, "isp.mssql.ispMssql.config"]], "configkey() (in module isp.mssql)": [[9, "isp.mssql.configKey"]], "connect (isp.mssql.ispmssql attribute)": [[9, "isp.mssql.ispMssql.connect"]], "connect (isp.mssql.ispmssqlconnection attribute)": [[9, "isp.mssql.ispMssqlConnection.connect"]], "connectdatabase() (in module isp.mssql)": [[9, "isp.mssql.connectDatabase"]], "connectsqlite() (in module isp.mssql)": [[9, "isp.mssql.connectSqlite"]], "convert() (isp.mssql.ispmssqlresultcache static method)": [[9, "isp.mssql.ispMssqlResultCache.convert"]], "copydataset() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.copyDataset"]], "createdocs() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.createDocs"]], "created (isp.mssql.ispmssqlconnection attribute)": [[9, "isp.mssql.ispMssqlConnection.created"]], "custom_decorators (isp.safrs.ispsafrs attribute)": [[9, "isp.safrs.ispSAFRS.custom_decorators"]], "datasetcache (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.datasetCache"]], "datasetsize() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.datasetSize"]], "dbname (isp.mssql.ispmssql attribute)": [[9, "isp.mssql.ispMssql.dbname"]], "decodemsgobj() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.decodeMsgObj"]], "defaultttl (isp.mssql.ispmssqlresultcache attribute)": [[9, "isp.mssql.ispMssqlResultCache.defaultTTL"]], "defaults (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass.defaults"]], "dicompath (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.dicomPath"]], "dicompath (isp.dicomarchive.ispdicomarchive attribute)": [[9, "isp.dicomarchive.ispDicomArchive.dicomPath"]], "dict_merge() (in module isp.config)": [[9, "isp.config.dict_merge"]], "discard() (isp.dicomarchive.ispdicomdatasetcache method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.discard"]], "discard() (isp.mssql.ispmssqlresultcache method)": [[9, "isp.mssql.ispMssqlResultCache.discard"]], "docmnd() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.doCmnd"]], "domessage() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.doMessage"]], "doprocess() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.doProcess"]], "dopublish() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.doPublish"]], "dopublish() (isp.mqtt.mqttclass method)": [[9, "isp.mqtt.MQTTclass.doPublish"]], "dopublish() (isp.socket.websocketclass method)": [[9, "isp.socket.WebSocketClass.doPublish"]], "dosignal() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.doSignal"]], "dostatus() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.doStatus"]], "done() (isp.dicom.ispdicomrequest method)": [[9, "isp.dicom.ispDicomRequest.done"]], "echo() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.echo"]], "emit() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.emit"]], "engine (isp.mssql.ispmssql attribute)": [[9, "isp.mssql.ispMssql.engine"]], "engine (isp.mssql.ispmssqlconnection attribute)": [[9, "isp.mssql.ispMssqlConnection.engine"]], "engine (isp.mssql.ispmssqlquery attribute)": [[9, "isp.mssql.ispMssqlQuery.engine"]], "error() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.error"]], "exclude_attrs (isp.safrs.ispsafrs attribute)": [[9, "isp.safrs.ispSAFRS.exclude_attrs"]], "exclude_rels (isp.safrs.ispsafrs attribute)": [[9, "isp.safrs.ispSAFRS.exclude_rels"]], "execute() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.execute"]], "expose_object() (in module isp.webapp)": [[9, "isp.webapp.expose_object"]], "fig (isp.plot.plotclass attribute)": [[9, "isp.plot.plotClass.fig"]], "filechecksum() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.fileChecksum"]], "filename (isp.dicomarchive.ispdicomarchive attribute)": [[9, "isp.dicomarchive.ispDicomArchive.filename"]], "filter() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS.filter"]], "finish() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.finish"]], "flush() (isp.dicomarchive.ispdicomwriter method)": [[9, "isp.dicomarchive.ispDicomWriter.flush"]], "fromsql (isp.mssql.ispmssqlquery attribute)": [[9, "isp.mssql.ispMssqlQuery.fromSql"]], "fsyncbatch (isp.dicomarchive.ispdicomwriter attribute)": [[9, "isp.dicomarchive.ispDicomWriter.fsyncBatch"]], "future (isp.dicom.ispdicomrequest attribute)": [[9, "isp.dicom.ispDicomRequest.future"]], "get() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.get"]], "get() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.get"]], "get() (isp.mssql.ispmssqlresultcache method)": [[9, "isp.mssql.ispMssqlResultCache.get"]], "getcache() (isp.dicomarchive.ispdicomdatasetcache class method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.getCache"]], "getcache() (isp.mssql.ispmssqlresultcache class method)": [[9, "isp.mssql.ispMssqlResultCache.getCache"]], "getdataset() (isp.dicomarchive.ispdicomdatasetcache method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.getDataset"]], "getdbversion() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.getDbVersion"]], "getinfo() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.getInfo"]], "getloggerhandler() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.getLoggerHandler"]], "getpixels() (isp.dicomarchive.ispdicomdatasetcache method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.getPixels"]], "getplot() (isp.plot.plotclass method)": [[9, "isp.plot.plotClass.getPlot"]], "getpool() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.getPool"]], "getpool() (isp.mssql.ispmssqlpool class method)": [[9, "isp.mssql.ispMssqlPool.getPool"]], "getresultcache() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.getResultCache"]], "getstatementstats() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.getStatementStats"]], "getstats() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.getStats"]], "getstats() (isp.dicomarchive.ispdicomdatasetcache method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.getStats"]], "getstats() (isp.mssql.ispmssqlpool method)": [[9, "isp.mssql.ispMssqlPool.getStats"]], "getstats() (isp.mssql.ispmssqlresultcache method)": [[9, "isp.mssql.ispMssqlResultCache.getStats"]], "getttl() (isp.mssql.ispmssqlresultcache method)": [[9, "isp.mssql.ispMssqlResultCache.getTTL"]], "get_element() (isp.mpdf.pdfgenerator static method)": [[9, "isp.mpdf.PdfGenerator.get_element"]], "groupby() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS.groupby"]], "groupsplit() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS.groupsplit"]], "handle_event() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.handle_EVENT"]], "handle_store() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.handle_STORE"]], "haspixels() (isp.dicomarchive.ispdicomdatasetcache method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.hasPixels"]], "html() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.html"]], "http_methods (isp.safrs.ispsafrsdummy attribute)": [[9, "isp.safrs.ispSAFRSDummy.http_methods"]], "http_methods (isp.safrs.system attribute)": [[9, "isp.safrs.system.http_methods"]], "icon() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.icon"]], "id (isp.safrs.ispsafrsdummy attribute)": [[9, "isp.safrs.ispSAFRSDummy.id"]], "id_type (isp.safrs.ispsafrs attribute)": [[9, "isp.safrs.ispSAFRS.id_type"]], "id_type (isp.safrs.ispsafrsdummy attribute)": [[9, "isp.safrs.ispSAFRSDummy.id_type"]], "id_type (isp.safrs.system attribute)": [[9, "isp.safrs.system.id_type"]], "idletimeout (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.idleTimeout"]], "idletimeout (isp.dicomarchive.ispdicomwriter attribute)": [[9, "isp.dicomarchive.ispDicomWriter.idleTimeout"]], "idletimeout (isp.mssql.ispmssqlpool attribute)": [[9, "isp.mssql.ispMssqlPool.idleTimeout"]], "image() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.image"]], "impl (isp.safrs.isodatetimetype attribute)": [[9, "isp.safrs.isoDateTimeType.impl"]], "impl (isp.safrs.isodatetype attribute)": [[9, "isp.safrs.isoDateType.impl"]], "info() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.info"]], "initae() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.initAE"]], "initplot() (isp.plot.plotclass method)": [[9, "isp.plot.plotClass.initPlot"]], "instances (isp.dicom.ispdicomrequest attribute)": [[9, "isp.dicom.ispDicomRequest.instances"]], "invalidate() (isp.dicomarchive.ispdicomdatasetcache method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.invalidate"]], "invalidate() (isp.mssql.ispmssqlresultcache method)": [[9, "isp.mssql.ispMssqlResultCache.invalidate"]], "invalidatecache() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.invalidateCache"]], "invalidatecaches() (isp.dicomarchive.ispdicomdatasetcache class method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.invalidateCaches"]], "invalidatecaches() (isp.mssql.ispmssqlresultcache class method)": [[9, "isp.mssql.ispMssqlResultCache.invalidateCaches"]], "iso2date() (in module isp.safrs)": [[9, "isp.safrs.iso2date"]], "isodatetimetype (class in isp.safrs)": [[9, "isp.safrs.isoDateTimeType"]], "isodatetype (class in isp.safrs)": [[9, "isp.safrs.isoDateType"]], "isp": [[9, "module-isp"]], "isp.config": [[9, "module-isp.config"]], "isp.dicom": [[9, "module-isp.dicom"]], "isp.dicomarchive": [[9, "module-isp.dicomarchive"]], "isp.logging": [[9, "module-isp.logging"]], "isp.mpdf": [[9, "module-isp.mpdf"]], "isp.mqtt": [[9, "module-isp.mqtt"]], "isp.mssql": [[9, "module-isp.mssql"]], "isp.plot": [[9, "module-isp.plot"]], "isp.safrs": [[9, "module-isp.safrs"]], "isp.socket": [[9, "module-isp.socket"]], "isp.webapp": [[9, "module-isp.webapp"]], "ispbasewebapp (class in isp.webapp)": [[9, "isp.webapp.ispBaseWebApp"]], "ispconfig (class in isp.config)": [[9, "isp.config.ispConfig"]], "ispdicom (class in isp.dicom)": [[9, "isp.dicom.ispDicom"]], "ispdicomarchive (class in isp.dicomarchive)": [[9, "isp.dicomarchive.ispDicomArchive"]], "ispdicomdatasetcache (class in isp.dicomarchive)": [[9, "isp.dicomarchive.ispDicomDatasetCache"]], "ispdicomrequest (class in isp.dicom)": [[9, "isp.dicom.ispDicomRequest"]], "ispdicomwriter (class in isp.dicomarchive)": [[9, "isp.dicomarchive.ispDicomWriter"]], "ispmssql (class in isp.mssql)": [[9, "isp.mssql.ispMssql"]], "ispmssqlconnection (class in isp.mssql)": [[9, "isp.mssql.ispMssqlConnection"]], "ispmssqlpool (class in isp.mssql)": [[9, "isp.mssql.ispMssqlPool"]], "ispmssqlquery (class in isp.mssql)": [[9, "isp.mssql.ispMssqlQuery"]], "ispmssqlresultcache (class in isp.mssql)": [[9, "isp.mssql.ispMssqlResultCache"]], "ispsafrs (class in isp.safrs)": [[9, "isp.safrs.ispSAFRS"]], "ispsafrsdummy (class in isp.safrs)": [[9, "isp.safrs.ispSAFRSDummy"]], "ispsafrsmodel (class in isp.safrs)": [[9, "isp.safrs.ispSAFRSModel"]], "ispsafrs_decorator() (in module isp.safrs)": [[9, "isp.safrs.ispSAFRS_decorator"]], "iterate() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.iterate"]], "jinjaenv() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.jinjaEnv"]], "key() (isp.mssql.ispmssqlresultcache static method)": [[9, "isp.mssql.ispMssqlResultCache.key"]], "lastexecuteparams (isp.mssql.ispmssql attribute)": [[9, "isp.mssql.ispMssql.lastExecuteParams"]], "lastexecutesql (isp.mssql.ispmssql attribute)": [[9, "isp.mssql.ispMssql.lastExecuteSql"]], "lastused (isp.mssql.ispmssqlconnection attribute)": [[9, "isp.mssql.ispMssqlConnection.lastUsed"]], "level (isp.logging.logginghandlerclass attribute)": [[9, "isp.logging.loggingHandlerClass.level"]], "loadpixelcache() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.loadPixelCache"]], "loadpixeldata() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.loadPixelData"]], "logger (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass.logger"]], "logging (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass.logging"]], "logginghandlerclass (class in isp.logging)": [[9, "isp.logging.loggingHandlerClass"]], "markdown() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.markdown"]], "mathtext() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.mathtext"]], "maxbytes (isp.dicomarchive.ispdicomdatasetcache attribute)": [[9, "isp.dicomarchive.ispDicomDatasetCache.maxBytes"]], "maxbytes (isp.mssql.ispmssqlresultcache attribute)": [[9, "isp.mssql.ispMssqlResultCache.maxBytes"]], "maxsize (isp.mssql.ispmssqlpool attribute)": [[9, "isp.mssql.ispMssqlPool.maxSize"]], "maxsize (isp.dicomarchive.ispdicomwriter attribute)": [[9, "isp.dicomarchive.ispDicomWriter.maxsize"]], "merge() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.merge"]], "messageid (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.messageId"]], "migrate() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.migrate"]], "minsize (isp.mssql.ispmssqlpool attribute)": [[9, "isp.mssql.ispMssqlPool.minSize"]], "mqttcleanup() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.mqttCleanup"]], "mqttgethandler() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.mqttGetHandler"]], "mqttinitloggerhandler() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.mqttInitLoggerHandler"]], "name (isp.dicomarchive.ispdicomdatasetcache attribute)": [[9, "isp.dicomarchive.ispDicomDatasetCache.name"]], "name (isp.mssql.ispmssql attribute)": [[9, "isp.mssql.ispMssql.name"]], "name (isp.mssql.ispmssqlpool attribute)": [[9, "isp.mssql.ispMssqlPool.name"]], "name (isp.mssql.ispmssqlresultcache attribute)": [[9, "isp.mssql.ispMssqlResultCache.name"]], "newpage() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.newPage"]], "no_flask_admin (isp.safrs.ispsafrsdummy attribute)": [[9, "isp.safrs.ispSAFRSDummy.no_flask_admin"]], "onconnect() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.onConnect"]], "onconnect() (isp.mqtt.mqttclass method)": [[9, "isp.mqtt.MQTTclass.onConnect"]], "ondisconnect() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.onDisconnect"]], "onmessage() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.onMessage"]], "onmessage() (isp.mqtt.mqttclass method)": [[9, "isp.mqtt.MQTTclass.onMessage"]], "onmessage() (isp.socket.websocketclass method)": [[9, "isp.socket.WebSocketClass.onMessage"]], "onthefly() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.onTheFly"]], "openassociation() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.openAssociation"]], "opendatabase() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.openDatabase"]], "order_by (isp.safrs.ispsafrsdummy attribute)": [[9, "isp.safrs.ispSAFRSDummy.order_by"]], "override (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.override"]], "pandas() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.pandas"]], "pandasplot() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.pandasPlot"]], "parallel (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.parallel"]], "params (isp.dicom.ispdicomrequest attribute)": [[9, "isp.dicom.ispDicomRequest.params"]], "params (isp.mssql.ispmssqlquery attribute)": [[9, "isp.mssql.ispMssqlQuery.params"]], "parserequestparams() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.parseRequestParams"]], "password (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass.password"]], "path() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.path"]], "ping() (isp.mssql.ispmssqlconnection method)": [[9, "isp.mssql.ispMssqlConnection.ping"]], "pixelcachefilename() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.pixelCacheFilename"]], "pixeldatadeferred() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.pixelDataDeferred"]], "plotclass (class in isp.plot)": [[9, "isp.plot.plotClass"]], "port (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass.port"]], "prepare() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.prepare"]], "printdebugpage() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.printDebugPage"]], "process_bind_param() (isp.safrs.isodatetimetype method)": [[9, "isp.safrs.isoDateTimeType.process_bind_param"]], "process_bind_param() (isp.safrs.isodatetype method)": [[9, "isp.safrs.isoDateType.process_bind_param"]], "progress_ready() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.progress_ready"]], "progress_run() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.progress_run"]], "progress_start() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.progress_start"]], "publish() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.publish"]], "put() (isp.dicomarchive.ispdicomwriter method)": [[9, "isp.dicomarchive.ispDicomWriter.put"]], "put() (isp.mssql.ispmssqlresultcache method)": [[9, "isp.mssql.ispMssqlResultCache.put"]], "putdataset() (isp.dicomarchive.ispdicomdatasetcache method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.putDataset"]], "putpixels() (isp.dicomarchive.ispdicomdatasetcache method)": [[9, "isp.dicomarchive.ispDicomDatasetCache.putPixels"]], "python_type (isp.safrs.isodatetimetype property)": [[9, "isp.safrs.isoDateTimeType.python_type"]], "python_type (isp.safrs.isodatetype property)": [[9, "isp.safrs.isoDateType.python_type"]], "query() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.query"]], "query() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.query"]], "readdataset() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.readDataset"]], "releasepixeldata() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.releasePixelData"]], "remove() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.remove"]], "removeloggerhandler() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.removeLoggerHandler"]], "removepixelcache() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.removePixelCache"]], "render() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.render"]], "render_pdf() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.render_pdf"]], "render_template() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.render_template"]], "response_headers (isp.webapp.ispbasewebapp attribute)": [[9, "isp.webapp.ispBaseWebApp.response_headers"]], "result() (isp.dicom.ispdicomrequest method)": [[9, "isp.dicom.ispDicomRequest.result"]], "resultcachettl (isp.mssql.ispmssql attribute)": [[9, "id41"], [9, "isp.mssql.ispMssql.resultCacheTTL"]], "resulticon() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.resultIcon"]], "retries (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.retries"]], "retrieve() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.retrieve"]], "retrieveasync() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.retrieveAsync"]], "retrievemany() (isp.dicom.ispdicom method)": [[9, "isp.dicom.ispDicom.retrieveMany"]], "retrievetimeout (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.retrieveTimeout"]], "retrieveworkers (isp.dicom.ispdicom attribute)": [[9, "id0"], [9, "isp.dicom.ispDicom.retrieveWorkers"]], "retrybackoff (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.retryBackoff"]], "rootinitlogger() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.rootInitLogger"]], "routeapi() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.routeApi"]], "routecoverage() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.routeCoverage"]], "routedocs() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.routeDocs"]], "routefile() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.routeFile"]], "routeiframe() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.routeIFrame"]], "routeindex() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.routeIndex"]], "routerender() (isp.webapp.ispbasewebapp method)": [[9, "isp.webapp.ispBaseWebApp.routeRender"]], "rql_parse() (isp.safrs.rqlquery method)": [[9, "isp.safrs.RQLQuery.rql_parse"]], "savepixelcache() (in module isp.dicomarchive)": [[9, "isp.dicomarchive.savePixelCache"]], "scp (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.scp"]], "select() (isp.mssql.ispmssqlquery method)": [[9, "isp.mssql.ispMssqlQuery.select"]], "send() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.send"]], "server (isp.dicom.ispdicom attribute)": [[9, "isp.dicom.ispDicom.server"]], "server (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass.server"]], "set() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.set"]], "setcontentname() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.setContentName"]], "setlastexecute() (isp.mssql.ispmssql method)": [[9, "isp.mssql.ispMssql.setLastExecute"]], "setvariables() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.setVariables"]], "set_class_defaults() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.set_class_defaults"]], "set_page_defaults() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.set_page_defaults"]], "shardfilename() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.shardFilename"]], "shardpath() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.shardPath"]], "showplot() (isp.plot.plotclass method)": [[9, "isp.plot.plotClass.showPlot"]], "shutdown() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.shutdown"]], "shutdown() (isp.mqtt.mqttclass method)": [[9, "isp.mqtt.MQTTclass.shutdown"]], "shutdown() (isp.socket.websocketclass method)": [[9, "isp.socket.WebSocketClass.shutdown"]], "signal (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass.signal"]], "signals (isp.dicom.ispdicomrequest attribute)": [[9, "isp.dicom.ispDicomRequest.signals"]], "sizeof() (isp.mssql.ispmssqlresultcache static method)": [[9, "isp.mssql.ispMssqlResultCache.sizeOf"]], "startup() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.startup"]], "startup() (isp.mqtt.mqttclass method)": [[9, "isp.mqtt.MQTTclass.startup"]], "startup() (isp.socket.websocketclass method)": [[9, "isp.socket.WebSocketClass.startup"]], "statementcachesize (isp.mssql.ispmssql attribute)": [[9, "isp.mssql.ispMssql.statementCacheSize"]], "statementstats (isp.mssql.ispmssql attribute)": [[9, "isp.mssql.ispMssql.statementStats"]], "statements (isp.mssql.ispmssqlconnection attribute)": [[9, "isp.mssql.ispMssqlConnection.statements"]], "stats (isp.dicomarchive.ispdicomdatasetcache attribute)": [[9, "isp.dicomarchive.ispDicomDatasetCache.stats"]], "stats (isp.dicomarchive.ispdicomwriter attribute)": [[9, "isp.dicomarchive.ispDicomWriter.stats"]], "stats (isp.mssql.ispmssqlpool attribute)": [[9, "isp.mssql.ispMssqlPool.stats"]], "stats (isp.mssql.ispmssqlresultcache attribute)": [[9, "isp.mssql.ispMssqlResultCache.stats"]], "status (isp.dicom.ispdicomrequest attribute)": [[9, "isp.dicom.ispDicomRequest.status"]], "system (class in isp.safrs)": [[9, "isp.safrs.system"]], "test() (isp.safrs.system class method)": [[9, "isp.safrs.system.test"]], "text() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.text"]], "textfile() (isp.mpdf.pdfgenerator method)": [[9, "isp.mpdf.PdfGenerator.textFile"]], "timeout (isp.dicom.ispdicomrequest attribute)": [[9, "isp.dicom.ispDicomRequest.timeout"]], "timeout (isp.mssql.ispmssqlpool attribute)": [[9, "isp.mssql.ispMssqlPool.timeout"]], "tokenexpression() (isp.mssql.ispmssqlquery method)": [[9, "isp.mssql.ispMssqlQuery.tokenExpression"]], "ttl (isp.mssql.ispmssqlresultcache attribute)": [[9, "isp.mssql.ispMssqlResultCache.ttl"]], "undefined() (isp.safrs.ispsafrs class method)": [[9, "isp.safrs.ispSAFRS.undefined"]], "update() (isp.config.ispconfig method)": [[9, "isp.config.ispConfig.update"]], "url_prefix (isp.safrs.system attribute)": [[9, "isp.safrs.system.url_prefix"]], "usepool (isp.mssql.ispmssql attribute)": [[9, "id42"], [9, "isp.mssql.ispMssql.usePool"]], "username (isp.mqtt.mqttclass attribute)": [[9, "isp.mqtt.MQTTclass.username"]], "verify() (isp.dicomarchive.ispdicomarchive method)": [[9, "isp.dicomarchive.ispDicomArchive.verify"]], "warning() (isp.logging.logginghandlerclass method)": [[9, "isp.logging.loggingHandlerClass.warning"]], "websocket (isp.webapp.ispbasewebapp attribute)": [[9, "isp.webapp.ispBaseWebApp.webSocket"]], "where() (isp.mssql.ispmssqlquery method)": [[9, "isp.mssql.ispMssqlQuery.where"]], "wheredate() (isp.mssql.ispmssqlquery method)": [[9, "isp.mssql.ispMssqlQuery.whereDate"]], "wherein() (isp.mssql.ispmssqlquery method)": [[9, "isp.mssql.ispMssqlQuery.whereIn"]], "whererange() (isp.mssql.ispmssqlquery method)": [[9, "isp.mssql.ispMssqlQuery.whereRange"]], "wheretokens() (isp.mssql.ispmssqlquery method)": [[9, "isp.mssql.ispMssqlQuery.whereTokens"]], "pygqa": [[11, "module-pygqa"]], "version": [[12, "module-version"]]}})
\ No newline at end of file
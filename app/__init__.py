@@ -123,6 +123,16 @@ class system( system ):
 
         html += '<div class="alert alert-{} ">{}</div>'.format( info_class, info_text )
 
+        if aria:
+            cache = aria.getResultCache()
+            if cache:
+                cache_stats = cache.getStats()
+                info_text = 'Abfrage Cache <span class="badge badge-info">database.{}.result_cache</span> - Trefferquote: <b>{:.1%}</b>'.format( _database_key, cache_stats["hit_ratio"] )
+                info_text += '</br> <pre>{}</pre>'.format( json.dumps( cache_stats, indent=2 ) )
+                html += '<div class="alert alert-info ">{}</div>'.format( info_text )
+            else:
+                html += '<div class="alert alert-info ">Abfrage Cache ist deaktiviert</div>'
+
         if connect:
             html += '<div class="alert alert-dark" >Prüfe Patienten für <span class="badge badge-info">units</span> - Konfiguration:'
             html += '</br> <pre>{}</pre>'.format( json.dumps( config.get( "units" ).toDict(), indent=2 ) )
@@ -130,8 +140,8 @@ class system( system ):
                 if not unit:
                     continue
                 sql = "SELECT PatientSer, PatientId, FirstName, LastName FROM [{dbname}].[dbo].[Patient] [Patient]"
-                sql = sql + " WHERE [PatientId] = '{}' ".format( name )
-                result = aria.execute( sql )
+                sql = sql + " WHERE [PatientId] = ? "
+                result = aria.execute( sql, [ name ] )
 
                 html += aria.lastExecuteSql
 
@@ -219,6 +229,13 @@ class system( system ):
 
 
         dicom_info = adc.getInfo()
+
+        if dicom_info["dataset_cache"]:
+            info_text = 'Dataset Cache <span class="badge badge-info">dicom.{}.dataset_cache</span> - Trefferquote: <b>{:.1%}</b>'.format( _dicom_key, dicom_info["dataset_cache"]["hit_ratio"] )
+            info_text += '</br> <pre>{}</pre>'.format( json.dumps( dicom_info["dataset_cache"], indent=2 ) )
+            html += '<div class="alert alert-info ">{}</div>'.format( info_text )
+        else:
+            html += '<div class="alert alert-info ">Dataset Cache ist deaktiviert</div>'
         
         if status == 0x0000:
             info_class = "success"
@@ -447,6 +464,36 @@ def exportPandas( filename, conn:str=None ):
 
     print( msg )
 
+def migrateDicomArchive( server:str=None, copy:bool=False ):
+    """Vorhandene DICOM Dateien in das verteilte Verzeichnis mit Index übernehmen
+
+    Parameters
+    ----------
+    server : str, optional
+        DICOM Server Eintrag. The default is dicom.servername.
+    copy : bool, optional
+        Dateien kopieren statt verschieben. The default is False.
+
+    """
+    from isp.dicomarchive import ispDicomArchive
+    _config = ispConfig( )
+    if not server:
+        server = _config.get( "dicom.servername", "VMSDBD" )
+
+    dicomPath = str( _config.get( ["dicom", server, "local_dir"], "", replaceVariables=True ) )
+    if dicomPath == "" or not os.path.isdir( dicomPath ):
+        print( "migrate kein DICOM Verzeichnis für: {}".format( server ) )
+        return
+
+    archive = ispDicomArchive( dicomPath )
+    start = time.time()
+    result = archive.migrate( copy=copy )
+    archive.close()
+
+    print( "migrate {}: {} verschoben, {} doppelt, {} ergänzt, {} Fehler in {:.1f} s".format(
+        dicomPath, result["moved"], result["duplicate"], result["indexed"], result["failed"], time.time() - start
+    ) )
+
 
 # -----------------------------------------------------------------------------
 def run( overlay:dict={}, additionalModels:list=[] ):
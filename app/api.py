@@ -206,6 +206,12 @@ class gqa( ispSAFRSDummy ):
               in : query
               required : false
               description : Name eines Geräts wird nach pid umgewandelt und auch dort gesetzt
+            - name : refresh
+              in : query
+              type: boolean
+              required : false
+              default : false
+              description : Bilder neu aus Aria holen statt aus dem lokalen Spiegel
 
         ----
 
@@ -226,7 +232,8 @@ class gqa( ispSAFRSDummy ):
                 pids = _kwargs["pid"],
                 year = _kwargs["year"],
                 testTags = _kwargs["tags"],
-                withResult=True     # Testergebnisse mit ausgeben
+                withResult=True,    # Testergebnisse mit ausgeben
+                refresh = _kwargs.get( "refresh", False ) in [ True, "true", "1", 1 ]
             )
 
         else:
@@ -565,7 +572,7 @@ class gqa( ispSAFRSDummy ):
         # Aufruf Paramter in App-Info ablegen
         cls.appInfo( "do_get", _kwargs )
 
-        where = "LEN([Radiation].[Comment]) > 0  "
+        where = "[Radiation].[Comment] <> ''"
 
         pids = _kwargs["pid"]
         if type(pids) == str:
@@ -577,13 +584,10 @@ class gqa( ispSAFRSDummy ):
         if not pids or len(pids) == 0:
             _result = { "error": "no pid (Aria Patient ID) found in config or params" }
         else:
-            subSql = []
-            for pid in pids:
-                subSql.append( "[Patient].[PatientId]='{}'".format( pid.strip() ) )
-            if len( subSql ) > 0:
-                where += " AND (" + " OR ".join( subSql ) + ")"
+            pids = [ pid.strip() for pid in pids ]
 
             images, sql = cls.ariaDicom.getImages(
+                PatientId=pids,
                 addWhere=where,
                 AcquisitionYear=_kwargs["year"]
             #    AcquisitionMonth=month,
@@ -591,7 +595,7 @@ class gqa( ispSAFRSDummy ):
             #    testTags=testTags
             )
 
-            _result = {"sql": sql, "data":images }
+            _result = {"sql": sql, "params": cls.ariaDicom.lastExecuteParams, "data":images }
 
         return cls._int_json_response( { "data": _result } )
 
@@ -669,6 +673,15 @@ class gqa( ispSAFRSDummy ):
 
         # nur wenn mind. pid, year, testid angegeben wurde
         if "pid" in _kwargs and "year" in _kwargs and "testid" in _kwargs:
+            # die Datenbank Abfragen aller Patienten Ids gleichzeitig
+            runData = cls.ariaDicom.getRunData(
+                pids =          _kwargs["pid"],
+                year =          int( _kwargs["year"] ),
+                month =         int( _kwargs["month"] ),
+                day =           int( _kwargs["day"] ),
+                testId =        _kwargs["testid"],
+                reloadDicom =   _kwargs["reloadDicom"]
+            )
             # für jede Patienten Id
             for pid in _kwargs["pid"]:
                 _result = cls.ariaDicom.runTests(
@@ -678,7 +691,8 @@ class gqa( ispSAFRSDummy ):
                     day =           int( _kwargs["day"] ),
                     testId =        _kwargs["testid"],
                     reloadDicom =   _kwargs["reloadDicom"],
-                    unittest =      _kwargs["unittest"]
+                    unittest =      _kwargs["unittest"],
+                    data =          runData.get( pid )
                 )
 
         if _kwargs["getall"] == True: # pragma: no cover
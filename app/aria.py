@@ -8,38 +8,163 @@ __author__ = "R. Bauer"
 __copyright__ = "MedPhyDO - Machbarkeitsstudien des Instituts für Medizinische Strahlenphysik und Strahlenschutz am Klinikum Dortmund im Rahmen von Bachelor und Masterarbeiten an der TU-Dortmund / FH-Dortmund"
 __credits__ = ["R.Bauer", "K.Loot"]
 __license__ = "MIT"
-__version__ = "0.2.1"
+__version__ = "0.2.2"
 __status__ = "Prototype"
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import itertools
 from pathlib import Path
 import re
+import numpy as np
+import pandas as pd
 
 import logging
 logger = logging.getLogger( "ISP" )
 
 from isp.mssql import ispMssql
+from app.ariamirror import ariaMirror
+from app.tagindex import gqaTestMap, gqaTagIndex
+
+# Felder und Tabellen für getImages
+imageColumns = [
+    "[Patient].[PatientId]", "[Course].[CourseId]", "[PlanSetup].[PlanSetupId]", "[Radiation].[RadiationId]",
+    "[Series].[SeriesUID]", "[Series].[FrameOfReferenceUID]",
+    "[Series].[SeriesId]", "[Series].[SeriesNumber]", "[Series].[CreationDate]",
+    "[Slice].[SliceUID]", "[Study].[StudyUID]",
+    "[SliceRT].[SliceRTType]", "[SliceRT].[AcqNote]", "[SliceRT].[Energy]", "[SliceRT].[MetersetExposure]",
+    "[SliceRT].[DoseRate]", "[SliceRT].[SAD]", "[SliceRT].[GantryAngle]", "[SliceRT].[CollRtn]",
+    "[SliceRT].[CollX1]", "[SliceRT].[CollX2]", "[SliceRT].[CollY1]", "[SliceRT].[CollY2]", "[SliceRT].[RadiationMachineName]",
+    "[ExternalField].[GantryRtn]", "[ExternalField].[GantryRtnExt]", "[ExternalField].[GantryRtnDirection]",
+    "[ExternalField].[StopAngle]", "[ExternalField].[CollMode]",
+    "[Slice].[AcquisitionDateTime]", "[Slice].[PatientSupportAngle]", "[Slice].[FileName]", "[Slice].[SliceModality]",
+    "[MLCPlan].[MLCPlanType]", "[MLCPlan].[IndexParameterType]",
+    "[Radiation].[RadiationSer]", "[Radiation].[TechniqueLabel]", "[Radiation].[Comment]",
+    "[Image].[ImageId]"
+]
+
+imageFrom = """[{dbname}].[dbo].[Patient] [Patient]
+  INNER JOIN [{dbname}].[dbo].[Course] [Course] ON ([Patient].[PatientSer] = [Course].[PatientSer])
+  INNER JOIN [{dbname}].[dbo].[PlanSetup] [PlanSetup] ON ([Course].[CourseSer] = [PlanSetup].[CourseSer])
+  INNER JOIN [{dbname}].[dbo].[Radiation] [Radiation] ON ([PlanSetup].[PlanSetupSer] = [Radiation].[PlanSetupSer])
+  INNER JOIN [{dbname}].[dbo].[ExternalField] [ExternalField] ON ([Radiation].[RadiationSer] = [ExternalField].[RadiationSer])
+  INNER JOIN [{dbname}].[dbo].[SliceRT] [SliceRT] ON ([Radiation].[RadiationSer] = [SliceRT].[RadiationSer])
+  INNER JOIN [{dbname}].[dbo].[Slice] [Slice] ON ([SliceRT].[SliceSer] = [Slice].[SliceSer])
+  INNER JOIN [{dbname}].[dbo].[Series] [Series] ON ([Slice].[SeriesSer] = [Series].[SeriesSer])
+  LEFT JOIN [{dbname}].[dbo].[MLCPlan] [MLCPlan] ON ([Radiation].[RadiationSer] = [MLCPlan].[RadiationSer])
+  INNER JOIN [{dbname}].[dbo].[Study] [Study] ON ([Series].[StudySer] = [Study].[StudySer])
+  INNER JOIN [{dbname}].[dbo].[ImageSlice] [ImageSlice] ON ([Slice].[SliceSer] = [ImageSlice].[SliceSer])
+  INNER JOIN [{dbname}].[dbo].[Image] [Image] ON ([ImageSlice].[ImageSer] = [Image].[ImageSer])"""
 
 class ariaClass( ispMssql ):
     '''Database querys on Aria Database see ispMssql
 
+    Connections are borrowed from the shared ispMssqlPool
+
+    Results of getImages and getTags are held in the shared ispMssqlResultCache.
+    Images of past years change rarely and are held longer
+
     '''
 
+    usePool: bool = True
+
+    resultCacheTTL: dict = {
+        "images": 300,
+        "images_past": 86400,
+        "tags": 600
+    }
+
+    def getParallel( self ):
+        """Anzahl der gleichzeitigen Abfragen aus database.<name>.parallel (default 4)
+
+        Begrenzt durch die Größe des Verbindungspools, ohne Pool 1
+
+        Returns
+        -------
+        int
+
+        """
+        pool = self.getPool() if self.usePool else None
+        if not pool:
+            return 1
+        parallel = int( self.config.database[ self.name ].get( "parallel", 4 ) )
+        return max( 1, min( parallel, pool.maxSize ) )
+
+    def executeParallel( self, func, calls:list ):
+        """Mehrere Abfragen gleichzeitig ausführen, jede mit einer eigenen Verbindung aus dem Pool
+
+        Die Abfragen in den worker threads setzen lastExecuteSql und lastExecuteParams nicht,
+        sie würden sich sonst gegenseitig überschreiben.
+
+        Parameters
+        ----------
+        func : callable
+            aufzurufende Funktion z.B. getImages
+        calls : list
+            mit den kwargs dict für jeden Aufruf von func
+
+        Returns
+        -------
+        list
+            Rückgaben von func in der Reihenfolge von calls
+
+        """
+        workers = min( self.getParallel(), len( calls ) )
+        if workers <= 1:
+            return [ func( **kwargs ) for kwargs in calls ]
+
+        def call( kwargs ):
+            # die gleichzeitigen Abfragen setzen lastExecuteSql und lastExecuteParams nicht
+            self._worker.parallel = True
+            try:
+                return func( **kwargs )
+            finally:
+                self._worker.parallel = False
+
+        with ThreadPoolExecutor( max_workers=workers, thread_name_prefix="aria" ) as executor:
+            return list( executor.map( call, calls ) )
+
+    def getMirror( self ):
+        """Der lokale Spiegel der Bild Metadaten falls in database.<name>.mirror angegeben
+
+        Returns
+        -------
+        ariaMirror or None
+
+        """
+        if not hasattr( self, "_mirror" ):
+            self._mirror = ariaMirror.fromConfig( self, imageColumns, imageFrom )
+        return self._mirror
+
+    def getTestMap( self ):
+        """Die einmal aus config.GQA bestimmten Zuordnungen von testTag, testId, inaktiv und energyFields
+
+        Returns
+        -------
+        gqaTestMap
+
+        """
+        if not hasattr( self, "_testMap" ):
+            self._testMap = gqaTestMap( self.config.get( "GQA", {} ) )
+        return self._testMap
+
     def getImages( self,
                   PatientId=None, CourseId=None,
                   PlanSetupId=None, RadiationSer=None,
                   AcquisitionYear=None,
                   AcquisitionMonth=None,
                   AcquisitionDay=None,
-                  testTags:list=None, addWhere:str="" ):
+                  testTags:list=None, addWhere:str="", addParams:list=None,
+                  mode:str="list", refresh:bool=False ):
         """SQl Anweisung um alle Felder zu holen die für die Auswertungen benötigt werden.
 
         Parameters
         ----------
-        PatientId : str, optional
-            zu suchende Patienten Id. default None
-        CourseId : str, optional
+        PatientId : str|list, optional
+            zu suchende Patienten Id oder Liste von Ids. default None
+        CourseId : str|list, optional
             zu suchende CourseId, default None
-        PlanSetupId : str, optional
+        PlanSetupId : str|list, optional
             zu suchende PlanSetupId, default None
         RadiationSer : str, optional
             zu suchende RadiationSer, default None
@@ -50,13 +175,20 @@ class ariaClass( ispMssql ):
         AcquisitionDay : str, optional
             zu suchender Tag im AcquisitionDateTime Feld, default None
         testTags : list, optional
-            im Comment Field vorkommende tags, default None
+            im Comment Field als ganzes Wort oder mit :subTag vorkommende tags, default None
         addWhere : str, optional
             zusätzlicher sql where filter, default ""
+        addParams : list, optional
+            Parameter für die ? Platzhalter in addWhere, default None
+        mode : str, optional
+            Art der Rückgabe von execute (list, stream, columns, frame), default "list"
+        refresh : bool, optional
+            bei Verwendung des Spiegels alle Bilder der PatientId neu holen
+            sonst das Ergebnis nicht aus dem Cache verwenden, default False
 
         Returns
         -------
-        list
+        list|generator|dict|DataFrame
             Ergebnis der sql Abfrage
         str
             Verwendete sql Abfrage
@@ -64,69 +196,58 @@ class ariaClass( ispMssql ):
         """
 
         if not PatientId and addWhere == "":
-            return [], ""
+            return self._emptyResult( mode ), ""
+
+        # mit PatientId aus dem lokalen Spiegel holen
+        mirror = self.getMirror() if PatientId else None
 
         # alles aufeinmal holen
-        sql = """
-        SELECT [Patient].[PatientId], [Course].[CourseId], [PlanSetup].[PlanSetupId], [Radiation].[RadiationId]
-          , [Series].[SeriesUID], [Series].[FrameOfReferenceUID]
-          , [Series].[SeriesId], [Series].[SeriesNumber], [Series].[CreationDate]
-          , [Slice].[SliceUID], [Study].[StudyUID]
-          , [SliceRT].[SliceRTType], [SliceRT].[AcqNote], [SliceRT].[Energy],[SliceRT].[MetersetExposure], [SliceRT].[DoseRate], [SliceRT].[SAD], [SliceRT].[GantryAngle], [SliceRT].[CollRtn]
-          , [SliceRT].[CollX1], [SliceRT].[CollX2], [SliceRT].[CollY1], [SliceRT].[CollY2], [SliceRT].[RadiationMachineName]
-          , [ExternalField].[GantryRtn], [ExternalField].[GantryRtnExt], [ExternalField].[GantryRtnDirection], [ExternalField].[StopAngle], [ExternalField].[CollMode]
-          , [Slice].[AcquisitionDateTime], [Slice].[SliceUID], [Slice].[PatientSupportAngle], [Slice].[FileName], [Slice].[SliceModality]
-          , [MLCPlan].[MLCPlanType], [MLCPlan].[IndexParameterType]
-          , [Radiation].[RadiationSer], [Radiation].[TechniqueLabel], [Radiation].[Comment]
-          , [Image].[ImageId]
-        FROM [{dbname}].[dbo].[Patient] [Patient]
-          INNER JOIN [{dbname}].[dbo].[Course] [Course] ON ([Patient].[PatientSer] = [Course].[PatientSer])
-          INNER JOIN [{dbname}].[dbo].[PlanSetup] [PlanSetup] ON ([Course].[CourseSer] = [PlanSetup].[CourseSer])
-          INNER JOIN [{dbname}].[dbo].[Radiation] [Radiation] ON ([PlanSetup].[PlanSetupSer] = [Radiation].[PlanSetupSer])
-          INNER JOIN [{dbname}].[dbo].[ExternalField] [ExternalField] ON ([Radiation].[RadiationSer] = [ExternalField].[RadiationSer])
-          INNER JOIN [{dbname}].[dbo].[SliceRT] [SliceRT] ON ([Radiation].[RadiationSer] = [SliceRT].[RadiationSer])
-          INNER JOIN [{dbname}].[dbo].[Slice] [Slice] ON ([SliceRT].[SliceSer] = [Slice].[SliceSer])
-          INNER JOIN [{dbname}].[dbo].[Series] [Series] ON ([Slice].[SeriesSer] = [Series].[SeriesSer])
-          LEFT JOIN [{dbname}].[dbo].[MLCPlan] [MLCPlan] ON ([Radiation].[RadiationSer] = [MLCPlan].[RadiationSer])
-          INNER JOIN [{dbname}].[dbo].[Study] [Study] ON ([Series].[StudySer] = [Study].[StudySer])
-          INNER JOIN [{dbname}].[dbo].[ImageSlice] [ImageSlice] ON ([Slice].[SliceSer] = [ImageSlice].[SliceSer])
-          INNER JOIN [{dbname}].[dbo].[Image] [Image] ON ([ImageSlice].[ImageSer] = [Image].[ImageSer])
-        WHERE NOT [SliceRT].[SliceRTType] = 'SliceDRR'
-        """
+        if mirror:
+            query = mirror.query().select( *imageColumns )
+        else:
+            query = self.query( imageFrom ).select( *imageColumns )
+        query.where( "NOT [SliceRT].[SliceRTType] = 'SliceDRR'" )
 
         if PatientId:
-            sql = sql + " AND [Patient].[PatientId] = '{}' ".format( PatientId )
+            query.whereIn( "[Patient].[PatientId]", PatientId )
         if CourseId:
-            sql = sql + " AND [Course].[CourseId] = '{}' ".format( CourseId)
+            query.whereIn( "[Course].[CourseId]", CourseId )
         if PlanSetupId:
-            sql = sql + " AND [PlanSetup].[PlanSetupId] = '{}' ".format( PlanSetupId)
+            query.whereIn( "[PlanSetup].[PlanSetupId]", PlanSetupId )
         if RadiationSer:
-            sql = sql + " AND [Radiation].[RadiationSer] = {} ".format( RadiationSer)
-        if AcquisitionYear:
-            sql = sql + " AND YEAR([Slice].[AcquisitionDateTime]) = {} ".format( AcquisitionYear)
-        if AcquisitionMonth:
-            sql = sql + " AND MONTH([Slice].[AcquisitionDateTime]) = {} ".format( AcquisitionMonth )
-        if AcquisitionDay:
-            sql = sql + " AND DAY([Slice].[AcquisitionDateTime]) = {} ".format( AcquisitionDay )
+            query.whereIn( "[Radiation].[RadiationSer]", int( RadiationSer ) )
+
+        # als Bereich damit der Index auf AcquisitionDateTime verwendet werden kann
+        query.whereDate( "[Slice].[AcquisitionDateTime]",
+            year=AcquisitionYear, month=AcquisitionMonth, day=AcquisitionDay
+        )
 
         if testTags:
-            subSql = []
-            for tag in testTags:
-                subSql.append("CHARINDEX('{}', [Radiation].[Comment] ) > 0".format( tag ) )
-            if len( subSql ) > 0:
-                sql += " AND (" + " OR ".join( subSql ) + ")"
+            query.whereTokens( "[Radiation].[Comment]", testTags )
 
         if addWhere != "":
-            sql += " AND " + addWhere
+            query.where( addWhere, addParams )
 
-        return self.execute( sql ), sql
+        sql, params = query.build()
+
+        if mirror:
+            mirror.sync( PatientId, force=refresh )
+            self.setLastExecute( sql, params )
+            return mirror.execute( sql, params, mode=mode ), sql
+
+        # abgeschlossene Jahre ändern sich kaum und bleiben länger im Cache
+        cache = "images"
+        if AcquisitionYear and int( AcquisitionYear ) < datetime.now().year:
+            cache = "images_past"
+
+        return self.execute( sql, params, mode=mode, cache=cache, refresh=refresh ), sql
 
     def getTestData( self,
                   PatientId=None,
                   AcquisitionYear=None,
                   AcquisitionMonth=None,
                   AcquisitionDay=None,
-                  testTags:list=None ):
+                  testTags:list=None, refresh:bool=False ):
         """Alle Felder für ein Gerät, einen testTag und das angegebene Jahr holen und aufbereiten
 
         Parameters
@@ -141,6 +262,8 @@ class ariaClass( ispMssql ):
             zu suchender Tag im AcquisitionDateTime Feld, default None
         testTags : list, optional
             im Comment Field vorkommende tags, default None
+        refresh : bool, optional
+            bei Verwendung des Spiegels alle Bilder der PatientId neu holen, default False
 
         Returns
         -------
@@ -153,28 +276,27 @@ class ariaClass( ispMssql ):
             AcquisitionYear=AcquisitionYear,
             AcquisitionMonth=AcquisitionMonth,
             AcquisitionDay=AcquisitionDay,
-            testTags=testTags
+            testTags=testTags,
+            mode="frame",
+            refresh=refresh
         )
 
-        data = {}
-
-        for image_data in image_datas:
-            # bereitetet die Datenbank Informationen auf
-            info = self.getImageInfos( image_data )
-            # test auf testTag um ungültige auszuschließen z.B.suche nach 10.3 findet auch 10.3.1
-            # da in der SQL mit CHARINDEX gesucht wird werden auch Teile gefunden
-            ok = False
-            for tt in testTags:
-                if tt in info["testTags"]:
-                    ok = True
+        # bereitetet die Datenbank Informationen spaltenweise auf
+        infos = self.getImageInfosFrame( image_datas )
 
-            if not ok:
-                continue
+        # bei mehreren Zeilen pro SliceUID gilt die letzte
+        infos = infos.drop_duplicates( subset=[ "SliceUID" ], keep="last" ).set_index( "SliceUID", drop=False )
 
-            if not info["energy"] in data:
-                data[ info["energy"] ] = {}
+        data = {}
+        if not testTags:
+            for energy, group in infos.groupby( "energy", sort=False ):
+                data[ energy ] = group.to_dict( orient="index" )
+            return data
 
-            data[ info["energy"] ][ info["SliceUID"] ] = info
+        # SliceUIDs pro Energie aus dem Tag Index
+        index = gqaTagIndex( infos, self.getTestMap() )
+        for energy, uids in index.sliceUIDs( testTags ).items():
+            data[ energy ] = infos.loc[ uids ].to_dict( orient="index" )
 
         return data
 
@@ -225,65 +347,37 @@ class ariaClass( ispMssql ):
           AND SUBSTRING( [Radiation].[Comment], 2, 2 ) = 'T_'
         """
 
-        if isinstance( PatientId, list):
-            sql = sql + " AND (1=2 "
-            for _id in PatientId:
-                sql = sql + " OR [Patient].[PatientId] = '{}'".format(_id)
-            sql = sql + ")"
-        else:
-            sql = sql + " AND [Patient].[PatientId] = '{}'".format(PatientId)
+        if not isinstance( PatientId, list):
+            PatientId = [ PatientId ]
+
+        sql = sql + " AND [Patient].[PatientId] IN ({})".format( ", ".join( ["?"] * len( PatientId ) ) )
 
-        result = self.execute( sql )
+        df = self.execute( sql, PatientId, mode="frame", cache="tags" )
 
         # alle durchgehen und Comment aufteilem
-        if len( result ) == 0:
+        if len( df.index ) == 0:
             return []
 
-        data = []
-        for row in result:
-            d = row.copy()
-            # energie und doserate ais AcqNote bestimmen
-            desc = re.split("[\r\n|,]", d["AcqNote"])
-            energy = d["Energy"]
-            doserate = 0
-            # ohne energie Angabe sind es Setupfelder
-            if len(desc) <= 2:
-                pass
-            else:
-                try:
-                    energy = desc[0].replace( " [MV]", "" ).strip()
-                    doserate = int( desc[1].replace( " [MU/min]", "" ).strip() )
-                except:
-                    pass
-
-            if split:
-                # Comment nach neuer zeile oder leerzeichen Splitten
-                comment = (lambda v: v.split() if v else [] )( d["Comment"] )
-                for t in comment:
-                    # comment ersetzen
-                    data.append( {
-                        'PatientId': d['PatientId'],
-                        'CourseId': d['CourseId'],
-                        'PlanSetupId': d['PlanSetupId'],
-                        'RadiationId': d['RadiationId'],
-                        'Energy': energy,
-                        'DoseRate': doserate,
-                        'nummer': d['nummer'],
-                        'Comment':  t,
-                    } )
-            else:
-                data.append( {
-                    'PatientId': d['PatientId'],
-                    'CourseId': d['CourseId'],
-                    'PlanSetupId': d['PlanSetupId'],
-                    'RadiationId': d['RadiationId'],
-                    'Energy': energy,
-                    'DoseRate': doserate,
-                    'nummer': d['nummer'],
-                    'Comment':  d["Comment"],
-                 } )
+        # energie und doserate aus AcqNote bestimmen
+        desc = df["AcqNote"].fillna("").str.split( "[\r\n|,]", regex=True )
+        energy = desc.str[0].str.replace( " [MV]", "", regex=False ).str.strip()
+        doserate = desc.str[1].str.replace( " [MU/min]", "", regex=False ).str.strip()
+        # ohne energie Angabe sind es Setupfelder
+        hasDesc = desc.str.len() > 2
+        isRate = hasDesc & doserate.str.fullmatch( "[+-]?[0-9]+" ).fillna( False ).astype( bool )
 
-        return data
+        df["Energy"] = df["Energy"].astype( object ).where( ~hasDesc, energy )
+        df["DoseRate"] = 0
+        df.loc[ isRate, "DoseRate" ] = doserate[ isRate ].astype( int )
+
+        if split:
+            # Comment nach neuer zeile oder leerzeichen Splitten
+            df["Comment"] = df["Comment"].str.split()
+            df = df.explode( "Comment" )
+            df = df[ df["Comment"].notna() ]
+
+        fields = [ 'PatientId', 'CourseId', 'PlanSetupId', 'RadiationId', 'Energy', 'DoseRate', 'nummer', 'Comment' ]
+        return df[ fields ].to_dict( orient="records" )
 
 
     def getImageInfos(self, imageRow:dict=None ):
@@ -450,3 +544,136 @@ class ariaClass( ispMssql ):
 
         })
         return infos
+
+    def getImageInfosFrame(self, imageRows=None ):
+        """Bestimmt die Infos aller Aufnahmen einer Abfrage spaltenweise.
+
+        Ergebnis wie getImageInfos für jede Zeile, aber als DataFrame mit einer Zeile pro Aufnahme
+
+        Parameters
+        ----------
+        imageRows : list|generator|dict|DataFrame
+            Ergebnis von getImages in einem der modes list, stream, columns oder frame
+
+        Returns
+        -------
+        DataFrame
+            Spalten aus infoFields sowie AcquisitionDateTime und is_FFF.
+
+            - gantry, collimator, table, X1, X2, Y1, Y2 : float
+            - AcquisitionYear, AcquisitionMonth, doserate, ME : int
+            - is_FFF : bool
+            - testTags, subTags : list
+            - varianten : dict {testTag:subTag}
+
+        """
+        columns = list( self.infoFields.keys() ) + [ "AcquisitionDateTime", "is_FFF" ]
+
+        if isinstance( imageRows, pd.DataFrame ):
+            df = imageRows
+        elif isinstance( imageRows, dict ):
+            df = pd.DataFrame( imageRows )
+        else:
+            df = pd.DataFrame( list( imageRows or [] ) )
+
+        if len( df.index ) == 0:
+            return pd.DataFrame( columns=columns )
+
+        df = df.reset_index( drop=True )
+
+        def angle( name ):
+            # 360° ist 0°
+            values = df[ name ].astype( float ).round( 1 )
+            return values.where( values != 360, 0.0 )
+
+        # in der DICOM datei steht 'RT Image Storage' und nicht RTIMAGE
+        modality = df["SliceModality"].where( df["SliceModality"] != 'RTIMAGE', 'RT Image Storage' )
+
+        filepath = df["FileName"].str.replace( r"[\\/]+", "/", regex=True ).str.rstrip( "/" )
+
+        # Energie und Doserate aus AcqNote bestimmen, ohne mind. zwei Trenner sind es Setupfelder
+        desc = df["AcqNote"].fillna("").str.split( "[\r\n|,]", regex=True )
+        hasDesc = desc.str.len() > 2
+        for filename in df.loc[ ~hasDesc, "FileName" ]:
+            logger.warning( "aria.getImageInfos:AcqNote: {}".format( filename ) )
+        energy = desc.str[0].str.replace( " [MV]", "", regex=False ).str.strip().where( hasDesc, "" )
+        rate = desc.str[1].str.replace( " [MU/min]", "", regex=False ).str.strip()
+        isRate = hasDesc & rate.str.fullmatch( "[+-]?[0-9]+" ).fillna( False ).astype( bool )
+        doserate = pd.Series( 0, index=df.index, dtype="int64" )
+        doserate[ isRate ] = rate[ isRate ].astype( "int64" )
+
+        # type zuerst nach neuer zeile oder leerzeichen Splitten, dann in tag:subtag
+        comments = df["Comment"].fillna("").str.split()
+        lengths = comments.str.len().to_numpy()
+        parts = [ t.partition( ":" ) for t in itertools.chain.from_iterable( comments ) ]
+        tags = [ p[0] for p in parts ]
+        subs = [ p[2].partition( ":" )[0] if p[1] else None for p in parts ]
+        # Listen pro Aufnahme aus den flachen Listen schneiden
+        ends = np.cumsum( lengths )
+        starts = ends - lengths
+        bounds = list( zip( starts.tolist(), ends.tolist() ) )
+        testTags = [ tags[ a:b ] for a, b in bounds ]
+        subTags = [ subs[ a:b ] for a, b in bounds ]
+        varianten = [ dict( zip( t, v ) ) for t, v in zip( testTags, subTags ) ]
+        rowIndex = np.repeat( np.arange( len( df.index ) ), lengths )
+        gating = np.bincount( rowIndex[ np.array( subs, dtype=object ) == "gating" ], minlength=len( df.index ) ) > 0
+
+        acquisition = pd.to_datetime( df["AcquisitionDateTime"] )
+        acquisitionText = acquisition.dt.strftime( "%Y-%m-%d %H:%M:%S" )
+        day = acquisitionText.str[0:10]
+
+        infos = pd.DataFrame( {
+            'id': df["SliceUID"],
+            'PatientId': df["PatientId"],
+            'RadiationId': df["RadiationId"],
+            'RadiationSer': df["RadiationSer"],
+            'CourseId': df["CourseId"],
+            'PlanSetupId': df["PlanSetupId"],
+            'SliceRTType': df["SliceRTType"],
+            'ImageId': df["ImageId"],
+            'SeriesId': df["SeriesId"],
+            'SeriesNumber' : df["SeriesNumber"],
+            'CreationDate' : df["CreationDate"],
+            'studyID': '',
+            'filepath': filepath,
+            'filename': filepath.str.rsplit( "/", n=1 ).str[-1],
+            'Kennung' : df["PlanSetupId"] + ":" + df["RadiationId"] + ":" + df["ImageId"],
+            'SOPClassUID': modality,
+            'acquisition': acquisitionText,
+            'AcquisitionYear': acquisition.dt.year.astype( "int64" ),
+            'AcquisitionMonth': acquisition.dt.month.astype( "int64" ),
+            'day' : day,
+            'Tag' : day.str[8:10] + "." + day.str[5:7] + "." + day.str[0:4],
+            'unit': df["RadiationMachineName"],
+            'energy': energy,
+            'doserate': doserate,
+            'MetersetExposure' : df["MetersetExposure"],
+            'ME': df["MetersetExposure"].astype( float ).round().astype( "int64" ),
+            'Technique': df["TechniqueLabel"],
+            'gantry' : angle( "GantryRtn" ),
+            'GantryRtnExt' : df["GantryRtnExt"],
+            'GantryRtnDirection' : df["GantryRtnDirection"],
+            'StopAngle' : df["StopAngle"],
+            'collimator': angle( "CollRtn" ),
+            'CollMode' : df["CollMode"],
+            'table' : angle( "PatientSupportAngle" ),
+            'SID': df["SAD"],
+            'MLCPlanType': df["MLCPlanType"],
+            'IndexParameterType': df["IndexParameterType"],
+            'X1': df["CollX1"].astype( float ).round( 1 ) * 10, # in mm
+            'X2': df["CollX2"].astype( float ).round( 1 ) * 10, # in mm
+            'Y1': df["CollY1"].astype( float ).round( 1 ) * 10, # in mm
+            'Y2': df["CollY2"].astype( float ).round( 1 ) * 10, # in mm
+            'SliceUID' : df["SliceUID"],
+            'SeriesUID' : df["SeriesUID"],
+            'StudyUID': df["StudyUID"],
+            'FrameOfReferenceUID': df["FrameOfReferenceUID"],
+            'gating': np.where( gating, "gating", "" ),
+            'testTags': testTags,
+            'subTags': subTags,
+            'varianten': varianten,
+            'AcquisitionDateTime': acquisition,
+            'is_FFF': energy.str.contains( "FFF", regex=False )
+        } )
+
+        return infos[ columns ]
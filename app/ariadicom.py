@@ -4,7 +4,7 @@ __author__ = "R. Bauer"
 __copyright__ = "MedPhyDO - Machbarkeitsstudien des Instituts für Medizinische Strahlenphysik und Strahlenschutz am Klinikum Dortmund im Rahmen von Bachelor und Masterarbeiten an der TU-Dortmund / FH-Dortmund"
 __credits__ = ["R.Bauer", "K.Loot"]
 __license__ = "MIT"
-__version__ = "0.2.1"
+__version__ = "0.2.2"
 __status__ = "Prototype"
 
 from dotmap import DotMap
@@ -16,11 +16,14 @@ import json
 from datetime import date
 
 from isp.dicom import ispDicom
+from isp.dicomarchive import loadPixelData, pixelCacheFilename
 from isp.config import dict_merge
 
 from app.config import infoFields
 
 from app.aria import ariaClass
+from app.image import DicomImage
+from app.tagindex import gqaTagIndex
 from app.results import ispResults
 
 
@@ -75,6 +78,18 @@ class ariaDicomClass( ariaClass, ispDicom ):
 
         # dicomClass initialisieren. Der Erfolg kann über dicomClass.initialized abgefragt werden
         ispDicom.__init__( self, server, self.config )
+
+        # aufbereitete Bilddaten als .npy neben den DICOM Dateien ablegen und wieder verwenden
+        DicomImage.pixelCache = bool( self.config.get( ["dicom", server, "pixel_cache"], False ) )
+
+        # aufbereitete Bilddaten im prozessweiten Cache von ispDicom halten
+        DicomImage.datasetCache = self.datasetCache
+
+        # Bilddaten nach dem rescale und beim normalisieren als compute_dtype
+        DicomImage.computeDtype = np.dtype( self.config.get( ["dicom", server, "compute_dtype"], "float32" ) )
+
+        # Aufnahmen der nächsten Energie während der Auswertung holen, höchstens prefetchBytes Bilddaten dekodieren
+        self.prefetchBytes = int( self.config.get( ["dicom", server, "prefetch_bytes"], 268435456 ) )
         
         self.pd_results = ispResults( self.config )
 
@@ -113,7 +128,7 @@ class ariaDicomClass( ariaClass, ispDicom ):
 
         return dirname
 
-    def getAllGQA(self, pids=None, testTags:list=None, year:int=None, month:int=None, day:int=None, withResult=False ):
+    def getAllGQA(self, pids=None, testTags:list=None, year:int=None, month:int=None, day:int=None, withResult=False, refresh:bool=False ):
         '''Holt für die angegebenen PatientenIds aus allen Courses
         die Felder mit Angaben in [Radiation].[Comment] und wertet sie entsprechend aus
 
@@ -131,6 +146,8 @@ class ariaDicomClass( ariaClass, ispDicom ):
             Day to search in AcquisitionDateTime Field, default: None
         withResult : boolean, optional
             Testergebnisse mit ausgeben. default: False.
+        refresh : boolean, optional
+            bei Verwendung des Spiegels alle Bilder neu aus Aria holen. default: False.
 
         Returns
         -------
@@ -174,23 +191,24 @@ class ariaDicomClass( ariaClass, ispDicom ):
             testTags = [testTags]
 
         # filter zusammenstellen
-        where = "LEN([Radiation].[Comment]) > 0  "
-
-        subSql = []
-        for pid in pids:
-            subSql.append( "[Patient].[PatientId]='{}'".format( pid.strip() ) )
-        if len( subSql ) > 0:
-            where += " AND (" + " OR ".join( subSql ) + ")"
-
-        images, sql = self.getImages(
-            addWhere=where,
-            AcquisitionYear=year,
-            AcquisitionMonth=month,
-            AcquisitionDay=day,
-            testTags=testTags
-        )
+        where = "[Radiation].[Comment] <> ''"
+
+        pids = [ pid.strip() for pid in pids ]
 
-        self.lastSQL = sql
+        # eine Abfrage pro Gerät, gleichzeitig mit database.<name>.parallel Verbindungen
+        results = self.executeParallel( self.getImages, [ {
+            "PatientId": pid,
+            "addWhere": where,
+            "AcquisitionYear": year,
+            "AcquisitionMonth": month,
+            "AcquisitionDay": day,
+            "testTags": testTags,
+            "mode": "frame",
+            "refresh": refresh
+        } for pid in pids ] )
+
+        images = pd.concat( [ frame for frame, sql in results ], ignore_index=True )
+        self.lastSQL = results[0][1]
 
         # Pfad für die PDF Dateien
         self.initResultsPath( year )
@@ -211,8 +229,8 @@ class ariaDicomClass( ariaClass, ispDicom ):
 
         Parameters
         ----------
-        imagedatas : list, optional
-            Auflistungen von Bildinformationen aus der Aria Datenbank. default: is [].
+        imagedatas : list|DataFrame, optional
+            Auflistungen von Bildinformationen aus der Aria Datenbank (getImages). default: is [].
         year : int, optional
             Das zu verwendende Jahr. default: is 0.
         withResult : boolean, optional
@@ -279,103 +297,69 @@ class ariaDicomClass( ariaClass, ispDicom ):
                 "index":[]
             }
 
-        # tags und gqa ids bestimmen
-        for testid, item in self.config.GQA.items():
-            if "tag" in item:
-                data["testTags"][ item["tag"] ] = testid
-                data["testIds"][ testid ] = item["tag"]
- 
-        tagNotFound = {}
-
-        inactiv = []
-        testNotFound = []
-        
-        for imagedata in imagedatas:
-
-            # bereitetet die Datenbank Informationen auf
-            info = self.getImageInfos( imagedata )
-            #print(info["day"], info["testTags"], info["subTags"], info["varianten"] )
-            unit = info["unit"]
-            energy =  info["energy"]
-
-            #
-            # zusätzlich die Daten in self.dicomfiles ablegen
-            #
-            if withDicomData:
-                if not unit in self.dicomfiles:
-                    self.dicomfiles[ unit ] = {}
-                # zusätzlich in dicomfiles ablegen
-                self.dicomfiles[ unit ][ info["id"] ] = info
-
-            # Felder zuordnen, eine Aufnahme kann für mehrere tests verwendet werden
-            # tag für die Datenbank, testid für das PDF
-            for testTag in info["testTags"]:
-                # nur wenn es auch einen test gibt
-                if not testTag in data["testTags"]:
-                    tagNotFound[ testTag ] = testTag
-                    continue
-
-                testId = data["testTags"][testTag]
+        # tags und gqa ids aus den einmal bestimmten Zuordnungen
+        testMap = self.getTestMap()
+        data["testTags"].update( testMap.tagTests )
+        data["testIds"].update( testMap.testTags )
 
-                # ist der test in gqa nicht erlaubt überspringen
-                # inaktive kann auch einen Text enthalten der beschreibt warum
-                # FIXME: inaktive
-                t = "GQA.{}.info.inaktiv".format( testId )
-                if not self.config.get(t, False) == False:
-                    inactiv.append( self.config.get(t) )
-                    continue
-
-                # gibt es in GQA passend zum Test dem Gerät und der Energie einen Eintrag
-                t = "GQA.{}.{}.energyFields.{}".format( testId, unit, energy )
-                energyFields = self.config.get(t, False)
-                if energyFields == False:
-                    testNotFound.append( t )
-                    continue
+        # bereitetet die Datenbank Informationen spaltenweise auf
+        infos = self.getImageInfosFrame( imagedatas )
 
-                # Art des tests MT|JT
-                tagArt = testId[0:2]
-                if tagArt == "JT":
-                    dateFlag = "0"
-                else:
-                    dateFlag = str( info["AcquisitionMonth"] )
+        #
+        # zusätzlich die Daten in self.dicomfiles ablegen
+        #
+        if withDicomData:
+            for unit, group in infos.drop_duplicates( subset=[ "id" ], keep="last" ).groupby( "unit", sort=False ):
+                self.dicomfiles[ unit ] = group.set_index( "id", drop=False ).to_dict( orient="index" )
+
+        # Felder zuordnen, eine Aufnahme kann für mehrere tests verwendet werden
+        # tag für die Datenbank, testid für das PDF
+        index = gqaTagIndex( infos, testMap )
+
+        tagNotFound = index.tagNotFound()
+        inactiv = index.inactiv()
+        testNotFound = index.testNotFound()
+
+        # lokal vorhandene Aufnahmen aus dem Index des DICOM Archivs und die noch zu schreibenden
+        cached = None
+        if self.archive and len( infos.index ) > 0:
+            cached = self.writer.cached( infos["SliceUID"].unique() )
+
+        # Anzahl der Felder für das Datumsflag der jeweiligen Energie (counts)
+        for row in index.counts( cached ).itertuples( index=False ):
+            test_unit = data["GQA"][ row.testId ][ row.unit ]
+            if not row.dateFlag in test_unit:
+                test_unit[ row.dateFlag ] = {}
+
+            test_unit[ row.dateFlag ][ row.energy ] = {
+                "counts": row.counts,
+                "ready": bool( row.ready ),
+                "pdfName" : "",
+                "pdf": False,
+                "acceptance" : {}
+            }
+            if cached is not None:
+                # Anzahl der Felder die nicht mehr vom DICOM Server geholt werden müssen
+                test_unit[ row.dateFlag ][ row.energy ]["cached"] = int( row.cached )
+
+        # PDF Dateiname zusammenstellen, nur einmal pro Jahr und Monat
+        for testId, unit, dateFlag, energy, AcquisitionYear, AcquisitionMonth in index.periods().itertuples( index=False, name=None ):
+            tagArt = testId[0:2]
+            pdfName = self.config.render_template(
+                self.config["templates"][ "PDF-" + tagArt + "-filename"],
+                {
+                    "AcquisitionYear": AcquisitionYear,
+                    "AcquisitionMonth": AcquisitionMonth,
+                    "unit": unit,
+                    "energy": energy,
+                    "testId": testId
+                }
+            )
 
-                #
+            if pdfName in pdfFiles:
                 test_unit = data["GQA"][testId][unit]
-
-                if not dateFlag in test_unit:
-                    test_unit[ dateFlag ] = {}
-
-                if not energy in test_unit[ dateFlag ]:
-                    test_unit[ dateFlag ][energy] = {
-                        "counts": 0,
-                        "ready": False,
-                        "pdfName" : "",
-                        "pdf": False,
-                        "acceptance" : {}
-                    }
-
-                # Anzahl der Felder für das Datumsflag der jeweiligen Energie erhöhen (counts)
-                test_unit[ dateFlag ][ energy ][ "counts" ] += 1
-
-                # auf mid Anzahl prüfen
-                if test_unit[ dateFlag ][ energy ][ "counts" ]  >= energyFields:
-                    test_unit[ dateFlag ][ energy ][ "ready" ] = True
-
-                # PDF Dateiname zusammenstellen
-                pdfName = self.config.render_template(
-                    self.config["templates"][ "PDF-" + tagArt + "-filename"],
-                    {
-                        "AcquisitionYear": info["AcquisitionYear"],
-                        "AcquisitionMonth": info["AcquisitionMonth"],
-                        "unit": unit,
-                        "energy": energy,
-                        "testId": testId
-                    }
-                )
-
-                if pdfName in pdfFiles:
-                    test_unit[ dateFlag ][ energy ][ "pdfName" ] = pdfName
-                    test_unit[ dateFlag ][ energy ][ "pdf" ] = True
+                test_unit[ dateFlag ][ energy ][ "pdfName" ] = pdfName
+                test_unit[ dateFlag ][ energy ][ "pdf" ] = True
 
         # nicht gefundene Tags
         data["inactiv"] = inactiv
@@ -449,6 +433,13 @@ class ariaDicomClass( ariaClass, ispDicom ):
 
         tags = self.getTags( pid, split )
 
+        # Pandas erzeugen
+        df = pd.DataFrame( tags )
+        if split and len( df.index ) > 0:
+            # testId über die einmal bestimmten Zuordnungen, "" ohne Test
+            df["testId"] = self.getTestMap().testId( df["Comment"].str.partition( ":" )[0] ).fillna( "" )
+            tags = df.to_dict( orient="records" )
+
         if output_format == "json":
             return tags
 
@@ -457,8 +448,6 @@ class ariaDicomClass( ariaClass, ispDicom ):
 
         html = '<div class="gqa-tagging flex-1">'
         html += '<h1 class="m-0 p-1 text-white bg-secondary">Art: ' + art + '</h2>'
-        # Pandas erzeugen
-        df = pd.DataFrame( tags )
 
         if art == "full":
             table = pd.pivot_table( df,
@@ -477,7 +466,7 @@ class ariaDicomClass( ariaClass, ispDicom ):
                 )
         elif art == "test":
             table = pd.pivot_table( df,
-                    index=['Comment', 'CourseId', 'Energy', 'DoseRate'],
+                    index=['testId', 'Comment', 'CourseId', 'Energy', 'DoseRate'],
                     columns=[ 'PlanSetupId', 'PatientId'],
                     values= 'nummer',
                     aggfunc=[np.sum],
@@ -756,9 +745,52 @@ class ariaDicomClass( ariaClass, ispDicom ):
 
 
     # ---------------------- Test durchführung
+    def getRunData(self, pids:list=[],
+                 year:int=None, month:int=None, day:int=None,
+                 testId:str=None, reloadDicom:bool=False ):
+        """Die Datenbank Informationen für runTests mehrerer Geräte gleichzeitig holen
+
+        Parameters
+        ----------
+        pids : list, optional
+            die zu verwendenden PatientIds, default: []
+        year : int, optional
+            das zu verwendende Jahr, default: None
+        month : int, optional
+            der zu verwendende Monat, default: None
+        day : int, optional
+            der zu verwendende Tag, default: None
+        testId : str, optional
+            die id des durchzuführenden Test, default: None
+        reloadDicom : bool, optional
+            auch die Datenbank Informationen neu holen, default: False
+
+        Returns
+        -------
+        dict
+            pro PatientId das Ergebnis von getTestData
+        """
+        testTag = self.config.get( ["GQA", testId, "tag"], False )
+        pids = [ pid for pid in pids if self.config.get( ["units", pid], False ) ]
+        if testTag == False or len( pids ) == 0:
+            return {}
+
+        if reloadDicom:
+            self.invalidateCache()
+
+        results = self.executeParallel( self.getTestData, [ {
+            "PatientId": pid,
+            "AcquisitionYear": year,
+            "AcquisitionMonth": month,
+            "AcquisitionDay": day,
+            "testTags": [ testTag ]
+        } for pid in pids ] )
+
+        return dict( zip( pids, results ) )
+
     def runTests(self, pid=None,
                  year:int=None, month:int=None, day:int=None,
-                 testId:str=None, reloadDicom:bool=False, unittest:bool=False ):
+                 testId:str=None, reloadDicom:bool=False, unittest:bool=False, data:dict=None ):
         """Einen angegebenen Test vorbereiten und durchführen
 
         Parameters
@@ -777,6 +809,8 @@ class ariaDicomClass( ariaClass, ispDicom ):
             Dicomdaten neu laden oder vorhandene verwenden, default: False
         unittest : bool, optional
             spezieller modus für unittest, default: False
+        data : dict, optional
+            bereits mit getRunData geholte Imageinfos per energy, default: None
 
         Returns
         -------
@@ -794,29 +828,29 @@ class ariaDicomClass( ariaClass, ispDicom ):
         if test == False or unit == False:
             return test_results
 
-        # tags und gqa ids bestimmen
-        tags = {}
-        for key, item in self.config.GQA.items():
-            if "tag" in item:
-                tags[ item["tag"] ] = key
-
         testTag = test.tag
-        # getTestData sucht in der datenbank nach dem tag des tests
-        data = self.getTestData(
-            PatientId=pid,
-            AcquisitionYear=year,
-            AcquisitionMonth=month,
-            AcquisitionDay=day,
-            testTags=[ testTag ]
-        )
+        if data is None:
+            # beim neu laden auch die Datenbank Informationen neu holen
+            if reloadDicom:
+                self.invalidateCache()
+
+            # getTestData sucht in der datenbank nach dem tag des tests
+            data = self.getTestData(
+                PatientId=pid,
+                AcquisitionYear=year,
+                AcquisitionMonth=month,
+                AcquisitionDay=day,
+                testTags=[ testTag ]
+            )
 
         energyFields = self.config.get( ["GQA", testId, unit, 'energyFields'], {} )
 
-        for energy, info in data.items():
+        # nur die Energien die angegeben wurden
+        energies = [ ( energy, info ) for energy, info in data.items() if energy in energyFields ]
 
-            # nur die Energien die angegeben wurden
-            if not energy in energyFields:
-                continue
+        # die Aufnahmen der nächsten Energie werden während der Auswertung der aktuellen geholt
+        prefetched = None
+        for index, ( energy, info ) in enumerate( energies ):
 
             # payload erweitert in doTestType variables und wird für MQTT verwendet
             payload = {
@@ -830,11 +864,29 @@ class ariaDicomClass( ariaClass, ispDicom ):
                 "unittest": unittest
             }
 
+            images = None
+            if prefetched:
+                try:
+                    images = prefetched.result()
+                except Exception as e:
+                    # dann holt doTestType die Aufnahmen selbst
+                    logger.warning( "runTests: prefetch {} - {}".format( energy, str(e) ) )
+                prefetched = None
+
+            def retrieved():
+                nonlocal prefetched
+                if self.prefetchBytes > 0 and index + 1 < len( energies ):
+                    prefetched = self.prefetchTestImages( energies[ index + 1 ][1],
+                        override=reloadDicom, subPath=str( year )
+                    )
+
             # den test durchführen
             pdfFilename, results = self.doTestType(
                 testId =  testId,
                 data =      info,
-                payload =   payload
+                payload =   payload,
+                images =    images,
+                retrieved = retrieved
             )
 
             # results in pandas ablegen
@@ -849,11 +901,88 @@ class ariaDicomClass( ariaClass, ispDicom ):
         # Pandas Ergebnisse speichern
         self.pd_results.write()
 
+        # die Übersichten sollen den neuen Stand zeigen
+        self.invalidateCache()
+
         # pdf Dateien zurückgeben
         return test_results
 
 
-    def doTestType(self, testId:str, data=None, payload:dict={} ):
+    def retrieveTestImages( self, data:dict, override:bool=False, subPath:str="", progress=None ):
+        """Die Aufnahmen eines Tests mit retrieveMany() holen
+
+        Parameters
+        ----------
+        data : dict
+            Imageinfos per SliceUID
+        override : bool, optional
+            vorhandene Dateien neu holen, default: False
+        subPath : str, optional
+            ergänzt den lokalen Ablageort um subPath, default: ""
+        progress : callable, optional
+            wird mit der Anzahl der erhaltenen Datensätze aufgerufen, default: None
+
+        Returns
+        -------
+        result : dict
+            SOPInstanceUID -> Dataset
+        signals : list
+
+        """
+        return self.retrieveMany( {
+            SOPInstanceUID: {
+                "PatientID" : item["PatientId"],
+                "StudyInstanceUID" : item.get( "StudyUID", None ),
+                "SeriesInstanceUID" : item.get( "SeriesUID", None )
+            } for SOPInstanceUID, item in data.items()
+        }, override=override, subPath=subPath, progress=progress )
+
+    def prefetchTestImages( self, data:dict, override:bool=False, subPath:str="" ):
+        """Die Aufnahmen eines Tests im Hintergrund holen und die Bilddaten bis prefetchBytes dekodieren
+
+        Parameters
+        ----------
+        data : dict
+            Imageinfos per SliceUID
+        override : bool, optional
+            vorhandene Dateien neu holen, default: False
+        subPath : str, optional
+            ergänzt den lokalen Ablageort um subPath, default: ""
+
+        Returns
+        -------
+        concurrent.futures.Future
+            mit result und signals von retrieveTestImages()
+
+        """
+        def _prefetch():
+            result, signals = self.retrieveTestImages( data, override=override, subPath=subPath )
+            budget = self.prefetchBytes
+            for ds in result.values():
+                # Bilddaten und dekodiertes array belegen etwa den doppelten Platz
+                size = 2 * int( ds.get( "Rows", 0 ) or 0 ) * int( ds.get( "Columns", 0 ) or 0 ) \
+                    * ( int( ds.get( "BitsAllocated", 16 ) or 16 ) // 8 ) * int( ds.get( "NumberOfFrames", 1 ) or 1 )
+                if size > budget:
+                    break
+                filename = getattr( ds, "filename", None )
+                if DicomImage.pixelCache and isinstance( filename, str ) and osp.isfile( pixelCacheFilename( filename ) ):
+                    # die Auswertung verwendet die abgelegten Bilddaten
+                    continue
+                if self.datasetCache and self.datasetCache.hasPixels( ds.get( "SOPInstanceUID", None ) ):
+                    # die Auswertung verwendet die Bilddaten aus dem Cache
+                    continue
+                try:
+                    loadPixelData( ds )
+                    ds.pixel_array
+                except Exception as e: # pragma: no cover
+                    logger.warning( "prefetchTestImages: {} - {}".format( ds.get( "SOPInstanceUID", "" ), str(e) ) )
+                    continue
+                budget -= size
+            return result, signals
+
+        return self._getRetrievePool().submit( _prefetch )
+
+    def doTestType(self, testId:str, data=None, payload:dict={}, images:tuple=None, retrieved=None ):
         """Den angegebene Test durchführen. Dabei die passende Klasse verwenden
 
         Parameters
@@ -864,6 +993,10 @@ class ariaDicomClass( ariaClass, ispDicom ):
             Imageinfos per SliceUID, default: None
         payload : dict, optional
             erweitert self.variables für den Test, default: {}
+        images : tuple, optional
+            schon mit retrieveTestImages() geholte result und signals, default: None
+        retrieved : callable, optional
+            wird aufgerufen sobald die Aufnahmen geholt sind, default: None
 
         Returns
         -------
@@ -946,29 +1079,33 @@ class ariaDicomClass( ariaClass, ispDicom ):
         if hasattr( logger, "progressStart"):
             logger.progressStart( testId, payload )
 
-        # Dicomdaten mit retrieve() holen entweder lokal oder vom server
-        for SOPInstanceUID in data:
-            i += 1
+        # Dicomdaten mit retrieveMany() holen entweder lokal oder vom server mit einer Abfrage pro Serie
+        def _progress( count ):
             # 40% für die dicom daten 40% für die Auswertung 20 % für das pdf
             if hasattr( logger, "progress"):
-                logger.progress( testId, 40 / imageCount * i )
-
-            # Dicomdaten holen, diese werden in self.dicomData ergänzt um AcquisitionYear abgelegt
-            result, signals = self.retrieve( {
-                "PatientID" : data[SOPInstanceUID]["PatientId"],
-                "SOPInstanceUID" : SOPInstanceUID,
-                "override" : variables["reloadDicom"],
-                "subPath" : str(AcquisitionYear)
-            })
-            for dcm in result:
-                data[ dcm.SOPInstanceUID ]["dicom"] = dcm
-                # FIXME: in allen testModulen zugriff auf dicom daten über data und nicht mehr über dicomData
-                # getFullData() sollte dann nicht mehr benötigt werden
-                dicomData[ dcm.SOPInstanceUID ] = dcm
-                read_count += 1
-
-            # dicom Verbindung falls sie geöffnet wurde schließen
-            self.closeAE()
+                logger.progress( testId, 40 / imageCount * count )
+
+        if images is None:
+            result, signals = self.retrieveTestImages( data, override=variables["reloadDicom"], subPath=str(AcquisitionYear), progress=_progress )
+        else:
+            result, signals = images
+
+        # die Aufnahmen werden nicht mehr von dieser Auswertung geholt
+        if retrieved:
+            retrieved()
+
+        for SOPInstanceUID in data:
+            i += 1
+            dcm = result.get( SOPInstanceUID, None )
+            if dcm is None:
+                break
+            data[ SOPInstanceUID ]["dicom"] = dcm
+            # FIXME: in allen testModulen zugriff auf dicom daten über data und nicht mehr über dicomData
+            # getFullData() sollte dann nicht mehr benötigt werden
+            dicomData[ SOPInstanceUID ] = dcm
+            read_count += 1
+
+        # die dicom Verbindung bleibt für weitere Aufnahmen geöffnet und wird nach idle_timeout geschlossen
 
         if i > read_count: # pragma: no cover
             # das einlesen der Dicomdaten war nicht möglich
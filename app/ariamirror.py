@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+
+"""Lokaler SQLite Spiegel der Aria QA Bild Metadaten
+
+Der Spiegel enthält die Felder von ariaClass.getImages je PatientId und wird inkrementell
+über einen high-water mark auf [Slice].[SliceSer] und [Slice].[AcquisitionDateTime] abgeglichen.
+Abfragen von getImages werden dann lokal beantwortet.
+
+Konfiguration in database.<name>.mirror::
+
+    "mirror": {
+        "path": "{{BASE_DIR}}/data/mirror",
+        "max_age": 300,
+        "overlap_days": 31
+    }
+
+- path: Verzeichnis der Datei <name>.sqlite, default {{BASE_DIR}}/data/mirror
+- max_age: Sekunden nach denen erneut mit Aria abgeglichen wird, default 300
+- overlap_days: Tage vor dem letzten AcquisitionDateTime die erneut geholt werden
+  um nachträglich geänderte Kommentare zu übernehmen, default 31
+
+"mirror": true verwendet die Vorgaben. In Aria gelöschte Bilder werden erst mit refresh entfernt.
+
+"""
+
+__author__ = "R. Bauer"
+__copyright__ = "MedPhyDO - Machbarkeitsstudien des Instituts für Medizinische Strahlenphysik und Strahlenschutz am Klinikum Dortmund im Rahmen von Bachelor und Masterarbeiten an der TU-Dortmund / FH-Dortmund"
+__credits__ = ["R.Bauer", "K.Loot"]
+__license__ = "MIT"
+__version__ = "0.1.0"
+__status__ = "Prototype"
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+import os
+import os.path as osp
+import re
+import sqlite3
+import threading
+import time
+
+import logging
+logger = logging.getLogger( "ISP" )
+
+from isp.mssql import ispMssqlQuery
+
+# Format der Datumsfelder im Spiegel, sortierbar als Text
+dateFormat = "%Y-%m-%d %H:%M:%S.%f"
+
+def mirrorColumn( column:str ):
+    """[Table].[Column] in den Spaltennamen Table.Column des Spiegels umwandeln
+    """
+    return re.sub( r"\[(\w+)\]\.\[(\w+)\]", r"[\1.\2]", column )
+
+class ariaMirrorQuery( ispMssqlQuery ):
+    '''Query auf die Spiegel Tabelle
+
+    Spalten und Bedingungen werden wie für Aria angegeben
+    und auf die Spalten des Spiegels umgesetzt
+
+    '''
+
+    def __init__( self ):
+        super().__init__( "[images]", engine="sqlite" )
+
+    def select( self, *columns ):
+        for column in columns:
+            name = re.sub( r"^\[\w+\]\.\[(\w+)\]$", r"\1", column )
+            super().select( "{} AS [{}]".format( mirrorColumn( column ), name ) )
+        return self
+
+    def where( self, condition:str, params:list=None ):
+        return super().where( mirrorColumn( condition ), params )
+
+
+class ariaMirror( ):
+    '''Lokaler SQLite Spiegel der Aria Bild Metadaten
+
+    Attributes
+    ----------
+
+    aria : ariaClass
+        für den Abgleich verwendete Aria Verbindung
+
+    filename : str
+        SQLite Datei
+
+    columns : list
+        Aria Spalten des Spiegels
+
+    maxAge : float
+        Sekunden nach denen erneut abgeglichen wird
+
+    overlap : timedelta
+        Zeitraum vor dem high-water mark der erneut geholt wird
+
+    '''
+
+    _locks = {}
+    _locksLock = threading.Lock()
+
+    dateColumns = [ "CreationDate", "AcquisitionDateTime" ]
+
+    def __init__( self, aria, filename:str, columns:list, fromSql:str, maxAge:float=300, overlapDays:int=31 ):
+        self.aria = aria
+        self.filename = filename
+        self.columns = list( columns )
+        # für Abgleich und Index benötigte Spalten
+        for column in [ "[Patient].[PatientId]", "[Slice].[AcquisitionDateTime]", "[Slice].[SliceSer]" ]:
+            if not column in self.columns:
+                self.columns.append( column )
+        self.fromSql = fromSql
+        self.maxAge = maxAge
+        self.overlap = timedelta( days=overlapDays )
+
+        with self._locksLock:
+            if not filename in self._locks:
+                self._locks[ filename ] = threading.Lock()
+            self._lock = self._locks[ filename ]
+
+        with self._lock:
+            db = self.connect()
+            try:
+                self._createTables( db )
+            finally:
+                db.close()
+
+    @classmethod
+    def fromConfig( cls, aria, columns:list, fromSql:str ):
+        """Spiegel für die Datenbank Konfiguration von aria
+
+        Parameters
+        ----------
+        aria : ariaClass
+            Aria Verbindung mit name und config
+        columns : list
+            zu spiegelnde Spalten
+        fromSql : str
+            FROM Teil der Aria Abfrage
+
+        Returns
+        -------
+        ariaMirror or None
+            None wenn database.<name>.mirror nicht angegeben ist
+
+        """
+        if not aria.name or not aria.config.database[ aria.name ]:
+            return None
+        options = aria.config.database[ aria.name ].get( "mirror", False )
+        if not options:
+            return None
+        if options == True:
+            options = {}
+
+        path = options.get( "path", "{{BASE_DIR}}/data/mirror" )
+        path = path.replace( "{{BASE_DIR}}", aria.config.get( "BASE_DIR", "." ) )
+        # ist der Pfad relativ angegeben ab base path verwenden
+        if path[0] == ".":
+            path = osp.join( aria.config.get( "BASE_DIR", "." ), path )
+        os.makedirs( path, exist_ok=True )
+
+        return cls( aria,
+            filename = osp.abspath( osp.join( path, "{}.sqlite".format( aria.name ) ) ),
+            columns = columns,
+            fromSql = fromSql,
+            maxAge = float( options.get( "max_age", 300 ) ),
+            overlapDays = int( options.get( "overlap_days", 31 ) )
+        )
+
+    def connect( self ):
+        """Neue Verbindung zur SQLite Datei
+
+        Zeilen werden als dict mit datetime für die Datumsfelder geliefert
+
+        """
+        db = sqlite3.connect( self.filename, timeout=30 )
+        # T-SQL Funktionen für Filter ohne Jahr
+        db.create_function( "MONTH", 1, lambda v: int( v[5:7] ) if v else None, deterministic=True )
+        db.create_function( "DAY", 1, lambda v: int( v[8:10] ) if v else None, deterministic=True )
+
+        dateColumns = self.dateColumns
+        def rowFactory( cur, row ):
+            result = {}
+            for i, column in enumerate( cur.description ):
+                value = row[i]
+                if column[0] in dateColumns and isinstance( value, str ):
+                    value = datetime.strptime( value, dateFormat )
+                result[ column[0] ] = value
+            return result
+        db.row_factory = rowFactory
+        return db
+
+    def _createTables( self, db ):
+        names = [ mirrorColumn( c )[1:-1] for c in self.columns ]
+        existing = [ r["name"] for r in db.execute( "PRAGMA table_info([images])" ).fetchall() ]
+        if existing and not existing == names:
+            # geänderte Spalten, Spiegel neu aufbauen
+            db.execute( "DROP TABLE [images]" )
+            db.execute( "DROP TABLE IF EXISTS [sync]" )
+        columns = ", ".join( [ mirrorColumn( c ) for c in self.columns ] )
+        db.execute( "CREATE TABLE IF NOT EXISTS [images] ({})".format( columns ) )
+        db.execute( "CREATE INDEX IF NOT EXISTS [images_patient] ON [images] ([Patient.PatientId], [Slice.AcquisitionDateTime])" )
+        db.execute( "CREATE INDEX IF NOT EXISTS [images_slice] ON [images] ([Slice.SliceSer])" )
+        db.execute( "CREATE TABLE IF NOT EXISTS [sync] ([PatientId] TEXT PRIMARY KEY, [AcquisitionDateTime] TEXT, [SliceSer] INTEGER, [synced] REAL, [rows] INTEGER)" )
+        db.commit()
+
+    def _value( self, value ):
+        """Wert für SQLite umwandeln
+        """
+        if isinstance( value, datetime ):
+            return value.strftime( dateFormat )
+        if isinstance( value, Decimal ):
+            return float( value )
+        return value
+
+    def query( self ):
+        """Query Builder für die Spiegel Tabelle
+
+        Returns
+        -------
+        ariaMirrorQuery
+
+        """
+        return ariaMirrorQuery()
+
+    def sync( self, PatientId, force:bool=False ):
+        """Spiegel für eine oder mehrere PatientIds mit Aria abgleichen
+
+        Parameters
+        ----------
+        PatientId : str|list
+            abzugleichende Patienten Ids
+        force : bool, optional
+            alle Bilder der PatientId neu holen. The default is False.
+
+        Returns
+        -------
+        int
+            Anzahl der geholten Zeilen
+
+        """
+        if not isinstance( PatientId, (list, tuple) ):
+            PatientId = [ PatientId ]
+
+        count = 0
+        db = self.connect()
+        try:
+            for pid in PatientId:
+                # Abgleiche verschiedener PatientIds laufen gleichzeitig
+                with self._patientLock( pid ):
+                    count += self._syncPatient( db, pid, force )
+        finally:
+            db.close()
+        return count
+
+    def _patientLock( self, pid:str ):
+        """lock für den Abgleich einer PatientId in dieser Datei
+        """
+        key = ( self.filename, pid )
+        with self._locksLock:
+            if not key in self._locks:
+                self._locks[ key ] = threading.Lock()
+            return self._locks[ key ]
+
+    def _syncPatient( self, db, pid:str, force:bool ):
+        """Abgleich einer PatientId, mit gehaltenem _patientLock aufrufen
+
+        Die Zeilen werden ohne lock aus Aria geholt, nur das Schreiben in den Spiegel hält den lock der Datei.
+        Schlägt der Abruf fehl, werden weiter die vorhandenen Zeilen verwendet und beim nächsten Aufruf erneut abgeglichen
+        """
+        mark = db.execute( "SELECT * FROM [sync] WHERE [PatientId] = ?", [ pid ] ).fetchone()
+        if mark and not force and time.time() - mark["synced"] < self.maxAge:
+            return 0
+
+        query = self.aria.query( self.fromSql ).select( *self.columns )
+        query.where( "NOT [SliceRT].[SliceRTType] = 'SliceDRR'" )
+        query.whereIn( "[Patient].[PatientId]", pid )
+
+        incremental = mark and not force and mark["SliceSer"] is not None
+        if incremental:
+            # neue Bilder und die letzten overlap Tage erneut
+            since = mark["AcquisitionDateTime"] - self.overlap
+            query.where( "([Slice].[SliceSer] > ? OR [Slice].[AcquisitionDateTime] >= ?)", [ mark["SliceSer"], since ] )
+
+        sql, params = query.build()
+        names = [ re.sub( r"^\[\w+\]\.\[(\w+)\]$", r"\1", c ) for c in self.columns ]
+        rows = []
+        sers = set()
+        try:
+            for row in self.aria.execute( sql, params, mode="stream" ):
+                rows.append( [ self._value( row[ name ] ) for name in names ] )
+                sers.add( row[ "SliceSer" ] )
+        except Exception as e:
+            # ein fehlgeschlagener Abruf ist kein leeres Ergebnis, Spiegel und high-water mark bleiben unverändert
+            db.rollback()
+            logger.warning( "ariaMirror.sync: {} - {}".format( pid, str(e) ) )
+            return 0
+
+        with self._lock:
+            if incremental:
+                # geholte Slices ersetzen
+                sers = list( sers )
+                for i in range( 0, len( sers ), 500 ):
+                    chunk = sers[ i:i + 500 ]
+                    db.execute( "DELETE FROM [images] WHERE [Slice.SliceSer] IN ({})".format( ", ".join( ["?"] * len( chunk ) ) ), chunk )
+            else:
+                db.execute( "DELETE FROM [images] WHERE [Patient.PatientId] = ?", [ pid ] )
+
+            db.executemany( "INSERT INTO [images] VALUES ({})".format( ", ".join( ["?"] * len( self.columns ) ) ), rows )
+
+            # high-water mark merken
+            db.execute( """INSERT OR REPLACE INTO [sync]
+                SELECT ?, MAX([Slice.AcquisitionDateTime]), MAX([Slice.SliceSer]), ?, COUNT(*)
+                FROM [images] WHERE [Patient.PatientId] = ?""", [ pid, time.time(), pid ]
+            )
+            db.commit()
+
+        logger.info( "ariaMirror.sync: {} {} rows {}".format( pid, len( rows ), "incremental" if incremental else "full" ) )
+        return len( rows )
+
+    def execute( self, sql:str, params:list=None, mode:str="list" ):
+        """Abfrage auf den Spiegel
+
+        Parameters
+        ----------
+        sql : str
+            sql query string
+        params : list, optional
+            bound parameters. The default is None.
+        mode : str, optional
+            list, stream, columns or frame see ispMssql.execute. The default is "list".
+
+        Returns
+        -------
+        list|generator|dict|pandas.DataFrame
+
+        """
+        db = self.connect()
+        try:
+            cur = db.execute( sql, [ self._value( p ) for p in params or [] ] )
+            result = self.aria._fetch( cur, "list" if mode == "stream" else mode )
+        finally:
+            db.close()
+        if mode == "stream":
+            return iter( result )
+        return result
+
+    def getStats( self ):
+        """Stand des Spiegels je PatientId
+
+        Returns
+        -------
+        dict
+            filename und je PatientId AcquisitionDateTime, SliceSer, synced und rows
+
+        """
+        db = self.connect()
+        try:
+            marks = db.execute( "SELECT * FROM [sync]" ).fetchall()
+        finally:
+            db.close()
+        return {
+            "filename": self.filename,
+            "patients": { mark.pop( "PatientId" ): mark for mark in marks }
+        }
@@ -17,6 +17,8 @@ import datetime
 from isp.mpdf import PdfGenerator as ispPdf
 from isp.config import dict_merge
 
+from app.image import DicomImage, DicomImageStack
+
 import matplotlib.pyplot as plt
 
 from collections import OrderedDict
@@ -46,6 +48,8 @@ class ispBase(  ):
         wird für progress verwendet
     icons: dict
         Vorbelegte Icons für die Testergebnisse
+    imageCache: dict
+        Basis Bilder und daraus abgeleitete arrays dieses Laufs nach SOPInstanceUID, siehe ispCheckClass.getImage
 
     '''
 
@@ -87,6 +91,9 @@ class ispBase(  ):
 
         self.dicomData: dict = dicomData
 
+        # z.B. offene Felder die mit mehreren Feldern verglichen werden nur einmal aufbereiten
+        self.imageCache: dict = {}
+
         # ispCore initialisieren
         #ispCore.__init__( self )
 
@@ -167,6 +174,26 @@ class ispBase(  ):
 
         return result
 
+    def getImageStack(self, df):
+        """Alle Bilder von df als DicomImageStack bereitstellen
+
+        Die mittlere Dosis usw. in mm Bereichen wird dann mit DicomImageStack.roiStats
+        für alle Bilder in einem Aufruf bestimmt
+
+        Parameters
+        ----------
+        df: pandas.DataFrame
+            Felder der Gruppe, jede Zeile muss id enthalten siehe getFullData
+
+        Returns
+        -------
+        DicomImageStack
+            mit df.index als index
+
+        """
+        images = [ DicomImage( self.getFullData( row ) ) for index, row in df.iterrows() ]
+        return DicomImageStack( images, index=df.index )
+
     def getMetaErrorString( self, meta:dict={} ):
         """Erzeugt einen String aus Metadata für Fehler Angaben
 
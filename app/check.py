@@ -11,6 +11,8 @@ __status__ = "Prototype"
 import matplotlib
 matplotlib.use('agg')
 
+import numpy as np
+
 from app.image import DicomImage
 
 import logging
@@ -34,10 +36,13 @@ class ispCheckClass(  ):
         
     baseField : dict
         die für das normalisieren zu verwendende Bildinformatioen
+
+    cache : dict
+        Basis Bilder und daraus abgeleitete arrays eines Laufs nach SOPInstanceUID siehe ispBase.imageCache
                 
     """
 
-    def __init__( self, image:DicomImage=None, baseImage:DicomImage=None, normalize="none" ):
+    def __init__( self, image:DicomImage=None, baseImage:DicomImage=None, normalize="none", cache:dict=None ):
         """Check Klasse initialisieren
 
         Parameters
@@ -48,12 +53,16 @@ class ispCheckClass(  ):
             Das Basis image für das normalisieren, default: None
         normalize : str, optional
             normalize() mit Parametern aufrufen, default: "none"
+        cache : dict, optional
+            Basis Bilder und abgeleitete arrays eines Laufs, default: None
         """        
 
        
         self.image = image
     
         self.baseImage = baseImage
+
+        self.cache = cache
         
         self.infos = {}
         
@@ -66,9 +75,67 @@ class ispCheckClass(  ):
             self.infos = self.image.infos
             
 
-    def normalize( self, normalize: str="diff" ):
+    @staticmethod
+    def getImage( field, cache:dict=None ):
+        """DicomImage für field, mit cache pro SOPInstanceUID nur einmal erzeugt
+
+        Die Bilddaten eines Bildes aus cache sind schreibgeschützt, es wird von allen Auswertungen des Laufs verwendet
+
+        Parameters
+        ----------
+        field : dict
+            siehe ispBase.getFullData
+        cache : dict, optional
+            siehe ispBase.imageCache. The default is None.
+
+        Returns
+        -------
+        DicomImage
+
+        """
+        dicom = field.get( "dicom", None ) if isinstance( field, dict ) else None
+        SOPInstanceUID = dicom.get( "SOPInstanceUID", None ) if hasattr( dicom, "get" ) else None
+        if cache is None or not SOPInstanceUID:
+            return DicomImage( field )
+
+        key = ( "image", SOPInstanceUID )
+        if not key in cache:
+            image = DicomImage( field )
+            if isinstance( getattr( image, "array", None ), np.ndarray ):
+                image.array.flags.writeable = False
+            cache[ key ] = image
+        return cache[ key ]
+
+    def baseReciprocal( self, dtype ):
+        """1 / ( baseImage.array + 0.000001 ) in dtype, mit cache pro SOPInstanceUID nur einmal berechnet
+
+        Parameters
+        ----------
+        dtype : np.dtype
+
+        Returns
+        -------
+        np.array
+
+        """
+        SOPInstanceUID = self.baseImage.metadata.get( "SOPInstanceUID", None ) if hasattr( self.baseImage, "metadata" ) else None
+        key = ( "reciprocal", SOPInstanceUID, np.dtype( dtype ).str )
+        if self.cache is not None and SOPInstanceUID and key in self.cache:
+            return self.cache[ key ]
+
+        reciprocal = np.add( self.baseImage.array, 0.000001, dtype=dtype )
+        np.reciprocal( reciprocal, out=reciprocal )
+        if self.cache is not None and SOPInstanceUID:
+            reciprocal.flags.writeable = False
+            self.cache[ key ] = reciprocal
+        return reciprocal
+
+    def normalize( self, normalize: str="diff", keepOriginal: bool=True ):
         '''Normalisiert checkField mit baseField
            in self.image.array liegen anschließend die normalisierten Daten 
+
+           Gerechnet wird in image.computeDtype in einem Ergebnis Array mit dem Kehrwert von baseImage
+           aus baseReciprocal(), baseImage.array bleibt unverändert.
         
         Parameters
         ----------
@@ -77,23 +144,43 @@ class ispCheckClass(  ):
             - none: keine Normalisierung durchführen
             - diff: test / open
             - prozent: (test - open) / open
+        keepOriginal : bool, optional
+            image.array ohne Kopie als image.arrayOriginal für plotImage( original=True ) behalten.
+            Bei False wird ein beschreibbares image.array direkt überschrieben. The default is True.
             
         Returns
         -------
         None.
 
         '''
-                
-        # image.array als image.arrayOriginal merken
-        self.image.arrayOriginal = self.image.array.copy()
-        base = self.baseImage.array.copy()
-        check = self.image.array.copy()
-        
+
+        check = self.image.array
+        dtype = self.image.computeDtype
+
+        # image.array als image.arrayOriginal merken, normalize ersetzt image.array
+        self.image.arrayOriginal = check if keepOriginal else None
+
+        if not normalize in [ "diff", "prozent" ]:
+            return
+
+        # Kehrwert von open + 0.000001, bei gleichem baseImage aus cache
+        reciprocal = self.baseReciprocal( dtype )
+
+        if not keepOriginal and check.flags.writeable and check.dtype == dtype:
+            out = check
+        else:
+            out = np.empty( check.shape, dtype=dtype )
+
         if normalize == "diff":
-            # Beide Arrays um 0.000001 erhöhen und geschlossenes durch offene teilen
-            self.image.array = (check + 0.000001) / (base + 0.000001)
-        elif normalize == "prozent":
-            self.image.array = ( (check + 0.000001) - (base + 0.000001) ) / (base + 0.000001)
+            # ( test + 0.000001 ) / ( open + 0.000001 )
+            np.add( check, 0.000001, out=out, casting="same_kind" )
+        else:
+            # ( test - open ) / ( open + 0.000001 )
+            np.subtract( check, self.baseImage.array, out=out, casting="same_kind" )
+        np.multiply( out, reciprocal, out=out )
+        self.image.array = out
+        # out kann das bisherige array sein, Summentabelle verwerfen
+        self.image.integralReset()
 
     def getMeanDose( self, field=None ):
         """Die mittlere Dosis eines Angegebenen Bereichs ermitteln
@@ -111,9 +198,8 @@ class ispCheckClass(  ):
         
         if not field:  # pragma: no cover
             field =  { "X1":-2, "X2": 2, "Y1": -2, "Y2":2 }
-        # holt den angegebenen Bereich um dort die Dosis zu bestimmen
-        roi = self.image.getRoi( field ).copy()
-        return roi.mean()
+        # Mittelwert im angegebenen Bereich ohne Kopie, bei vielen Bereichen aus der Summentabelle
+        return self.image.getRoiStat( field, "mean" )
 
 
     
\ No newline at end of file
@@ -23,6 +23,7 @@ from pylinac.settings import get_dicom_cmap
 
 from app.config import infoFields
 from isp.plot import plotClass
+from isp.dicomarchive import PIXEL_DATA, pixelDataDeferred, loadPixelData, releasePixelData, loadPixelCache, savePixelCache
 
 from pylinac.core.geometry import Point
 
@@ -42,13 +43,64 @@ class plotImage( pyDicomImage, plotClass ):
         plt.subplots ax. Default ist None
     """
     
-    def mm2dots_X( self, position ):
+    def viewRotation( self ):
+        """Anzahl der 90° Drehungen (np.rot90) für die Kollimator normalisierte Ansicht
+
+        Returns
+        -------
+        int
+            3 bei Kollimator 90, 2 bei 180, 1 bei 270 sonst 0
+
+        """
+        infos = getattr( self, "infos", None ) or {}
+        return { 90: 3, 180: 2, 270: 1 }.get( infos.get( "collimator", 0 ), 0 )
+
+    def orientedArray( self ):
+        """Die Kollimator normalisierte Ansicht von array.
+
+        np.rot90 liefert eine view mit vertauschten strides ohne Kopie.
+        Sie wird bis zur nächsten Änderung von array wiederverwendet, array selbst bleibt unverändert.
+
+        Returns
+        -------
+        np.array
+
+        """
+        k = self.viewRotation()
+        view = getattr( self, "_orientedView", None )
+        if view is None or view[0] is not self.array or view[1] != k:
+            view = ( self.array, k, np.rot90( self.array, k ) )
+            self._orientedView = view
+        return view[2]
+
+    def orientedCax( self ):
+        """cax in den Pixel Positionen der Kollimator normalisierten Ansicht
+
+        Returns
+        -------
+        Point
+
+        """
+        cax = self.cax
+        k = self.viewRotation()
+        rows, cols = self.array.shape[:2]
+        if k == 1:
+            return Point( cax.y, cols - 1 - cax.x )
+        elif k == 2:
+            return Point( cols - 1 - cax.x, rows - 1 - cax.y )
+        elif k == 3:
+            return Point( rows - 1 - cax.y, cax.x )
+        return cax
+
+    def mm2dots_X( self, position, oriented: bool=False ):
         """Wandelt eine X mm Angabe in die Pixel Positionen des image um.
         
         Parameters
         ----------
         position : int, float
             Position in mm.
+        oriented : bool, optional
+            Pixel Position in orientedArray(). The default is False.
 
         Returns
         -------
@@ -56,18 +108,21 @@ class plotImage( pyDicomImage, plotClass ):
             Umgewandelte Position immer größer gleich 0
 
         """
-        x = int(round( self.dpmm * position + self.cax.x ))
+        cax = self.orientedCax() if oriented else self.cax
+        x = int(round( self.dpmm * position + cax.x ))
         if x < 0:
             x = 0
         return x
     
-    def mm2dots_Y( self, position ):
+    def mm2dots_Y( self, position, oriented: bool=False ):
         """Wandelt eine Y mm Angabe in die Pixel Positionen des image um.
         
         Parameters
         ----------
         position : int, float
             Position in mm.
+        oriented : bool, optional
+            Pixel Position in orientedArray(). The default is False.
 
         Returns
         -------
@@ -75,7 +130,8 @@ class plotImage( pyDicomImage, plotClass ):
             Umgewandelte Position immer größer gleich 0
 
         """
-        y = int(round( self.dpmm * position + self.cax.y ))
+        cax = self.orientedCax() if oriented else self.cax
+        y = int(round( self.dpmm * position + cax.y ))
         if y < 0:
             y = 0
         return y
@@ -267,8 +323,37 @@ class DicomImage( plotImage ):
         
     isRescaled : boolean
         Gibt an ob schon ein rescale durchgeführt wurde
+
+    geometry : dict
+        dpmm, sid und cax der Aufnahme wenn die Bilddaten abgelegt wurden
+
+    pixelCache : boolean
+        Bilddaten aus einer Datei nach dem rescale als float32 .npy neben der DICOM Datei ablegen
+        und bei weiteren Auswertungen ohne Kopie öffnen. Default False
+        siehe: config.dicom.<server>.pixel_cache
+
+    datasetCache : ispDicomDatasetCache
+        Bilddaten nach dem rescale schreibgeschützt im prozessweiten Cache nach SOPInstanceUID halten. Default None
+        siehe: config.dicom.<server>.dataset_cache
+
+    computeDtype : np.dtype
+        dtype der Bilddaten nach dem rescale und beim normalisieren. Default float32
+        siehe: config.dicom.<server>.compute_dtype
+
+    integralMinRois : int
+        ab mehr als integralMinRois Bereichen eines Bildes werden Summe, Mittelwert und Varianz
+        aus einer einmal berechneten Summentabelle (integral image) bestimmt. Default 4
+        siehe: integralImage()
     """
-    
+
+    pixelCache: bool = False
+
+    datasetCache = None
+
+    computeDtype = np.dtype( np.float32 )
+
+    integralMinRois: int = 4
+
     def __init__(self, path: type[str|dict|tuple]=None, infoOnly: bool=False ):
         """ Klasse initialisieren
         wird path angegeben aus dem Pfad das DicomBild einlesen
@@ -294,6 +379,18 @@ class DicomImage( plotImage ):
         self.arrayOriginal = None
     
         self.isRescaled = False
+
+        self.geometry = {}
+
+        # DICOM Datei deren Bilddaten nach dem rescale abgelegt werden
+        self._pixelCacheFile = None
+
+        # SOPInstanceUID unter der die Bilddaten nach dem rescale in datasetCache abgelegt werden
+        self._datasetCacheKey = None
+
+        # Summentabelle von array siehe integralImage() und Anzahl der bisherigen Bereichs Abfragen
+        self._integral = None
+        self._roiQueries = 0
                 
         if not path: 
             # es wurde nichts übergeben
@@ -309,7 +406,9 @@ class DicomImage( plotImage ):
                     
         # rescale durchführen oder nur info erzeugen
         if not infoOnly:
-            self.doRescaleSlope()       
+            self.doRescaleSlope()
+            self.savePixelCache()
+            self.cachePixels()
         
     
     def initMemoryDicom(self, data:dict={}):
@@ -345,13 +444,49 @@ class DicomImage( plotImage ):
             return False
                        
         self.metadata = data["dicom"] # pydicom.FileDataset <class 'pydicom.dataset.FileDataset'>
-       
+
+        # unveränderte Bilddaten einer Datei aus der abgelegten .npy verwenden, die ist schon rescaled
+        filename = getattr( self.metadata, "filename", None )
+        unchanged = self.infos.get( "SOPClassUID", None ) == 'RT Image Storage' \
+                and ( pixelDataDeferred( self.metadata ) or not PIXEL_DATA in self.metadata )
+        if self.pixelCache and isinstance( filename, str ) and unchanged:
+            array, meta = loadPixelCache( filename )
+            if array is not None:
+                self.array = array
+                self._original_dtype = np.dtype( meta["dtype"] )
+                self.geometry = meta.get( "geometry", {} )
+                self.isRescaled = True
+                return True
+            self._pixelCacheFile = filename
+
+        # schon aufbereitete unveränderte Bilddaten aus dem prozessweiten Cache
+        SOPInstanceUID = self.metadata.get( "SOPInstanceUID", None )
+        if self.datasetCache and SOPInstanceUID and unchanged:
+            array, meta = self.datasetCache.getPixels( SOPInstanceUID )
+            if array is not None:
+                self.array = array
+                self._original_dtype = np.dtype( meta["dtype"] )
+                self.geometry = meta.get( "geometry", {} )
+                self.isRescaled = True
+                self._pixelCacheFile = None
+                return True
+            self._datasetCacheKey = SOPInstanceUID
+
+        # ohne Bilddaten gelesen (read_mode header) dann jetzt aus der Datei holen
+        loadPixelData( self.metadata )
+
+        # noch nicht gelesene Bilddaten nach dem Übernehmen in array wieder freigeben
+        raw = self.metadata._dict[ PIXEL_DATA ] if pixelDataDeferred( self.metadata ) else None
+
         # dtype=uint16; SOPClassUID=RT Image Storage
         self._original_dtype = self.metadata.pixel_array.dtype
         if dtype is not None:
             self.array = self.metadata.pixel_array.astype(dtype)
         else:
             self.array = self.metadata.pixel_array
+
+        if raw is not None:
+            releasePixelData( self.metadata, raw )
             
         # convert values to proper HU: real_values = slope * raw + intercept
         if self.metadata.SOPClassUID.name == 'CT Image Storage':
@@ -362,14 +497,57 @@ class DicomImage( plotImage ):
     def doRescaleSlope( self ):
         """ RescaleSlope anwenden wenn es ein RT Image Storage ist
         Wird nur durchgeführt wenn self.isRescaled false ist und setzt isRescaled
+
+        Die Bilddaten werden dabei einmal nach computeDtype kopiert und dort skaliert,
+        pixel_array des Dataset bleibt unverändert
         
         """
         if not self.isRescaled and self.infos["SOPClassUID"] == 'RT Image Storage':
             #print("doRescaleSlope", self.base_path, self.metadata.RescaleSlope )
-            self.array = self.array * self.metadata.RescaleSlope
+            array = self.array.astype( self.computeDtype )
+            np.multiply( array, float( self.metadata.RescaleSlope ), out=array, casting="same_kind" )
+            self.array = array
             self.isRescaled = True
     
-    def getFieldDots( self, field=None ):
+    def savePixelCache( self ):
+        """ Die Bilddaten nach dem rescale als .npy neben der DICOM Datei ablegen
+        Danach wird auch hier die abgelegte Datei verwendet, damit jede Auswertung mit den gleichen float32 Daten rechnet
+
+        """
+        filename = self._pixelCacheFile
+        if not filename:
+            return
+        self._pixelCacheFile = None
+
+        try:
+            self.geometry = {
+                "dpmm": self.dpmm,
+                "sid": self.sid,
+                "cax": [ float( self.cax.x ), float( self.cax.y ) ]
+            }
+        except: # pragma: no cover
+            self.geometry = {}
+
+        if savePixelCache( filename, self.array.astype( np.float32, copy=False ), { "dtype": str( self._original_dtype ), "geometry": self.geometry } ):
+            array, meta = loadPixelCache( filename )
+            if array is not None:
+                self.array = array
+
+    def cachePixels( self ):
+        """ Die Bilddaten nach dem rescale schreibgeschützt in datasetCache ablegen
+        Nur unveränderte Bilddaten aus einer Datei, aus einer .npy geöffnete werden nicht abgelegt
+
+        """
+        SOPInstanceUID = self._datasetCacheKey
+        if not SOPInstanceUID or not self.datasetCache:
+            return
+        self._datasetCacheKey = None
+
+        if not self.isRescaled or isinstance( self.array, np.memmap ) or not self.array.flags.writeable:
+            return
+        self.datasetCache.putPixels( SOPInstanceUID, self.array, { "dtype": str( self._original_dtype ), "geometry": self.geometry } )
+
+    def getFieldDots( self, field=None, oriented: bool=False ):
         """ gibt die pixelangaben für die Feldgröße 
             berücksichtigt dabei die Kollimator Rotation
             
@@ -378,25 +556,23 @@ class DicomImage( plotImage ):
             Parameters
             ----------
             field : dict
+            oriented : bool
+                Pixel Positionen in orientedArray(), dort ist die Kollimator Rotation schon berücksichtigt
         """
-        if field:
-            d = { 
-                "X1" : self.mm2dots_X( field["X1"] ),
-                "X2" : self.mm2dots_X( field["X2"] ),
-                "Y1" : self.mm2dots_Y( field["Y1"] ),
-                "Y2" : self.mm2dots_Y( field["Y2"] ),
-                "X" : self.mm2dots_X( field["X2"] ) - self.mm2dots_X( field["X1"] ),
-                "Y" : self.mm2dots_Y( field["Y2"] ) - self.mm2dots_Y( field["Y1"] ),
-            }
-        else:
-            d = { 
-                "X1" : self.mm2dots_X( self.infos["X1"] ),
-                "X2" : self.mm2dots_X( self.infos["X2"] ),
-                "Y1" : self.mm2dots_Y( self.infos["Y1"] ),
-                "Y2" : self.mm2dots_Y( self.infos["Y2"] ),
-                "X" : self.mm2dots_X( self.infos["X2"] ) - self.mm2dots_X( self.infos["X1"] ),
-                "Y" : self.mm2dots_Y( self.infos["Y2"] ) - self.mm2dots_Y( self.infos["Y1"] ),
-            }
+        if not field:
+            field = self.infos
+
+        d = { 
+            "X1" : self.mm2dots_X( field["X1"], oriented ),
+            "X2" : self.mm2dots_X( field["X2"], oriented ),
+            "Y1" : self.mm2dots_Y( field["Y1"], oriented ),
+            "Y2" : self.mm2dots_Y( field["Y2"], oriented ),
+        }
+        d["X"] = d["X2"] - d["X1"]
+        d["Y"] = d["Y2"] - d["Y1"]
+
+        if oriented:
+            return d
             
         dots = copy.deepcopy( d )
         if self.infos["collimator"] == 90:
@@ -652,6 +828,119 @@ class DicomImage( plotImage ):
         da = self.getFieldDots( )
         return self.array[ da["Y1"]:da["Y2"], da["X1"]:da["X2"] ]     
     
+    def integralImage( self, squares: bool=False ):
+        """Summentabelle (summed-area table) von array, einmal pro array berechnet
+
+        Die Werte werden um ihren Mittelwert verschoben in float64 aufsummiert,
+        mit squares auch die Quadrate für die Varianz.
+        Wird array ersetzt, wird die Tabelle neu berechnet, bei Änderungen in array selbst integralReset() aufrufen.
+
+        Parameters
+        ----------
+        squares : bool, optional
+            auch die Summentabelle der Quadrate bereitstellen. The default is False.
+
+        Returns
+        -------
+        dict
+            - array: array für das die Tabelle gilt
+            - offset: Verschiebung der Werte
+            - sum: np.array shape ( Rows + 1, Columns + 1 )
+            - squares: np.array oder None
+        """
+        integral = self._integral
+        if integral is None or not integral["array"] is self.array:
+            offset = float( np.mean( self.array, dtype=np.float64 ) ) if self.array.size else 0.0
+            integral = {
+                "array": self.array,
+                "offset": offset,
+                "sum": None,
+                "squares": None
+            }
+            self._integral = integral
+
+        if integral["sum"] is None or ( squares and integral["squares"] is None ):
+            shifted = np.subtract( self.array, integral["offset"], dtype=np.float64 )
+            if integral["sum"] is None:
+                integral["sum"] = self._cumsum2d( shifted )
+            if squares:
+                np.square( shifted, out=shifted )
+                integral["squares"] = self._cumsum2d( shifted )
+        return integral
+
+    @staticmethod
+    def _cumsum2d( array ):
+        """Summentabelle von array mit einer führenden Zeile und Spalte 0"""
+        table = np.zeros( ( array.shape[0] + 1, array.shape[1] + 1 ), dtype=np.float64 )
+        np.cumsum( array, axis=0, out=table[1:, 1:] )
+        np.cumsum( table[1:, 1:], axis=1, out=table[1:, 1:] )
+        return table
+
+    def integralReset( self ):
+        """ Summentabelle verwerfen, nach Änderungen in array selbst aufrufen
+        """
+        self._integral = None
+        self._roiQueries = 0
+
+    def getDotsStat( self, da:dict, stat: str="mean" ):
+        """ sum, mean, var oder std eines Pixel Bereichs wie bei getRoi aus image.array
+
+        Nach mehr als integralMinRois Abfragen oder mit vorhandener Summentabelle
+        wird der Bereich ohne Slicing in O(1) aus integralImage() bestimmt
+
+        Parameters
+        ----------
+        da : dict
+            Pixel Angaben X1, X2, Y1, Y2 wie aus getFieldDots
+        stat : str, optional
+            sum, mean, var oder std. The default is "mean".
+
+        Returns
+        -------
+        float
+        """
+        if not stat in [ "sum", "mean", "var", "std" ]:
+            raise ValueError( "getDotsStat: unbekannte Statistik {}".format( stat ) )
+
+        self._roiQueries += 1
+        useIntegral = self._roiQueries > self.integralMinRois or (
+            self._integral is not None and self._integral["array"] is self.array
+        )
+        if not useIntegral:
+            return getattr( self.array[ da["Y1"]:da["Y2"], da["X1"]:da["X2"] ], stat )()
+
+        # Grenzen wie beim Slicing von array
+        rows, columns = self.array.shape
+        y1, y2, _ = slice( da["Y1"], da["Y2"] ).indices( rows )
+        x1, x2, _ = slice( da["X1"], da["X2"] ).indices( columns )
+        y2 = max( y1, y2 )
+        x2 = max( x1, x2 )
+        count = ( y2 - y1 ) * ( x2 - x1 )
+
+        integral = self.integralImage( squares=stat in [ "var", "std" ] )
+
+        def boxSum( table ):
+            return table[ y2, x2 ] - table[ y1, x2 ] - table[ y2, x1 ] + table[ y1, x1 ]
+
+        shiftedSum = boxSum( integral["sum"] )
+        if stat == "sum":
+            return shiftedSum + count * integral["offset"]
+        if count == 0:
+            return np.nan
+        if stat == "mean":
+            return shiftedSum / count + integral["offset"]
+
+        var = max( boxSum( integral["squares"] ) / count - ( shiftedSum / count ) ** 2, 0.0 )
+        return var if stat == "var" else np.sqrt( var )
+
+    def getRoiStat( self, field:dict=None, stat: str="mean" ):
+        """ sum, mean, var oder std der region of interest des angegebenen Bereichs wie getRoi
+            ohne field die Feldgröße wie getFieldRoi
+
+        siehe getDotsStat
+        """
+        return self.getDotsStat( self.getFieldDots( field ), stat )
+
     def getLine( self, field=None ):
         """ holt eine pixel Reihe 
         """
@@ -676,3 +965,170 @@ class DicomImage( plotImage ):
         self.center.y = self.array.shape[1] / 2
         
         return self
+
+
+class DicomImageStack( ):
+    """Bilddaten mehrerer DicomImage gleicher Größe in einem zusammenhängenden 3D array
+
+    Die in mm angegebenen Bereiche werden pro Bild mit getFieldDots (Kollimator Rotation und cax) umgerechnet,
+    Bilder mit gleicher Pixel Lage werden in einem Aufruf für alle Bilder ausgewertet.
+
+    Attributes
+    ----------
+    images : list
+        die DicomImage Instanzen in der Reihenfolge von array
+    index : list
+        index der Bilder z.B. aus dem DataFrame der Gruppe. Default 0..n-1
+    array : np.array
+        Bilddaten mit shape ( Anzahl, Rows, Columns ) in DicomImage.computeDtype
+    """
+
+    stats = [ "mean", "sum", "min", "max", "std" ]
+
+    def __init__( self, images: list=[], index: list=None ):
+        """ stack aus images erzeugen
+
+        Parameters
+        ----------
+        images : list
+            DicomImage Instanzen mit Bilddaten gleicher Größe
+        index : list, optional
+            index der Bilder. Default None für 0..n-1
+
+        """
+        self.images = list( images )
+        self._integral = None
+        self.index = list( index ) if index is not None else list( range( len( self.images ) ) )
+        if len( self.index ) != len( self.images ):
+            raise ValueError( "DicomImageStack: index und images unterschiedlich lang" )
+
+        if len( self.images ) == 0:
+            self.array = np.empty( ( 0, 0, 0 ), dtype=DicomImage.computeDtype )
+            return
+
+        shape = self.images[0].array.shape
+        for image in self.images:
+            if image.array.shape != shape:
+                raise ValueError( "DicomImageStack: Bilder unterschiedlicher Größe {} {}".format( shape, image.array.shape ) )
+
+        self.array = np.empty( ( len( self.images ), ) + shape, dtype=self.images[0].computeDtype )
+        for i, image in enumerate( self.images ):
+            self.array[ i ] = image.array
+
+    def __len__( self ):
+        return len( self.images )
+
+    def roiStats( self, rois: dict={}, stats: list=[ "mean" ] ):
+        """Statistik der in mm angegebenen Bereiche für alle Bilder
+
+        Bei mehr als DicomImage.integralMinRois Bereichen werden mean, sum und std aus integralImage() bestimmt
+
+        Parameters
+        ----------
+        rois : dict
+            name: { "X1", "X2", "Y1", "Y2" } wie bei DicomImage.getRoi. Ein leerer Bereich verwendet die Feldgröße aus image.infos
+        stats : list, optional
+            Auswahl aus DicomImageStack.stats. Default [ "mean" ]
+
+        Returns
+        -------
+        pandas.DataFrame
+            eine Zeile pro Bild mit index, Spalten: name bei einem stat sonst name_stat
+
+        """
+        import pandas as pd
+
+        for stat in stats:
+            if not stat in self.stats:
+                raise ValueError( "DicomImageStack: unbekannte Statistik {}".format( stat ) )
+
+        # bei vielen Bereichen aus der Summentabelle aller Bilder
+        useIntegral = len( rois ) > DicomImage.integralMinRois
+
+        columns = {}
+        for name, field in rois.items():
+            # Bilder mit gleicher Pixel Lage des Bereichs zusammenfassen
+            groups = {}
+            for i, image in enumerate( self.images ):
+                da = image.getFieldDots( field )
+                box = ( da["Y1"], da["Y2"], da["X1"], da["X2"] )
+                groups.setdefault( box, [] ).append( i )
+
+            values = { stat: np.full( len( self.images ), np.nan ) for stat in stats }
+            for ( y1, y2, x1, x2 ), idx in groups.items():
+                if len( idx ) == len( self.images ):
+                    # alle Bilder, view ohne Kopie
+                    idx = slice( None )
+                roi = self.array[ idx, y1:y2, x1:x2 ]
+                for stat in stats:
+                    if useIntegral and stat in [ "mean", "sum", "std" ]:
+                        values[ stat ][ idx ] = self._integralStat( ( y1, y2, x1, x2 ), stat )[ idx ]
+                    elif stat in [ "mean", "sum", "std" ]:
+                        # in float64 aufsummieren
+                        values[ stat ][ idx ] = getattr( roi, stat )( axis=( 1, 2 ), dtype=np.float64 )
+                    else:
+                        values[ stat ][ idx ] = getattr( roi, stat )( axis=( 1, 2 ) )
+
+            for stat in stats:
+                columns[ name if len( stats ) == 1 else "{}_{}".format( name, stat ) ] = values[ stat ]
+
+        return pd.DataFrame( columns, index=self.index )
+
+    def integralImage( self, squares: bool=False ):
+        """Summentabellen aller Bilder wie DicomImage.integralImage, einmal pro stack berechnet
+
+        Returns
+        -------
+        dict
+            - offset: np.array Verschiebung der Werte pro Bild
+            - sum: np.array shape ( Anzahl, Rows + 1, Columns + 1 )
+            - squares: np.array oder None
+        """
+        if self._integral is None:
+            self._integral = {
+                "offset": np.mean( self.array, axis=( 1, 2 ), dtype=np.float64 ),
+                "sum": None,
+                "squares": None
+            }
+        integral = self._integral
+
+        if integral["sum"] is None or ( squares and integral["squares"] is None ):
+            shifted = np.subtract( self.array, integral["offset"][ :, None, None ], dtype=np.float64 )
+            if integral["sum"] is None:
+                integral["sum"] = self._cumsum3d( shifted )
+            if squares:
+                np.square( shifted, out=shifted )
+                integral["squares"] = self._cumsum3d( shifted )
+        return integral
+
+    @staticmethod
+    def _cumsum3d( array ):
+        """Summentabellen über die Bildachsen mit einer führenden Zeile und Spalte 0"""
+        table = np.zeros( ( array.shape[0], array.shape[1] + 1, array.shape[2] + 1 ), dtype=np.float64 )
+        np.cumsum( array, axis=1, out=table[:, 1:, 1:] )
+        np.cumsum( table[:, 1:, 1:], axis=2, out=table[:, 1:, 1:] )
+        return table
+
+    def _integralStat( self, box: tuple, stat: str="mean" ):
+        """ sum, mean oder std eines Pixel Bereichs ( Y1, Y2, X1, X2 ) für alle Bilder aus integralImage()"""
+        rows, columns = self.array.shape[1:]
+        y1, y2, _ = slice( box[0], box[1] ).indices( rows )
+        x1, x2, _ = slice( box[2], box[3] ).indices( columns )
+        y2 = max( y1, y2 )
+        x2 = max( x1, x2 )
+        count = ( y2 - y1 ) * ( x2 - x1 )
+
+        integral = self.integralImage( squares=stat == "std" )
+
+        def boxSum( table ):
+            return table[ :, y2, x2 ] - table[ :, y1, x2 ] - table[ :, y2, x1 ] + table[ :, y1, x1 ]
+
+        shiftedSum = boxSum( integral["sum"] )
+        if stat == "sum":
+            return shiftedSum + count * integral["offset"]
+        if count == 0:
+            return np.full( len( self.images ), np.nan )
+        if stat == "mean":
+            return shiftedSum / count + integral["offset"]
+        var = np.maximum( boxSum( integral["squares"] ) / count - ( shiftedSum / count ) ** 2, 0.0 )
+        return np.sqrt( var )
@@ -32,9 +32,10 @@ class qa_field( ispCheckClass, FieldAnalysis ):
     """Erweitert die Klasse FieldAnalysis mit ispCheckClass
 
     """
-    def __init__( self, checkField, baseField=None, normalize: str="none" ):
+    def __init__( self, checkField, baseField=None, normalize: str="none", cache: dict=None ):
         """ checkField und ggf baseField laden und ispCheckClass initialisieren
 
+        baseField wird mit cache (siehe ispBase.imageCache) nur einmal pro Lauf aufbereitet
         """
         self._is_FFF = False
         self.checkField = checkField
@@ -45,8 +46,9 @@ class qa_field( ispCheckClass, FieldAnalysis ):
             # self.image und self.baseImage initialisieren und ggf normalisieren
             ispCheckClass.__init__( self,
                 image=DicomImage( self.checkField ),
-                baseImage=DicomImage( self.baseField ),
-                normalize=normalize
+                baseImage=self.getImage( self.baseField, cache ),
+                normalize=normalize,
+                cache=cache
             )
            
         elif self.checkField:
@@ -207,14 +209,15 @@ class qa_field( ispCheckClass, FieldAnalysis ):
         if not field:
             field = { "X1":-50, "X2": 50, "Y1": -50, "Y2": 50 }
 
-        roi = self.image.getRoi( field ).copy()
+        # nur die vier Rand Profile werden verwendet, roi ohne Kopie
+        roi = self.image.getRoi( field )
 
         result = {}
 
         result['Q2Q1'] = {
             'name' : 'Q2 - Q1',
             'profile' : FWXMProfilePhysical( 
-                roi[ : , 0 ],
+                roi[ : , 0 ].copy(),
                 dpmm=self.image.dpmm 
             ),
             'field' : field
@@ -223,7 +226,7 @@ class qa_field( ispCheckClass, FieldAnalysis ):
         result['Q2Q3'] = {
             'name' : 'Q2 - Q3',
             'profile' : FWXMProfilePhysical( 
-                roi[ 0 ],
+                roi[ 0 ].copy(),
                 dpmm=self.image.dpmm 
             ),
             'field' : field
@@ -231,7 +234,7 @@ class qa_field( ispCheckClass, FieldAnalysis ):
         result['Q3Q4'] = {
             'name' : 'Q3 - Q4',
             'profile' : FWXMProfilePhysical( 
-                roi[ : , -1 ],
+                roi[ : , -1 ].copy(),
                 dpmm=self.image.dpmm 
             ),
             'field' : field
@@ -239,7 +242,7 @@ class qa_field( ispCheckClass, FieldAnalysis ):
         result['Q1Q4'] = {
             'name' : 'Q1 - Q4',
             'profile' : FWXMProfilePhysical( 
-                roi[ -1 ],
+                roi[ -1 ].copy(),
                 dpmm=self.image.dpmm 
             ),
             'field' : field
@@ -353,43 +356,42 @@ class checkField( ispBase ):
             if not ok:
                 return
 
-            # base Field und dosis bereitstellen
-            baseField = qa_field( self.getFullData( df_base.loc[df_base.index[0]] ) )
-            baseMeanDose = baseField.getMeanDose( md["doseArea"] )
+            # base Field und alle anderen in einem stack, mittlere Dosis für alle Bilder in einem Aufruf
+            stack = self.getImageStack( pd.concat( [ df_base.iloc[:1], df_fields ] ) )
+            meanDose = stack.roiStats( { "fieldMeanDose": md["doseArea"] } )["fieldMeanDose"].values
+
+            baseImage = stack.images[0]
+            baseMeanDose = meanDose[0]
 
             #
             evaluation_table = [ {
-                'Kennung': baseField.infos["RadiationId"],
-                'doserate': baseField.infos["doserate"],
-                'ME': baseField.infos["ME"],
-                'baseME': baseField.infos["ME"],
+                'Kennung': baseImage.infos["RadiationId"],
+                'doserate': baseImage.infos["doserate"],
+                'ME': baseImage.infos["ME"],
+                'baseME': baseImage.infos["ME"],
                 'baseMeanDose': 1,
                 'fieldMeanDose': baseMeanDose
             }]
 
             # print BaseField Image
-            img = baseField.image.plotImage( **md.plotImage )
+            img = baseImage.plotImage( **md.plotImage )
             self.pdf.image(img, **md.plotImage_pdf )
 
             # alle anderen durchgehen
-            for info in df_fields.itertuples():
-                # prüf Field und dosis bereitstellen
-                checkField = qa_field( self.getFullData(info), normalize="none" )
-                fieldMeanDose = checkField.getMeanDose( md["doseArea"] )
-
+            for checkImage, fieldMeanDose in zip( stack.images[1:], meanDose[1:] ):
                 #
                 evaluation_table.append( {
-                      'Kennung': checkField.infos["Kennung"],
-                      'doserate': checkField.infos["doserate"],
-                      'ME': checkField.infos["ME"],
-                      'baseME': baseField.infos["ME"],
+                      'Kennung': checkImage.infos["Kennung"],
+                      'doserate': checkImage.infos["doserate"],
+                      'ME': checkImage.infos["ME"],
+                      'baseME': baseImage.infos["ME"],
                       'baseMeanDose': baseMeanDose,
                       'fieldMeanDose': fieldMeanDose
                 } )
 
                 if md["print_all_images"] == True:
                     # print checkField Image
-                    img = checkField.image.plotImage( **md.plotImage )
+                    img = checkImage.plotImage( **md.plotImage )
                     self.pdf.image(img, **md.plotImage_pdf )
 
                 # progress
@@ -465,36 +467,34 @@ class checkField( ispBase ):
                 # das offene Feld bestimmen
                 df_base = df_doserate.query( openFieldQuery )
 
-                # base Field und dosis bereitstellen
-                baseField = qa_field( self.getFullData( df_base.loc[df_base.index[0]] ), normalize="none" )
-                baseMeanDose = baseField.getMeanDose( md["doseArea"] )
+                # alle anderen filtern
+                df_fields = df_doserate.query( fieldQuery )
+
+                # base Field und alle anderen in einem stack, mittlere Felddosis für alle Bilder in einem Aufruf
+                stack = self.getImageStack( pd.concat( [ df_base.iloc[:1], df_fields ] ) )
+                meanDose = stack.roiStats( { "fieldMeanDose": md["doseArea"] } )["fieldMeanDose"].values
+
+                baseImage = stack.images[0]
+                baseMeanDose = meanDose[0]
 
                 # 100  referenz Dose 1.0
                 data = [ {
-                    'Kennung': baseField.infos["RadiationId"],
-                    'doserate': baseField.infos["doserate"],
-                    'ME': baseField.infos["ME"],
+                    'Kennung': baseImage.infos["RadiationId"],
+                    'doserate': baseImage.infos["doserate"],
+                    'ME': baseImage.infos["ME"],
                     'fieldMeanDose': baseMeanDose,
                     'diff': np.nan # (baseMeanDose - 1.0) * 100
                 }]
-                # alle anderen filtern
-                df_fields = df_doserate.query( fieldQuery )
 
                 # alle anderen durchgehen
-                for info in df_fields.itertuples():
-                    # prüft Field und dosis bereitstellen
-                    checkField = qa_field( self.getFullData(info), normalize="none" )
-
-                    # Berechnung der mittleren Felddosis
-                    fieldMeanDose = checkField.getMeanDose( md["doseArea"] )
-
+                for checkImage, fieldMeanDose in zip( stack.images[1:], meanDose[1:] ):
                     # Berechnung
-                    baseFmu = baseMeanDose / baseField.infos['ME'] * checkField.infos['ME']
+                    baseFmu = baseMeanDose / baseImage.infos['ME'] * checkImage.infos['ME']
 
                     data.append( {
-                      'Kennung': checkField.infos["RadiationId"],
-                      'doserate': checkField.infos["doserate"],
-                      'ME': checkField.infos["ME"],
+                      'Kennung': checkImage.infos["RadiationId"],
+                      'doserate': checkImage.infos["doserate"],
+                      'ME': checkImage.infos["ME"],
                       'fieldMeanDose': fieldMeanDose,
                       'diff': (fieldMeanDose - baseFmu) / baseFmu * 100,
                     } )
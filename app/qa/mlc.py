@@ -13,7 +13,7 @@ from pylinac.core.profile import FWXMProfilePhysical, MultiProfile
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 from app.base import ispBase
-from app.image import DicomImage
+from app.image import DicomImage, DicomImageStack
 from app.check import ispCheckClass
 
 from isp.config import dict_merge
@@ -45,7 +45,8 @@ class qa_mlc( PicketFence, ispCheckClass ):
         baseField=None, 
         normalize: str="diff", 
         kennung:str="{Kennung}",
-        mlc: MLC | MLCArrangement | str = MLC.MILLENNIUM
+        mlc: MLC | MLCArrangement | str = MLC.MILLENNIUM,
+        cache: dict=None
     ):
         """
         Attributes
@@ -59,6 +60,10 @@ class qa_mlc( PicketFence, ispCheckClass ):
         kennung : format string
             Welche Felder aus infos sollen für das Feld Kennung verwendet werden.
             default: {Kennung}
+
+        cache : dict
+            baseField und dessen Kehrwert nur einmal pro Lauf aufbereiten, siehe ispBase.imageCache.
+            default: None
         """
 
         self._is_analyzed = False
@@ -73,8 +78,9 @@ class qa_mlc( PicketFence, ispCheckClass ):
             # self.image und self.baseImage initialisieren und ggf normalisieren
             ispCheckClass.__init__( self,
                 image=DicomImage( self.checkField ),
-                baseImage=DicomImage( self.baseField ),
-                normalize=normalize
+                baseImage=self.getImage( self.baseField, cache ),
+                normalize=normalize,
+                cache=cache
             )
         elif self.checkField:
             # nur checkfield wurde angegeben
@@ -140,18 +146,11 @@ class qa_mlc( PicketFence, ispCheckClass ):
         if position < -200 or position > 200 :
             return {}
 
-        # PixelPosition ermitteln
-        pxPosition = self.image.mm2dots_X( position )
+        # PixelPosition in der Kollimator normalisierten Ansicht ermitteln
+        pxPosition = self.image.mm2dots_X( position, oriented=True )
 
         """ Analysis """
-        if self.infos["collimator"] == 90:
-            self.image.rot90( n=3 )
-        elif self.infos["collimator"] == 180:
-            self.image.rot90( n=2 )
-        elif self.infos["collimator"] == 270:
-            self.image.rot90( n=1 )
-
-        profile = MultiProfile( self.image.array[:, pxPosition] )
+        profile = MultiProfile( self.image.orientedArray()[:, pxPosition] )
 
         """ max Peaks (interleaf) suchen """
         # max peaks für innere leafs bei 10 für äußere bei 20
@@ -176,14 +175,6 @@ class qa_mlc( PicketFence, ispCheckClass ):
         # mittelwert von minPeaks
         meanMinPeaks = np.mean( profile[minPeaks] )
 
-        # rotation wieder zurücknehmen
-        if self.infos["collimator"] == 90:
-            self.image.rot90( n=3 )
-        elif self.infos["collimator"] == 180:
-            self.image.rot90( n=2 )
-        elif self.infos["collimator"] == 270:
-            self.image.rot90( n=1 )
-
         return {
                 'filename': self.infos["filename"],
                 'Kennung': self._kennung.format( **self.infos ),
@@ -899,6 +890,7 @@ class checkMlc( ispBase ):
                 check = qa_mlc(
                         checkField=self.getFullData(info),
                         baseField=baseField,
+                        cache=self.imageCache,
                         normalize="diff"
                     )
 
@@ -1120,6 +1112,7 @@ class checkMlc( ispBase ):
                     check = qa_mlc(
                              checkField=self.getFullData(info),
                              baseField=baseField,
+                             cache=self.imageCache,
                              normalize="diff",
                              kennung="{RadiationId} - {ImageId}"
                     )
@@ -1374,6 +1367,7 @@ class checkMlc( ispBase ):
                     check = qa_mlc(
                              checkField=self.getFullData(info),
                              baseField=baseField,
+                             cache=self.imageCache,
                              normalize="diff",
                              kennung="{RadiationId} - {ImageId}"
                     )
@@ -1613,6 +1607,7 @@ class checkMlc( ispBase ):
 
                 # alle anderen durchgehen
                 # alle Felder durchgehen
+                checks = []
                 for (idx, df_field) in df_speed.query("open != 'OF'").iterrows():
 
 
@@ -1623,50 +1618,53 @@ class checkMlc( ispBase ):
                             md, date=checkDate, group_len=len( result ),
                             errors=errors
                         ) )
-                        return
-
-                    # die Bilder von den Felder mit gedrehtem Kollimator drehen
-                    if df_field["collimator"] == 90:
-                        dicomfile=df_field["dicom"]
-                        arr=dicomfile.pixel_array
-                        arr=np.rot90(arr, k=3)
-                        dicomfile.PixelData=arr.tobytes()
-                        df_field["dicom"]=dicomfile
-                    if df_field["collimator"] == 270:
-                        dicomfile=df_field["dicom"]
-                        arr=dicomfile.pixel_array
-                        arr=np.rot90(arr)
-                        dicomfile.PixelData=arr.tobytes()
-                        df_field["dicom"]=dicomfile
+                        break
 
                     # es wurden keine Felder gefunden (checkFields fehler)
                     check = qa_mlc(
                         checkField=self.getFullData( df_field ),
                         baseField=self.getFullData( df_base ),
-                        normalize="prozent"
+                        cache=self.imageCache,
+                        normalize="none"
                     )
 
+                    # die Bilder von den Felder mit gedrehtem Kollimator vor dem normalisieren drehen,
+                    # als view ohne das Dataset zu ändern
+                    if check.infos["collimator"] in [ 90, 270 ]:
+                        check.image.array = check.image.orientedArray()
+                    check.normalize( "prozent" )
+
                     if check.infos["collimator"] == 90:
                         check.image.rot90( n=3 )
                     elif check.infos["collimator"] == 270:
                         check.image.rot90( n=1 )
 
-                    # Daten merken
+                    checks.append( check )
+
+                    # progress pro file stimmt nicht immer genau (baseimage)
+                    # 40% für die dicom daten 40% für die Auswertung 20 % für das pdf
+                    self.fileCount += 1
+                    if hasattr( logger, "progress"):
+                        logger.progress( md["testId"],  40 + ( 40 / filesMax * self.fileCount ) )
+
+                if len( checks ) == 0:
+                    return
+
+                # normalisierte Bilder aller Felder in einem stack, delta in der Feldgröße für alle Bilder in einem Aufruf
+                stack = DicomImageStack( [ check.image for check in checks ] )
+                deltas = stack.roiStats( { "delta": None } )["delta"].values * 100
+
+                # Daten merken
+                for check, delta in zip( checks, deltas ):
                     data.append( {
                         "doserate" : check.infos["doserate"],
                         "speed" : check.infos["speed"],
                         "gantry" : check.infos["gantry"],
                         "collimator" : check.infos["collimator"],
                         "AcquisitionDateTime" : check.infos["AcquisitionDateTime"],
-                        "delta" : check.image.getFieldRoi().mean() * 100
+                        "delta" : delta
                     })
 
-                    # progress pro file stimmt nicht immer genau (baseimage)
-                    # 40% für die dicom daten 40% für die Auswertung 20 % für das pdf
-                    self.fileCount += 1
-                    if hasattr( logger, "progress"):
-                        logger.progress( md["testId"],  40 + ( 40 / filesMax * self.fileCount ) )
-
             # alle doserate speed Arten durch gehen
             ( df_group
                  .sort_values(by=[ "gantry", "collimator", "doserate", "speed", "AcquisitionDateTime"])
@@ -1887,8 +1885,8 @@ class checkMlc( ispBase ):
 
                 # alle anderen durchgehen
                 # alle Felder durchgehen
+                checks = []
                 for (idx, df_field) in df_speed.query("open != 'OF'").iterrows():
-                    gating=""
 
                     # alles notwendige da?
                     errors = self.checkFields( md, df_base, df_field, md["field_count"] )
@@ -1897,7 +1895,7 @@ class checkMlc( ispBase ):
                             md, date=checkDate, group_len=len( result ),
                             errors=errors
                         ) )
-                        return
+                        break
                     '''
                     # prüfung der benötigten Felder
                     if not self.checkFields( md, df_base, df_field, 1 ):
@@ -1907,13 +1905,30 @@ class checkMlc( ispBase ):
                     check = qa_mlc(
                         checkField=self.getFullData( df_field ),
                         baseField=self.getFullData( df_base ),
+                        cache=self.imageCache,
                         normalize="prozent"
                     )
+                    checks.append( check )
+
+                    # progress pro file stimmt nicht immer genau (baseimage)
+                    # 40% für die dicom daten 40% für die Auswertung 20 % für das pdf
+                    self.fileCount += 1
+                    if hasattr( logger, "progress"):
+                        logger.progress( md["testId"],  40 + ( 40 / filesMax * self.fileCount ) )
 
+                if len( checks ) == 0:
+                    return
+
+                # normalisierte Bilder aller Felder in einem stack, delta in der Feldgröße für alle Bilder in einem Aufruf
+                stack = DicomImageStack( [ check.image for check in checks ] )
+                deltas = stack.roiStats( { "delta": None } )["delta"].values * 100
+
+                # Daten merken
+                for check, delta in zip( checks, deltas ):
+                    gating = ""
                     if check.infos["check_subtag"] == "gating":
                         gating = "gating"
 
-                    # Daten merken
                     data.append( {
                         "doserate" : check.infos["doserate"],
                         "gating" : gating,
@@ -1921,15 +1936,9 @@ class checkMlc( ispBase ):
                         "gantry" : check.infos["gantry"],
                         "collimator" : check.infos["collimator"],
                         "AcquisitionDateTime" : check.infos["AcquisitionDateTime"],
-                        "delta" : check.image.getFieldRoi().mean() * 100
+                        "delta" : delta
                     })
 
-                    # progress pro file stimmt nicht immer genau (baseimage)
-                    # 40% für die dicom daten 40% für die Auswertung 20 % für das pdf
-                    self.fileCount += 1
-                    if hasattr( logger, "progress"):
-                        logger.progress( md["testId"],  40 + ( 40 / filesMax * self.fileCount ) )
-
 
             # alle doserate speed Arten durch gehen
             ( df_group
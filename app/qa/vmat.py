@@ -18,7 +18,7 @@ __license__ = "MIT"
 __version__ = "0.2.1"
 __status__ = "Prototype"
 
-from pylinac.vmat import VMATBase
+from pylinac.vmat import VMATBase, Segment
 
 import numpy as np
 import pandas as pd
@@ -39,6 +39,28 @@ from dotmap import DotMap
 import logging
 logger = logging.getLogger( "ISP" )
         
+class qa_segment( Segment ):
+    """Segment mit r_corr aus den Summentabellen von DicomImage
+
+    r_corr wird von VMATBase für jedes Segment mehrfach abgefragt,
+    die Mittelwerte kommen dann aus DicomImage.getDotsStat statt aus einer Kopie des Bereichs
+    """
+
+    @property
+    def r_corr( self ) -> float:
+        """Return the ratio of the mean pixel values of DMLC/OPEN images."""
+        corner = self.bl_corner
+        da = {
+            "X1": int( corner.x ),
+            "X2": int( corner.x + self.width ),
+            "Y1": int( corner.y ),
+            "Y2": int( corner.y + self.height )
+        }
+        dmlc_value = self._dmlc_image.getDotsStat( da, "mean" )
+        open_value = self._open_image.getDotsStat( da, "mean" )
+        return ( dmlc_value / open_value ) * 100
+
+
 class qa_vmat( VMATBase, ispCheckClass ):
     '''
     
@@ -120,6 +142,15 @@ class qa_vmat( VMATBase, ispCheckClass ):
         self.results = self.getResults()
 
 
+    def _construct_segments( self, points: list ):
+        """Overrides pylinac _construct_segments, verwendet qa_segment
+        """
+        for point in points:
+            segment = qa_segment( point, self.open_image, self.dmlc_image, self._tolerance )
+            self.segments.append( segment )
+        # post-analysis to update R_corr values
+        self._update_r_corrs()
+
     def getResults( self ):
         """Holt die Ergebnisse der Auswertung.
         und füllt die segmente mit jeweiligen Daten aus metadata
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+
+"""Index der Kommentar Tags einer Aria Abfrage
+
+gqaTestMap wird einmal aus config.GQA bestimmt:
+
+- tagTests: testTag -> testId
+- testTags: testId -> testTag
+- inaktiv: testId -> Angabe aus info.inaktiv
+- energyFields: (testId, unit, energy) -> Anzahl der benötigten Felder
+
+gqaTagIndex wird einmal pro Abfrageergebnis (getImageInfosFrame) erstellt und enthält
+eine Zeile pro Aufnahme und testTag ergänzt um die Angaben aus gqaTestMap.
+Zusätzlich ist der Zugriff testTag -> subTag -> energy -> month -> SliceUIDs möglich.
+
+"""
+
+__author__ = "R. Bauer"
+__copyright__ = "MedPhyDO - Machbarkeitsstudien des Instituts für Medizinische Strahlenphysik und Strahlenschutz am Klinikum Dortmund im Rahmen von Bachelor und Masterarbeiten an der TU-Dortmund / FH-Dortmund"
+__credits__ = ["R.Bauer", "K.Loot"]
+__license__ = "MIT"
+__version__ = "0.1.1"
+__status__ = "Prototype"
+
+import pandas as pd
+
+class gqaTestMap( ):
+    '''Zuordnungen aus config.GQA
+
+    Attributes
+    ----------
+
+    tagTests : dict
+        testTag -> testId
+
+    testTags : dict
+        testId -> testTag
+
+    inaktiv : dict
+        testId -> info.inaktiv für inaktive Tests
+
+    energyFields : dict
+        (testId, unit, energy) -> Anzahl der benötigten Felder
+
+    '''
+
+    def __init__( self, gqa=None ):
+        """Zuordnungen bestimmen
+
+        Parameters
+        ----------
+        gqa : dict, optional
+            config.GQA. The default is None.
+
+        """
+        self.tagTests = {}
+        self.testTags = {}
+        self.inaktiv = {}
+        self.energyFields = {}
+
+        for testId, item in ( gqa or {} ).items():
+            if "tag" in item:
+                self.tagTests[ item["tag"] ] = testId
+                self.testTags[ testId ] = item["tag"]
+
+            # inaktive kann auch einen Text enthalten der beschreibt warum
+            info = item.get( "info", None )
+            if isinstance( info, dict ) and "inaktiv" in info and not info["inaktiv"] == False:
+                self.inaktiv[ testId ] = info["inaktiv"]
+
+            for unit, unitItem in item.items():
+                if not isinstance( unitItem, dict ) or not isinstance( unitItem.get( "energyFields", None ), dict ):
+                    continue
+                for energy, fields in unitItem["energyFields"].items():
+                    if not fields == False:
+                        self.energyFields[ ( testId, unit, energy ) ] = fields
+
+    def testId( self, tags ):
+        """testId zu den tags, None wenn es keinen Test gibt
+
+        Parameters
+        ----------
+        tags : pandas.Series
+            testTags
+
+        Returns
+        -------
+        pandas.Series
+
+        """
+        return tags.map( self.tagTests )
+
+
+class gqaTagIndex( ):
+    '''Index der testTags einer Abfrage
+
+    Attributes
+    ----------
+
+    frame : pandas.DataFrame
+        eine Zeile pro Aufnahme und testTag mit den Spalten
+        SliceUID, unit, energy, testTag, subTag, AcquisitionYear, AcquisitionMonth,
+        testId, inaktiv, energyFields und valid
+
+    testMap : gqaTestMap
+        verwendete Zuordnungen aus config.GQA
+
+    '''
+
+    columns = [ "SliceUID", "unit", "energy", "testTag", "subTag", "AcquisitionYear", "AcquisitionMonth" ]
+
+    def __init__( self, infos:pd.DataFrame, testMap:gqaTestMap ):
+        """Index aus dem Ergebnis von getImageInfosFrame erstellen
+
+        Parameters
+        ----------
+        infos : pandas.DataFrame
+            Ergebnis von getImageInfosFrame
+        testMap : gqaTestMap
+            Zuordnungen aus config.GQA
+
+        """
+        self.testMap = testMap
+        self._index = None
+
+        if len( infos.index ) == 0:
+            frame = pd.DataFrame( columns=self.columns )
+        else:
+            # testTags und subTags gleichzeitig auflösen
+            frame = infos[ [ "SliceUID", "unit", "energy", "testTags", "subTags", "AcquisitionYear", "AcquisitionMonth" ] ]
+            frame = frame.explode( [ "testTags", "subTags" ] ).rename( columns={ "testTags": "testTag", "subTags": "subTag" } )
+            frame = frame[ frame["testTag"].notna() ].reset_index( drop=True )
+            frame["subTag"] = frame["subTag"].fillna( "" )
+
+        frame["testId"] = testMap.testId( frame["testTag"] )
+        frame["inaktiv"] = frame["testId"].map( lambda testId: testMap.inaktiv.get( testId, False ) )
+        frame["energyFields"] = pd.Series( [
+            testMap.energyFields.get( key ) for key in zip( frame["testId"], frame["unit"], frame["energy"] )
+        ], index=frame.index, dtype=object )
+        frame["valid"] = frame["testId"].notna() & ( frame["inaktiv"] == False ) & frame["energyFields"].notna()
+
+        self.frame = frame
+
+    @property
+    def index( self ):
+        """testTag -> subTag -> energy -> month -> SliceUIDs
+
+        subTag ist "" wenn kein subTag angegeben wurde
+
+        Returns
+        -------
+        dict
+
+        """
+        if self._index is None:
+            self._index = {}
+            groups = self.frame.groupby( [ "testTag", "subTag", "energy", "AcquisitionMonth" ], sort=False )[ "SliceUID" ]
+            for ( testTag, subTag, energy, month ), uids in groups.agg( lambda s: list( dict.fromkeys( s ) ) ).items():
+                self._index.setdefault( testTag, {} ).setdefault( subTag, {} ).setdefault( energy, {} )[ month ] = uids
+        return self._index
+
+    def sliceUIDs( self, testTags, subTag=None, energy=None, month=None ):
+        """SliceUIDs der Aufnahmen mit einem der testTags
+
+        Parameters
+        ----------
+        testTags : str|list
+            ein oder mehrere testTags
+        subTag : str, optional
+            nur mit diesem subTag, "" für ohne subTag. The default is None.
+        energy : str, optional
+            nur diese Energie. The default is None.
+        month : int, optional
+            nur dieser Monat. The default is None.
+
+        Returns
+        -------
+        dict
+            energy -> list mit SliceUIDs
+
+        """
+        if not isinstance( testTags, (list, tuple) ):
+            testTags = [ testTags ]
+
+        result = {}
+        for testTag in testTags:
+            for _subTag, energies in self.index.get( testTag, {} ).items():
+                if subTag is not None and not _subTag == subTag:
+                    continue
+                for _energy, months in energies.items():
+                    if energy is not None and not _energy == energy:
+                        continue
+                    for _month, uids in months.items():
+                        if month is not None and not _month == month:
+                            continue
+                        result.setdefault( _energy, {} ).update( dict.fromkeys( uids ) )
+
+        return { key: list( uids ) for key, uids in result.items() }
+
+    def tagNotFound( self ):
+        """testTags zu denen es keinen Test gibt
+
+        Returns
+        -------
+        dict
+            testTag -> testTag
+
+        """
+        tags = self.frame.loc[ self.frame["testId"].isna(), "testTag" ].unique()
+        return { tag: tag for tag in tags }
+
+    def inactiv( self ):
+        """info.inaktiv pro Aufnahme und testTag eines inaktiven Tests
+
+        Returns
+        -------
+        list
+
+        """
+        found = self.frame["testId"].notna()
+        return self.frame.loc[ found & ~( self.frame["inaktiv"] == False ), "inaktiv" ].tolist()
+
+    def testNotFound( self ):
+        """config Pfade der fehlenden energyFields pro Aufnahme und testTag
+
+        Returns
+        -------
+        list
+            mit GQA.<testId>.<unit>.energyFields.<energy>
+
+        """
+        missing = self.frame[ self.frame["testId"].notna() & ( self.frame["inaktiv"] == False ) & self.frame["energyFields"].isna() ]
+        return [ "GQA.{}.{}.energyFields.{}".format( *key ) for key in zip( missing["testId"], missing["unit"], missing["energy"] ) ]
+
+    def counts( self, cached:set=None ):
+        """Anzahl der Felder pro Test, Gerät, Datumsflag und Energie
+
+        Das Datumsflag ist bei JT Tests "0" sonst der Monat
+
+        Parameters
+        ----------
+        cached : set, optional
+            SliceUIDs der lokal vorhandenen DICOM Dateien. The default is None.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Spalten testId, unit, dateFlag, energy, counts, energyFields, ready
+            und mit cached die Anzahl der lokal vorhandenen Felder in cached
+
+        """
+        valid = self.frame[ self.frame["valid"] ].copy()
+        valid["dateFlag"] = valid["AcquisitionMonth"].astype( str ).where( valid["testId"].str[0:2] != "JT", "0" )
+
+        aggregations = {
+            "counts": ( "SliceUID", "size" ),
+            "energyFields": ( "energyFields", "first" )
+        }
+        if cached is not None:
+            valid["cached"] = valid["SliceUID"].isin( cached )
+            aggregations["cached"] = ( "cached", "sum" )
+
+        keys = [ "testId", "unit", "dateFlag", "energy" ]
+        counts = valid.groupby( keys, sort=False ).agg( **aggregations ).reset_index()
+        counts["ready"] = counts["counts"] >= counts["energyFields"]
+        return counts
+
+    def periods( self ):
+        """Jahr und Monat der gültigen Aufnahmen pro Test, Gerät, Datumsflag und Energie
+
+        In der Reihenfolge des letzten Vorkommens
+
+        Returns
+        -------
+        pandas.DataFrame
+            Spalten testId, unit, dateFlag, energy, AcquisitionYear, AcquisitionMonth
+
+        """
+        valid = self.frame[ self.frame["valid"] ].copy()
+        valid["dateFlag"] = valid["AcquisitionMonth"].astype( str ).where( valid["testId"].str[0:2] != "JT", "0" )
+        return valid[ [ "testId", "unit", "dateFlag", "energy", "AcquisitionYear", "AcquisitionMonth" ] ].drop_duplicates( keep="last" )
@@ -10,6 +10,23 @@ There are two types of AEs:
 CHANGELOG
 =========
 
+0.1.4 / 2026-10-18
+------------------
+- add openAssociation() - reuse one association for all requests, renegotiate only after abort or release
+- add closeAE on idle_timeout and associationStats
+- change _retrieve() - send and responses under _assocLock
+- change retrieve() - ignore signals of other associations and other SOPInstanceUIDs
+- add retrieveMany() - one request per series for a set of SOPInstanceUIDs
+- add _scheduleRetrieve() - parallel associations, timeout and retry for retrieveMany(), subPath and override per request in ispDicomReceived
+- add archive - index of the local files by SOPInstanceUID in a sharded directory layout
+- add read_mode - lazy or header-only reads from the archive, archive_loadSOPInstanceUID() mode parameter
+- change archive_deleteSOPInstanceUID() - also removes the pixel cache
+- add retrieveAsync() and ispDicomRequest - one handle per request on a shared pool, with cancel() and timeout
+- change retrieve() - uses retrieveAsync(), no blinker signals and no thread per call
+- change handle_STORE() - assign datasets by SOPInstanceUID, MoveOriginatorMessageID or C-GET association
+- add writer - received datasets are written by ispDicomWriter, handle_STORE() and the retrieve requests no longer wait for the disk
+- add datasetCache - datasets by SOPInstanceUID in the process-wide ispDicomDatasetCache, removed on override and archive_deleteSOPInstanceUID()
+
 0.1.3 / 2022-06-01
 ------------------
 - change __init__() remove app.Error() call
@@ -33,7 +50,7 @@ __author__ = "R. Bauer"
 __copyright__ = "MedPhyDO - Machbarkeitsstudien des Instituts für Medizinische Strahlenphysik und Strahlenschutz am Klinikum Dortmund im Rahmen von Bachelor und Masterarbeiten an der TU-Dortmund / FH-Dortmund"
 __credits__ = ["R.Bauer", "K.Loot"]
 __license__ = "MIT"
-__version__ = "0.1.3"
+__version__ = "0.1.4"
 __status__ = "Prototype"
 
 import os
@@ -42,13 +59,16 @@ import json
 
 from typing import List
 
-from blinker import signal
 import threading
 import queue
+import time
+import itertools
+from concurrent.futures import ThreadPoolExecutor, CancelledError, Future, wait
+
+import sqlite3
 
 from pydicom.dataset import Dataset
-from pydicom import dcmread
-from pydicom.uid import generate_uid
+from pydicom.uid import generate_uid, ImplicitVRLittleEndian
 
 from pynetdicom import (
     AE,
@@ -83,6 +103,8 @@ from pynetdicom.sop_class import (
 
 from pynetdicom import sop_class
 
+from isp.dicomarchive import ispDicomArchive, ispDicomWriter, ispDicomDatasetCache, acquisitionYear, readDataset, removePixelCache, READ_MODES
+
 import logging
 logger = logging.getLogger( "ISP" )
 # logger.level = 10 # 0 - NOTSET, 10 - DEBUG, 20 - INFO, 30 - WARNING, 40 - ERROR, 50 - CRITICAL
@@ -133,6 +155,103 @@ dicomQueryDefaults = {
 }
 
 
+class ispDicomReceived( dict ):
+    """SOPInstanceUID -> Dataset der von einer Abfrage empfangenen Datensätze
+
+    Liegt in ispDicom._pending, handle_STORE legt die Datensätze mit subPath und override
+    der Abfrage ab und nicht mit denen einer gleichzeitig laufenden.
+
+    """
+
+    def __init__( self, subPath:str="", override:bool=False ):
+        super().__init__()
+        self.subPath = subPath
+        self.override = override
+
+
+class ispDicomRequest( ):
+    """Eine mit ispDicom.retrieveAsync() gestartete Abfrage
+
+    Empfangene Datensätze werden nur der eigenen Abfrage zugeordnet, über die SOPInstanceUID,
+    die MoveOriginatorMessageID des C-MOVE oder bei C-GET über die verwendete Verbindung.
+
+    Attributes
+    ----------
+    params : dict
+        Parameter für ispDicom._retrieve
+
+    timeout : float
+        Sekunden nach denen der C-GET/C-MOVE abgebrochen wird
+
+    instances : ispDicomReceived
+        SOPInstanceUID -> Dataset der erhaltenen Datensätze
+
+    signals : list
+        pro Schritt name, status, msg und count
+
+    status : Dicom Status
+        Ergebnis der Abfrage, None solange sie läuft
+
+    future : concurrent.futures.Future
+        die Ausführung im gemeinsamen Pool
+
+    """
+
+    def __init__( self, params:dict={}, timeout:float=None ):
+        self.params = dict( params )
+        self.timeout = timeout
+        self.instances = ispDicomReceived( self.params.get( "subPath", "" ), self.params.get( "override", False ) )
+        self.signals = []
+        self.status = None
+        self.future = None
+
+        self._cancelled = threading.Event()
+        # bricht einen laufenden C-GET/C-MOVE ab, wird von _sendRetrieve gesetzt
+        self._abort = None
+
+    def cancel( self ):
+        """Abfrage abbrechen
+
+        Eine noch wartende Abfrage wird nicht mehr ausgeführt, bei einer laufenden wird die Verbindung abgebrochen.
+
+        """
+        self._cancelled.set()
+        if self.future and self.future.cancel():
+            return True
+        abort = self._abort
+        if abort:
+            abort()
+        return True
+
+    def cancelled( self ):
+        return self._cancelled.is_set()
+
+    def done( self ):
+        return self.future is not None and self.future.done()
+
+    def result( self, timeout:float=None ):
+        """Auf das Ende der Abfrage warten
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Sekunden die gewartet wird, danach concurrent.futures.TimeoutError. The default is None.
+
+        Returns
+        -------
+        instances : list
+            die erhaltenen Datensätze
+        signals : list
+
+        """
+        try:
+            self.future.result( timeout )
+        except CancelledError:
+            self.status = 0xFE00
+            self.signals.append( { "name": "EVT_C_STORE", "status": 0xFE00, "msg": "cancelled", "count": 0 } )
+        return list( self.instances.values() ), self.signals
+
+
 class ispDicom(  ):
     """Dicom Klasse zum Abfragen eines Dicom servers.
 
@@ -159,8 +278,46 @@ class ispDicom(  ):
     messageId : int
         id der laufenden abfrage
 
+    idleTimeout : float
+        Sekunden ohne Abfrage nach denen die Verbindung geschlossen wird.
+        Aus config.dicom.<server>.idle_timeout default: 30, 0 schließt nicht automatisch
+
+    associationStats : dict
+        Anzahl der geöffneten, wiederverwendeten, erfolgreich neu ausgehandelten, fehlgeschlagenen
+        und wegen idle_timeout geschlossenen Verbindungen
+
+    parallel : int
+        Anzahl der gleichzeitigen Verbindungen von retrieveMany aus config.dicom.<server>.parallel default: 2
+
+    retrieveTimeout : float
+        Sekunden nach denen eine Abfrage von retrieveMany abgebrochen wird aus config.dicom.<server>.timeout default: 60
+
+    retries : int
+        Wiederholungen bei vorübergehenden Fehlern (0xA7xx, 0xC5xx) aus config.dicom.<server>.retries default: 2
+
+    retryBackoff : float
+        Wartezeit vor der ersten Wiederholung, verdoppelt sich bei jeder weiteren aus config.dicom.<server>.retry_backoff default: 1
+
+    retrieveWorkers : int
+        Anzahl der threads im gemeinsamen Pool von retrieveAsync() aller Instanzen
+
+    scheduleWorkers : int
+        Anzahl der threads im gemeinsamen Pool der Verbindungen von _scheduleRetrieve() aller Instanzen
+
+    datasetCache : ispDicomDatasetCache
+        prozessweiter Cache der gelesenen und empfangenen Datasets aus config.dicom.<server>.dataset_cache, None wenn abgeschaltet
+
     """
 
+    retrieveWorkers: int = 4
+
+    _retrievePool = None
+    _retrievePoolLock = threading.Lock()
+
+    scheduleWorkers: int = 16
+
+    _schedulePool = None
+
     def __init__( self, server="VMSDBD", config=None ):
         """Klasse initialisieren
 
@@ -194,6 +351,33 @@ class ispDicom(  ):
         self.subPath: str = ""
         self.messageId = 0
 
+        # eine Verbindung pro Lauf, Zugriffe darauf über _assocLock
+        self._assocLock = threading.RLock()
+        # laufende _scheduleRetrieve, closeAE und _idleCheck warten auf deren Ende
+        self._running = 0
+        self._runningDone = threading.Condition( self._assocLock )
+        self._idleTimer = None
+        self._lastUsed = 0
+        self.associationStats = {
+            "opened": 0,
+            "reused": 0,
+            "renegotiated": 0,
+            "failed": 0,
+            "idle_closed": 0
+        }
+
+        # instances dict der wartenden Abfrage nach SOPInstanceUID (str), MoveOriginatorMessageID (int)
+        # oder bei C-GET nach der Verbindung
+        self._pending = {}
+
+        # message id 1 bis 65535 auch bei gleichzeitigen Abfragen eindeutig
+        self._messageIds = itertools.count( 1 )
+
+        # nicht belegte zusätzliche Verbindungen für gleichzeitige Abfragen
+        self._extraAssocs = []
+        # von laufenden _scheduleRetrieve belegte Verbindungen
+        self._busyAssocs = 0
+
         # konfiguration verwenden oder einlesen liegt in self.config
         if config:
             self.config = config
@@ -203,6 +387,20 @@ class ispDicom(  ):
             
         self.server=server
 
+        self.idleTimeout = float( self.config.get( ["dicom", self.server, "idle_timeout"], 30 ) )
+
+        # gleichzeitige Abfragen von retrieveMany mit Wiederholung bei vorübergehenden Fehlern
+        self.parallel = max( 1, int( self.config.get( ["dicom", self.server, "parallel"], 2 ) ) )
+        self.retrieveTimeout = float( self.config.get( ["dicom", self.server, "timeout"], 60 ) )
+        self.retries = int( self.config.get( ["dicom", self.server, "retries"], 2 ) )
+        self.retryBackoff = float( self.config.get( ["dicom", self.server, "retry_backoff"], 1 ) )
+
+        # Dateien aus dem Archiv ohne die Bilddaten lesen, PixelData erst beim Zugriff
+        self.readMode = str( self.config.get( ["dicom", self.server, "read_mode"], "lazy" ) )
+        if not self.readMode in READ_MODES: # pragma: no cover
+            logger.warning( 'dicomClass.__init__: unbekannter read_mode: {}'.format( self.readMode ) )
+            self.readMode = "full"
+
         self.initialized = False
 
         # pfad zu den dicom dateien bereitstellen default: {{BASE_DIR}}/files/DICOM
@@ -225,6 +423,23 @@ class ispDicom(  ):
             msg = 'dicomClass.initAE: keine Schreibrechte auf: {}'.format( self.dicomPath )
             logger.error(  msg )
 
+        # Index des Archivs nach SOPInstanceUID, ohne Index werden die Dateien unter dicomPath/subPath gesucht
+        self.archive = None
+        if self.initialized and self.config.get( ["dicom", self.server, "archive_index"], True ):
+            try:
+                self.archive = ispDicomArchive( self.dicomPath )
+            except sqlite3.Error as e: # pragma: no cover
+                logger.error( 'dicomClass.__init__: Fehler beim öffnen des Archiv Index: {}'.format( str(e) ) )
+
+        # empfangene Datensätze im Hintergrund schreiben, write_queue 0 schreibt sofort in handle_STORE
+        self.writer = ispDicomWriter( self.archive,
+            maxsize=int( self.config.get( ["dicom", self.server, "write_queue"], 100 ) ),
+            fsyncBatch=int( self.config.get( ["dicom", self.server, "fsync_batch"], 0 ) )
+        )
+
+        # gelesene und empfangene Datasets über die Laufzeit des Prozesses nur einmal holen
+        self.datasetCache = ispDicomDatasetCache.getCache( self.server, self.config, self.dicomPath )
+
     def __del__(self):
         """Deleting Class (Calling destructor)
 
@@ -233,7 +448,7 @@ class ispDicom(  ):
 
 
     def initAE( self ):
-        """Application Entity bereitstellen
+        """Application Entity bereitstellen und Verbindung herstellen
 
         Status Codes: Non-service specific - 0xC000 to 0xC0FF
 
@@ -255,8 +470,6 @@ class ispDicom(  ):
         # sicherheitshalber bestehende schließen
         self.closeAE()
 
-        # Initialise the Application Entity
-        assoc = None
         try:
             # Initialise the Application Entity
             aet = self.config.dicom[self.server]["aet"]
@@ -291,73 +504,162 @@ class ispDicom(  ):
             for uid in storage_sop_classes:
                 self.ae.add_supported_context(uid, ALL_TRANSFER_SYNTAXES)
 
-            # bei den handlern wird nicht auf EVT_REJECTED geprüft, da offline ja möglich ist
-            handlers=[
-                ( evt.EVT_ESTABLISHED , self.handle_EVENT),
-                #( evt.EVT_REJECTED , self.handle_event),
-                ( evt.EVT_RELEASED, self.handle_EVENT),
-                # für send_c_get
-                ( evt.EVT_C_STORE, self.handle_STORE),
-            ]
-
             # requestmode für den server festlegen: c_move oder c_get
             self.request_mode = self.config.get( ["dicom", self.server, "request_mode"], "c_move" )
 
             # request_query_model für den server festlegen: P-patient S-series O-PS only
             self.request_query_model = self.config.get( ["dicom", self.server, "request_query_model"], "S" )
 
-            # Create an SCP/SCU Role Selection Negotiation item for CT Image Storage
-            roles = []
-            roles.append( build_role(CTImageStorage, scp_role=True, scu_role=True ) )
-            roles.append( build_role(XRayRadiationDoseSRStorage, scp_role=True, scu_role=True) )
-
-            # Associate with peer AE
-            assoc = self.ae.associate(
-                self.config.dicom[self.server]['server_ip'],
-                self.config.dicom[self.server]['server_port'],
-                ae_title=self.config.dicom[self.server]['aec'],
-                evt_handlers=handlers,
-                ext_neg=roles
-            )
-
         except:  # pragma: no cover
             pass
 
-        self.assoc = None
-        status = 0xC0FF
+        return self._associate()
+
+    def _associate( self ):
+        """Verbindung mit dem vorhandenen Application Entity herstellen
+
+        Wird von initAE und von openAssociation nach einem abort oder release verwendet
+
+        Returns
+        -------
+        status : hex
+            - 0x0000 - alles OK
+            - 0xC0FF -Verbindung fehlgeschlagen
+
+        """
+        self.assoc = self._newAssociation()
+
+        return 0x0000 if self.assoc else 0xC0FF
+
+    def _newAssociation( self ):
+        """Eine weitere Verbindung mit dem vorhandenen Application Entity herstellen
+
+        Returns
+        -------
+        assoc : Association
+            die aufgebaute Verbindung oder None
+
+        """
+        assoc = None
+        if self.ae:
+            try:
+                # bei den handlern wird nicht auf EVT_REJECTED geprüft, da offline ja möglich ist
+                handlers=[
+                    ( evt.EVT_ESTABLISHED , self.handle_EVENT),
+                    #( evt.EVT_REJECTED , self.handle_event),
+                    ( evt.EVT_RELEASED, self.handle_EVENT),
+                    # für send_c_get
+                    ( evt.EVT_C_STORE, self.handle_STORE),
+                ]
+
+                # Create an SCP/SCU Role Selection Negotiation item for CT Image Storage
+                roles = []
+                roles.append( build_role(CTImageStorage, scp_role=True, scu_role=True ) )
+                roles.append( build_role(XRayRadiationDoseSRStorage, scp_role=True, scu_role=True) )
+
+                # Associate with peer AE
+                assoc = self.ae.associate(
+                    self.config.dicom[self.server]['server_ip'],
+                    self.config.dicom[self.server]['server_port'],
+                    ae_title=self.config.dicom[self.server]['aec'],
+                    evt_handlers=handlers,
+                    ext_neg=roles
+                )
+            except:  # pragma: no cover
+                pass
 
         if assoc and assoc.is_established:
-            self.assoc = assoc
-            status = 0x0000
+            self.associationStats["opened"] += 1
             logger.debug('dicomClass.initAE: Verbindung hergestellt')
-        else:  # pragma: no cover
-            logger.warning('dicomClass.initAE: Association rejected, aborted or never connected')
+            return assoc
+
+        self.associationStats["failed"] += 1
+        logger.warning('dicomClass.initAE: Association rejected, aborted or never connected')
+        return None
+
+    def openAssociation( self ):
+        """Bestehende Verbindung verwenden oder herstellen
+
+        Eine aufgebaute Verbindung wird für alle Abfragen eines Laufs verwendet.
+        Nur nach einem abort oder release wird mit dem vorhandenen Application Entity
+        neu verbunden, ohne Application Entity wird initAE aufgerufen.
+
+        Returns
+        -------
+        status : hex
+            - 0x0000 - alles OK
+            - 0xC0FF -Verbindung fehlgeschlagen
+
+        """
+        with self._assocLock:
+            if self.assoc and self.assoc.is_established:
+                self.associationStats["reused"] += 1
+                status = 0x0000
+            elif self.ae:
+                logger.debug('dicomClass.openAssociation: Verbindung neu aushandeln')
+                status = self._associate()
+                if self.assoc:
+                    self.associationStats["renegotiated"] += 1
+            else:
+                status = self.initAE()
+
+            if self.assoc:
+                self._touch()
 
         return status
 
+    def _touch( self ):
+        """Zeitpunkt der letzten Verwendung merken und idle timer starten
+
+        """
+        self._lastUsed = time.monotonic()
+        if self.idleTimeout > 0 and not self._idleTimer:
+            self._startIdleTimer( self.idleTimeout )
+
+    def _startIdleTimer( self, delay:float ):
+        self._idleTimer = threading.Timer( delay, self._idleCheck )
+        self._idleTimer.daemon = True
+        self._idleTimer.start()
+
+    def _idleCheck( self ):
+        """Verbindung schließen wenn sie idleTimeout Sekunden nicht verwendet wurde
+
+        Läuft eine Abfrage noch, wird später erneut geprüft
+
+        """
+        idle = time.monotonic() - self._lastUsed
+        if idle >= self.idleTimeout and not self._running and self._assocLock.acquire( blocking=False ):
+            try:
+                if self._running: # pragma: no cover
+                    # inzwischen gestartet
+                    self._startIdleTimer( self.idleTimeout )
+                    return
+                self._idleTimer = None
+                if self.assoc or self.ae:
+                    logger.debug('dicomClass._idleCheck: idle_timeout nach {:.0f} s'.format( idle ) )
+                    self.associationStats["idle_closed"] += 1
+                    self.closeAE()
+            finally:
+                self._assocLock.release()
+        else:
+            self._startIdleTimer( max( self.idleTimeout - idle, 1 ) )
+
     def _start_server(self, evt_name:str="EVT_C_STORE"):
 
         # EVT_C_STORE oder EVT_C_FIND
 
-        # Verbindung ggf herstellen
-        if not self.assoc:
-            status = self.initAE()
-            # und testen
-            if not self.assoc: # pragma: no cover
-                logger.warning("dicomClass._start_server: Verbindung fehlgeschlagen")
-                signal( 'dicom.{}'.format( evt_name ) ).send( {
-                    "name": evt_name,
-                    '_is_cancelled': True,
-                    "status": status,
-                    "msg" : "initAE: Verbindung fehlgeschlagen",
-                    # "dataset": None,
-                } )
-                return status
+        # bestehende Verbindung verwenden oder herstellen
+        status = self.openAssociation()
+        # und testen
+        if not self.assoc: # pragma: no cover
+            logger.warning("dicomClass._start_server: Verbindung fehlgeschlagen")
+            return status
 
         # wenn noch nicht passiert server zum empfangen der daten starten
         if not self.scp:
             # message id zurpcksetzen
             self.messageId = 0
+            self._messageIds = itertools.count( 1 )
 
             # handler zum empfang der Daten bereitstellen
             handlers = [
@@ -390,7 +692,6 @@ class ispDicom(  ):
 
             # Server starten um die Daten zu empfangen storage SCP on port listen_port
             self.ae.ae_title = self.config.dicom[self.server]['aet']
-            sig_msg = None
             try:
                 logger.debug( "dicomClass._start_server: DO START" )
                 # If set to non-blocking then a running ``ThreadedAssociationServer``
@@ -402,24 +703,9 @@ class ispDicom(  ):
                 )
             except OSError as e: # pragma: no cover
                 logger.error( "dicomClass._start_server: 0xC515 - {}".format( str(e) ) )
-                sig_msg = {
-                    "name": evt_name,
-                    "_is_cancelled": True,
-                    "status": 0xC515,
-                    "msg" : "{}".format( str(e) )
-                }
+                return 0xC515
             except: # pragma: no cover
                 logger.error( "dicomClass._start_server: ERROR start listen server" )
-                sig_msg = {
-                    "name": evt_name,
-                    "_is_cancelled": True,
-                    "status": 0xC515,
-                    "msg" : "Fehler bei start listen server"
-                }
-
-            # send signal on error
-            if not sig_msg == None:
-                signal( 'dicom.{}'.format( evt_name ) ).send( sig_msg )
                 return 0xC515
 
         logger.debug( "dicomClass._start_server: STARTED" )
@@ -446,26 +732,49 @@ class ispDicom(  ):
 
         do = 0
 
-        # shutdown scp - empfangen
-        if self.scp:
-            self.scp.shutdown()
-            self.scp = None
-            done["scp"] = "shutdown()"
-            do += 1
-
-        # release assoc
-        if self.assoc:
-             self.assoc.release()
-             self.assoc = None
-             done["assoc"] = "release()"
-             do += 1
-
-        # shutdown ae
-        if self.ae:
-            self.ae.shutdown()
-            self.ae = None
-            done["ae"] = "shutdown()"
-            do += 1
+        # idle timer beenden, außer closeAE wird von ihm aufgerufen
+        if self._idleTimer:
+            if not self._idleTimer is threading.current_thread():
+                self._idleTimer.cancel()
+            self._idleTimer = None
+
+        # eine laufende Abfrage erst beenden lassen
+        with self._assocLock:
+            self._runningDone.wait_for( lambda: self._running == 0, 60 )
+
+            # shutdown scp - empfangen
+            if self.scp:
+                self.scp.shutdown()
+                self.scp = None
+                done["scp"] = "shutdown()"
+                do += 1
+
+            # noch eingereihte Datensätze schreiben
+            if getattr( self, "writer", None ):
+                self.writer.flush( 60 )
+
+            # zusätzliche Verbindungen
+            for assoc in self._extraAssocs:
+                if assoc.is_established:
+                    assoc.release()
+            if self._extraAssocs:
+                self._extraAssocs = []
+                done["assoc"] = "release()"
+                do += 1
+
+            # release assoc
+            if self.assoc:
+                 self.assoc.release()
+                 self.assoc = None
+                 done["assoc"] = "release()"
+                 do += 1
+
+            # shutdown ae
+            if self.ae:
+                self.ae.shutdown()
+                self.ae = None
+                done["ae"] = "shutdown()"
+                do += 1
 
         if do > 0:
             logger.debug('dicomClass.closeAE: {}'.format( json.dumps( done ) ) )
@@ -482,8 +791,15 @@ class ispDicom(  ):
 
         """
         obj = {
-            "dicomPath": self.dicomPath
+            "dicomPath": self.dicomPath,
+            "idle_timeout": self.idleTimeout,
+            "read_mode": self.readMode,
+            "writer": dict( self.writer.stats ),
+            "dataset_cache": self.datasetCache.getStats() if self.datasetCache else False,
+            "association_stats": dict( self.associationStats )
         }
+        if self.archive:
+            obj["archive"] = self.archive.getStats()
         if self.ae:
             obj["title"] = self.ae.ae_title
             obj["active_associations"] = len(self.ae.active_associations)
@@ -512,7 +828,7 @@ class ispDicom(  ):
 
     def handle_EVENT(self, event):
         """Event Verarbeitung
-        sendet in evt_handlers definierte events über signal weiter
+        protokolliert die in evt_handlers definierten events, die Zuordnung zu einer Abfrage erfolgt in handle_STORE
 
         Parameters
         ----------
@@ -525,12 +841,6 @@ class ispDicom(  ):
 
         """
         logger.info('dicomClass.handle_EVENT: {}'.format( event.event.name ) )
-        signal( 'dicom.{}'.format( event.event.name ) ).send( {
-            "name": event.event.name,
-            "event": event,
-            "status":0x0000,
-            "msg":""
-        } )
 
     def handle_STORE(self, event ):
         """Handle a C-STORE request event.
@@ -562,40 +872,48 @@ class ispDicom(  ):
 
         status = 0x0000
 
-        # Ort der Dicomdaten bestimmen
-        local_path = osp.join( self.dicomPath, self.subPath )
-
-        # ggf anlegen
-        if not os.path.isdir( local_path ):
-            logger.debug('dicomClass.handle_STORE: erzeuge subdir={}'.format( local_path ) )
-            os.makedirs( local_path )
+        # die wartende Abfrage, ihr subPath und override gelten für den Datensatz
+        waiting = self._pending.get( ds.SOPInstanceUID, None )
+        if waiting is None and event.request.MoveOriginatorMessageID:
+            waiting = self._pending.get( int( event.request.MoveOriginatorMessageID ), None )
+        if waiting is None:
+            waiting = self._pending.get( event.assoc, None )
+        subPath = getattr( waiting, "subPath", self.subPath )
+        override = getattr( waiting, "override", self.override )
 
         # Datei schon vorhanden, oder nicht
-        exists, filename = self.archive_hasSOPInstanceUID( ds.SOPInstanceUID )
+        exists, filename = self.archive_hasSOPInstanceUID( ds.SOPInstanceUID, subPath )
 
         logger.debug( "dicomClass.handle_STORE: {}".format( ds.SOPInstanceUID + ".dcm" ) )
         msg = ""
 
         # DICOM Daten schreiben
-        if not exists or self.override:
+        queued = False
+        # File Meta Information damit auch der noch nicht geschriebene Datensatz vollständig ist
+        if not hasattr( ds, "file_meta" ):
+            ds.file_meta = event.file_meta
+
+        if not exists or override:
             # Wie werden die Bilddaten inerpretiert
             ds.is_little_endian = True
             ds.is_implicit_VR = True
-
-            # Datei speichern
-            #   write_like_original=False um DCIM zu schreiben
-            try:
-                ds.save_as( filename , write_like_original=False )
-                msg = "Datei abgelegt: {}".format( filename )
-            except IOError as e:  # pragma: no cover
+            ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+
+            # ein vorher abgelegtes Dataset ist jetzt veraltet
+            if self.datasetCache:
+                self.datasetCache.discard( ds.SOPInstanceUID )
+
+            # Datei über writer speichern, ohne write_queue sofort
+            queued = self.writer.maxsize > 0
+            if self.writer.put( ds, filename, ds.get( "SeriesInstanceUID", None ),
+                acquisitionYear( ds ) or ( int( subPath ) if str( subPath ).isdigit() else None )
+            ):
+                msg = "Datei {}: {}".format( "eingereiht" if queued else "abgelegt", filename )
+            else:
                 # 0xC511 - Unhandled exception raised by the user’s implementation of the on_c_move callback
                 status = 0xC511
-                msg = "io_error: {}".format( str(e) )
-                logger.warning( "dicomClass.handle_STORE(io_error) [{}]: {}".format(status, filename ) )
-            except: # pragma: no cover
-                status = 0xC512
                 msg = "io_error: {}".format( filename )
-                logger.warning( "dicomClass.handle_STORE(save_error) [{}]: {}".format(status, filename )  )
+                logger.warning( "dicomClass.handle_STORE(io_error) [{}]: {}".format(status, filename ) )
 
         else: # pragma: no cover
             logger.debug( "Datei vorhanden: {}".format( filename ) )
@@ -603,13 +921,20 @@ class ispDicom(  ):
 
         logger.debug( "dicomClass.handle_STORE [{}]: {} - {}".format( status, ds.SOPInstanceUID + ".dcm", msg ) )
 
-        signal( 'dicom.EVT_C_STORE' ).send( {
-            "name": event.event.name,
-            "_is_cancelled": False,
-            "dataset":ds,
-            "status":status,
-            "msg":msg
-        } )
+        # an die wartende Abfrage weitergeben
+        if status == 0x0000:
+            if waiting is not None:
+                # geschriebene Bilddaten nicht bis zur Auswertung im Speicher halten, eingereihte sofort weitergeben
+                instance = ds
+                if self.readMode != "full" and not queued:
+                    try:
+                        instance = readDataset( filename, self.readMode )
+                    except: # pragma: no cover
+                        pass
+                waiting[ ds.SOPInstanceUID ] = instance
+                # eingereihte mit Bilddaten erst nach dem Schreiben beim nächsten Lesen aus dem Archiv ablegen
+                if self.datasetCache and ( instance is not ds or self.readMode == "full" ):
+                    self.datasetCache.putDataset( ds.SOPInstanceUID, instance )
 
         return status
 
@@ -675,37 +1000,39 @@ class ispDicom(  ):
             logger.warning("dicomClass.query: kein Dataset")
             return results, 0xC3F1
 
-        # Verbindung ggf herstellen
-        if not self.assoc:
-            status = self.initAE()
+        with self._assocLock:
+            # bestehende Verbindung verwenden oder herstellen
+            status = self.openAssociation()
             # und testen
             if not self.assoc: # pragma: no cover
                 logger.warning("dicomClass.query: Verbindung fehlgeschlagen")
                 return results, status
 
-        logger.warning("dicomClass.query: Abfrage durchführen")
-        # Abfrage durchführen
-        responses = self.assoc.send_c_find(
-            ds,
-            query_model=PatientRootQueryRetrieveInformationModelFind
-        )
-        # Rückgabe auswerten
-        for (response_status, rds) in responses:
-
-            # status code bestimmen
-            status = 0xC3F3
-            if response_status:
-                status = response_status.Status
-
-            # je nach status
-            if status in (0xFF00, 0xFF01) and rds:
-               # If the status is 'Pending' then `identifier` is the C-FIND response
-               results.append( rds )
-            elif status == 0x0000:
-                # abfrage wurde komplett durchgeführt
-                pass
-            else: # pragma: no cover
-                logger.warning('dicomClass.query: Connection timed out, was aborted or received invalid response: 0x{0:04x}'.format( status ) )
+            logger.warning("dicomClass.query: Abfrage durchführen")
+            # Abfrage durchführen
+            responses = self.assoc.send_c_find(
+                ds,
+                query_model=PatientRootQueryRetrieveInformationModelFind
+            )
+            # Rückgabe auswerten
+            for (response_status, rds) in responses:
+
+                # status code bestimmen
+                status = 0xC3F3
+                if response_status:
+                    status = response_status.Status
+
+                # je nach status
+                if status in (0xFF00, 0xFF01) and rds:
+                   # If the status is 'Pending' then `identifier` is the C-FIND response
+                   results.append( rds )
+                elif status == 0x0000:
+                    # abfrage wurde komplett durchgeführt
+                    pass
+                else: # pragma: no cover
+                    logger.warning('dicomClass.query: Connection timed out, was aborted or received invalid response: 0x{0:04x}'.format( status ) )
+
+            self._touch()
 
         return results, status
 
@@ -833,7 +1160,8 @@ class ispDicom(  ):
                  SOPInstanceUID:str=None,
                  override:bool=False,
                  subPath:str="",
-                 ds=None
+                 ds=None,
+                 request:ispDicomRequest=None
         ):
         '''DICOM Datensätze vom Server holen
 
@@ -855,18 +1183,8 @@ class ispDicom(  ):
             ergänzt den lokalen Ablageort um subPath
         ds : Dataset, optional
             Angaben des Dataset statt PatientID, StudyInstanceUID, SeriesInstanceUID oder SOPInstanceUID verwenden
-
-        evt_handlers
-        ------------
-        EVT_C_STORE
-        EVT_REJECTED
-        EVT_ACCEPTED
-        EVT_ABORTED
-
-        Signals
-        -------
-        dicom.EVT_C_STORE
-
+        request : ispDicomRequest, optional
+            nimmt die erhaltenen Datensätze und signals auf. The default is None.
 
         Returns
         -------
@@ -876,97 +1194,153 @@ class ispDicom(  ):
             - 0xC0FF - initAE: Verbindung fehlgeschlagen
             - 0xC512 -
             - 0xC515 - Address/Port already in use
+            - 0xC5F2 - timeout
+            - 0xFE00 - mit request.cancel() abgebrochen
 
 
         '''
 
-        # override Status merken
-        self.override = override
+        if request is None:
+            request = ispDicomRequest()
+
+        # subPath und override gelten über request.instances nur für diese Abfrage
+        request.instances.subPath = subPath
+        request.instances.override = override
+
+        # die Verbindung bis zum Ende der Übertragung belegen
+        with self._assocLock:
+            if not ds:
+                # Create our Identifier (query) dataset
+                ds = Dataset()
+
+                #auf welchem Level soll abgefragt werden
+                #ds.QueryRetrieveLevel = 'SERIES'
+                if PatientID:
+                    ds.QueryRetrieveLevel = 'PATIENT'
+                    # Unique key for PATIENT level
+                    ds.PatientID = PatientID
+
+                # Unique key for STUDY level
+                if StudyInstanceUID:
+                    ds.QueryRetrieveLevel = 'STUDY'
+                    ds.StudyInstanceUID = str(StudyInstanceUID)
+
+                # Unique key for SERIES
+                if SeriesInstanceUID:
+                    ds.QueryRetrieveLevel = 'SERIES'
+                    ds.SeriesInstanceUID = str(SeriesInstanceUID)
+
+                # Unique key for IMAGE
+                if SOPInstanceUID:
+                    ds.QueryRetrieveLevel = 'IMAGE'
+                    ds.SOPInstanceUID = str(SOPInstanceUID)
+
+                ds.Modality = 'RTIMAGE'
+
+            # info QueryRetrieveLevel ausgeben
+            logger.debug( "dicomClass._retrieve: QueryRetrieveLevel {}".format( ds.QueryRetrieveLevel ) )
+
+            # bei image level versuchen aus dem Dateiarchiv zu lesen statt vom Server zu holen
+            SOPInstanceUID = ds.get( "SOPInstanceUID", None )
+            if not isinstance( SOPInstanceUID, str ):
+                SOPInstanceUID = None
+            if SOPInstanceUID and not override:
+                logger.debug( "dicomClass._retrieve: search archive {}".format( SOPInstanceUID ) )
+                # file aus dem archiv laden
+                instance = self.archive_loadSOPInstanceUID( SOPInstanceUID, subPath=subPath )
+                # konnte gelesen werden dann raus hier
+                if instance:
+                    logger.debug( "dicomClass._retrieve: load archive {}".format( SOPInstanceUID ) )
+                    request.instances[ SOPInstanceUID ] = instance
+                    request.signals.append( { "name": "archive", "status": 0x0000, "msg": "load archive", "count": 1 } )
+                    return 0x0000
+                else:
+                    logger.info( "dicomClass._retrieve: no archive {}".format( SOPInstanceUID ) )
 
-        # subPath merken
-        self.subPath = subPath
+            #
+            # ansonsten wird hier versucht neu zu laden
+            #
+            if request.cancelled():
+                result = 0xFE00
+            else:
+                result = self._start_server("EVT_C_STORE")
 
-        if not ds:
-            # Create our Identifier (query) dataset
-            ds = Dataset()
+            if result == 0x0000:
+                if SOPInstanceUID:
+                    self._pending[ SOPInstanceUID ] = request.instances
+                try:
+                    result, i = self._sendRetrieve( self.assoc, ds, request.timeout, request )
+                finally:
+                    self._pending.pop( SOPInstanceUID, None )
 
-            #auf welchem Level soll abgefragt werden
-            #ds.QueryRetrieveLevel = 'SERIES'
-            if PatientID:
-                ds.QueryRetrieveLevel = 'PATIENT'
-                # Unique key for PATIENT level
-                ds.PatientID = PatientID
+                # die Datensätze liegen im Speicher vor, der writer legt sie unabhängig davon ab
+                self._touch()
 
-            # Unique key for STUDY level
-            if StudyInstanceUID:
-                ds.QueryRetrieveLevel = 'STUDY'
-                ds.StudyInstanceUID = str(StudyInstanceUID)
+                logger.debug("dicomClass._retrieve: {} DICOM Daten holen: {} - {} i={} messageId:{}".format( self.request_mode,  hex(result), SOPInstanceUID, i, self.messageId ) )
 
-            # Unique key for SERIES
-            if SeriesInstanceUID:
-                ds.QueryRetrieveLevel = 'SERIES'
-                ds.SeriesInstanceUID = str(SeriesInstanceUID)
+            request.signals.append( {
+                "name": "EVT_C_STORE",
+                "status": result,
+                "msg": "{} {}".format( self.request_mode, ds.QueryRetrieveLevel ),
+                "count": len( request.instances )
+            } )
 
-            # Unique key for IMAGE
-            if SOPInstanceUID:
-                ds.QueryRetrieveLevel = 'IMAGE'
-                ds.SOPInstanceUID = str(SOPInstanceUID)
+            return result
 
-            ds.Modality = 'RTIMAGE'
 
-        # info QueryRetrieveLevel ausgeben
-        logger.debug( "dicomClass._retrieve: QueryRetrieveLevel {}".format( ds.QueryRetrieveLevel ) )
-
-        # bei image level versuchen aus dem Dateiarchiv zu lesen statt vom Server zu holen
-        # fixme - bei Angabe von SOPInstanceUID statt QueryRetrieveLevel
-        if ( hasattr(ds, 'SOPInstanceUID')) and not ds.SOPInstanceUID == None and not override:
-        #if ds.QueryRetrieveLevel == 'IMAGE' and not override:
-            # info
-            logger.debug( "dicomClass._retrieve: search archive {}".format( ds.SOPInstanceUID ) )
-            # file aus dem archiv laden
-            instance = self.archive_loadSOPInstanceUID( ds.SOPInstanceUID )
-            # konnte gelesen werden dann raus hier
-            if instance:
-
-                logger.debug( "dicomClass._retrieve: load archive {}".format( ds.SOPInstanceUID ) )
-
-                signal( 'dicom.EVT_C_STORE').send( {
-                    "name": "EVT_C_STORE",
-                    '_is_cancelled': False,
-                    "status":0x0000,
-                    "msg" : "load archive",
-                    "dataset": instance, # Dataset mitgeben (fertig)
-                } )
-                return 0x0000
-            else:
-                logger.info( "dicomClass._retrieve: no archive {}".format( ds.SOPInstanceUID ) )
+    def _sendRetrieve( self, assoc, ds, timeout:float=None, request:ispDicomRequest=None, received:dict=None ):
+        """C-GET oder C-MOVE mit ds über assoc durchführen und die Antworten auswerten
 
-        #
-        # ansonsten wird hier versucht neu zu laden
-        #
+        Die Datensätze selbst werden über handle_STORE empfangen und über die message id
+        bzw. bei C-GET über assoc in received abgelegt
 
-        status = self._start_server("EVT_C_STORE")
+        Parameters
+        ----------
+        assoc : Association
+            eine aufgebaute Verbindung
+        ds : Dataset
+            Identifier der Abfrage
+        timeout : float, optional
+            Sekunden nach denen die Abfrage abgebrochen wird. The default is None.
+        request : ispDicomRequest, optional
+            kann die Abfrage mit cancel() abbrechen. The default is None.
+        received : dict, optional
+            SOPInstanceUID -> Dataset der empfangenen Datensätze. The default is None für request.instances.
 
-        if not status == 0x000:
-            return status
+        Returns
+        -------
+        result : Dicom Status
+            letzter Status der Antworten
 
-        # ohne try
+            - 0xC512 - keine Antwort
+            - 0xC5F2 - timeout
+            - 0xFE00 - abgebrochen
+        i : int
+            Anzahl der Antworten
 
-        '''
-            convert PSO to UID
-
-            - ``P`` - 1.2.840.10008.5.1.4.1.2.1.2 -
-              *Patient Root Information Model - MOVE*
-            - ``S`` - 1.2.840.10008.5.1.4.1.2.2.2 -
-              *Study Root Information Model - MOVE*
-            - ``O`` - 1.2.840.10008.5.1.4.1.2.3.2 -
-              *Patient Study Only Information Model - MOVE*
-        '''
+        """
+        messageId = ( next( self._messageIds ) - 1 ) % 0xFFFF + 1
+        self.messageId = messageId
+
+        if received is None and request:
+            received = request.instances
+        keys = []
+        if received is not None:
+            keys = [ messageId, assoc ] if self.request_mode == "c_get" else [ messageId ]
+            for key in keys:
+                self._pending[ key ] = received
+        try:
+            return self._sendRequest( assoc, ds, messageId, timeout, request )
+        finally:
+            for key in keys:
+                self._pending.pop( key, None )
 
-        # Retrieve Error
+    def _sendRequest( self, assoc, ds, messageId:int, timeout:float=None, request:ispDicomRequest=None ):
+        """C-GET oder C-MOVE mit messageId senden, siehe _sendRetrieve
+
+        """
         result = 0xC512
         responses =  None
-        self.messageId += 1
         if self.request_mode == "c_get":
             query_model = StudyRootQueryRetrieveInformationModelGet
             if self.request_query_model == "P":
@@ -974,11 +1348,11 @@ class ispDicom(  ):
             elif self.request_query_model == "O":
                 query_model= PatientStudyOnlyQueryRetrieveInformationModelGet
             # c_get durchführen
-            if self.assoc.is_established:
-                responses = self.assoc.send_c_get(
+            if assoc.is_established:
+                responses = assoc.send_c_get(
                     ds,
                     query_model = query_model,
-                    msg_id = self.messageId
+                    msg_id = messageId
                 )
             else:
                 logger.warn( "dicomClass._retrieve send_c_get():  assoc is not established" )
@@ -990,16 +1364,37 @@ class ispDicom(  ):
             elif self.request_query_model == "O":
                 query_model= PatientStudyOnlyQueryRetrieveInformationModelMove
             # c_move durchführen
-            if self.assoc.is_established:
-                responses = self.assoc.send_c_move(
+            if assoc.is_established:
+                responses = assoc.send_c_move(
                     ds,
                     self.config.dicom[self.server]['aet'],
                     query_model = query_model,
-                    msg_id = self.messageId
+                    msg_id = messageId
                 )
             else:
                 logger.warn( "dicomClass._retrieve send_c_move():  assoc is not established" )
-            
+        
+
+        # Abfrage nach timeout Sekunden oder mit request.cancel() über abort beenden
+        timer = None
+        timedOut = threading.Event()
+        aborted = threading.Event()
+        def _abort():
+            aborted.set()
+            assoc.abort()
+            # die auf Antworten wartende Schleife sofort beenden, nicht erst nach dimse_timeout
+            assoc.dimse.msg_queue.put( ( None, None ) )
+        if responses and timeout:
+            def _timeout():
+                timedOut.set()
+                _abort()
+            timer = threading.Timer( timeout, _timeout )
+            timer.daemon = True
+            timer.start()
+        if responses and request:
+            request._abort = _abort
+            if request.cancelled() and not aborted.is_set():
+                _abort()
 
         i = 0
         if responses:
@@ -1037,38 +1432,40 @@ class ispDicom(  ):
                         # 0xB000 -Warning - Sub-operations complete, one or more or warnings
                     else: # 0xC001
                         logger.error( "dicomClass._retrieve: {} STATUS {} beim speichern der DICOM Daten identifier={}".format( self.request_mode, hex(result), identifier ) )
-                    
+                
                 else:
                     # Association._wrap_get_move_responses 
                     logger.warning('dicomClass._retrieve - Connection timed out, was aborted or received invalid response')
         else:
             logger.warning('dicomClass._retrieve - no responses')
             pass
-        
-        logger.debug("dicomClass._retrieve: {} DICOM Daten holen: {} - {} i={} messageId:{}".format( self.request_mode,  hex(result), SOPInstanceUID, i, self.messageId ) )
-
-        # wenn nicht pending (retrieve_thread übernimmt) EVT_C_STORE mit _is_cancelled senden
-        # 0xff00 - Pending
-        # 0x0000 - Success
-        if not result in ( 0x0000, 0xff00):
-            signal( 'dicom.EVT_C_STORE').send( {
-                "name": "EVT_C_STORE",
-                "_is_cancelled": True,
-                "status": result,
-                "hex": hex(result),
-                "msg": "run EVT_C_STORE"
-            } )
 
-        return result
+        if timer:
+            timer.cancel()
+        if request:
+            request._abort = None
+        if timedOut.is_set():
+            logger.warning( "dicomClass._sendRetrieve: 0xC5F2 - timeout nach {} s".format( timeout ) )
+            result = 0xC5F2
+        elif aborted.is_set():
+            logger.info( "dicomClass._sendRetrieve: 0xFE00 - abgebrochen" )
+            result = 0xFE00
 
+        return result, i
 
-    def archive_hasSOPInstanceUID(self, SOPInstanceUID):
+    def archive_hasSOPInstanceUID(self, SOPInstanceUID, subPath:str=None ):
         """Prüft ob eine SOPInstanceUID schon im File Archiv vorhanden ist
 
+        Mit Index wird zuerst dort gesucht, dann unter dicomPath/subPath.
+        Ist die Datei nicht vorhanden, wird der Dateiname im verteilten Verzeichnis zurückgegeben.
+        Auf einen noch vom writer eingereihten Datensatz wird gewartet.
+
         Parameters
         ----------
         SOPInstanceUID : TYPE
             Eine SOPInstanceUID.
+        subPath : str, optional
+            ergänzt den lokalen Ablageort um subPath. The default is None für self.subPath.
 
         Returns
         -------
@@ -1078,17 +1475,39 @@ class ispDicom(  ):
             Der geprüfte Dateiname
         """
 
-        filename = osp.join( self.dicomPath, self.subPath, SOPInstanceUID + ".dcm" )
+        # ein noch eingereihter Datensatz ist erst nach dem Schreiben vorhanden
+        writer = getattr( self, "writer", None )
+        if writer and writer.pending( SOPInstanceUID ) is not None:
+            writer.wait( SOPInstanceUID, 60 )
+
+        if self.archive:
+            filename = self.archive.path( SOPInstanceUID )
+            if filename:
+                if os.path.isfile( filename ):
+                    return True, filename
+                # Datei wurde entfernt
+                self.archive.remove( SOPInstanceUID )
 
-        return os.path.isfile( filename ), filename
+        filename = osp.join( self.dicomPath, self.subPath if subPath is None else subPath, SOPInstanceUID + ".dcm" )
 
-    def archive_loadSOPInstanceUID( self, SOPInstanceUID ):
+        if not self.archive or os.path.isfile( filename ):
+            return os.path.isfile( filename ), filename
+
+        return False, self.archive.shardFilename( SOPInstanceUID )
+
+    def archive_loadSOPInstanceUID( self, SOPInstanceUID, mode:str=None, subPath:str=None ):
         """Lädt eine Dicomdatei mit SOPInstanceUID aus dem Archiv
 
         Parameters
         ----------
         SOPInstanceUID : str
             Eine SOPInstanceUID.
+        mode : str, optional
+            full, lazy oder header. The default is None für config.dicom.<server>.read_mode.
+            Nur mit read_mode wird datasetCache verwendet.
+            Ein noch vom writer eingereihter Datensatz wird vollständig aus dem Speicher geliefert
+        subPath : str, optional
+            ergänzt den lokalen Ablageort um subPath. The default is None für self.subPath.
 
         Returns
         -------
@@ -1098,17 +1517,32 @@ class ispDicom(  ):
         """
 
         ds = None
-        exists, filename = self.archive_hasSOPInstanceUID( SOPInstanceUID )
+        cached = self.datasetCache and ( mode is None or mode == self.readMode )
+        if cached:
+            ds = self.datasetCache.getDataset( SOPInstanceUID )
+            if ds is not None:
+                return ds
+
+        # ein noch eingereihter Datensatz ohne auf das Schreiben zu warten
+        writer = getattr( self, "writer", None )
+        if writer:
+            ds = writer.pending( SOPInstanceUID )
+            if ds is not None:
+                return ds
+
+        exists, filename = self.archive_hasSOPInstanceUID( SOPInstanceUID, subPath )
 
         if exists:
             try:
-                # mit force True einlesen um trotz fehlender headerdaten einzulesen
-                ds = dcmread(filename, force=True)
+                ds = readDataset( filename, mode or self.readMode )
             except: # pragma: no cover
                 # alle sonstigen Fehler abfangen
                 logger.error("Fehler beim lesen der DICOM Datei")
                 pass
 
+        if cached and ds is not None:
+            self.datasetCache.putDataset( SOPInstanceUID, ds )
+
         return ds
 
     def archive_deleteSOPInstanceUID(self, SOPInstanceUID):
@@ -1130,73 +1564,340 @@ class ispDicom(  ):
 
         if exists:
             os.remove( filename )
+            removePixelCache( filename )
+        if self.datasetCache:
+            self.datasetCache.discard( SOPInstanceUID )
+        if self.archive:
+            self.archive.remove( SOPInstanceUID )
 
         return filename
 
-    def retrieve( self, params={} ):
-        """Holt DICOM Daten mit threading und event Benachrichtigung.
-
-        Ruft _retrieve mit den Parametern auf
+    def retrieve( self, params={}, timeout:float=None ):
+        """Holt DICOM Daten und wartet auf das Ergebnis.
 
-        suchen nach
-            Received unexpected C-MOVE service message in pynetdicom Association _serve_request
-            aufgerufen von _run_reactor
+        Ruft retrieveAsync mit den Parametern auf
 
         Parameters
         ----------
         params : dict, optional
-            DESCRIPTION. The default is {}.
+            Parameter für _retrieve. The default is {}.
+        timeout : float, optional
+            Sekunden nach denen der C-GET/C-MOVE abgebrochen wird. The default is None für retrieveTimeout.
 
         Returns
         -------
         instances : list
             gefundene Dataset Instances.
         signals: list
+            pro Schritt name, status, msg und count
 
         """
-        instances = []
-        signals = []
+        return self.retrieveAsync( params, timeout ).result()
+
+    def retrieveAsync( self, params={}, timeout:float=None ):
+        """Startet eine Abfrage im gemeinsamen Pool und gibt sofort ihr ispDicomRequest zurück.
+
+        Das Ergebnis liefert request.result(), abbrechen mit request.cancel().
+
+        Parameters
+        ----------
+        params : dict, optional
+            Parameter für _retrieve. The default is {}.
+        timeout : float, optional
+            Sekunden nach denen der C-GET/C-MOVE abgebrochen wird. The default is None für retrieveTimeout.
+
+        Returns
+        -------
+        request : ispDicomRequest
+
+        """
+        request = ispDicomRequest( params, self.retrieveTimeout if timeout is None else timeout )
+        request.future = self._getRetrievePool().submit( self._runRetrieve, request )
+        return request
 
-        result_available = threading.Event()
-        mq = queue.Queue()
+    def _runRetrieve( self, request:ispDicomRequest ):
+        """Führt eine Abfrage von retrieveAsync im Pool aus
 
-        def _C_STORE( signal ):
-            signals.append(signal)
-            if signal["_is_cancelled"] == True:
-                # Vorgang abbrechen
-                result_available.set()
-            elif signal["_is_cancelled"] == False:
+        """
+        request.status = self._retrieve( request=request, **request.params )
+        return request.status
+
+    @classmethod
+    def _getRetrievePool( cls ):
+        """Der von allen Instanzen gemeinsam verwendete Pool für retrieveAsync
+
+        """
+        with cls._retrievePoolLock:
+            if cls._retrievePool is None:
+                cls._retrievePool = ThreadPoolExecutor( max_workers=cls.retrieveWorkers, thread_name_prefix="dicom-retrieve" )
+            return cls._retrievePool
+
+    @classmethod
+    def _getSchedulePool( cls ):
+        """Der von allen Instanzen gemeinsam verwendete Pool für die Verbindungen von _scheduleRetrieve
+
+        Nicht der Pool von retrieveAsync, dessen threads rufen selbst retrieveMany auf und würden
+        auf die eigenen Verbindungen warten
+
+        """
+        with cls._retrievePoolLock:
+            if cls._schedulePool is None:
+                cls._schedulePool = ThreadPoolExecutor( max_workers=cls.scheduleWorkers, thread_name_prefix="dicom-assoc" )
+            return cls._schedulePool
 
-                if "dataset" in signal:
-                    # Ergebnis setzen und abbrechen
-                    instances.append( signal["dataset"] )
-                    result_available.set()
+    def retrieveMany( self, images:dict, override:bool=False, subPath:str="", level:str="IMAGE", progress=None ):
+        """Holt mehrere DICOM Datensätze mit einer Abfrage pro Serie.
 
-        def _RELEASED( signal ):
-            signals.append( signal )
-            result_available.set()
+        Vorhandene Dateien werden aus dem Archiv gelesen. Die übrigen SOPInstanceUIDs
+        werden nach PatientID, StudyInstanceUID und SeriesInstanceUID gruppiert und pro Gruppe
+        mit einem C-GET/C-MOVE geholt. Bei level IMAGE mit der Liste der SOPInstanceUIDs
+        (höchstens config.dicom.<server>.retrieve_batch pro Abfrage), bei level SERIES die ganze Serie.
 
-        def _REJECTED( signal ):
-            signals.append( signal )
-            result_available.set()
+        Jeder empfangene C-STORE wird über die SOPInstanceUID der wartenden Abfrage zugeordnet.
+        Nicht erhaltene Datensätze werden einzeln mit _retrieve nachgeholt.
 
-        def _ABORTED( signal ):
-            signals.append( signal )
-            result_available.set()
+        Parameters
+        ----------
+        images : dict
+            SOPInstanceUID -> dict mit PatientID, StudyInstanceUID und SeriesInstanceUID
+        override : bool, optional
+            vorhandene Dateien neu holen. The default is False.
+        subPath : str, optional
+            ergänzt den lokalen Ablageort um subPath. The default is "".
+        level : str, optional
+            QueryRetrieveLevel der Gruppen IMAGE oder SERIES. The default is "IMAGE".
+        progress : callable, optional
+            wird nach jeder Gruppe mit der Anzahl der erhaltenen Datensätze aufgerufen. The default is None.
 
-        signal( 'dicom.EVT_C_STORE' ).connect( _C_STORE )
-        signal( 'dicom.EVT_REJECTED' ).connect( _REJECTED )
-        signal( 'dicom.EVT_RELEASED' ).connect( _RELEASED )
-        signal( 'dicom.EVT_ABORTED' ).connect( _ABORTED )
+        Returns
+        -------
+        instances : dict
+            SOPInstanceUID -> Dataset der erhaltenen Datensätze
+        signals : list
+            pro Abfrage name, status, msg und count
 
-        # Als Thread aufrufen, über mq.get() wird die Rückgabe von  _retrieve abgerufen
-        thread = threading.Thread( target=lambda q, args: q.put( self._retrieve( **args ) ), args=( mq, params ) )
-        thread.start()
+        """
+        instances = {}
+        signals = []
 
-        # nach max. 10 sec den Vorgang abbrechen
-        while not result_available.wait( timeout=10 ):
-            result_available.set()
+        # vorhandene Dateien aus dem Archiv
+        groups = {}
+        for SOPInstanceUID, image in images.items():
+            if not override:
+                instance = self.archive_loadSOPInstanceUID( SOPInstanceUID, subPath=subPath )
+                if instance:
+                    instances[ SOPInstanceUID ] = instance
+                    continue
+            key = ( image.get( "PatientID", None ), image.get( "StudyInstanceUID", None ), image.get( "SeriesInstanceUID", None ) )
+            groups.setdefault( key, [] ).append( SOPInstanceUID )
+
+        if len( instances ) > 0:
+            signals.append( { "name": "archive", "status": 0x0000, "msg": "load archive", "count": len( instances ) } )
+
+        batch = int( self.config.get( ["dicom", self.server, "retrieve_batch"], 100 ) )
+        requests = []
+        missing = []
+        for ( PatientID, StudyInstanceUID, SeriesInstanceUID ), uids in groups.items():
+            if not SeriesInstanceUID:
+                missing.extend( uids )
+                continue
+
+            chunks = [ uids ] if level == "SERIES" else [ uids[ i:i + batch ] for i in range( 0, len( uids ), batch ) ]
+            for chunk in chunks:
+                ds = Dataset()
+                ds.QueryRetrieveLevel = level
+                if PatientID:
+                    ds.PatientID = PatientID
+                if StudyInstanceUID:
+                    ds.StudyInstanceUID = str( StudyInstanceUID )
+                ds.SeriesInstanceUID = str( SeriesInstanceUID )
+                if level == "IMAGE":
+                    ds.SOPInstanceUID = [ str( uid ) for uid in chunk ]
+                requests.append( ( ds, chunk, "{} {}".format( level, SeriesInstanceUID ) ) )
+
+        def deliver( request, status, received ):
+            ds, uids, msg = request
+            instances.update( received )
+            signals.append( { "name": "EVT_C_STORE", "status": status, "msg": msg, "count": len( received ) } )
+            missing.extend( uid for uid in uids if not uid in received )
+            if progress:
+                progress( len( instances ) )
+
+        self._scheduleRetrieve( requests, deliver, override=override, subPath=subPath )
+
+        # nicht erhaltene einzeln holen
+        requests = []
+        for SOPInstanceUID in missing:
+            ds = Dataset()
+            ds.QueryRetrieveLevel = 'IMAGE'
+            if images[ SOPInstanceUID ].get( "PatientID", None ):
+                ds.PatientID = images[ SOPInstanceUID ]["PatientID"]
+            ds.SOPInstanceUID = str( SOPInstanceUID )
+            ds.Modality = 'RTIMAGE'
+            requests.append( ( ds, [ SOPInstanceUID ], "IMAGE {}".format( SOPInstanceUID ) ) )
+        missing = []
+        self._scheduleRetrieve( requests, deliver, override=override, subPath=subPath )
 
+        # in der Reihenfolge von images zurückgeben
+        instances = { uid: instances[ uid ] for uid in images if uid in instances }
 
         return instances, signals
 
+    def _isTransient( self, status ):
+        """Vorübergehender Fehler der wiederholt werden kann
+
+        - 0xA7xx - Out of resources
+        - 0xC5xx - C-MOVE related, auch 0xC5F2 timeout
+
+        """
+        return ( status & 0xFF00 ) in ( 0xA700, 0xC500 )
+
+    def _runRequest( self, assoc, request, received:dict ):
+        """Eine Abfrage von _scheduleRetrieve mit Wiederholung durchführen
+
+        Bei vorübergehenden Fehlern oder einer verlorenen Verbindung wird nach retryBackoff Sekunden
+        (verdoppelt bei jeder weiteren Wiederholung) erneut abgefragt, bei level IMAGE nur die noch fehlenden.
+
+        Parameters
+        ----------
+        assoc : Association
+            die zu verwendende Verbindung
+        request : tuple
+            ds, SOPInstanceUIDs, msg
+        received : dict
+            SOPInstanceUID -> Dataset der empfangenen Datensätze
+
+        Returns
+        -------
+        status : Dicom Status
+        assoc : Association
+            die zuletzt verwendete Verbindung oder None
+
+        """
+        ds, uids, msg = request
+        status = 0xC0FF
+        for attempt in range( self.retries + 1 ):
+            if attempt > 0:
+                time.sleep( self.retryBackoff * 2 ** ( attempt - 1 ) )
+                logger.info( "dicomClass._runRequest: Wiederholung {} von {} nach 0x{:04x}".format( attempt, msg, status ) )
+
+            if not assoc or not assoc.is_established:
+                assoc = self._newAssociation()
+                if assoc:
+                    self.associationStats["renegotiated"] += 1
+            if not assoc:
+                status = 0xC0FF
+                continue
+
+            status, i = self._sendRetrieve( assoc, ds, self.retrieveTimeout, received=received )
+
+            missing = [ uid for uid in uids if not uid in received ]
+            if not missing or not ( self._isTransient( status ) or not assoc.is_established ):
+                break
+
+            if ds.QueryRetrieveLevel == "IMAGE":
+                ds.SOPInstanceUID = missing if len( missing ) > 1 else missing[0]
+
+        return status, assoc
+
+    def _scheduleRetrieve( self, requests:list, deliver, override:bool=False, subPath:str="" ):
+        """Abfragen mit bis zu parallel gleichzeitigen Verbindungen durchführen
+
+        Die Ergebnisse werden in der Reihenfolge von requests an deliver übergeben.
+        Jeder empfangene C-STORE wird über _pending der Abfrage mit seiner SOPInstanceUID zugeordnet,
+        dort liegen auch subPath und override der Abfrage.
+
+        _assocLock wird nur beim Belegen und Zurückgeben der Verbindungen gehalten, die Abfragen mit
+        Wiederholungen und timeout laufen ohne lock im gemeinsamen Pool von _getSchedulePool.
+
+        Parameters
+        ----------
+        requests : list
+            mit ds, SOPInstanceUIDs, msg pro Abfrage
+        deliver : callable
+            wird pro Abfrage mit request, status und dict der empfangenen Datensätze aufgerufen
+        override : bool, optional
+            vorhandene Dateien überschreiben. The default is False.
+        subPath : str, optional
+            ergänzt den lokalen Ablageort um subPath. The default is "".
+
+        Returns
+        -------
+        None.
+
+        """
+        if len( requests ) == 0:
+            return
+
+        # nur zum Belegen der Verbindungen
+        with self._assocLock:
+            status = self._start_server("EVT_C_STORE")
+            if status == 0x0000:
+                # zusätzliche Verbindungen, sie bleiben nach den Abfragen für weitere geöffnet
+                workers = min( self.parallel, len( requests ) )
+                idle = [ assoc for assoc in self._extraAssocs if assoc.is_established ]
+                assocs = idle[ :workers ]
+                self._extraAssocs = idle[ workers: ]
+                while len( assocs ) < workers:
+                    assoc = self._newAssociation()
+                    if not assoc:
+                        break
+                    assocs.append( assoc )
+                if len( assocs ) == 0:
+                    # _runRequest versucht dann selbst eine Verbindung aufzubauen
+                    assocs = [ None ]
+                self._running += 1
+                self._busyAssocs += len( assocs )
+                self.ae.maximum_associations = max( self.ae.maximum_associations,
+                    2 * ( self._busyAssocs + len( self._extraAssocs ) ) + 1
+                )
+
+        if not status == 0x0000:
+            for request in requests:
+                deliver( request, status, {} )
+            return
+
+        # die Abfragen in der Reihenfolge von requests auf die Verbindungen verteilen
+        todo = queue.Queue()
+        futures = []
+        for request in requests:
+            future = Future()
+            todo.put( ( request, future ) )
+            futures.append( future )
+
+        def worker( slot ):
+            while True:
+                try:
+                    request, future = todo.get_nowait()
+                except queue.Empty:
+                    return
+                received = ispDicomReceived( subPath, override )
+                self._pending.update( dict.fromkeys( request[1], received ) )
+                try:
+                    status, assocs[ slot ] = self._runRequest( assocs[ slot ], request, received )
+                    future.set_result( ( status, received ) )
+                except Exception as e:
+                    future.set_exception( e )
+                finally:
+                    for uid in request[1]:
+                        self._pending.pop( uid, None )
+
+        jobs = []
+        try:
+            if len( assocs ) == 1:
+                worker( 0 )
+            else:
+                pool = self._getSchedulePool()
+                jobs = [ pool.submit( worker, slot ) for slot in range( len( assocs ) ) ]
+            # in der Reihenfolge der Abfragen übergeben
+            for request, future in zip( requests, futures ):
+                deliver( request, *future.result() )
+        finally:
+            # die Verbindungen erst nach dem Ende aller Abfragen zurückgeben
+            wait( jobs )
+            with self._assocLock:
+                self._busyAssocs -= len( assocs )
+                self._extraAssocs.extend( assoc for assoc in assocs if assoc and assoc.is_established )
+                self._running -= 1
+                self._runningDone.notify_all()
+                self._touch()
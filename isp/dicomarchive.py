@@ -0,0 +1,1053 @@
+# -*- coding: utf-8 -*-
+
+"""Index des lokalen DICOM Archivs
+
+Die Dateien liegen verteilt in dicomPath/<aa>/<bb>/<SOPInstanceUID>.dcm, aa und bb sind
+die ersten Stellen des sha1 der SOPInstanceUID. Eine Aufnahme wird so nur einmal abgelegt,
+unabhängig vom Jahr unter dem sie geholt wird.
+
+Der Index archive.sqlite in dicomPath enthält pro SOPInstanceUID:
+
+- path: Dateiname relativ zu dicomPath
+- size: Dateigröße
+- SeriesInstanceUID
+- AcquisitionYear
+- checksum: sha1 des Dateiinhalts
+- added: Zeitpunkt der Aufnahme in den Index
+
+Vorhandene Archive mit den Unterverzeichnissen pro Jahr werden mit migrate() übernommen::
+
+    python pygqa.py archive [-s <dicomserver>] [--copy]
+
+Dateien werden mit readDataset() in einem der READ_MODES gelesen:
+
+- full: die ganze Datei mit den Bilddaten
+- lazy: PixelData wird erst beim Zugriff aus der Datei gelesen
+- header: ohne PixelData, loadPixelData() holt sie bei Bedarf nach
+
+Neben einer Datei <SOPInstanceUID>.dcm kann savePixelCache() die aufbereiteten Bilddaten
+als <SOPInstanceUID>.pixel.npy mit den Angaben in <SOPInstanceUID>.pixel.json ablegen.
+loadPixelCache() öffnet sie mit np.load( mmap_mode="r" ), solange die DICOM Datei unverändert ist.
+
+Empfangene Datensätze schreibt ispDicomWriter in einem eigenen thread, zuerst in eine temporäre Datei
+die dann umbenannt wird.
+
+Gelesene und empfangene Datasets sowie die aufbereiteten Bilddaten hält ispDicomDatasetCache
+prozessweit nach SOPInstanceUID.
+
+CHANGELOG
+=========
+
+0.1.4 / 2026-10-18
+------------------
+- add ispDicomDatasetCache - prozessweiter LRU Cache für Datasets und Bilddaten, copyDataset(), datasetSize()
+
+0.1.3 / 2026-10-18
+------------------
+- add ispDicomWriter - write-behind queue with atomic writes and fsync batching
+
+0.1.2 / 2026-10-18
+------------------
+- add savePixelCache(), loadPixelCache(), removePixelCache() - Bilddaten als .npy neben der DICOM Datei
+
+0.1.1 / 2026-10-18
+------------------
+- add readDataset(), loadPixelData(), releasePixelData() - Lesen ohne Bilddaten
+
+0.1.0 / 2026-10-18
+------------------
+- First Release
+
+"""
+
+__author__ = "R. Bauer"
+__copyright__ = "MedPhyDO - Machbarkeitsstudien des Instituts für Medizinische Strahlenphysik und Strahlenschutz am Klinikum Dortmund im Rahmen von Bachelor und Masterarbeiten an der TU-Dortmund / FH-Dortmund"
+__credits__ = ["R.Bauer", "K.Loot"]
+__license__ = "MIT"
+__version__ = "0.1.4"
+__status__ = "Prototype"
+
+import copy
+import hashlib
+import json
+import os
+import os.path as osp
+import queue
+import shutil
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from pydicom import dcmread
+
+import logging
+logger = logging.getLogger( "ISP" )
+
+def fileChecksum( filename:str ):
+    """sha1 des Dateiinhalts
+
+    Parameters
+    ----------
+    filename : str
+        Dateiname
+
+    Returns
+    -------
+    str
+        hexdigest
+
+    """
+    sha1 = hashlib.sha1()
+    with open( filename, "rb" ) as f:
+        for block in iter( lambda: f.read( 1024 * 1024 ), b"" ):
+            sha1.update( block )
+    return sha1.hexdigest()
+
+def acquisitionYear( ds ):
+    """Jahr aus AcquisitionDate, ContentDate oder StudyDate eines Dataset
+
+    Returns
+    -------
+    int or None
+
+    """
+    for name in [ "AcquisitionDate", "ContentDate", "StudyDate" ]:
+        value = str( ds.get( name, "" ) or "" )
+        if len( value ) >= 4 and value[0:4].isdigit():
+            return int( value[0:4] )
+    return None
+
+READ_MODES = [ "full", "lazy", "header" ]
+
+# Elemente ab dieser Größe werden bei read_mode lazy erst beim Zugriff gelesen
+DEFER_SIZE = "64 KB"
+
+PIXEL_DATA = 0x7FE00010
+
+def readDataset( filename:str, mode:str="full" ):
+    """Liest eine DICOM Datei
+
+    Parameters
+    ----------
+    filename : str
+        Dateiname
+    mode : str, optional
+        full, lazy oder header. The default is "full".
+
+    Returns
+    -------
+    ds : pydicom.FileDataset
+
+    """
+    # mit force True einlesen um trotz fehlender headerdaten einzulesen
+    if mode == "header":
+        return dcmread( filename, force=True, stop_before_pixels=True )
+    elif mode == "lazy":
+        return dcmread( filename, force=True, defer_size=DEFER_SIZE )
+    return dcmread( filename, force=True )
+
+def pixelDataDeferred( ds ):
+    """True wenn PixelData eines Dataset noch nicht aus der Datei gelesen wurde
+
+    """
+    elem = ds._dict.get( PIXEL_DATA, None )
+    return elem is not None and elem.__class__.__name__ == "RawDataElement" and elem.value is None
+
+def loadPixelData( ds ):
+    """PixelData eines mit read_mode header gelesenen Dataset nachladen
+
+    Das Element wird dabei nur verzögert übernommen, gelesen wird es erst beim Zugriff.
+
+    Parameters
+    ----------
+    ds : pydicom.Dataset
+
+    Returns
+    -------
+    bool
+        True wenn PixelData vorhanden ist
+
+    """
+    if PIXEL_DATA in ds:
+        return True
+    filename = getattr( ds, "filename", None )
+    if not isinstance( filename, str ) or not osp.isfile( filename ):
+        return False
+    lazy = readDataset( filename, "lazy" )
+    if not PIXEL_DATA in lazy:
+        return False
+    ds._dict[ PIXEL_DATA ] = lazy._dict[ PIXEL_DATA ]
+    ds.timestamp = lazy.timestamp
+    ds.fileobj_type = lazy.fileobj_type
+    return True
+
+def releasePixelData( ds, raw ):
+    """Gelesene PixelData eines Dataset wieder freigeben
+
+    Das verzögerte Element raw wird wieder eingesetzt, ein weiterer Zugriff liest erneut aus der Datei.
+
+    Parameters
+    ----------
+    ds : pydicom.Dataset
+    raw : pydicom.dataelem.RawDataElement
+        das vor dem Zugriff mit pixelDataDeferred() geprüfte Element
+
+    """
+    ds._dict[ PIXEL_DATA ] = raw
+    ds._pixel_array = None
+    ds._pixel_id = {}
+
+def pixelCacheFilename( filename:str ):
+    """Dateiname der .npy Datei zu einer DICOM Datei
+
+    """
+    return osp.splitext( filename )[0] + ".pixel.npy"
+
+def _sourceKey( filename:str ):
+    """Größe und Änderungszeit der DICOM Datei um veraltete Bilddaten zu erkennen
+
+    """
+    stat = os.stat( filename )
+    return { "size": stat.st_size, "mtime": stat.st_mtime_ns }
+
+def savePixelCache( filename:str, array, meta:dict={} ):
+    """Bilddaten zu einer DICOM Datei als .npy ablegen
+
+    Parameters
+    ----------
+    filename : str
+        Die DICOM Datei
+    array : np.array
+        Aufbereitete Bilddaten
+    meta : dict, optional
+        zusätzliche Angaben z.B. dtype und geometry. The default is {}.
+
+    Returns
+    -------
+    npyname : str or None
+        Der Dateiname oder None wenn nicht abgelegt werden konnte
+
+    """
+    npyname = pixelCacheFilename( filename )
+    jsonname = npyname[:-4] + ".json"
+    try:
+        info = dict( meta, source=_sourceKey( filename ) )
+        # erst vollständig schreiben dann umbenennen, damit gleichzeitige Leser keine halben Dateien sehen
+        tmpname = "{}.{}.tmp".format( npyname, threading.get_ident() )
+        with open( tmpname, "wb" ) as f:
+            np.save( f, np.ascontiguousarray( array ) )
+        os.replace( tmpname, npyname )
+        tmpname = "{}.{}.tmp".format( jsonname, threading.get_ident() )
+        with open( tmpname, "w" ) as f:
+            json.dump( info, f )
+        os.replace( tmpname, jsonname )
+    except ( OSError, TypeError, ValueError ) as e:
+        logger.warning( "savePixelCache: {} - {}".format( npyname, str(e) ) )
+        return None
+    return npyname
+
+def loadPixelCache( filename:str ):
+    """Abgelegte Bilddaten zu einer DICOM Datei ohne Kopie öffnen
+
+    Parameters
+    ----------
+    filename : str
+        Die DICOM Datei
+
+    Returns
+    -------
+    array : np.memmap or None
+        nur lesbar, None wenn nicht vorhanden oder die DICOM Datei geändert wurde
+    meta : dict or None
+        die mit savePixelCache() abgelegten Angaben
+
+    """
+    npyname = pixelCacheFilename( filename )
+    try:
+        with open( npyname[:-4] + ".json" ) as f:
+            meta = json.load( f )
+        if meta.get( "source", None ) != _sourceKey( filename ):
+            return None, None
+        return np.load( npyname, mmap_mode="r" ), meta
+    except ( OSError, ValueError ):
+        return None, None
+
+def removePixelCache( filename:str ):
+    """Abgelegte Bilddaten zu einer DICOM Datei entfernen
+
+    """
+    npyname = pixelCacheFilename( filename )
+    for name in [ npyname, npyname[:-4] + ".json" ]:
+        if osp.isfile( name ):
+            os.remove( name )
+
+class ispDicomArchive( ):
+    '''Index der DICOM Dateien nach SOPInstanceUID
+
+    Attributes
+    ----------
+
+    dicomPath : str
+        Basisverzeichnis des Archivs
+
+    filename : str
+        SQLite Datei des Index
+
+    '''
+
+    _locks = {}
+    _locksLock = threading.Lock()
+
+    columns = [ "SOPInstanceUID", "path", "size", "SeriesInstanceUID", "AcquisitionYear", "checksum", "added" ]
+
+    def __init__( self, dicomPath:str, filename:str=None ):
+        """Index öffnen und ggf anlegen
+
+        Parameters
+        ----------
+        dicomPath : str
+            Basisverzeichnis des Archivs
+        filename : str, optional
+            SQLite Datei des Index. The default is dicomPath/archive.sqlite.
+
+        """
+        self.dicomPath = osp.abspath( dicomPath )
+        self.filename = filename or osp.join( self.dicomPath, "archive.sqlite" )
+
+        # eine Verbindung für alle threads, Zugriffe über einen lock pro Datei
+        with self._locksLock:
+            if not self.filename in self._locks:
+                self._locks[ self.filename ] = threading.Lock()
+            self._lock = self._locks[ self.filename ]
+
+        os.makedirs( osp.dirname( self.filename ), exist_ok=True )
+        with self._lock:
+            self._db = sqlite3.connect( self.filename, timeout=30, check_same_thread=False )
+            self._db.execute( "PRAGMA journal_mode=WAL" )
+            self._db.execute( "PRAGMA synchronous=NORMAL" )
+            self._db.execute( """CREATE TABLE IF NOT EXISTS [archive] (
+                [SOPInstanceUID] TEXT PRIMARY KEY, [path] TEXT, [size] INTEGER, [SeriesInstanceUID] TEXT,
+                [AcquisitionYear] INTEGER, [checksum] TEXT, [added] REAL
+            )""" )
+            self._db.execute( "CREATE INDEX IF NOT EXISTS [archive_series] ON [archive] ([SeriesInstanceUID])" )
+            self._db.commit()
+
+    def close( self ):
+        """Verbindung zum Index schließen
+        """
+        with self._lock:
+            if self._db:
+                self._db.close()
+                self._db = None
+
+    def shardPath( self, SOPInstanceUID:str ):
+        """Dateiname relativ zu dicomPath im verteilten Verzeichnis
+
+        Parameters
+        ----------
+        SOPInstanceUID : str
+
+        Returns
+        -------
+        str
+            <aa>/<bb>/<SOPInstanceUID>.dcm
+
+        """
+        digest = hashlib.sha1( str( SOPInstanceUID ).encode( "ascii" ) ).hexdigest()
+        return osp.join( digest[0:2], digest[2:4], "{}.dcm".format( SOPInstanceUID ) )
+
+    def shardFilename( self, SOPInstanceUID:str ):
+        """Dateiname für eine neue Aufnahme im verteilten Verzeichnis
+        """
+        return osp.join( self.dicomPath, self.shardPath( SOPInstanceUID ) )
+
+    def get( self, SOPInstanceUID:str ):
+        """Eintrag einer SOPInstanceUID
+
+        Returns
+        -------
+        dict or None
+            mit den Feldern aus columns
+
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT {} FROM [archive] WHERE [SOPInstanceUID] = ?".format( ", ".join( self.columns ) ),
+                ( str( SOPInstanceUID ), )
+            ).fetchone()
+        if row is None:
+            return None
+        return dict( zip( self.columns, row ) )
+
+    def path( self, SOPInstanceUID:str ):
+        """Absoluter Dateiname einer SOPInstanceUID aus dem Index ohne Prüfung der Datei
+
+        Returns
+        -------
+        str or None
+
+        """
+        with self._lock:
+            row = self._db.execute( "SELECT [path] FROM [archive] WHERE [SOPInstanceUID] = ?", ( str( SOPInstanceUID ), ) ).fetchone()
+        if row is None:
+            return None
+        return osp.join( self.dicomPath, row[0] )
+
+    def cached( self, SOPInstanceUIDs ):
+        """Die im Index vorhandenen SOPInstanceUIDs
+
+        Parameters
+        ----------
+        SOPInstanceUIDs : list
+            zu prüfende SOPInstanceUIDs
+
+        Returns
+        -------
+        set
+
+        """
+        uids = [ str( uid ) for uid in SOPInstanceUIDs ]
+        found = set()
+        # sqlite erlaubt höchstens 999 Parameter
+        with self._lock:
+            for i in range( 0, len( uids ), 900 ):
+                chunk = uids[ i:i + 900 ]
+                rows = self._db.execute(
+                    "SELECT [SOPInstanceUID] FROM [archive] WHERE [SOPInstanceUID] IN ({})".format( ", ".join( [ "?" ] * len( chunk ) ) ),
+                    chunk
+                ).fetchall()
+                found.update( row[0] for row in rows )
+        return found
+
+    def add( self, SOPInstanceUID:str, filename:str, SeriesInstanceUID:str=None, AcquisitionYear:int=None ):
+        """Eine abgelegte Datei in den Index aufnehmen, ein vorhandener Eintrag wird ersetzt
+
+        Parameters
+        ----------
+        SOPInstanceUID : str
+        filename : str
+            Dateiname innerhalb von dicomPath
+        SeriesInstanceUID : str, optional
+            The default is None.
+        AcquisitionYear : int, optional
+            The default is None.
+
+        Returns
+        -------
+        dict
+            der Eintrag
+
+        """
+        entry = {
+            "SOPInstanceUID": str( SOPInstanceUID ),
+            "path": osp.relpath( osp.abspath( filename ), self.dicomPath ),
+            "size": os.path.getsize( filename ),
+            "SeriesInstanceUID": str( SeriesInstanceUID ) if SeriesInstanceUID else None,
+            "AcquisitionYear": int( AcquisitionYear ) if AcquisitionYear else None,
+            "checksum": fileChecksum( filename ),
+            "added": time.time()
+        }
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO [archive] ({}) VALUES ({})".format( ", ".join( self.columns ), ", ".join( [ "?" ] * len( self.columns ) ) ),
+                [ entry[ column ] for column in self.columns ]
+            )
+            self._db.commit()
+        return entry
+
+    def remove( self, SOPInstanceUID:str ):
+        """Eintrag einer SOPInstanceUID entfernen, die Datei bleibt erhalten
+        """
+        with self._lock:
+            self._db.execute( "DELETE FROM [archive] WHERE [SOPInstanceUID] = ?", ( str( SOPInstanceUID ), ) )
+            self._db.commit()
+
+    def verify( self, SOPInstanceUID:str ):
+        """Datei einer SOPInstanceUID mit Größe und checksum des Index vergleichen
+
+        Returns
+        -------
+        bool
+            False wenn der Eintrag oder die Datei fehlt oder verändert wurde
+
+        """
+        entry = self.get( SOPInstanceUID )
+        if not entry:
+            return False
+        filename = osp.join( self.dicomPath, entry["path"] )
+        if not osp.isfile( filename ) or not os.path.getsize( filename ) == entry["size"]:
+            return False
+        return fileChecksum( filename ) == entry["checksum"]
+
+    def getStats( self ):
+        """Anzahl und Größe der Dateien im Index
+
+        Returns
+        -------
+        dict
+            files, size und years mit der Anzahl pro AcquisitionYear
+
+        """
+        with self._lock:
+            files, size = self._db.execute( "SELECT COUNT(*), COALESCE(SUM([size]), 0) FROM [archive]" ).fetchone()
+            years = self._db.execute( "SELECT [AcquisitionYear], COUNT(*) FROM [archive] GROUP BY [AcquisitionYear]" ).fetchall()
+        return {
+            "files": files,
+            "size": size,
+            "years": { year: count for year, count in years }
+        }
+
+    def migrate( self, copy:bool=False, progress=None ):
+        """Vorhandene Dateien unter dicomPath in das verteilte Verzeichnis übernehmen
+
+        Dateien die nicht im verteilten Verzeichnis liegen werden verschoben (oder kopiert)
+        und in den Index aufgenommen. Das AcquisitionYear wird aus dem Dataset bestimmt,
+        ohne Angabe aus einem Verzeichnisnamen mit vier Ziffern.
+        Mehrfach abgelegte Aufnahmen werden nur einmal übernommen.
+
+        Parameters
+        ----------
+        copy : bool, optional
+            Dateien kopieren statt verschieben. The default is False.
+        progress : callable, optional
+            wird pro Datei mit dem Dateinamen aufgerufen. The default is None.
+
+        Returns
+        -------
+        dict
+            Anzahl der Dateien mit moved, duplicate, indexed und failed
+
+        """
+        result = { "moved": 0, "duplicate": 0, "indexed": 0, "failed": 0 }
+
+        for root, dirs, files in os.walk( self.dicomPath ):
+            # ältere Jahre zuerst
+            dirs.sort()
+            for name in sorted( files ):
+                if not name.endswith( ".dcm" ):
+                    continue
+                filename = osp.join( root, name )
+                SOPInstanceUID = name[:-4]
+                target = self.shardFilename( SOPInstanceUID )
+                if progress:
+                    progress( filename )
+
+                try:
+                    if filename == target:
+                        # schon im verteilten Verzeichnis nur fehlende Einträge ergänzen
+                        if not self.path( SOPInstanceUID ):
+                            self.add( SOPInstanceUID, target, *self._datasetInfo( target ) )
+                            result["indexed"] += 1
+                        continue
+
+                    if osp.isfile( target ):
+                        result["duplicate"] += 1
+                        if not copy:
+                            os.remove( filename )
+                            removePixelCache( filename )
+                        continue
+
+                    SeriesInstanceUID, AcquisitionYear = self._datasetInfo( filename )
+                    if not AcquisitionYear:
+                        folder = osp.basename( root )
+                        if len( folder ) == 4 and folder.isdigit():
+                            AcquisitionYear = int( folder )
+
+                    os.makedirs( osp.dirname( target ), exist_ok=True )
+                    if copy:
+                        shutil.copy2( filename, target )
+                    else:
+                        shutil.move( filename, target )
+                        removePixelCache( filename )
+                    self.add( SOPInstanceUID, target, SeriesInstanceUID, AcquisitionYear )
+                    result["moved"] += 1
+                except ( OSError, IOError ) as e: # pragma: no cover
+                    logger.error( "ispDicomArchive.migrate: {} - {}".format( filename, str( e ) ) )
+                    result["failed"] += 1
+
+        return result
+
+    def _datasetInfo( self, filename:str ):
+        """SeriesInstanceUID und AcquisitionYear aus dem header der Datei
+        """
+        try:
+            ds = readDataset( filename, "header" )
+        except: # pragma: no cover
+            return None, None
+        return ds.get( "SeriesInstanceUID", None ), acquisitionYear( ds )
+
+
+class ispDicomWriter( ):
+    '''Schreibt Datensätze in einem eigenen thread
+
+    Jede Datei wird zuerst als <filename>.<thread>.tmp geschrieben und dann umbenannt,
+    ein Leser sieht so nie eine halb geschriebene Datei. Mit fsyncBatch > 0 werden bis zu fsyncBatch
+    Dateien gemeinsam mit fsync auf die Platte gebracht bevor sie umbenannt werden.
+    Der thread wird beim ersten put() gestartet und beendet sich nach idleTimeout Sekunden ohne Daten.
+
+    Attributes
+    ----------
+
+    archive : ispDicomArchive
+        nimmt die geschriebenen Dateien in den Index auf, None ohne Index
+
+    maxsize : int
+        Anzahl der Datensätze in der Warteschlange, put() wartet bei voller Warteschlange.
+        0 schreibt sofort im aufrufenden thread
+
+    fsyncBatch : int
+        Anzahl der Dateien pro fsync, 0 ohne fsync
+
+    stats : dict
+        Anzahl queued, written, failed und batches
+
+    '''
+
+    idleTimeout: float = 5
+
+    def __init__( self, archive:ispDicomArchive=None, maxsize:int=100, fsyncBatch:int=0 ):
+        self.archive = archive
+        self.maxsize = int( maxsize )
+        self.fsyncBatch = int( fsyncBatch )
+        self.stats = { "queued": 0, "written": 0, "failed": 0, "batches": 0 }
+
+        self._queue = queue.Queue( maxsize=max( self.maxsize, 0 ) )
+        self._thread = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition( self._lock )
+        # eingereihte aber noch nicht geschriebene Datensätze
+        self._open = 0
+        # und diese nach SOPInstanceUID für pending() und cached()
+        self._pendingItems = {}
+
+    def put( self, ds, filename:str, SeriesInstanceUID:str=None, AcquisitionYear:int=None ):
+        """Einen Datensatz zum schreiben einreihen
+
+        Parameters
+        ----------
+        ds : pydicom.Dataset
+        filename : str
+            Ziel Dateiname
+        SeriesInstanceUID : str, optional
+            für den Index. The default is None.
+        AcquisitionYear : int, optional
+            für den Index. The default is None.
+
+        Returns
+        -------
+        bool
+            False wenn bei maxsize 0 nicht geschrieben werden konnte
+
+        """
+        item = ( ds, filename, SeriesInstanceUID, AcquisitionYear )
+        if self.maxsize <= 0:
+            return self._writeBatch( [ item ] ) == 1
+
+        with self._lock:
+            self._open += 1
+            self._pendingItems[ str( ds.SOPInstanceUID ) ] = item
+            self.stats["queued"] += 1
+            if self._thread is None:
+                self._thread = threading.Thread( target=self._run, name="dicom-writer", daemon=True )
+                self._thread.start()
+        self._queue.put( item )
+        return True
+
+    def flush( self, timeout:float=None ):
+        """Warten bis alle eingereihten Datensätze geschrieben sind
+
+        Returns
+        -------
+        bool
+            False wenn nach timeout Sekunden noch nicht alle geschrieben sind
+
+        """
+        with self._idle:
+            return self._idle.wait_for( lambda: self._open == 0, timeout )
+
+    def pending( self, SOPInstanceUID:str ):
+        """Der eingereihte aber noch nicht geschriebene Datensatz
+
+        Returns
+        -------
+        pydicom.Dataset
+            oder None wenn nichts eingereiht ist
+
+        """
+        with self._lock:
+            item = self._pendingItems.get( str( SOPInstanceUID ) )
+        return item[0] if item else None
+
+    def wait( self, SOPInstanceUID:str, timeout:float=None ):
+        """Warten bis der Datensatz mit SOPInstanceUID geschrieben ist, anders als flush() nicht auf alle
+
+        Returns
+        -------
+        bool
+            False wenn er nach timeout Sekunden noch nicht geschrieben ist
+
+        """
+        SOPInstanceUID = str( SOPInstanceUID )
+        with self._idle:
+            return self._idle.wait_for( lambda: not SOPInstanceUID in self._pendingItems, timeout )
+
+    def cached( self, SOPInstanceUIDs ):
+        """archive.cached() ergänzt um die eingereihten Datensätze
+
+        Parameters
+        ----------
+        SOPInstanceUIDs : list
+
+        Returns
+        -------
+        set
+            die im Index vorhandenen oder eingereihten SOPInstanceUIDs
+
+        """
+        SOPInstanceUIDs = [ str( uid ) for uid in SOPInstanceUIDs ]
+        # zuerst die eingereihten, ein inzwischen geschriebener ist dann schon im Index
+        with self._lock:
+            pending = set( uid for uid in SOPInstanceUIDs if uid in self._pendingItems )
+        if self.archive:
+            return pending | self.archive.cached( SOPInstanceUIDs )
+        return pending
+
+    def _run( self ):
+        """Schreibt die eingereihten Datensätze in Gruppen von bis zu fsyncBatch
+
+        """
+        while True:
+            try:
+                batch = [ self._queue.get( timeout=self.idleTimeout ) ]
+            except queue.Empty:
+                with self._lock:
+                    if self._open == 0:
+                        self._thread = None
+                        return
+                continue
+
+            while len( batch ) < max( self.fsyncBatch, 1 ):
+                try:
+                    batch.append( self._queue.get_nowait() )
+                except queue.Empty:
+                    break
+
+            try:
+                self._writeBatch( batch )
+            finally:
+                with self._idle:
+                    self._open -= len( batch )
+                    for item in batch:
+                        # nicht einen inzwischen erneut eingereihten
+                        uid = str( item[0].SOPInstanceUID )
+                        if self._pendingItems.get( uid ) is item:
+                            del self._pendingItems[ uid ]
+                    self._idle.notify_all()
+
+    def _writeBatch( self, batch:list ):
+        """Schreibt, synchronisiert und benennt eine Gruppe von Datensätzen um
+
+        Returns
+        -------
+        int
+            Anzahl der geschriebenen Dateien
+
+        """
+        # erst alle temporären Dateien schreiben
+        saved = []
+        for item in batch:
+            ds, filename = item[0], item[1]
+            tmpname = "{}.{}.tmp".format( filename, threading.get_ident() )
+            try:
+                os.makedirs( osp.dirname( filename ), exist_ok=True )
+                # write_like_original=False um DICOM mit Header zu schreiben
+                ds.save_as( tmpname, write_like_original=False )
+                saved.append( ( tmpname, item ) )
+            except Exception as e:
+                logger.warning( "ispDicomWriter: {} - {}".format( filename, str(e) ) )
+                self.stats["failed"] += 1
+                if osp.exists( tmpname ):
+                    os.remove( tmpname )
+
+        # dann gemeinsam synchronisieren und umbenennen
+        if self.fsyncBatch > 0:
+            for tmpname, item in saved:
+                self._fsync( tmpname )
+        written = []
+        for tmpname, item in saved:
+            try:
+                os.replace( tmpname, item[1] )
+                written.append( item )
+            except OSError as e: # pragma: no cover
+                logger.warning( "ispDicomWriter: {} - {}".format( item[1], str(e) ) )
+                self.stats["failed"] += 1
+
+        # die Verzeichniseinträge der umbenannten Dateien sichern
+        if self.fsyncBatch > 0:
+            for path in set( osp.dirname( item[1] ) for item in written ):
+                self._fsync( path )
+
+        for ds, filename, SeriesInstanceUID, AcquisitionYear in written:
+            if self.archive:
+                try:
+                    self.archive.add( ds.SOPInstanceUID, filename, SeriesInstanceUID, AcquisitionYear )
+                except ( OSError, sqlite3.Error ) as e: # pragma: no cover
+                    logger.warning( "ispDicomWriter: index {} - {}".format( filename, str(e) ) )
+
+        self.stats["written"] += len( written )
+        self.stats["batches"] += 1
+        return len( written )
+
+    def _fsync( self, filename:str ):
+        """fsync für eine Datei oder ein Verzeichnis, Verzeichnisse lassen sich unter Windows nicht öffnen
+
+        """
+        try:
+            fd = os.open( filename, os.O_RDONLY )
+        except OSError:
+            return
+        try:
+            os.fsync( fd )
+        except OSError: # pragma: no cover
+            pass
+        finally:
+            os.close( fd )
+
+
+def copyDataset( ds ):
+    """Kopie eines Dataset deren Elemente ohne Änderung am Original ersetzt werden können
+
+    Die Werte selbst werden nicht kopiert, nur das dict der Elemente und die Elemente.
+
+    """
+    new = copy.copy( ds )
+    new._dict = { tag: copy.copy( elem ) for tag, elem in ds._dict.items() }
+    return new
+
+def datasetSize( ds ):
+    """Geschätzte Größe eines Dataset in Bytes
+
+    Verzögerte PixelData zählen nicht, dekodierte Bilddaten in _pixel_array schon.
+
+    """
+    size = 0
+    for elem in ds._dict.values():
+        value = elem.value
+        if isinstance( value, ( bytes, bytearray ) ):
+            size += len( value )
+        size += 128
+    pixels = getattr( ds, "_pixel_array", None )
+    if pixels is not None:
+        size += pixels.nbytes
+    return size
+
+
+class ispDicomDatasetCache( ):
+    '''Prozessweiter Cache für Datasets und aufbereitete Bilddaten nach SOPInstanceUID
+
+    Alle Instanzen von ispDicom mit dem gleichen Server und local_dir verwenden den gleichen Cache,
+    eine Aufnahme wird so während eines Laufs oder der Laufzeit des Servers nur einmal gelesen oder geholt.
+    Übersteigt die geschätzte Größe aller Einträge maxBytes werden die am längsten nicht verwendeten entfernt.
+
+    getDataset() gibt eine Kopie zurück, das ersetzen von Elementen (z.B. PixelData) ändert den Cache nicht.
+    Die Bilddaten von putPixels() sind schreibgeschützt.
+
+    Use ispDicomDatasetCache.getCache( server, config ) to get the shared cache
+
+    Attributes
+    ----------
+
+    name : str
+        DICOM Server aus config
+
+    maxBytes : int
+        max. geschätzte Größe aller Einträge
+
+    stats : dict
+        Anzahl hits, misses, stored, evicted und invalidated
+
+    '''
+
+    _caches = {}
+    _cachesLock = threading.Lock()
+
+    def __init__( self, name:str, maxBytes:int=256 * 1024 * 1024 ):
+        self.name = name
+        self.maxBytes = maxBytes
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "evicted": 0,
+            "invalidated": 0
+        }
+
+    @classmethod
+    def getCache( cls, name:str, config, dicomPath:str="" ):
+        """Den gemeinsamen Cache für den DICOM Server name holen
+
+        Konfiguration über dicom.<name>.dataset_cache, false schaltet den Cache ab
+
+        - max_bytes: max. geschätzte Größe aller Einträge, default 256 MB
+
+        Parameters
+        ----------
+        name : str
+            DICOM Server aus config
+        config : Dot
+            An instance of ispConfig
+        dicomPath : str, optional
+            local_dir des Servers. The default is "".
+
+        Returns
+        -------
+        ispDicomDatasetCache or None
+            None wenn dicom.<name>.dataset_cache false ist
+
+        """
+        options = config.get( ["dicom", name, "dataset_cache"], {} )
+        if options == False:
+            return None
+        if not isinstance( options, dict ):
+            options = {}
+
+        key = ( name, str( dicomPath ) )
+        with cls._cachesLock:
+            cache = cls._caches.get( key )
+            if not cache:
+                cache = cls( name, maxBytes=int( options.get( "max_bytes", 256 * 1024 * 1024 ) ) )
+                cls._caches[ key ] = cache
+        return cache
+
+    @classmethod
+    def invalidateCaches( cls ):
+        """Alle Einträge aller Caches entfernen
+
+        """
+        with cls._cachesLock:
+            caches = list( cls._caches.values() )
+        for cache in caches:
+            cache.invalidate()
+
+    def _get( self, key:tuple ):
+        with self._lock:
+            entry = self._entries.get( key )
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end( key )
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def _put( self, key:tuple, value, size:int ):
+        if size > self.maxBytes:
+            return
+        with self._lock:
+            self._discard( key )
+            self._entries[ key ] = ( size, value )
+            self._bytes += size
+            self.stats["stored"] += 1
+            while self._bytes > self.maxBytes and self._entries:
+                _, ( oldSize, _ ) = self._entries.popitem( last=False )
+                self._bytes -= oldSize
+                self.stats["evicted"] += 1
+
+    def _discard( self, key:tuple ):
+        entry = self._entries.pop( key, None )
+        if entry:
+            self._bytes -= entry[0]
+        return entry is not None
+
+    def getDataset( self, SOPInstanceUID:str ):
+        """Ein Dataset aus dem Cache holen
+
+        Returns
+        -------
+        pydicom.Dataset or None
+            eine Kopie mit copyDataset() oder None
+
+        """
+        ds = self._get( ( "dataset", SOPInstanceUID ) )
+        if ds is None:
+            return None
+        return copyDataset( ds )
+
+    def putDataset( self, SOPInstanceUID:str, ds ):
+        """Ein Dataset im Cache ablegen
+
+        """
+        self._put( ( "dataset", SOPInstanceUID ), copyDataset( ds ), datasetSize( ds ) )
+
+    def getPixels( self, SOPInstanceUID:str ):
+        """Aufbereitete Bilddaten aus dem Cache holen
+
+        Returns
+        -------
+        tuple
+            schreibgeschütztes np.ndarray und dict mit Angaben oder ( None, None )
+
+        """
+        entry = self._get( ( "pixels", SOPInstanceUID ) )
+        if entry is None:
+            return None, None
+        return entry
+
+    def hasPixels( self, SOPInstanceUID:str ):
+        """True wenn aufbereitete Bilddaten abgelegt sind, ohne die Statistik zu ändern
+
+        """
+        with self._lock:
+            return ( "pixels", SOPInstanceUID ) in self._entries
+
+    def putPixels( self, SOPInstanceUID:str, array, meta:dict={} ):
+        """Aufbereitete Bilddaten im Cache ablegen, array wird dabei schreibgeschützt
+
+        """
+        array.flags.writeable = False
+        self._put( ( "pixels", SOPInstanceUID ), ( array, dict( meta ) ), array.nbytes )
+
+    def discard( self, SOPInstanceUID:str ):
+        """Dataset und Bilddaten einer SOPInstanceUID entfernen
+
+        """
+        with self._lock:
+            removed = self._discard( ( "dataset", SOPInstanceUID ) )
+            removed = self._discard( ( "pixels", SOPInstanceUID ) ) or removed
+            if removed:
+                self.stats["invalidated"] += 1
+
+    def invalidate( self ):
+        """Alle Einträge entfernen
+
+        """
+        with self._lock:
+            self.stats["invalidated"] += len( self._entries )
+            self._entries.clear()
+            self._bytes = 0
+
+    def getStats( self ):
+        """Statistik des Cache
+
+        Returns
+        -------
+        dict
+            Zähler, entries, datasets, pixels, geschätzte bytes und hit_ratio
+
+        """
+        with self._lock:
+            stats = dict( self.stats )
+            stats["entries"] = len( self._entries )
+            stats["datasets"] = sum( 1 for key in self._entries if key[0] == "dataset" )
+            stats["pixels"] = stats["entries"] - stats["datasets"]
+            stats["bytes"] = self._bytes
+        stats["max_bytes"] = self.maxBytes
+        requests = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round( stats["hits"] / requests, 3 ) if requests else 0.0
+        return stats
@@ -20,9 +20,79 @@ print( msdb.execute("select @@version as version") )
 
 use {dbname} in sql querys to replace it with dbname from config
 
+use ? as placeholder for bound parameters. For pytds it is converted to %s
+
+print( msdb.execute("select * from [{dbname}].[dbo].[Patient] where [PatientId] = ?", ["_QA Linac1"] ) )
+
+Parameterized statements are held per connection in a statement cache keyed by the sql template.
+The size is set with database.<name>.statement_cache (default 50, 0 disables the cache)
+
+With usePool connections are borrowed from a process-wide ispMssqlPool per database configuration.
+The pool is configured with database.<name>.pool
+
+- min_size: connections kept open on idle eviction, default 0
+- max_size: max. open connections, default 5
+- idle_timeout: seconds after which an unused connection is closed, default 300
+- timeout: seconds to wait for a free connection, default 10
+- check_after: seconds after which a connection is checked with a ping before checkout, default 10
+
+"pool": false disables the pool for a database configuration
+
+execute() returns by default a list of dicts. Use mode="stream" to get a generator which fetches
+the rows in batches of database.<name>.fetch_size (default 500), mode="columns" for a dict of
+column lists or mode="frame" for a pandas.DataFrame. A failed query returns an empty result,
+only mode="stream" raises the error so a truncated stream is not mistaken for a complete one
+
+Querys can be build with ispMssqlQuery, use query() to get a builder for the database engine
+
+execute() with cache=<query class> uses a process-wide ispMssqlResultCache per database configuration.
+The cache is configured with database.<name>.result_cache
+
+- max_bytes: max. estimated size of all cached results, least recently used results are removed, default 64 MB
+- ttl: seconds to live per query class e.g. {"default": 300, "images_past": 86400}, 0 disables the query class
+
+"result_cache": false disables the cache. invalidateCache() removes cached results
+
+With engine "sqlite" a local sqlite file with the same tables is used instead of the mssql server,
+e.g. a synthetic Aria database for load tests created with tests/aria_generator.py
+
+- path: filename of the sqlite database, default {{BASE_DIR}}/data/<name>.sqlite
+
+[dbname].[dbo]. is removed from the sql querys
+
 
 CHANGELOG
 =========
+0.1.8 / 2026-10-18
+------------------
+- add engine sqlite for a local database with the same tables, e.g. for load tests
+
+0.1.7 / 2026-10-18
+------------------
+- add ispMssqlResultCache result cache with time to live per query class and LRU eviction by size
+- add parameters cache and refresh to execute(), add getResultCache() and invalidateCache()
+
+0.1.6 / 2026-10-18
+------------------
+- add ispMssqlQuery builder with IN-lists, half-open date ranges and token filters
+- add query() to get a builder for the database engine
+
+0.1.5 / 2026-10-18
+------------------
+- add result modes stream, columns and frame to execute()
+- add iterate() generator using fetchmany
+- pyodbc rows are converted with the column names read once per cursor
+
+0.1.4 / 2026-10-18
+------------------
+- add ispMssqlPool thread-safe connection pool with idle eviction, liveness check and reconnect
+- add ispMssqlConnection holding a connection and its prepared statements
+
+0.1.3 / 2026-10-18
+------------------
+- add bound parameters to execute() for pytds and pyodbc
+- add per connection prepared statement cache with hit/miss counter in statementStats
+
 0.1.2 / 2024-03-18
 ------------------
 - some code cleanup and documentation
@@ -41,13 +111,971 @@ __author__ = "R. Bauer"
 __copyright__ = "MedPhyDO - Machbarkeitsstudien des Instituts für Medizinische Strahlenphysik und Strahlenschutz am Klinikum Dortmund im Rahmen von Bachelor und Masterarbeiten an der TU-Dortmund / FH-Dortmund"
 __credits__ = ["R.Bauer", "K.Loot"]
 __license__ = "MIT"
-__version__ = "0.1.2"
+__version__ = "0.1.8"
 __status__ = "Prototype"
 
 
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import os.path as osp
+import re
+import sqlite3
+import threading
+import time
+
 import logging
 logger = logging.getLogger( "ISP" )
 
+# Literale, Bezeichner und Kommentare in denen ? kein Platzhalter ist
+_placeholderPattern = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\[[^\]]*\]|--[^\n]*|/\*.*?\*/|\?",
+    re.S
+)
+
+
+def connectDatabase( config, name:str ):
+    """Open a new connection for the database configuration name
+
+    Parameters
+    ----------
+    config : Dot
+        An instance of ispConfig
+    name : str
+        database configuration name from config
+
+    Returns
+    -------
+    class
+        An instance of :class:`Connection` or None
+
+    """
+    connect = None
+    engine = config.database[name].get("engine", "pytds")
+    dbname = config.database[name].get("dbname", name )
+
+    if engine == "pytds":
+        import pytds
+        try:
+            connect = pytds.connect(
+                dsn = config.database[name].host,
+                database = dbname,
+                user = config.database[name].user,
+                password = config.database[name].password,
+                as_dict = True,
+                login_timeout = int( config.database[name].get("login_timeout", 3 ) ) # timeout for connection and login in seconds, default 15
+            )
+
+        except Exception as err: # pragma: no cover
+            logger.warning( "mssqlClass.openDatabase '{}' failed. {}".format( name, err ) )
+
+    elif engine == "pyodbc":
+        import pyodbc
+        DRIVER = config.database[name].driver
+        SERVER = config.database[name].server_ip
+        DATABASE = config.database[name].dbname
+        USERNAME = config.database[name].user
+        PASSWORD = config.database[name].password
+        connectionString = f'DRIVER={DRIVER};SERVER={SERVER};DATABASE={DATABASE};UID={USERNAME};PWD={PASSWORD}'
+        try:
+            connect = pyodbc.connect( connectionString )
+        except Exception as err:
+            logger.warning( "mssqlClass.openDatabase '{}' failed. {}".format( name, err ) )
+
+    elif engine == "sqlite":
+        # lokale Datenbank mit dem Aria Schema z.B. für Lasttests
+        path = config.database[name].get( "path", "{{BASE_DIR}}/data/" + name + ".sqlite" )
+        path = path.replace( "{{BASE_DIR}}", config.get( "BASE_DIR", "." ) )
+        try:
+            connect = connectSqlite( path )
+        except Exception as err: # pragma: no cover
+            logger.warning( "mssqlClass.openDatabase '{}' failed. {}".format( name, err ) )
+
+    return connect
+
+
+def connectSqlite( path:str ):
+    """Open a sqlite database as stand-in for a mssql database
+
+    Columns declared as DATETIME are returned as datetime, datetime parameters are bound as iso string.
+    The T-SQL functions YEAR(), MONTH() and DAY() are available.
+    The database must exist, create it e.g. with tests/aria_generator.py
+
+    Parameters
+    ----------
+    path : str
+        filename of the sqlite database
+
+    Returns
+    -------
+    sqlite3.Connection
+
+    """
+    if not osp.isfile( path ):
+        raise FileNotFoundError( path )
+
+    sqlite3.register_adapter( datetime, lambda value: value.isoformat( " " ) )
+    sqlite3.register_converter( "DATETIME", lambda value: datetime.fromisoformat( value.decode() ) )
+
+    connect = sqlite3.connect( path, timeout=30, check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES )
+    connect.create_function( "YEAR", 1, lambda v: int( v[0:4] ) if v else None, deterministic=True )
+    connect.create_function( "MONTH", 1, lambda v: int( v[5:7] ) if v else None, deterministic=True )
+    connect.create_function( "DAY", 1, lambda v: int( v[8:10] ) if v else None, deterministic=True )
+    return connect
+
+
+def configKey( config, name:str ):
+    """Key for the connection settings of the database configuration name
+
+    Used to share pools and result caches between instances with the same settings
+
+    """
+    dbconfig = config.database[name]
+    return ( name, ) + tuple( str( dbconfig.get( k, "" ) ) for k in
+        [ "engine", "host", "driver", "server_ip", "dbname", "user", "password", "path" ]
+    )
+
+
+class ispMssqlConnection( ):
+    '''A database connection together with its prepared statements
+
+    Attributes
+    ----------
+
+    connect : class
+         An instance of :class:`Connection`
+
+    engine : str
+         Databaseengine `pytds`, `pyodbc` or `sqlite`
+
+    statements : OrderedDict
+        prepared statements of this connection keyed by (sql, parameterized)
+
+    created : float
+        time.monotonic() of the connect
+
+    lastUsed : float
+        time.monotonic() of the last checkin or check
+
+    '''
+
+    def __init__( self, connect, engine:str ):
+        self.connect = connect
+        self.engine = engine
+        self.statements = OrderedDict()
+        self.created = time.monotonic()
+        self.lastUsed = self.created
+
+    def clearStatements( self ):
+        """Remove all prepared statements of this connection
+        """
+        for statement in self.statements.values():
+            if statement["cursor"]:
+                try:
+                    statement["cursor"].close()
+                except Exception: # pragma: no cover
+                    pass
+        self.statements.clear()
+
+    def ping( self ):
+        """Check if the connection is alive
+
+        Returns
+        -------
+        bool
+            True if a simple query could be executed
+
+        """
+        try:
+            cur = self.connect.cursor()
+            cur.execute( "SELECT 1" )
+            cur.fetchall()
+            cur.close()
+        except Exception:
+            return False
+        self.lastUsed = time.monotonic()
+        return True
+
+    def close( self ):
+        """close statements and database connection
+        """
+        self.clearStatements()
+        try:
+            self.connect.close()
+        except Exception: # pragma: no cover
+            pass
+
+
+class ispMssqlPool( ):
+    '''Process-wide thread-safe connection pool for one database configuration
+
+    Use ispMssqlPool.getPool( name, config ) to get the shared pool
+
+    Attributes
+    ----------
+
+    name : str
+        database configuration name from config
+
+    minSize : int
+        connections kept open on idle eviction
+
+    maxSize : int
+        max. open connections
+
+    idleTimeout : float
+        seconds after which an unused connection is closed
+
+    timeout : float
+        seconds to wait for a free connection in checkout
+
+    checkAfter : float
+        seconds after which a connection is checked with a ping before checkout
+
+    stats : dict
+        counter for created, reused, checked, broken and evicted connections and timeouts
+
+    '''
+
+    _pools = {}
+    _poolsLock = threading.Lock()
+
+    def __init__( self, name:str, config, minSize:int=0, maxSize:int=5,
+                 idleTimeout:float=300, timeout:float=10, checkAfter:float=10 ):
+        self.name = name
+        self.config = config
+        self.engine = config.database[name].get("engine", "pytds")
+        self.minSize = minSize
+        self.maxSize = max( 1, maxSize )
+        self.idleTimeout = idleTimeout
+        self.timeout = timeout
+        self.checkAfter = checkAfter
+
+        self._idle = []
+        self._inUse = 0
+        self._condition = threading.Condition()
+
+        self.stats = {
+            "created": 0,
+            "reused": 0,
+            "checked": 0,
+            "broken": 0,
+            "evicted": 0,
+            "timeouts": 0
+        }
+
+    @classmethod
+    def getPool( cls, name:str, config ):
+        """Get the shared pool for the database configuration name
+
+        The pool is created on the first call. A changed connection configuration creates a new pool
+
+        Parameters
+        ----------
+        name : str
+            database configuration name from config
+        config : Dot
+            An instance of ispConfig
+
+        Returns
+        -------
+        ispMssqlPool
+
+        """
+        dbconfig = config.database[name]
+        key = configKey( config, name )
+        with cls._poolsLock:
+            pool = cls._pools.get( key )
+            if not pool:
+                options = dbconfig.get( "pool", {} )
+                if not isinstance( options, dict ):
+                    options = {}
+                pool = cls( name, config,
+                    minSize = int( options.get( "min_size", 0 ) ),
+                    maxSize = int( options.get( "max_size", 5 ) ),
+                    idleTimeout = float( options.get( "idle_timeout", 300 ) ),
+                    timeout = float( options.get( "timeout", 10 ) ),
+                    checkAfter = float( options.get( "check_after", 10 ) )
+                )
+                cls._pools[ key ] = pool
+        return pool
+
+    @classmethod
+    def closePools( cls ):
+        """Close all connections of all pools
+        """
+        with cls._poolsLock:
+            for pool in cls._pools.values():
+                pool.close()
+            cls._pools.clear()
+
+    def _connect( self ):
+        """Open a new pooled connection
+
+        Returns
+        -------
+        ispMssqlConnection or None
+
+        """
+        connect = connectDatabase( self.config, self.name )
+        if not connect:
+            return None
+        self.stats["created"] += 1
+        return ispMssqlConnection( connect, self.engine )
+
+    def _evict( self ):
+        """Close idle connections above minSize which are unused longer than idleTimeout
+
+        Call with acquired self._condition
+        """
+        now = time.monotonic()
+        keep = []
+        # die zuletzt verwendeten liegen am Ende
+        for connection in reversed( self._idle ):
+            if len( keep ) + self._inUse >= self.minSize and now - connection.lastUsed > self.idleTimeout:
+                connection.close()
+                self.stats["evicted"] += 1
+            else:
+                keep.insert( 0, connection )
+        self._idle = keep
+
+    def checkout( self ):
+        """Borrow a connection from the pool
+
+        An idle connection is checked with a ping if it was not used for checkAfter seconds,
+        broken connections are replaced by a new one.
+        Waits max. timeout seconds if maxSize connections are in use.
+
+        Returns
+        -------
+        ispMssqlConnection or None
+
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            self._evict()
+            while not self._idle and self._inUse >= self.maxSize:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.stats["timeouts"] += 1
+                    logger.warning( "mssqlPool.checkout '{}': no free connection after {}s".format( self.name, self.timeout ) )
+                    return None
+                self._condition.wait( remaining )
+            connection = self._idle.pop() if self._idle else None
+            self._inUse += 1
+
+        # ping und connect ausserhalb des locks
+        if connection and time.monotonic() - connection.lastUsed > self.checkAfter:
+            self.stats["checked"] += 1
+            if not connection.ping():
+                self.stats["broken"] += 1
+                connection.close()
+                connection = None
+
+        if connection:
+            self.stats["reused"] += 1
+        else:
+            connection = self._connect()
+            if not connection:
+                self._release()
+        return connection
+
+    def _release( self ):
+        """Free a slot of a connection that is not returned to the pool
+        """
+        with self._condition:
+            self._inUse -= 1
+            self._condition.notify()
+
+    def checkin( self, connection:ispMssqlConnection, broken:bool=False ):
+        """Return a borrowed connection to the pool
+
+        Parameters
+        ----------
+        connection : ispMssqlConnection
+            the borrowed connection
+        broken : bool, optional
+            close the connection instead of reusing it, default False
+
+        """
+        if not connection:
+            return
+        if not broken:
+            try:
+                # offene Transaktion beenden
+                connection.connect.rollback()
+            except Exception:
+                broken = True
+
+        if broken:
+            self.stats["broken"] += 1
+            connection.close()
+            self._release()
+            return
+
+        connection.lastUsed = time.monotonic()
+        with self._condition:
+            self._inUse -= 1
+            self._idle.append( connection )
+            self._evict()
+            self._condition.notify()
+
+    def getStats( self ):
+        """Statistics of the pool
+
+        Returns
+        -------
+        dict
+
+        """
+        with self._condition:
+            stats = dict( self.stats )
+            stats["idle"] = len( self._idle )
+            stats["in_use"] = self._inUse
+        stats["min_size"] = self.minSize
+        stats["max_size"] = self.maxSize
+        return stats
+
+    def close( self ):
+        """Close all idle connections
+        """
+        with self._condition:
+            for connection in self._idle:
+                connection.close()
+            self._idle = []
+
+
+class ispMssqlResultCache( ):
+    '''Process-wide cache for query results of one database configuration
+
+    Results are held as dict of column lists keyed by the normalized sql and the parameters.
+    Each entry belongs to a query class which sets its time to live. If the estimated size of
+    all entries exceeds maxBytes the least recently used entries are removed
+
+    Use ispMssqlResultCache.getCache( name, config ) to get the shared cache
+
+    Attributes
+    ----------
+
+    name : str
+        database configuration name from config
+
+    maxBytes : int
+        max. estimated size of all entries
+
+    ttl : dict
+        seconds to live per query class, "default" for query classes without own value.
+        0 disables caching for the query class
+
+    stats : dict
+        counter for hits, misses, stored, expired, evicted and invalidated entries
+
+    '''
+
+    _caches = {}
+    _cachesLock = threading.Lock()
+
+    defaultTTL = {
+        "default": 300
+    }
+
+    def __init__( self, name:str, maxBytes:int=64 * 1024 * 1024, ttl:dict=None ):
+        self.name = name
+        self.maxBytes = maxBytes
+        self.ttl = dict( self.defaultTTL )
+        if ttl:
+            self.ttl.update( ttl )
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "expired": 0,
+            "evicted": 0,
+            "invalidated": 0
+        }
+
+    @classmethod
+    def getCache( cls, name:str, config, ttl:dict=None ):
+        """Get the shared result cache for the database configuration name
+
+        Configured with database.<name>.result_cache, false disables the cache
+
+        - max_bytes: max. estimated size of all entries, default 64 MB
+        - ttl: dict with seconds to live per query class, default {"default": 300}
+
+        Parameters
+        ----------
+        name : str
+            database configuration name from config
+        config : Dot
+            An instance of ispConfig
+        ttl : dict, optional
+            default seconds to live per query class used when the cache is created. The default is None.
+
+        Returns
+        -------
+        ispMssqlResultCache or None
+            None if database.<name>.result_cache is false
+
+        """
+        options = config.database[name].get( "result_cache", {} )
+        if options == False:
+            return None
+        if not isinstance( options, dict ):
+            options = {}
+
+        key = configKey( config, name )
+        with cls._cachesLock:
+            cache = cls._caches.get( key )
+            if not cache:
+                ttl = dict( ttl or {} )
+                if isinstance( options.get( "ttl" ), dict ):
+                    ttl.update( { k: float( v ) for k, v in options["ttl"].items() } )
+                cache = cls( name,
+                    maxBytes = int( options.get( "max_bytes", 64 * 1024 * 1024 ) ),
+                    ttl = ttl
+                )
+                cls._caches[ key ] = cache
+        return cache
+
+    @classmethod
+    def invalidateCaches( cls, queryClass:str=None ):
+        """Remove the entries of all caches
+
+        Parameters
+        ----------
+        queryClass : str, optional
+            only entries of this query class. The default is None.
+
+        """
+        with cls._cachesLock:
+            caches = list( cls._caches.values() )
+        for cache in caches:
+            cache.invalidate( queryClass )
+
+    @staticmethod
+    def key( sql:str, params:list=None ):
+        """Cache key of the normalized sql and the parameters
+
+        Whitespace is collapsed, so the same query with a different layout gets the same key
+
+        """
+        return re.sub( r"\s+", " ", sql ).strip() + "\x00" + repr( list( params or [] ) )
+
+    @staticmethod
+    def sizeOf( columns:dict ):
+        """Estimate the size of a result in bytes from the first 100 rows
+
+        """
+        import sys
+        size = sys.getsizeof( columns )
+        for values in columns.values():
+            count = len( values )
+            size += sys.getsizeof( values )
+            if count:
+                sample = values[:100]
+                size += sum( sys.getsizeof( v ) for v in sample ) * count // len( sample )
+        return size
+
+    def getTTL( self, queryClass:str ):
+        """Seconds to live for queryClass
+        """
+        return self.ttl.get( queryClass, self.ttl.get( "default", 0 ) )
+
+    def get( self, key:str ):
+        """Get a cached result
+
+        Parameters
+        ----------
+        key : str
+            see key()
+
+        Returns
+        -------
+        dict or None
+            dict of column lists or None if there is no valid entry
+
+        """
+        with self._lock:
+            entry = self._entries.get( key )
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            expires, queryClass, size, columns = entry
+            if expires < time.monotonic():
+                del self._entries[ key ]
+                self._bytes -= size
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end( key )
+            self.stats["hits"] += 1
+            return columns
+
+    def put( self, key:str, queryClass:str, columns:dict ):
+        """Store a result, the least recently used entries are removed if maxBytes is exceeded
+
+        Parameters
+        ----------
+        key : str
+            see key()
+        queryClass : str
+            query class of the result
+        columns : dict
+            dict of column lists
+
+        """
+        ttl = self.getTTL( queryClass )
+        size = self.sizeOf( columns )
+        if ttl <= 0 or size > self.maxBytes:
+            return
+        with self._lock:
+            self._discard( key )
+            self._entries[ key ] = ( time.monotonic() + ttl, queryClass, size, columns )
+            self._bytes += size
+            self.stats["stored"] += 1
+            while self._bytes > self.maxBytes and self._entries:
+                _, ( _, _, oldSize, _ ) = self._entries.popitem( last=False )
+                self._bytes -= oldSize
+                self.stats["evicted"] += 1
+
+    def _discard( self, key:str ):
+        entry = self._entries.pop( key, None )
+        if entry:
+            self._bytes -= entry[2]
+        return entry is not None
+
+    def discard( self, key:str ):
+        """Remove one entry
+
+        """
+        with self._lock:
+            if self._discard( key ):
+                self.stats["invalidated"] += 1
+
+    def invalidate( self, queryClass:str=None ):
+        """Remove all entries or the entries of a query class
+
+        Parameters
+        ----------
+        queryClass : str, optional
+            only entries of this query class. The default is None.
+
+        """
+        with self._lock:
+            keys = [ key for key, entry in self._entries.items() if queryClass is None or entry[1] == queryClass ]
+            for key in keys:
+                self._discard( key )
+            self.stats["invalidated"] += len( keys )
+
+    @staticmethod
+    def convert( columns:dict, mode:str="list" ):
+        """Convert a cached result into a new result for mode
+
+        Parameters
+        ----------
+        columns : dict
+            dict of column lists
+        mode : str, optional
+            list, stream, columns or frame see ispMssql.execute. The default is "list".
+
+        Returns
+        -------
+        list|generator|dict|pandas.DataFrame
+
+        """
+        if mode == "columns":
+            return { name: list( values ) for name, values in columns.items() }
+        elif mode == "frame":
+            import pandas as pd
+            return pd.DataFrame( columns )
+        names = list( columns.keys() )
+        rows = [ dict( zip( names, row ) ) for row in zip( *columns.values() ) ]
+        if mode == "stream":
+            return iter( rows )
+        return rows
+
+    def getStats( self ):
+        """Statistics of the cache
+
+        Returns
+        -------
+        dict
+            counter, entries, estimated bytes and hit_ratio
+
+        """
+        with self._lock:
+            stats = dict( self.stats )
+            stats["entries"] = len( self._entries )
+            stats["bytes"] = self._bytes
+        stats["max_bytes"] = self.maxBytes
+        requests = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round( stats["hits"] / requests, 3 ) if requests else 0.0
+        stats["ttl"] = dict( self.ttl )
+        return stats
+
+
+class ispMssqlQuery( ):
+    '''Builder for parameterized select querys
+
+    All values are passed as bound parameters with ? placeholders.
+    Filters on date columns are written as half-open ranges so the
+    database can use an index on the column instead of scanning all rows
+
+    Example::
+
+        query = ispMssqlQuery( "[{dbname}].[dbo].[Slice] [Slice]" )
+        query.select( "[Slice].[SliceUID]", "[Slice].[AcquisitionDateTime]" )
+        query.whereIn( "[Slice].[SliceModality]", ["RTIMAGE"] )
+        query.whereDate( "[Slice].[AcquisitionDateTime]", year=2021, month=4 )
+        sql, params = query.build()
+
+    Attributes
+    ----------
+
+    fromSql : str
+        FROM part of the query including joins
+
+    columns : list
+        selected columns, each column only once
+
+    conditions : list
+        where conditions combined with AND
+
+    params : list
+        bound parameters in order of the ? placeholders
+
+    engine : str
+        Databaseengine used to select the concat operator
+
+    '''
+
+    def __init__( self, fromSql:str="", engine:str="pytds" ):
+        self.fromSql = fromSql
+        self.engine = engine
+        self.columns = []
+        self.conditions = []
+        self.params = []
+
+    def select( self, *columns ):
+        """add columns, duplicate columns are skipped
+
+        Parameters
+        ----------
+        *columns : str
+            column names like [Slice].[SliceUID]
+
+        Returns
+        -------
+        ispMssqlQuery
+            self for chaining
+
+        """
+        for column in columns:
+            if not column in self.columns:
+                self.columns.append( column )
+        return self
+
+    def where( self, condition:str, params:list=None ):
+        """add a condition with optional parameters
+
+        Parameters
+        ----------
+        condition : str
+            sql condition with ? placeholders
+        params : list, optional
+            parameters for the placeholders. The default is None.
+
+        Returns
+        -------
+        ispMssqlQuery
+            self for chaining
+
+        """
+        self.conditions.append( condition )
+        if params:
+            self.params.extend( params )
+        return self
+
+    def whereIn( self, column:str, values ):
+        """add column = ? or column IN (?, ...) for a list of values
+
+        Parameters
+        ----------
+        column : str
+            column name
+        values : str|int|list
+            one or more values
+
+        Returns
+        -------
+        ispMssqlQuery
+            self for chaining
+
+        """
+        if not isinstance( values, (list, tuple) ):
+            values = [ values ]
+        values = list( values )
+        if len( values ) == 0:
+            # leere Liste findet nichts
+            return self.where( "1 = 0" )
+        if len( values ) == 1:
+            return self.where( "{} = ?".format( column ), values )
+        return self.where( "{} IN ({})".format( column, ", ".join( ["?"] * len( values ) ) ), values )
+
+    def whereRange( self, column:str, start=None, end=None ):
+        """add a half-open range start <= column < end
+
+        Parameters
+        ----------
+        column : str
+            column name
+        start : optional
+            inclusive lower bound. The default is None.
+        end : optional
+            exclusive upper bound. The default is None.
+
+        Returns
+        -------
+        ispMssqlQuery
+            self for chaining
+
+        """
+        if start is not None:
+            self.where( "{} >= ?".format( column ), [ start ] )
+        if end is not None:
+            self.where( "{} < ?".format( column ), [ end ] )
+        return self
+
+    def whereDate( self, column:str, year=None, month=None, day=None ):
+        """add a date filter on a datetime column
+
+        With year the filter is a half-open datetime range over the year, month or day.
+        Without year month and day are compared with MONTH() and DAY(), which can not use an index
+
+        Parameters
+        ----------
+        column : str
+            datetime column name
+        year : int|str, optional
+            year. The default is None.
+        month : int|str, optional
+            month. The default is None.
+        day : int|str, optional
+            day. The default is None.
+
+        Returns
+        -------
+        ispMssqlQuery
+            self for chaining
+
+        """
+        year = int( year ) if year else None
+        month = int( month ) if month else None
+        day = int( day ) if day else None
+
+        if not year:
+            if month:
+                self.where( "MONTH({}) = ?".format( column ), [ month ] )
+            if day:
+                self.where( "DAY({}) = ?".format( column ), [ day ] )
+            return self
+
+        if not month:
+            start = datetime( year, 1, 1 )
+            end = datetime( year + 1, 1, 1 )
+            # Tag ohne Monat nur über DAY() möglich
+            if day:
+                self.where( "DAY({}) = ?".format( column ), [ day ] )
+        elif not day:
+            start = datetime( year, month, 1 )
+            end = datetime( year + 1, 1, 1 ) if month == 12 else datetime( year, month + 1, 1 )
+        else:
+            start = datetime( year, month, day )
+            end = start + timedelta( days=1 )
+
+        return self.whereRange( column, start, end )
+
+    def tokenExpression( self, column:str ):
+        """sql expression of a text column with whitespace separated tokens
+
+        Line breaks and tabs are replaced by spaces, : is prefixed with a space so tag:subtag
+        results in the tokens tag and :subtag. The expression starts and ends with a space
+
+        Parameters
+        ----------
+        column : str
+            column name
+
+        Returns
+        -------
+        str
+            sql expression
+
+        """
+        expr = "REPLACE({}, ':', ' :')".format( column )
+        for char in [ 13, 10, 9 ]:
+            expr = "REPLACE({}, CHAR({}), ' ')".format( expr, char )
+        if self.engine == "sqlite":
+            return "' ' || {} || ' '".format( expr )
+        return "' ' + {} + ' '".format( expr )
+
+    def whereTokens( self, column:str, tokens ):
+        """add a filter for whole tokens in a text column
+
+        Finds tag and tag:subtag but not tag.1 like a substring search would
+
+        Parameters
+        ----------
+        column : str
+            column name
+        tokens : str|list
+            one or more tokens, one of them must exist
+
+        Returns
+        -------
+        ispMssqlQuery
+            self for chaining
+
+        """
+        if not isinstance( tokens, (list, tuple) ):
+            tokens = [ tokens ]
+        if len( tokens ) == 0:
+            return self
+
+        expr = self.tokenExpression( column )
+        conditions = []
+        params = []
+        for token in tokens:
+            # LIKE Sonderzeichen maskieren
+            pattern = re.sub( r"([\\%_\[])", r"\\\1", str( token ) )
+            conditions.append( "{} LIKE ? ESCAPE '\\'".format( expr ) )
+            params.append( "% {} %".format( pattern ) )
+
+        return self.where( "(" + " OR ".join( conditions ) + ")", params )
+
+    def build( self ):
+        """build sql and parameter list
+
+        Returns
+        -------
+        str
+            sql query
+        list
+            parameters
+
+        """
+        sql = "SELECT\n  " + "\n  , ".join( self.columns )
+        sql += "\nFROM " + self.fromSql
+        if len( self.conditions ) > 0:
+            sql += "\nWHERE " + "\n  AND ".join( self.conditions )
+        return sql, list( self.params )
+
+
 class ispMssql( ):
     '''Database querys on mssql database
 
@@ -61,19 +1089,38 @@ class ispMssql( ):
          An instance of :class:`Connection`
 
     engine : str
-         Databaseengine `pytds` or `pyodbc`
+         Databaseengine `pytds`, `pyodbc` or `sqlite`
 
     dbname : object
         Names of dbname in connection
 
     lastExecuteSql: str
-        Holds last executed sql query
+        Holds last executed sql query, not set by querys in parallel worker threads (see ariaClass.executeParallel)
+
+    lastExecuteParams: list
+        Holds the parameters of the last executed sql query, not set by querys in parallel worker threads
+
+    statementCacheSize: int
+        max. number of prepared statements per connection
+
+    statementStats: dict
+        hits and misses of the prepared statement cache
+
+    usePool: bool
+        borrow connections from ispMssqlPool instead of holding an own connection
+
+    resultCacheTTL: dict
+        default seconds to live per query class for the result cache, overwritten by database.<name>.result_cache.ttl
 
     config: Dot
         An instance of ispConfig
 
     '''
 
+    usePool: bool = False
+
+    resultCacheTTL: dict = {}
+
     def __init__( self, name:str=None, config=None):
         '''initialise class
 
@@ -90,10 +1137,20 @@ class ispMssql( ):
         '''
 
         self.connect = None
+        self._connection = None
         self.engine = None
         self.name = None
         self.dbname = None
         self.lastExecuteSql = ""
+        self.lastExecuteParams = []
+        # parallel ist in den worker threads von ariaClass.executeParallel gesetzt
+        self._worker = threading.local()
+
+        self.statementCacheSize = 50
+        self.statementStats = {
+            "hits": 0,
+            "misses": 0
+        }
 
         if config:
             self.config = config
@@ -101,6 +1158,37 @@ class ispMssql( ):
         if name:
             self.name = name
 
+    def setLastExecute( self, sql:str, params:list ):
+        """Set lastExecuteSql and lastExecuteParams
+
+        Querys of parallel worker threads (_worker.parallel) would overwrite each other, they are not recorded
+
+        """
+        if getattr( self._worker, "parallel", False ):
+            return
+        self.lastExecuteSql = sql
+        self.lastExecuteParams = params
+
+    def _loadDatabaseConfig( self, name:str ):
+        """set engine, dbname and statementCacheSize from config
+
+        Parameters
+        ----------
+        name : str
+            database configuration name from config
+
+        Returns
+        -------
+        bool
+            True if there is a configuration for name
+
+        """
+        if not self.config.database[ name ]:
+            return False
+        self.engine = self.config.database[name].get("engine", "pytds")
+        self.dbname = self.config.database[name].get("dbname", name )
+        self.statementCacheSize = int( self.config.database[name].get("statement_cache", 50 ) )
+        return True
 
     def openDatabase( self, name:str=None ):
         '''Open database connection
@@ -119,98 +1207,480 @@ class ispMssql( ):
 
         '''
 
+        # prepared statements gehören zur Verbindung
+        if self._connection:
+            self._connection.clearStatements()
         self.connect = None
+        self._connection = None
         if not name:
             name = self.name
         if not name:  # pragma: no cover
             logger.warning( "mssqlClass.openDatabase - missing databasename." )
             return
 
-        if self.config.database[ name ]:
-            self.engine = self.config.database[name].get("engine", "pytds")
-            self.dbname = self.config.database[name].get("dbname", name )
-
-            if self.engine == "pytds":
-                import pytds
-                try:
-                    self.connect = pytds.connect(
-                        dsn = self.config.database[name].host,
-                        database = self.dbname,
-                        user = self.config.database[name].user,
-                        password = self.config.database[name].password,
-                        as_dict = True,
-                        login_timeout = int( self.config.database[name].get("login_timeout", 3 ) ) # timeout for connection and login in seconds, default 15
-                    )
-
-                except Exception as err: # pragma: no cover
-                    logger.warning( "mssqlClass.openDatabase '{}' failed. {}".format( name, err ) )
-
-            elif self.engine == "pyodbc":
-                import pyodbc
-                DRIVER = self.config.database[name].driver
-                SERVER = self.config.database[name].server_ip
-                DATABASE = self.config.database[name].dbname
-                USERNAME = self.config.database[name].user
-                PASSWORD = self.config.database[name].password
-                connectionString = f'DRIVER={DRIVER};SERVER={SERVER};DATABASE={DATABASE};UID={USERNAME};PWD={PASSWORD}'
-                try:
-                    self.connect = pyodbc.connect( connectionString )
-                except Exception as err:
-                    logger.warning( "mssqlClass.openDatabase '{}' failed. {}".format( name, err ) )
+        if self._loadDatabaseConfig( name ):
+            self.connect = connectDatabase( self.config, name )
+            if self.connect:
+                self._connection = ispMssqlConnection( self.connect, self.engine )
 
         return self.connect
 
     def close(self):
         """close database connection
         """
-        self.connect.close()
+        if self._connection:
+            self._connection.close()
+        elif self.connect:
+            self.connect.close()
+        self._connection = None
+        self.connect = None
 
-    def execute( self, sql ):
-        """Execute database Query
+    def getPool( self ):
+        """The shared connection pool for this database configuration
+
+        Returns
+        -------
+        ispMssqlPool or None
+            None if there is no configuration or database.<name>.pool is false
+
+        """
+        if not self.name or not self._loadDatabaseConfig( self.name ):
+            return None
+        if self.config.database[ self.name ].get( "pool", True ) == False:
+            return None
+        return ispMssqlPool.getPool( self.name, self.config )
+
+    def getResultCache( self ):
+        """The shared result cache for this database configuration
+
+        Returns
+        -------
+        ispMssqlResultCache or None
+            None if there is no configuration or database.<name>.result_cache is false
+
+        """
+        if not self.name or not self._loadDatabaseConfig( self.name ):
+            return None
+        return ispMssqlResultCache.getCache( self.name, self.config, ttl=self.resultCacheTTL )
+
+    def invalidateCache( self, queryClass:str=None ):
+        """Remove cached results of this database configuration
+
+        Parameters
+        ----------
+        queryClass : str, optional
+            only results of this query class. The default is None.
+
+        """
+        cache = self.getResultCache()
+        if cache:
+            cache.invalidate( queryClass )
+
+    def query( self, fromSql:str="" ):
+        """A query builder for the engine of this database configuration
+
+        Parameters
+        ----------
+        fromSql : str, optional
+            FROM part of the query including joins. The default is "".
+
+        Returns
+        -------
+        ispMssqlQuery
+
+        """
+        if not self.engine and self.name:
+            self._loadDatabaseConfig( self.name )
+        return ispMssqlQuery( fromSql, engine=self.engine or "pytds" )
 
-        If not connected open database
+    def prepare( self, sql:str, parameterized:bool=True, connection:ispMssqlConnection=None ):
+        """Get the prepared statement for a sql template from the statement cache of the connection
 
-        holds last sqlquery in this.lastExecuteSql
+        pyodbc reuses the prepared statement if the same sql is executed again on the same cursor,
+        so one cursor is held per statement. pytds sends parameterized statements with sp_executesql
+        which lets the server reuse the plan of the statement. For pytds the ? placeholders are converted
+        to %s, a ? in string literals, quoted identifiers or comments is kept.
 
         Parameters
         ----------
         sql : str
-            sql query string
+            sql query string with {dbname} already replaced
+        parameterized : bool, optional
+            the statement is executed with parameters, default True
+        connection : ispMssqlConnection, optional
+            connection holding the statements, default self._connection
 
         Returns
         -------
-        list
-            query result from execute fetchall
+        dict
+            - sql: engine specific sql query string
+            - cursor: cursor holding the prepared statement (pyodbc only) or None
 
         """
+        if not connection:
+            connection = self._connection
+        statements = connection.statements
 
-        def to_dict(row):
-            return dict(zip([t[0] for t in row.cursor_description], row))
+        key = ( sql, parameterized )
+        statement = statements.get( key )
+        if statement:
+            statements.move_to_end( key )
+            self.statementStats["hits"] += 1
+            return statement
 
-        result = []
-        # try to open database once. if not possible leave function
-        if not self.connect:
-            if not self.openDatabase( self.name ): # pragma: no cover
-                return result
+        self.statementStats["misses"] += 1
 
-        sql = sql.format( dbname=self.dbname )
-        # use with to close cursor automatically
-        try:
-            with self.connect.cursor() as cur:
-                cur.execute( sql )
+        statement_sql = sql
+        if self.engine == "pytds" and parameterized:
+            # pytds verwendet pyformat, % überall maskieren aber nur ? außerhalb von Literalen ersetzen
+            statement_sql = _placeholderPattern.sub(
+                lambda match: "%s" if match.group(0) == "?" else match.group(0),
+                sql.replace( "%", "%%" )
+            )
+        elif self.engine == "sqlite":
+            # sqlite kennt keine [database].[schema]. Angaben
+            statement_sql = re.sub( r"\[[^\]]*\]\.\[dbo\]\.", "", sql )
+
+        statement = {
+            "sql": statement_sql,
+            "cursor": None
+        }
+        if self.statementCacheSize <= 0:
+            return statement
+
+        statements[ key ] = statement
+        # die ältesten entfernen
+        while len( statements ) > self.statementCacheSize:
+            _, old = statements.popitem( last=False )
+            if old["cursor"]:
+                old["cursor"].close()
+
+        return statement
+
+    def getStatementStats( self ):
+        """Statistics of the prepared statement cache
 
-                if self.engine == "pyodbc":
-                    rows = cur.fetchall()
-                    result = [to_dict(row) for row in rows ]
+        Returns
+        -------
+        dict
+            hits, misses and the current size of the statement cache
+
+        """
+        return {
+            "hits": self.statementStats["hits"],
+            "misses": self.statementStats["misses"],
+            "size": len( self._connection.statements ) if self._connection else 0
+        }
+
+    def _cursor( self, connection:ispMssqlConnection, sql:str, params:list ):
+        """Execute the query on connection and return the cursor with the pending result
+
+        Parameters
+        ----------
+        connection : ispMssqlConnection
+            the connection to use
+        sql : str
+            sql query string with {dbname} already replaced
+        params : list
+            bound parameters for the placeholders in sql
+
+        Returns
+        -------
+        cursor
+            the executed cursor
+        bool
+            True if the cursor is not held by the statement cache and must be closed
+
+        """
+        statement = self.prepare( sql, len( params ) > 0, connection )
+        try:
+            if self.engine == "pyodbc":
+                # den cursor des statements wiederverwenden
+                if not statement["cursor"]:
+                    statement["cursor"] = connection.connect.cursor()
+                cur = statement["cursor"]
+                if params:
+                    cur.execute( statement["sql"], params )
                 else:
-                    result = cur.fetchall()
+                    cur.execute( statement["sql"] )
+                return cur, self.statementCacheSize <= 0
+            else:
+                cur = connection.connect.cursor()
+                cur.execute( statement["sql"], params or () )
+                return cur, True
+        except Exception:
+            # ein fehlerhaftes statement nicht weiter verwenden
+            connection.statements.pop( ( sql, len( params ) > 0 ), None )
+            if statement["cursor"]:
+                try:
+                    statement["cursor"].close()
+                except Exception:
+                    pass
+            raise
 
-        except Exception as err: # pragma: no cover
-            logger.warning( "mssqlClass.execute: {} ".format(err ) )
+    def _fetch( self, cur, mode:str="list" ):
+        """Fetch the complete result of an executed cursor
 
-        self.lastExecuteSql = sql
+        Parameters
+        ----------
+        cur : cursor
+            the executed cursor
+        mode : str, optional
+            - list: list of dicts (default)
+            - columns: dict with a list of values per column
+            - frame: pandas.DataFrame
+
+        Returns
+        -------
+        list|dict|pandas.DataFrame
+
+        """
+        columns = [ t[0] for t in cur.description ] if cur.description else []
+        rows = cur.fetchall() if columns else []
+        # pytds liefert dicts (as_dict=True), pyodbc Row Objekte
+        as_dict = len( rows ) > 0 and isinstance( rows[0], dict )
+
+        if mode == "columns":
+            if as_dict:
+                return { name: [ row[ name ] for row in rows ] for name in columns }
+            values = list( zip( *rows ) ) if rows else [ () ] * len( columns )
+            return { name: list( values[i] ) for i, name in enumerate( columns ) }
+        elif mode == "frame":
+            import pandas as pd
+            if as_dict:
+                return pd.DataFrame.from_records( rows, columns=columns )
+            return pd.DataFrame.from_records( [ tuple( row ) for row in rows ], columns=columns )
+
+        if as_dict:
+            return rows
+        return [ dict( zip( columns, row ) ) for row in rows ]
+
+    def _execute( self, connection:ispMssqlConnection, sql:str, params:list, mode:str="list" ):
+        """Execute the query on connection and fetch the complete result
+
+        Parameters
+        ----------
+        connection : ispMssqlConnection
+            the connection to use
+        sql : str
+            sql query string with {dbname} already replaced
+        params : list
+            bound parameters for the placeholders in sql
+        mode : str, optional
+            result mode see _fetch, default "list"
+
+        Returns
+        -------
+        list|dict|pandas.DataFrame
+            query result
+
+        """
+        cur, close = self._cursor( connection, sql, params )
+        try:
+            return self._fetch( cur, mode )
+        finally:
+            if close:
+                cur.close()
+
+    def _emptyResult( self, mode:str="list" ):
+        """Empty result for mode
+
+        """
+        if mode == "columns":
+            return {}
+        elif mode == "frame":
+            import pandas as pd
+            return pd.DataFrame()
+        return []
+
+    def execute( self, sql, params:list=None, mode:str="list", cache:str=None, refresh:bool=False ):
+        """Execute database Query
+
+        If not connected open database. With usePool a connection is borrowed from the pool,
+        a broken pooled connection is replaced and the query repeated once
+
+        With cache the result is taken from or stored in the ispMssqlResultCache
+        of the database configuration. Failed querys are not cached
+
+        holds last sqlquery in this.lastExecuteSql and the parameters in this.lastExecuteParams
+
+        Parameters
+        ----------
+        sql : str
+            sql query string, use ? as placeholder for params
+        params : list, optional
+            bound parameters for the placeholders in sql
+        mode : str, optional
+            - list: list of dicts from fetchall (default)
+            - stream: generator yielding dicts fetched in batches of database.<name>.fetch_size, raises on errors (see iterate)
+            - columns: dict with a list of values per column
+            - frame: pandas.DataFrame
+        cache : str, optional
+            query class for the result cache, None does not use the cache (default)
+        refresh : bool, optional
+            with cache ignore a cached result and store the new one. default False
+
+        Returns
+        -------
+        list|generator|dict|pandas.DataFrame
+            query result
+
+        """
+        resultCache = self.getResultCache() if cache else None
+        if mode == "stream" and not resultCache:
+            return self.iterate( sql, params )
+
+        params = list( params ) if params else []
+
+        resultMode = mode
+        if resultCache:
+            key = resultCache.key( sql.format( dbname=self.dbname ), params )
+            if refresh:
+                resultCache.discard( key )
+            columns = resultCache.get( key )
+            if columns is not None:
+                self.setLastExecute( sql.format( dbname=self.dbname ), params )
+                return resultCache.convert( columns, resultMode )
+            # im Cache werden die Spalten abgelegt
+            mode = "columns"
+
+        result = self._emptyResult( mode )
+        executed = False
+        error = None
+
+        pool = self.getPool() if self.usePool else None
+        if pool:
+            sql = sql.format( dbname=self.dbname )
+            # bei einer unterbrochenen Verbindung einmal mit einer neuen wiederholen
+            for attempt in range( 2 ):
+                connection = pool.checkout()
+                if not connection: # pragma: no cover
+                    error = ConnectionError( "mssqlClass.execute: no connection to '{}'".format( self.name ) )
+                    break
+                try:
+                    result = self._execute( connection, sql, params, mode )
+                    executed = True
+                except Exception as err: # pragma: no cover
+                    error = err
+                    alive = connection.ping()
+                    pool.checkin( connection, broken=not alive )
+                    logger.warning( "mssqlClass.execute: {} ".format(err ) )
+                    if alive:
+                        break
+                    continue
+                pool.checkin( connection )
+                break
+        else:
+            # try to open database once. if not possible leave function
+            if not self.connect:
+                if not self.openDatabase( self.name ): # pragma: no cover
+                    if resultMode == "stream":
+                        raise ConnectionError( "mssqlClass.execute: no connection to '{}'".format( self.name ) )
+                    return self._emptyResult( resultMode )
+
+            sql = sql.format( dbname=self.dbname )
+            try:
+                result = self._execute( self._connection, sql, params, mode )
+                executed = True
+            except Exception as err: # pragma: no cover
+                error = err
+                logger.warning( "mssqlClass.execute: {} ".format(err ) )
+
+        self.setLastExecute( sql, params )
+
+        if resultCache:
+            if not executed and resultMode == "stream" and error:
+                # wie iterate() den Fehler nicht als leeres Ergebnis liefern
+                raise error
+            if executed:
+                resultCache.put( key, cache, result )
+            return resultCache.convert( result, resultMode )
         return result
 
+    def iterate( self, sql, params:list=None, batchSize:int=None ):
+        """Execute database Query and yield the rows as dicts
+
+        The rows are fetched with fetchmany in batches of batchSize.
+        A pooled connection is held until the generator is exhausted or closed
+
+        Unlike execute() a failed query is not only logged, the error is raised
+        after the connection is checked in (as broken) so a truncated result can not
+        be mistaken for a complete one
+
+        Parameters
+        ----------
+        sql : str
+            sql query string, use ? as placeholder for params
+        params : list, optional
+            bound parameters for the placeholders in sql
+        batchSize : int, optional
+            rows per fetchmany, default database.<name>.fetch_size or 500
+
+        Yields
+        ------
+        dict
+            one result row
+
+        Raises
+        ------
+        ConnectionError
+            no connection to the database e.g. pool checkout timeout
+        Exception
+            the error of the failed query or fetch
+
+        """
+        params = list( params ) if params else []
+
+        pool = self.getPool() if self.usePool else None
+        if pool:
+            connection = pool.checkout()
+        else:
+            connection = None
+            if self.connect or self.openDatabase( self.name ):
+                connection = self._connection
+        if not connection:
+            raise ConnectionError( "mssqlClass.iterate: no connection to '{}'".format( self.name ) )
+
+        if not batchSize:
+            batchSize = int( self.config.database[ self.name ].get( "fetch_size", 500 ) )
+
+        sql = sql.format( dbname=self.dbname )
+        self.setLastExecute( sql, params )
+
+        broken = False
+        cur = None
+        close = False
+        try:
+            cur, close = self._cursor( connection, sql, params )
+            if cur.description:
+                columns = [ t[0] for t in cur.description ]
+                while True:
+                    rows = cur.fetchmany( batchSize )
+                    if not rows:
+                        break
+                    for row in rows:
+                        if isinstance( row, dict ):
+                            yield row
+                        else:
+                            yield dict( zip( columns, row ) )
+        except GeneratorExit:
+            # nicht komplett gelesen, die Verbindung nicht wiederverwenden
+            broken = True
+            raise
+        except Exception as err:
+            # der Zustand des cursors ist unbekannt, die Verbindung nicht wiederverwenden
+            broken = True
+            logger.warning( "mssqlClass.iterate: {} ".format(err ) )
+            raise
+        finally:
+            if cur and close:
+                try:
+                    cur.close()
+                except Exception: # pragma: no cover
+                    broken = True
+            if pool:
+                pool.checkin( connection, broken=broken )
+
     def getDbVersion(self):
         """Ask database for version
 
@@ -220,8 +1690,13 @@ class ispMssql( ):
             version result string
 
         """
-        result = self.execute( "select @@version as version" )
+        if not self.engine and self.name:
+            self._loadDatabaseConfig( self.name )
+        if self.engine == "sqlite":
+            result = self.execute( "select 'SQLite ' || sqlite_version() as version" )
+        else:
+            result = self.execute( "select @@version as version" )
         if len( result ) > 0:
             return str(result[0]["version"])
         else:
-            return ""
\ No newline at end of file
+            return ""
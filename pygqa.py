@@ -11,7 +11,7 @@ import sys
 import argparse
 
 from version import __version__
-from app import run, importPandas, exportPandas
+from app import run, importPandas, exportPandas, migrateDicomArchive
 
 # ----------------------------------------------------------------------------- 
 if __name__ == '__main__':
@@ -52,6 +52,19 @@ if __name__ == '__main__':
         help="Datenbank connection Angabe (ohne Angabe die aus config verwenden)",
     )
     
+
+    parser_archive = subparsers.add_parser( "archive",
+        help="Übernimmt die vorhandenen DICOM Dateien in das verteilte Verzeichnis mit Index"
+    )
+    parser_archive.add_argument( "-s", "--server",
+        default=None,
+        help="DICOM Server Eintrag (ohne Angabe dicom.servername aus config verwenden)",
+    )
+    parser_archive.add_argument( "--copy",
+        action="store_true",
+        default=False,
+        help="Dateien kopieren statt verschieben",
+    )
         
     # ohne Angaben immer webserver
     args = None
@@ -73,3 +86,5 @@ if __name__ == '__main__':
             importPandas( args.import_filename, args.connection )
         elif "export_filename" in args:
             exportPandas( args.export_filename, args.connection )
+        elif "copy" in args:
+            migrateDicomArchive( args.server, args.copy )
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Synthetische Aria Datenbank als SQLite Datei für Lasttests
+
+Erzeugt die Tabellen die in ariaClass.getImages und getTags verbunden werden
+(Patient, Course, PlanSetup, Radiation, ExternalField, SliceRT, Slice, Series,
+Study, ImageSlice, Image, MLCPlan) mit Indizes auf den Fremdschlüsseln.
+
+Pro Gerät (PatientId) gibt es einen Course pro Jahr, pro Monat testsPerMonth Tests
+als PlanSetup mit jeweils imagesPerTest Feldern (Radiation) und einer Aufnahme pro Feld.
+Die testTags werden reihum in [Radiation].[Comment] eingetragen.
+
+Die Datei wird in der Datenbank Konfiguration mit der engine sqlite verwendet::
+
+    "database": {
+        "servername": "synthetic",
+        "synthetic": {
+            "engine": "sqlite",
+            "dbname": "VARIAN",
+            "path": "{{BASE_DIR}}/data/synthetic.sqlite"
+        }
+    }
+
+Aufruf::
+
+    python tests/aria_generator.py <Datei> [--units 2] [--years 1] [--tests 10] [--images 10]
+
+"""
+
+import argparse
+from datetime import datetime, timedelta
+import os
+import random
+import sqlite3
+import time
+
+# Energie, AcqNote Energie, Dosisleistung
+energies = [
+    ( 6000, "6x", 600 ),
+    ( 6000, "6xFFF", 1400 ),
+    ( 10000, "10xFFF", 2400 )
+]
+
+# testTags falls keine angegeben werden
+defaultTags = [
+    "MT_4.1.2", "MT_LeafSpeed", "MT_8.02-1-2", "MT_8.02-3", "MT_VMAT_0.1",
+    "JT_4.2.2.1-A", "JT_7.2", "JT_7.3", "JT_10.3", "JT_LeafSpeed"
+]
+
+tables = {
+    "Patient": "[PatientSer] INTEGER PRIMARY KEY, [PatientId] TEXT, [FirstName] TEXT, [LastName] TEXT",
+    "Course": "[CourseSer] INTEGER PRIMARY KEY, [PatientSer] INTEGER, [CourseId] TEXT",
+    "PlanSetup": "[PlanSetupSer] INTEGER PRIMARY KEY, [CourseSer] INTEGER, [PlanSetupId] TEXT",
+    "Radiation": "[RadiationSer] INTEGER PRIMARY KEY, [PlanSetupSer] INTEGER, [RadiationId] TEXT, [TechniqueLabel] TEXT, [Comment] TEXT",
+    "ExternalField": "[RadiationSer] INTEGER PRIMARY KEY, [GantryRtn] REAL, [GantryRtnExt] TEXT, [GantryRtnDirection] TEXT, [StopAngle] REAL, [CollMode] TEXT",
+    "MLCPlan": "[RadiationSer] INTEGER PRIMARY KEY, [MLCPlanType] TEXT, [IndexParameterType] TEXT",
+    "Study": "[StudySer] INTEGER PRIMARY KEY, [StudyUID] TEXT",
+    "Series": "[SeriesSer] INTEGER PRIMARY KEY, [StudySer] INTEGER, [SeriesUID] TEXT, [FrameOfReferenceUID] TEXT, [SeriesId] TEXT, [SeriesNumber] INTEGER, [CreationDate] DATETIME",
+    "Slice": "[SliceSer] INTEGER PRIMARY KEY, [SeriesSer] INTEGER, [SliceUID] TEXT, [AcquisitionDateTime] DATETIME, [PatientSupportAngle] REAL, [FileName] TEXT, [SliceModality] TEXT",
+    "SliceRT": "[SliceSer] INTEGER PRIMARY KEY, [RadiationSer] INTEGER, [SliceRTType] TEXT, [AcqNote] TEXT, [Energy] INTEGER, [MetersetExposure] REAL, [DoseRate] INTEGER, [SAD] REAL, [GantryAngle] REAL, [CollRtn] REAL, [CollX1] REAL, [CollX2] REAL, [CollY1] REAL, [CollY2] REAL, [RadiationMachineName] TEXT",
+    "Image": "[ImageSer] INTEGER PRIMARY KEY, [ImageId] TEXT",
+    "ImageSlice": "[ImageSer] INTEGER, [SliceSer] INTEGER"
+}
+
+indexes = [
+    "[Patient] ([PatientId])", "[Course] ([PatientSer])", "[PlanSetup] ([CourseSer])", "[Radiation] ([PlanSetupSer])",
+    "[SliceRT] ([RadiationSer])", "[Slice] ([SeriesSer])", "[Slice] ([AcquisitionDateTime])", "[Series] ([StudySer])",
+    "[ImageSlice] ([SliceSer])"
+]
+
+def createAriaDatabase( filename:str, units:int=2, years:int=1, testsPerMonth:int=10, imagesPerTest:int=10,
+                       startYear:int=None, tags:list=None, seed:int=0 ):
+    """Synthetische Aria Datenbank erzeugen, eine vorhandene Datei wird ersetzt
+
+    Parameters
+    ----------
+    filename : str
+        SQLite Datei
+    units : int, optional
+        Anzahl der Geräte mit PatientId _QA Linac<n> und RadiationMachineName Linac-<n>. The default is 2.
+    years : int, optional
+        Anzahl der Jahre bis einschließlich startYear + years - 1. The default is 1.
+    testsPerMonth : int, optional
+        Tests pro Gerät und Monat. The default is 10.
+    imagesPerTest : int, optional
+        Aufnahmen pro Test. The default is 10.
+    startYear : int, optional
+        erstes Jahr, default aktuelles Jahr - years + 1
+    tags : list, optional
+        zu verwendende testTags. The default is defaultTags.
+    seed : int, optional
+        für random. The default is 0.
+
+    Returns
+    -------
+    dict
+        Anzahl der Zeilen pro Tabelle
+
+    """
+    if not startYear:
+        startYear = datetime.now().year - years + 1
+    if not tags:
+        tags = defaultTags
+    rnd = random.Random( seed )
+
+    if os.path.exists( filename ):
+        os.remove( filename )
+    db = sqlite3.connect( filename )
+    for table, columns in tables.items():
+        db.execute( "CREATE TABLE [{}] ({})".format( table, columns ) )
+
+    rows = { table: [] for table in tables }
+    ser = { table: 0 for table in tables }
+    def nextSer( table ):
+        ser[ table ] += 1
+        return ser[ table ]
+
+    for unit in range( 1, units + 1 ):
+        patientSer = nextSer( "Patient" )
+        rows["Patient"].append( ( patientSer, "_QA Linac{}".format( unit ), "QA", "Linac{}".format( unit ) ) )
+        machine = "Linac-{}".format( unit )
+        studySer = nextSer( "Study" )
+        rows["Study"].append( ( studySer, "1.2.826.0.1.{}".format( studySer ) ) )
+
+        for year in range( startYear, startYear + years ):
+            courseSer = nextSer( "Course" )
+            rows["Course"].append( ( courseSer, patientSer, "QA{}".format( year ) ) )
+
+            for month in range( 1, 13 ):
+                for test in range( testsPerMonth ):
+                    tag = tags[ ( month * testsPerMonth + test ) % len( tags ) ]
+                    energy, energyName, doserate = energies[ test % len( energies ) ]
+                    planSetupSer = nextSer( "PlanSetup" )
+                    rows["PlanSetup"].append( ( planSetupSer, courseSer, "{}-{:02d}-{}".format( tag, month, test ) ) )
+
+                    seriesSer = nextSer( "Series" )
+                    acquisition = datetime( year, month, 1 + test % 28, 7 ) + timedelta( minutes=rnd.randint( 0, 600 ) )
+                    rows["Series"].append( ( seriesSer, studySer, "1.2.826.0.2.{}".format( seriesSer ),
+                        "1.2.826.0.3.{}".format( seriesSer ), "S{}".format( seriesSer ), seriesSer, acquisition
+                    ) )
+
+                    for image in range( imagesPerTest ):
+                        radiationSer = nextSer( "Radiation" )
+                        gantry = float( rnd.choice( [ 0, 90, 180, 270 ] ) )
+                        rows["Radiation"].append( ( radiationSer, planSetupSer, "F{}".format( image + 1 ), "STATIC", tag ) )
+                        rows["ExternalField"].append( ( radiationSer, gantry, "NN", "NONE", None, "Symmetry" ) )
+                        if image % 2:
+                            rows["MLCPlan"].append( ( radiationSer, "DynamicMLC", "MU" ) )
+
+                        # Aufnahme pro Feld und jede fünfte zusätzlich ein DRR
+                        for sliceRTType in ( [ "Image", "SliceDRR" ] if image % 5 == 0 else [ "Image" ] ):
+                            sliceSer = nextSer( "Slice" )
+                            rows["Slice"].append( ( sliceSer, seriesSer, "1.2.826.0.4.{}".format( sliceSer ),
+                                acquisition + timedelta( seconds=image * 30 ), 0.0,
+                                "%%imagedir1\\Patients\\_{}\\SliceRT\\{}_id{}".format( patientSer, sliceSer, sliceSer ),
+                                "RTIMAGE"
+                            ) )
+                            rows["SliceRT"].append( ( sliceSer, radiationSer, sliceRTType,
+                                "{} [MV]\r\n{} [MU/min]\r\n".format( energyName, doserate ), energy,
+                                100.0, doserate, 1000.0, gantry, 0.0, -5.0, 5.0, -10.0, 10.0, machine
+                            ) )
+                            imageSer = nextSer( "Image" )
+                            rows["Image"].append( ( imageSer, "I{}".format( imageSer ) ) )
+                            rows["ImageSlice"].append( ( imageSer, sliceSer ) )
+
+    for table, values in rows.items():
+        if values:
+            db.executemany( "INSERT INTO [{}] VALUES ({})".format( table, ", ".join( ["?"] * len( values[0] ) ) ),
+                [ tuple( v.isoformat( " " ) if isinstance( v, datetime ) else v for v in row ) for row in values ]
+            )
+    for i, index in enumerate( indexes ):
+        db.execute( "CREATE INDEX [index_{}] ON {}".format( i, index ) )
+    db.commit()
+    db.close()
+
+    return { table: len( values ) for table, values in rows.items() }
+
+def main( argv=None ):
+    parser = argparse.ArgumentParser( description="Synthetische Aria Datenbank als SQLite Datei" )
+    parser.add_argument( "filename" )
+    parser.add_argument( "--units", type=int, default=2 )
+    parser.add_argument( "--years", type=int, default=1 )
+    parser.add_argument( "--tests", type=int, default=10, help="Tests pro Gerät und Monat" )
+    parser.add_argument( "--images", type=int, default=10, help="Aufnahmen pro Test" )
+    parser.add_argument( "--start", type=int, default=None, help="erstes Jahr" )
+    args = parser.parse_args( argv )
+
+    start = time.perf_counter()
+    counts = createAriaDatabase( args.filename, units=args.units, years=args.years,
+        testsPerMonth=args.tests, imagesPerTest=args.images, startYear=args.start
+    )
+    print( "{} in {:.1f} s".format( args.filename, time.perf_counter() - start ) )
+    for table, count in counts.items():
+        print( "{:<14} {:>9}".format( table, count ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Lasttest von getAllGQA, prepareGQA, getTagging und den Datenbank Abfragen von runTests
+
+Erzeugt mit tests/aria_generator.py eine synthetische Aria Datenbank und verwendet sie
+über die engine sqlite von ispMssql. Die testTags werden aus config.GQA übernommen.
+
+Die Auswertung der DICOM Daten in runTests wird nicht durchgeführt,
+gemessen werden die Abfragen aller Geräte mit getRunData.
+
+Aufruf::
+
+    python tests/benchmark_aria_load.py [Faktor] [Jahre]
+
+Faktor 1 entspricht 2 Geräten mit 10 Tests pro Monat und 10 Aufnahmen pro Test.
+
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ABSPATH = os.path.dirname( os.path.abspath( __file__ ) )
+BASEPATH = os.path.abspath( os.path.join( ABSPATH, ".." ) )
+sys.path.insert( 0, BASEPATH )
+sys.path.insert( 0, ABSPATH )
+
+from isp.config import ispConfig
+from aria_generator import createAriaDatabase
+
+def measure( name:str, func, *args, **kwargs ):
+    start = time.perf_counter()
+    result = func( *args, **kwargs )
+    print( "{:<14} {:8.2f} s".format( name, time.perf_counter() - start ) )
+    return result
+
+def main( factor:int=1, years:int=1 ):
+    config = ispConfig()
+    tags = [ item["tag"] for item in config.GQA.values() if "tag" in item ]
+    year = time.localtime().tm_year
+
+    path = os.path.join( tempfile.mkdtemp(), "synthetic.sqlite" )
+    counts = measure( "generate", createAriaDatabase, path, units=2, years=years,
+        testsPerMonth=10 * factor, imagesPerTest=10, startYear=year - years + 1, tags=tags
+    )
+    print( "Slice rows: {}".format( counts["Slice"] ) )
+
+    # Ergebnisse und PDF Dateien im temporären Verzeichnis
+    config["resultsPath"] = os.path.dirname( path )
+    config.database["gqa"]["connection"] = False
+
+    config.database["synthetic"] = {
+        "engine": "sqlite",
+        "dbname": "VARIAN",
+        "path": path,
+        "result_cache": False
+    }
+
+    from app.ariadicom import ariaDicomClass
+    adc = ariaDicomClass( "synthetic", config.get( "dicom.servername", "" ), config )
+
+    pids = [ pid for pid, unit in config.units.items() if unit ]
+    data = measure( "getAllGQA", adc.getAllGQA, pids=pids, year=year )
+    print( "tagNotFound: {} testNotFound: {}".format( len( data["tagNotFound"] ), len( data["testNotFound"] ) ) )
+
+    images, sql = measure( "getImages", adc.getImages, PatientId=pids, AcquisitionYear=year, addWhere="[Radiation].[Comment] <> ''", mode="frame" )
+    measure( "prepareGQA", adc.prepareGQA, images, year=year )
+    measure( "getTagging", adc.getTagging, art="test", pid=pids, output_format="html" )
+
+    for testId, item in config.GQA.items():
+        if "tag" in item:
+            runData = measure( "getRunData", adc.getRunData, pids=pids, year=year, month=1, testId=testId )
+            print( "{:<14} {}".format( testId, { pid: sum( len( v ) for v in energies.values() ) for pid, energies in runData.items() } ) )
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:3] ] )
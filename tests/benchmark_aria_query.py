@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Benchmark der getImages Filter an einer lokalen SQLite Datenbank
+
+Vergleicht YEAR()/MONTH() und CHARINDEX Filter mit den von ispMssqlQuery erzeugten
+halboffenen Datumsbereichen und Token Filtern.
+
+Gezählt werden die Zeilen die von der Datenbank gelesen und geprüft werden.
+Dafür wird die Funktion VISIT() als erste Bedingung eingefügt, sie wird für jede
+gelesene Zeile aufgerufen. Bei einem Bereich auf einer indizierten Spalte liest die
+Datenbank nur die passenden Zeilen über den Index.
+
+Aufruf::
+
+    python tests/benchmark_aria_query.py [Anzahl Jahre] [Bilder pro Tag]
+
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+ABSPATH = os.path.dirname( os.path.abspath( __file__ ) )
+BASEPATH = os.path.abspath( os.path.join( ABSPATH, ".." ) )
+sys.path.insert( 0, BASEPATH )
+
+from isp.mssql import ispMssqlQuery
+
+counter = { "visit": 0 }
+
+def visit( value ):
+    counter["visit"] += 1
+    return 1
+
+def createDatabase( years:int=5, perDay:int=20 ):
+    """Slice und Radiation Tabelle mit Index auf AcquisitionDateTime anlegen
+    """
+    db = sqlite3.connect( ":memory:" )
+    db.create_function( "VISIT", 1, visit )
+    # T-SQL Funktionen nachbilden
+    db.create_function( "YEAR", 1, lambda v: int( v[0:4] ) )
+    db.create_function( "MONTH", 1, lambda v: int( v[5:7] ) )
+    db.create_function( "DAY", 1, lambda v: int( v[8:10] ) )
+    db.create_function( "CHARINDEX", 2, lambda s, v: ( v or "" ).find( s ) + 1 )
+    db.execute( "CREATE TABLE [Radiation] ([RadiationSer] INTEGER PRIMARY KEY, [Comment] TEXT)" )
+    db.execute( "CREATE TABLE [Slice] ([SliceSer] INTEGER PRIMARY KEY, [SliceUID] TEXT, [RadiationSer] INTEGER, [AcquisitionDateTime] TEXT)" )
+    db.execute( "CREATE INDEX [Slice_AcquisitionDateTime] ON [Slice] ([AcquisitionDateTime])" )
+
+    tags = [ "MT-4_1_2", "MT-8_02-1-2", "JT-4_2_2_1-A", "JT-10_3", "JT-10_3_1", "MT-LeafSpeed:gating" ]
+    db.executemany( "INSERT INTO [Radiation] VALUES (?, ?)",
+        [ ( i, tag ) for i, tag in enumerate( tags ) ]
+    )
+
+    start = datetime( 2024 - years + 1, 1, 1 )
+    rows = []
+    ser = 0
+    for d in range( years * 365 ):
+        day = start + timedelta( days=d )
+        for n in range( perDay ):
+            ser += 1
+            rows.append( ( ser, "1.2.3.{}".format( ser ), ser % len( tags ),
+                ( day + timedelta( minutes=n ) ).strftime( "%Y-%m-%d %H:%M:%S" )
+            ) )
+    db.executemany( "INSERT INTO [Slice] VALUES (?, ?, ?, ?)", rows )
+    db.commit()
+    return db, len( rows )
+
+def run( db, name:str, sql:str, params:list ):
+    counter["visit"] = 0
+    plan = " / ".join( r[3] for r in db.execute( "EXPLAIN QUERY PLAN " + sql, params ) )
+    t = time.perf_counter()
+    result = db.execute( sql, params ).fetchall()
+    t = time.perf_counter() - t
+    print( "{:<12} rows: {:>7}  scanned: {:>7}  {:8.2f} ms  {}".format(
+        name, len( result ), counter["visit"], t * 1000, plan
+    ) )
+    return result
+
+def main( years:int=5, perDay:int=20 ):
+    db, total = createDatabase( years, perDay )
+    print( "Slice rows: {}".format( total ) )
+
+    fromSql = "[Slice] [Slice] INNER JOIN [Radiation] [Radiation] ON ([Slice].[RadiationSer] = [Radiation].[RadiationSer])"
+    columns = "SELECT [Slice].[SliceUID], [Slice].[AcquisitionDateTime], [Radiation].[Comment] FROM " + fromSql
+
+    year = 2024
+    for month, tags in [ ( None, None ), ( 4, None ), ( 4, [ "JT-10_3" ] ) ]:
+        print( "\nyear={} month={} testTags={}".format( year, month, tags ) )
+
+        # alter Filter
+        sql = columns + " WHERE VISIT([Slice].[SliceSer]) = 1 AND YEAR([Slice].[AcquisitionDateTime]) = ?"
+        params = [ year ]
+        if month:
+            sql += " AND MONTH([Slice].[AcquisitionDateTime]) = ?"
+            params.append( month )
+        if tags:
+            sql += " AND (" + " OR ".join( [ "CHARINDEX(?, [Radiation].[Comment] ) > 0" ] * len( tags ) ) + ")"
+            params.extend( tags )
+        old = run( db, "function", sql, params )
+
+        # neuer Filter
+        query = ispMssqlQuery( fromSql, engine="sqlite" )
+        query.select( "[Slice].[SliceUID]", "[Slice].[AcquisitionDateTime]", "[Radiation].[Comment]", "[Slice].[SliceUID]" )
+        query.where( "VISIT([Slice].[SliceSer]) = 1" )
+        query.whereDate( "[Slice].[AcquisitionDateTime]", year=year, month=month )
+        if tags:
+            query.whereTokens( "[Radiation].[Comment]", tags )
+        sql, params = query.build()
+        new = run( db, "range", sql, params )
+
+        if tags:
+            # CHARINDEX findet auch JT-10_3_1
+            print( "{:<12} {} substring matches removed".format( "", len( old ) - len( new ) ) )
+        else:
+            assert sorted( old ) == sorted( new )
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:3] ] )
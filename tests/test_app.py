@@ -54,6 +54,60 @@ from app import run
 from app.ariadicom import ariaDicomClass
 from app.aria import ariaClass
 
+def rtImage( pixels, rows: int=8, columns: int=None, slope: str="1", collimator=None, uid: str=None ):
+    """DicomImage aus einem im Speicher erzeugten RT Image mit 1mm Pixeln
+
+    Parameters
+    ----------
+    pixels : int, np.array
+        Wert aller Pixel oder array mit shape ( rows, columns )
+    rows : int, optional
+        Anzahl der Zeilen. The default is 8.
+    columns : int, optional
+        Anzahl der Spalten. The default is None für rows.
+    slope : str, optional
+        RescaleSlope. The default is "1".
+    collimator : int, optional
+        collimator in infos. The default is None.
+    uid : str, optional
+        SOPInstanceUID. The default is None.
+
+    Returns
+    -------
+    DicomImage
+    """
+    import numpy as np
+    from pydicom.dataset import Dataset, FileMetaDataset
+    from pydicom.uid import ImplicitVRLittleEndian, RTImageStorage
+    from app.image import DicomImage
+
+    columns = columns or rows
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+    ds.SOPClassUID = RTImageStorage
+    if uid:
+        ds.SOPInstanceUID = uid
+    ds.Rows = rows
+    ds.Columns = columns
+    ds.BitsAllocated = ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 0
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.RescaleSlope = slope
+    ds.ImagePlanePixelSpacing = [ 1, 1 ]
+    ds.RTImageSID = 1000
+    ds.RadiationMachineSAD = 1000
+    ds.is_little_endian = True
+    ds.is_implicit_VR = True
+    ds.PixelData = np.broadcast_to( np.asarray( pixels, dtype=np.uint16 ), ( rows, columns ) ).tobytes()
+
+    info = { "SOPClassUID": "RT Image Storage" }
+    if collimator is not None:
+        info["collimator"] = collimator
+    return DicomImage( { "info": info, "dicom": ds } )
+
 class testBase(testCaseBase):
     """
     setUp(), tearDown(), and __init__() will be called once per test.
@@ -464,6 +518,562 @@ class WebAppTest( testBase ):
         self.adc.closeAE()
         self.adc = None
         
+    def test_other_imageInfos(self):
+        ''' getImageInfosFrame liefert die gleichen Infos wie getImageInfos
+
+        '''
+        from datetime import datetime
+        from app.config import infoFields
+
+        aria = ariaClass()
+        aria.infoFields = infoFields
+
+        row = {
+            'PatientId': '_QA Linac1', 'CourseId': 'Jahrestest', 'PlanSetupId': '4Quadrant', 'RadiationId': 'X6 Q1',
+            'SeriesUID': '1.2.3', 'FrameOfReferenceUID': '1.2.4', 'SeriesId': 'S1', 'SeriesNumber': 1, 'CreationDate': datetime(2021, 3, 20),
+            'SliceUID': '1.2.5', 'StudyUID': '1.2.6', 'SliceRTType': 'Image', 'AcqNote': '6 [MV]\r\n600 [MU/min]\r\n',
+            'Energy': 6000, 'MetersetExposure': 100.4, 'DoseRate': 600, 'SAD': 1000, 'GantryAngle': 0.02, 'CollRtn': 359.98,
+            'CollX1': -5.04, 'CollX2': 5.06, 'CollY1': -10, 'CollY2': 10, 'RadiationMachineName': 'Linac-1',
+            'GantryRtn': 359.97, 'GantryRtnExt': 'NN', 'GantryRtnDirection': 'NONE', 'StopAngle': None, 'CollMode': 'Symmetry',
+            'AcquisitionDateTime': datetime(2021, 3, 20, 19, 7, 9, 510000), 'PatientSupportAngle': 90.0,
+            'FileName': '%%imagedir1\\Patients\\_716\\SliceRT\\1820744_id1432516', 'SliceModality': 'RTIMAGE',
+            'MLCPlanType': None, 'IndexParameterType': None, 'RadiationSer': 1234, 'TechniqueLabel': 'STATIC',
+            'Comment': 'MT-4_1_2 JT-10_3:gating\nMT-8_02', 'ImageId': 'I1'
+        }
+        rows = [ row, dict( row, SliceUID='1.2.7', AcqNote='Setup', Comment=None ) ]
+
+        infos = aria.getImageInfosFrame( pd.DataFrame( rows ) )
+        self.assertEqual( len( infos.index ), 2, "getImageInfosFrame Anzahl der Zeilen" )
+        self.assertEqual( infos["gantry"].dtype, "float64", "getImageInfosFrame gantry ist kein float" )
+        self.assertEqual( infos["ME"].dtype, "int64", "getImageInfosFrame ME ist kein int" )
+
+        for row, info in zip( rows, infos.to_dict( orient="records" ) ):
+            self.assertEqual( info, aria.getImageInfos( dict( row ) ), "getImageInfosFrame weicht von getImageInfos ab" )
+
+        self.assertEqual( len( aria.getImageInfosFrame( [] ).index ), 0, "getImageInfosFrame ohne Daten" )
+
+    def test_other_normalize(self):
+        ''' DicomImage rescale und ispCheckClass.normalize in computeDtype
+
+        '''
+        import numpy as np
+        from app.check import ispCheckClass
+
+        def image( value ):
+            return rtImage( value, slope="0.5", uid="1.2.3.{}".format( value ) )
+
+        check = image( 300 )
+        self.assertEqual( check.array.dtype, np.float32, "doRescaleSlope computeDtype" )
+        self.assertEqual( float( check.array[0, 0] ), 150.0, "doRescaleSlope RescaleSlope" )
+        self.assertEqual( int( check.metadata.pixel_array[0, 0] ), 300, "doRescaleSlope pixel_array unverändert" )
+
+        base = image( 200 )
+        original = check.array
+        ispCheckClass( check, base, "diff" )
+        self.assertTrue( np.allclose( check.array, 1.5 ), "normalize diff" )
+        self.assertIs( check.arrayOriginal, original, "normalize arrayOriginal ohne Kopie" )
+        self.assertEqual( float( base.array[0, 0] ), 100.0, "normalize baseImage unverändert" )
+
+        check = image( 300 )
+        original = check.array
+        ispCheckClass( check, base ).normalize( "prozent", keepOriginal=False )
+        self.assertTrue( np.allclose( check.array, 0.5 ), "normalize prozent" )
+        self.assertIs( check.array, original, "normalize keepOriginal=False überschreibt image.array" )
+        self.assertIsNone( check.arrayOriginal, "normalize keepOriginal=False ohne arrayOriginal" )
+
+        # Basis Bild und Kehrwert eines Laufs nur einmal aufbereiten
+        cache = {}
+        field = { "info": { "SOPClassUID": "RT Image Storage" }, "dicom": base.metadata }
+        base = ispCheckClass.getImage( field, cache )
+        self.assertIs( ispCheckClass.getImage( field, cache ), base, "getImage aus cache" )
+        self.assertFalse( base.array.flags.writeable, "getImage aus cache nur lesbar" )
+        first = ispCheckClass( image( 300 ), base, "diff", cache=cache )
+        second = ispCheckClass( image( 400 ), base, "prozent", cache=cache )
+        self.assertIs( second.baseReciprocal( first.image.computeDtype ), first.baseReciprocal( first.image.computeDtype ), "baseReciprocal aus cache" )
+        self.assertTrue( np.allclose( first.image.array, 1.5 ), "normalize diff mit cache" )
+        self.assertTrue( np.allclose( second.image.array, 1.0 ), "normalize prozent mit cache" )
+
+    def test_other_orientedArray(self):
+        ''' DicomImage Kollimator normalisierte Ansicht und Pixel Positionen darin
+
+        '''
+        import numpy as np
+
+        for collimator, k in [ ( 0, 0 ), ( 90, 3 ), ( 180, 2 ), ( 270, 1 ) ]:
+            image = rtImage( np.arange( 35 ).reshape( 5, 7 ), rows=5, columns=7, collimator=collimator )
+            view = image.orientedArray()
+            self.assertTrue( np.array_equal( view, np.rot90( image.array, k ) ), "orientedArray Kollimator {}".format( collimator ) )
+            self.assertIs( image.orientedArray(), view, "orientedArray wiederverwenden" )
+            if k:
+                self.assertTrue( np.shares_memory( view, image.array ), "orientedArray ohne Kopie" )
+
+            # cax liegt in der Ansicht auf dem gleichen Pixel
+            self.assertEqual( view[ image.mm2dots_Y( 0, oriented=True ), image.mm2dots_X( 0, oriented=True ) ],
+                image.array[ image.mm2dots_Y( 0 ), image.mm2dots_X( 0 ) ], "orientedCax Kollimator {}".format( collimator )
+            )
+
+            dots = image.getFieldDots( { "X1": -2, "X2": 2, "Y1": -1, "Y2": 1 }, oriented=True )
+            self.assertEqual( ( dots["X"], dots["Y"] ), ( 4, 2 ), "getFieldDots oriented Kollimator {}".format( collimator ) )
+
+    def test_other_imageStack(self):
+        ''' DicomImageStack ROI Statistik aller Bilder in einem Aufruf
+
+        '''
+        import numpy as np
+        from app.image import DicomImageStack
+
+        def image( value, collimator=0 ):
+            return rtImage( np.arange( 81 ).reshape( 9, 9 ) + value, rows=9, collimator=collimator )
+
+        images = [ image( 0 ), image( 100 ), image( 200, 90 ) ]
+        rois = {
+            "center": { "X1": -1, "X2": 1, "Y1": -1, "Y2": 1 },
+            "left": { "X1": -4, "X2": -1, "Y1": -2, "Y2": 3 }
+        }
+        stack = DicomImageStack( images, index=[ "a", "b", "c" ] )
+        self.assertEqual( stack.array.shape, ( 3, 9, 9 ), "DicomImageStack shape" )
+        self.assertFalse( np.shares_memory( stack.array, images[0].array ), "DicomImageStack eigenes array" )
+
+        df = stack.roiStats( rois, [ "mean", "max" ] )
+        self.assertEqual( list( df.index ), [ "a", "b", "c" ], "roiStats index" )
+        self.assertEqual( list( df.columns ), [ "center_mean", "center_max", "left_mean", "left_max" ], "roiStats columns" )
+        for i, name in enumerate( df.index ):
+            for roi, field in rois.items():
+                self.assertAlmostEqual( df.loc[ name, roi + "_mean" ], images[ i ].getRoi( field ).mean(), 4, "roiStats mean {} {}".format( name, roi ) )
+                self.assertEqual( df.loc[ name, roi + "_max" ], images[ i ].getRoi( field ).max(), "roiStats max {} {}".format( name, roi ) )
+
+        self.assertEqual( list( stack.roiStats( rois ).columns ), [ "center", "left" ], "roiStats ein stat" )
+
+        # ohne Bereich die Feldgröße aus infos wie getFieldRoi
+        for i, img in enumerate( images ):
+            img.infos.update( { "X1": -3, "X2": 1, "Y1": -2, "Y2": 2 } )
+        delta = stack.roiStats( { "delta": None } )["delta"]
+        for i, name in enumerate( delta.index ):
+            self.assertAlmostEqual( delta[ name ], images[ i ].getFieldRoi().mean(), 4, "roiStats Feldgröße {}".format( name ) )
+        with self.assertRaises( ValueError ):
+            stack.roiStats( rois, [ "median" ] )
+        with self.assertRaises( ValueError ):
+            DicomImageStack( [ images[0], image( 0 ).cropField( rois[ "left" ] ) ] )
+
+    def test_other_integralImage(self):
+        ''' DicomImage Summentabelle für viele Bereiche eines Bildes
+
+        '''
+        import numpy as np
+        from pylinac.core.geometry import Point
+        from pylinac.vmat import Segment
+        from app.image import DicomImageStack
+        from app.check import ispCheckClass
+        from app.qa.vmat import qa_segment
+
+        rng = np.random.default_rng( 42 )
+
+        def image( collimator=0 ):
+            return rtImage( rng.integers( 20000, 40000, ( 50, 50 ) ), rows=50, slope="0.5", collimator=collimator )
+
+        rois = []
+        for x in range( -20, 20, 5 ):
+            for y in range( -20, 20, 6 ):
+                rois.append( { "X1": x, "X2": x + 4, "Y1": y, "Y2": y + 5 } )
+
+        check = image()
+        for field in rois[ :check.integralMinRois ]:
+            check.getRoiStat( field )
+        self.assertIsNone( check._integral, "integralImage erst nach integralMinRois" )
+        for field in rois:
+            roi = check.getRoi( field )
+            for stat in [ "sum", "mean", "var", "std" ]:
+                self.assertTrue( np.isclose( check.getRoiStat( field, stat ), getattr( roi, stat )( dtype=np.float64 ), rtol=1e-6 ),
+                    "getRoiStat {} {}".format( stat, field )
+                )
+        table = check._integral["sum"]
+        check.getRoiStat( rois[0] )
+        self.assertIs( check._integral["sum"], table, "integralImage einmal pro array" )
+
+        # normalize ersetzt oder überschreibt array, Summentabelle neu berechnen
+        base = image()
+        ispCheckClass( check, base ).normalize( "diff", keepOriginal=False )
+        self.assertIsNone( check._integral, "integralReset nach normalize" )
+        for field in rois:
+            self.assertTrue( np.isclose( check.getRoiStat( field ), check.getRoi( field ).mean( dtype=np.float64 ), rtol=1e-6 ), "getRoiStat nach normalize" )
+        check.array = check.array * 2
+        self.assertTrue( np.isclose( check.getRoiStat( rois[0] ), check.getRoi( rois[0] ).mean( dtype=np.float64 ), rtol=1e-6 ), "getRoiStat nach neuem array" )
+
+        # stack mit vielen Bereichen
+        images = [ image(), image( 90 ) ]
+        stack = DicomImageStack( images )
+        df = stack.roiStats( { str( i ): field for i, field in enumerate( rois ) }, [ "mean", "std", "max" ] )
+        self.assertIsNotNone( stack._integral, "DicomImageStack integralImage" )
+        for i, img in enumerate( images ):
+            for n, field in enumerate( rois ):
+                roi = img.getRoi( field )
+                self.assertTrue( np.isclose( df.loc[ i, "{}_mean".format( n ) ], roi.mean( dtype=np.float64 ), rtol=1e-6 ), "roiStats mean" )
+                self.assertTrue( np.isclose( df.loc[ i, "{}_std".format( n ) ], roi.std( dtype=np.float64 ), rtol=1e-6 ), "roiStats std" )
+                self.assertEqual( df.loc[ i, "{}_max".format( n ) ], roi.max(), "roiStats max" )
+
+        # VMAT Segmente
+        open_image, dmlc_image = image(), image()
+        Segment._nominal_width_mm = 5
+        Segment._nominal_height_mm = 20
+        for x in [ 10, 20, 30 ]:
+            point = Point( x, 20 )
+            self.assertTrue( np.isclose(
+                qa_segment( point, open_image, dmlc_image, 0 ).r_corr,
+                Segment( point, open_image, dmlc_image, 0 ).r_corr, rtol=1e-5 ), "qa_segment r_corr"
+            )
+
+    def test_other_tagIndex(self):
+        ''' gqaTagIndex ordnet die Aufnahmen über testTag, subTag, energy und Monat zu
+
+        '''
+        from app.tagindex import gqaTestMap, gqaTagIndex
+
+        testMap = gqaTestMap( {
+            "JT-10_3": { "tag": "JT_10.3", "Linac-1": { "energyFields": { "6x": 2 } } },
+            "MT-8_02": { "tag": "MT_8.02", "info": { "inaktiv": "ersetzt" }, "Linac-1": { "energyFields": { "6x": 1 } } }
+        } )
+        self.assertEqual( testMap.tagTests, { "JT_10.3": "JT-10_3", "MT_8.02": "MT-8_02" }, "gqaTestMap tagTests" )
+
+        infos = pd.DataFrame( [
+            { "SliceUID": "1", "unit": "Linac-1", "energy": "6x", "testTags": [ "JT_10.3", "MT_8.02" ], "subTags": [ "", "" ], "AcquisitionYear": 2021, "AcquisitionMonth": 3 },
+            { "SliceUID": "2", "unit": "Linac-1", "energy": "6x", "testTags": [ "JT_10.3" ], "subTags": [ "gating" ], "AcquisitionYear": 2021, "AcquisitionMonth": 4 },
+            { "SliceUID": "3", "unit": "Linac-1", "energy": "15x", "testTags": [ "JT_10.3", "XX" ], "subTags": [ "", "" ], "AcquisitionYear": 2021, "AcquisitionMonth": 4 },
+            { "SliceUID": "4", "unit": "Linac-1", "energy": "6x", "testTags": [], "subTags": [], "AcquisitionYear": 2021, "AcquisitionMonth": 4 }
+        ] )
+        index = gqaTagIndex( infos, testMap )
+
+        self.assertEqual( index.index["JT_10.3"]["gating"], { "6x": { 4: [ "2" ] } }, "gqaTagIndex index subTag" )
+        self.assertEqual( index.sliceUIDs( "JT_10.3" ), { "6x": [ "1", "2" ], "15x": [ "3" ] }, "gqaTagIndex sliceUIDs" )
+        self.assertEqual( index.sliceUIDs( [ "JT_10.3" ], subTag="", month=4 ), { "15x": [ "3" ] }, "gqaTagIndex sliceUIDs Filter" )
+        self.assertEqual( index.tagNotFound(), { "XX": "XX" }, "gqaTagIndex tagNotFound" )
+        self.assertEqual( index.inactiv(), [ "ersetzt" ], "gqaTagIndex inactiv" )
+        self.assertEqual( index.testNotFound(), [ "GQA.JT-10_3.Linac-1.energyFields.15x" ], "gqaTagIndex testNotFound" )
+
+        counts = index.counts().to_dict( orient="records" )
+        self.assertEqual( counts, [
+            { "testId": "JT-10_3", "unit": "Linac-1", "dateFlag": "0", "energy": "6x", "counts": 2, "energyFields": 2, "ready": True }
+        ], "gqaTagIndex counts" )
+        self.assertEqual( index.counts( cached={ "2" } )["cached"].tolist(), [ 1 ], "gqaTagIndex counts cached" )
+        self.assertEqual( len( index.periods().index ), 2, "gqaTagIndex periods" )
+
+        self.assertEqual( gqaTagIndex( infos.iloc[0:0], testMap ).sliceUIDs( "JT_10.3" ), {}, "gqaTagIndex ohne Daten" )
+
+    def test_other_syntheticAria(self):
+        ''' ariaClass mit der engine sqlite auf einer synthetischen Aria Datenbank
+
+        '''
+        from isp.config import ispConfig
+        from aria_generator import createAriaDatabase
+
+        filename = osp.join( FILESPATH, "synthetic.sqlite" )
+        counts = createAriaDatabase( filename, units=1, years=1, testsPerMonth=2, imagesPerTest=5,
+            startYear=2021, tags=[ "MT_4.1.2", "JT_10.3" ]
+        )
+        self.assertEqual( counts["Radiation"], 120, "createAriaDatabase Anzahl der Felder" )
+
+        config = ispConfig()
+        config.database["synthetic"] = { "engine": "sqlite", "dbname": "VARIAN", "path": filename, "result_cache": False }
+        aria = ariaClass( "synthetic", config )
+        self.assertIn( "SQLite", aria.getDbVersion(), "getDbVersion ohne SQLite" )
+
+        images, sql = aria.getImages( "_QA Linac1", AcquisitionYear=2021, AcquisitionMonth=3, mode="frame" )
+        self.assertEqual( len( images.index ), 10, "getImages Anzahl der Bilder im Monat" )
+        self.assertEqual( images["AcquisitionDateTime"].dt.month.unique().tolist(), [ 3 ], "getImages AcquisitionDateTime" )
+
+        images, sql = aria.getImages( "_QA Linac1", AcquisitionYear=2021, testTags=[ "JT_10.3" ] )
+        self.assertEqual( len( images ), 60, "getImages Anzahl der Bilder mit testTag" )
+
+        tags = aria.getTags( "_QA Linac1" )
+        self.assertEqual( len( tags ), 144, "getTags Anzahl der Tags" )
+
+    def test_other_ariaParallel(self):
+        ''' getRunData mit mehreren Geräten gleichzeitig auf einer synthetischen Aria Datenbank
+
+        '''
+        import threading
+        import time
+        from isp.config import ispConfig
+        from aria_generator import createAriaDatabase
+
+        filename = osp.join( FILESPATH, "parallel_aria.sqlite" )
+        createAriaDatabase( filename, units=3, years=1, testsPerMonth=2, imagesPerTest=5, startYear=2021, tags=[ "MT_4.1.2", "JT_10.3" ] )
+
+        config = ispConfig()
+        config.units["_QA Linac3"] = "Linac-3"
+        pids = [ "_QA Linac1", "_QA Linac2", "_QA Linac3" ]
+
+        def runData( parallel ):
+            name = "parallel{}".format( parallel )
+            config.database[ name ] = { "engine": "sqlite", "dbname": "VARIAN", "path": filename, "result_cache": False, "parallel": parallel }
+            with self.app.application.app_context():
+                adc = ariaDicomClass( name, "VMSDBD", config )
+            self.assertEqual( adc.getParallel(), parallel, "getParallel aus database.<name>.parallel" )
+            return adc, adc.getRunData( pids, year=2021, month=3, testId="MT-4_1_2" )
+
+        # seriell und gleichzeitig ergibt die selbe Struktur
+        serial, serialData = runData( 1 )
+        parallel, parallelData = runData( 2 )
+        self.assertEqual( list( parallelData.keys() ), pids, "getRunData Reihenfolge der PatientIds" )
+        for pid in pids:
+            self.assertGreater( len( parallelData[ pid ] ), 0, "getRunData ohne Daten für {}".format( pid ) )
+        self.assertEqual(
+            json.dumps( parallelData, default=str, sort_keys=True ),
+            json.dumps( serialData, default=str, sort_keys=True ),
+            "getRunData parallel anders als seriell"
+        )
+
+        # database.<name>.parallel begrenzt die gleichzeitigen Aufrufe
+        running = { "now": 0, "max": 0 }
+        lock = threading.Lock()
+        def getTestData( **kwargs ):
+            with lock:
+                running["now"] += 1
+                running["max"] = max( running["max"], running["now"] )
+            time.sleep( 0.1 )
+            try:
+                return parallel.getImages( kwargs["PatientId"], AcquisitionYear=2021, mode="frame" )[0]
+            finally:
+                with lock:
+                    running["now"] -= 1
+
+        parallel.getImages( "_QA Linac1", AcquisitionYear=2021, AcquisitionMonth=3 )
+        lastSql = parallel.lastExecuteSql
+        lastParams = parallel.lastExecuteParams
+
+        calls = [ { "PatientId": pid } for pid in pids * 2 ]
+        frames = parallel.executeParallel( getTestData, calls )
+        self.assertEqual( running["max"], 2, "executeParallel mehr worker als database.<name>.parallel" )
+        self.assertEqual( len( frames ), 6, "executeParallel Anzahl der Ergebnisse" )
+        for call, frame in zip( calls, frames ):
+            self.assertEqual( frame["PatientId"].unique().tolist(), [ call["PatientId"] ], "executeParallel Reihenfolge der Ergebnisse" )
+
+        # die worker threads setzen lastExecuteSql nicht
+        self.assertEqual( parallel.lastExecuteSql, lastSql, "lastExecuteSql aus einem worker thread" )
+        self.assertEqual( parallel.lastExecuteParams, lastParams, "lastExecuteParams aus einem worker thread" )
+
+    def test_other_prefetchTestImages(self):
+        ''' runTests holt die Aufnahmen der nächsten Energie während der Auswertung der aktuellen
+
+        '''
+        import threading
+        import time
+        import numpy as np
+        from types import SimpleNamespace
+        from pydicom.dataset import Dataset, FileMetaDataset
+        from pydicom.uid import ImplicitVRLittleEndian
+        from isp.config import ispConfig
+        from aria_generator import createAriaDatabase
+
+        filename = osp.join( FILESPATH, "prefetch_aria.sqlite" )
+        createAriaDatabase( filename, units=1, years=1, testsPerMonth=1, imagesPerTest=1, startYear=2021, tags=[ "MT_4.1.2" ] )
+
+        config = ispConfig()
+        config.set( [ "resultsPath" ], osp.join( FILESPATH, "results" ) )
+        config.database["prefetch"] = { "engine": "sqlite", "dbname": "VARIAN", "path": filename, "result_cache": False }
+        with self.app.application.app_context():
+            adc = ariaDicomClass( "prefetch", "VMSDBD", config )
+        # ohne Ergebnis Dateien
+        adc.pd_results = SimpleNamespace( upsert=lambda result: None, write=lambda: None )
+
+        def dataset( uid ):
+            ds = Dataset()
+            ds.file_meta = FileMetaDataset()
+            ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+            ds.SOPInstanceUID = uid
+            ds.Rows = ds.Columns = 8
+            ds.BitsAllocated = ds.BitsStored = 16
+            ds.HighBit = 15
+            ds.PixelRepresentation = 0
+            ds.SamplesPerPixel = 1
+            ds.PhotometricInterpretation = "MONOCHROME2"
+            ds.PixelData = np.arange( 64, dtype=np.uint16 ).tobytes()
+            return ds
+
+        # die Aufrufe mit Energie und ob sie aus dem prefetch kommen mitschreiben
+        main = threading.current_thread()
+        events = []
+        failing = []
+        lock = threading.Lock()
+        def record( *event ):
+            with lock:
+                events.append( event )
+
+        def retrieveTestImages( data, override=False, subPath="", progress=None ):
+            energy = next( iter( data.values() ) )["energy"]
+            prefetch = not threading.current_thread() is main
+            record( "retrieve", energy, prefetch )
+            if prefetch and energy in failing:
+                raise ValueError( "prefetch" )
+            time.sleep( 0.05 )
+            record( "retrieved", energy, prefetch )
+            # ohne passende SOPInstanceUID beendet doTestType nach dem holen die Auswertung
+            return { "9." + uid: dataset( "9." + uid ) for uid in data }, []
+        adc.retrieveTestImages = retrieveTestImages
+
+        doTestType = adc.doTestType
+        def evaluate( testId, data=None, payload={}, images=None, retrieved=None ):
+            result = doTestType( testId, data=data, payload=payload, images=images, retrieved=retrieved )
+            record( "evaluate", payload["energy"], images is None )
+            time.sleep( 0.2 )
+            record( "evaluated", payload["energy"] )
+            return result
+        adc.doTestType = evaluate
+
+        energies = [ "6x", "6xFFF", "10xFFF" ]
+        def runTests():
+            events.clear()
+            data = { energy: { "1.2.{}".format( i ): {
+                "energy": energy, "PatientId": "_QA Linac1", "ImageId": "MT_4.1.2", "testTags": [ "MT_4.1.2" ]
+            } } for i, energy in enumerate( energies ) }
+            adc.runTests( pid="_QA Linac1", year=2021, month=3, testId="MT-4_1_2", data=data, unittest=True )
+            retrieves = [ event[1:] for event in events if event[0] == "retrieve" ]
+            fetched = [ event[2] for event in events if event[0] == "evaluate" ]
+            return retrieves, fetched
+
+        # die nächste Energie wird während der Auswertung geholt
+        retrieves, fetched = runTests()
+        self.assertEqual( retrieves, [ ( "6x", False ), ( "6xFFF", True ), ( "10xFFF", True ) ], "prefetch Aufrufe" )
+        self.assertEqual( fetched, [ True, False, False ], "doTestType mit den Aufnahmen aus dem prefetch" )
+        for current, following in zip( energies, energies[1:] ):
+            self.assertLess( events.index( ( "retrieved", following, True ) ), events.index( ( "evaluated", current ) ),
+                "prefetch {} während der Auswertung von {}".format( following, current )
+            )
+
+        # bei einem Fehler holt doTestType die Aufnahmen selbst
+        failing.append( "6xFFF" )
+        retrieves, fetched = runTests()
+        self.assertEqual( retrieves, [ ( "6x", False ), ( "6xFFF", True ), ( "6xFFF", False ), ( "10xFFF", True ) ], "prefetch Fehler" )
+        self.assertEqual( fetched, [ True, True, False ], "doTestType nach einem prefetch Fehler" )
+
+        # ohne prefetchBytes kein prefetch
+        adc.prefetchBytes = 0
+        retrieves, fetched = runTests()
+        self.assertEqual( retrieves, [ ( energy, False ) for energy in energies ], "ohne prefetchBytes" )
+
+        # höchstens prefetchBytes dekodieren, ein Bild mit Array belegt 2 * 8 * 8 * 2 Bytes
+        adc.prefetchBytes = 600
+        result, signals = adc.prefetchTestImages( { "1.2.{}".format( i ): { "energy": "6x" } for i in range( 3 ) } ).result( timeout=30 )
+        decoded = [ ds._pixel_array is not None for ds in result.values() ]
+        self.assertEqual( decoded, [ True, True, False ], "prefetchTestImages prefetchBytes" )
+
+    def test_other_ariaMirror(self):
+        ''' getImages aus dem lokalen Spiegel einer synthetischen Aria Datenbank
+
+        '''
+        import sqlite3
+        import threading
+        import time
+        import types
+        from isp.config import ispConfig
+        from aria_generator import createAriaDatabase
+        from app.aria import imageFrom
+        from app.ariamirror import ariaMirror
+
+        filename = osp.join( FILESPATH, "mirror_aria.sqlite" )
+        createAriaDatabase( filename, units=2, years=1, testsPerMonth=2, imagesPerTest=5, startYear=2021, tags=[ "MT_4.1.2", "JT_10.3" ] )
+        mirrorPath = osp.join( FILESPATH, "mirror" )
+        if osp.isfile( osp.join( mirrorPath, "mirrortest.sqlite" ) ):
+            os.remove( osp.join( mirrorPath, "mirrortest.sqlite" ) )
+
+        config = ispConfig()
+        config.database["mirrortest"] = { "engine": "sqlite", "dbname": "VARIAN", "path": filename, "result_cache": False,
+            "mirror": { "path": mirrorPath, "max_age": 0.2 }
+        }
+        config.database["directtest"] = { "engine": "sqlite", "dbname": "VARIAN", "path": filename, "result_cache": False }
+        aria = ariaClass( "mirrortest", config )
+        direct = ariaClass( "directtest", config )
+
+        # Abfragen an Aria mitschreiben
+        fetches = []
+        execute = aria.execute
+        def recordExecute( sql, params=None, mode="list", **kwargs ):
+            fetches.append( sql )
+            return execute( sql, params, mode=mode, **kwargs )
+        aria.execute = recordExecute
+
+        def frame( db, **kwargs ):
+            images, sql = db.getImages( "_QA Linac1", mode="frame", **kwargs )
+            return images.sort_values( "SliceUID" ).reset_index( drop=True )
+
+        def assertSame( msg, **kwargs ):
+            pd.testing.assert_frame_equal( frame( aria, **kwargs ), frame( direct, **kwargs ), check_dtype=False, obj=msg )
+
+        # erster Abgleich holt alle Bilder der PatientId
+        assertSame( "getImages aus dem Spiegel", AcquisitionYear=2021 )
+        self.assertEqual( len( fetches ), 1, "ariaMirror sync beim ersten Aufruf" )
+        self.assertNotIn( "[Slice].[SliceSer] >", fetches[0], "ariaMirror erster sync vollständig" )
+        assertSame( "getImages mit testTags aus dem Spiegel", AcquisitionYear=2021, AcquisitionMonth=3, testTags=[ "JT_10.3" ] )
+        self.assertEqual( len( fetches ), 1, "ariaMirror innerhalb max_age kein sync" )
+
+        # ein neues Bild mit höherer SliceSer
+        db = sqlite3.connect( filename )
+        sliceSer, = db.execute( "SELECT MAX([SliceSer]) FROM [Slice]" ).fetchone()
+        source, = db.execute( "SELECT MIN([SliceRT].[SliceSer]) FROM [SliceRT] INNER JOIN [Slice] ON [Slice].[SliceSer] = [SliceRT].[SliceSer]"
+            " INNER JOIN [Series] ON [Series].[SeriesSer] = [Slice].[SeriesSer] WHERE [Series].[StudySer] = 1 AND [SliceRTType] = 'Image'"
+        ).fetchone()
+        db.execute( "INSERT INTO [Slice] SELECT ?, [SeriesSer], '1.2.826.0.9.1', '2021-12-31 12:00:00', [PatientSupportAngle], [FileName], [SliceModality]"
+            " FROM [Slice] WHERE [SliceSer] = ?", [ sliceSer + 1, source ] )
+        db.execute( "INSERT INTO [SliceRT] SELECT ?, [RadiationSer], [SliceRTType], [AcqNote], [Energy], [MetersetExposure], [DoseRate], [SAD],"
+            " [GantryAngle], [CollRtn], [CollX1], [CollX2], [CollY1], [CollY2], [RadiationMachineName] FROM [SliceRT] WHERE [SliceSer] = ?", [ sliceSer + 1, source ] )
+        db.execute( "INSERT INTO [Image] VALUES ( 99999, 'I99999' )" )
+        db.execute( "INSERT INTO [ImageSlice] VALUES ( 99999, ? )", [ sliceSer + 1 ] )
+        db.commit()
+        db.close()
+
+        # nach max_age ein inkrementeller Abgleich
+        time.sleep( 0.3 )
+        assertSame( "getImages nach inkrementellem sync", AcquisitionYear=2021 )
+        self.assertEqual( len( fetches ), 2, "ariaMirror sync nach max_age" )
+        self.assertIn( "[Slice].[SliceSer] >", fetches[1], "ariaMirror sync inkrementell" )
+        self.assertIn( "1.2.826.0.9.1", frame( aria, AcquisitionYear=2021, AcquisitionMonth=12 )["SliceUID"].tolist(), "ariaMirror neues Bild" )
+
+        mirror = aria.getMirror()
+        stats = mirror.getStats()["patients"]["_QA Linac1"]
+        self.assertEqual( stats["SliceSer"], sliceSer + 1, "ariaMirror high-water mark SliceSer" )
+        self.assertEqual( stats["rows"], len( frame( direct ).index ), "ariaMirror rows" )
+
+        # ein fehlgeschlagener Abruf ändert weder die Zeilen noch den high-water mark
+        cursor = aria._cursor
+        def failingCursor( self, connection, sql, params ):
+            raise sqlite3.OperationalError( "failingCursor" )
+        aria._cursor = types.MethodType( failingCursor, aria )
+        count = len( fetches )
+        assertSame( "getImages mit refresh nach fehlgeschlagenem sync", AcquisitionYear=2021, refresh=True )
+        self.assertEqual( mirror.getStats()["patients"]["_QA Linac1"], stats, "ariaMirror high-water mark nach fehlgeschlagenem sync" )
+        time.sleep( 0.3 )
+        assertSame( "getImages nach fehlgeschlagenem inkrementellem sync", AcquisitionYear=2021 )
+        self.assertEqual( mirror.getStats()["patients"]["_QA Linac1"], stats, "ariaMirror high-water mark nach fehlgeschlagenem inkrementellem sync" )
+        self.assertEqual( len( fetches ), count + 2, "ariaMirror sync Versuche" )
+        # ohne neuen synced Zeitpunkt wird beim nächsten Aufruf erneut abgeglichen
+        aria._cursor = cursor
+        assertSame( "getImages nach erneutem sync", AcquisitionYear=2021 )
+        self.assertEqual( len( fetches ), count + 3, "ariaMirror sync nach fehlgeschlagenem sync" )
+        self.assertGreater( mirror.getStats()["patients"]["_QA Linac1"]["synced"], stats["synced"], "ariaMirror synced nach erneutem sync" )
+
+        # execute modes
+        sql = "SELECT [Slice.SliceUID] AS [SliceUID] FROM [images] WHERE [Patient.PatientId] = ? ORDER BY [Slice.SliceUID]"
+        rows = mirror.execute( sql, [ "_QA Linac1" ] )
+        self.assertEqual( list( mirror.execute( sql, [ "_QA Linac1" ], mode="stream" ) ), rows, "ariaMirror execute stream" )
+        self.assertEqual( mirror.execute( sql, [ "_QA Linac1" ], mode="columns" ), { "SliceUID": [ row["SliceUID"] for row in rows ] }, "ariaMirror execute columns" )
+        self.assertEqual( mirror.execute( sql, [ "_QA Linac1" ], mode="frame" )["SliceUID"].tolist(), [ row["SliceUID"] for row in rows ], "ariaMirror execute frame" )
+
+        # der Abgleich einer PatientId wartet nicht auf den einer anderen
+        with mirror._patientLock( "_QA Linac1" ):
+            thread = threading.Thread( target=mirror.sync, args=( "_QA Linac2", ) )
+            thread.start()
+            thread.join( 10 )
+            self.assertFalse( thread.is_alive(), "ariaMirror sync wartet auf andere PatientId" )
+        self.assertIn( "_QA Linac2", mirror.getStats()["patients"], "ariaMirror sync zweite PatientId" )
+
+        # geänderte Spalten bauen den Spiegel neu auf
+        ariaMirror( aria, mirror.filename, [ "[Slice].[SliceUID]" ], imageFrom )
+        db = sqlite3.connect( mirror.filename )
+        columns = [ row[1] for row in db.execute( "PRAGMA table_info([images])" ).fetchall() ]
+        marks = db.execute( "SELECT COUNT(*) FROM [sync]" ).fetchone()[0]
+        db.close()
+        self.assertEqual( columns, [ "Slice.SliceUID", "Patient.PatientId", "Slice.AcquisitionDateTime", "Slice.SliceSer" ], "ariaMirror neue Spalten" )
+        self.assertEqual( marks, 0, "ariaMirror ohne high-water mark nach neuen Spalten" )
+
     def test_other_Tagging(self):
         ''' Gibt eine Liste alle Testbeschreibungen (config) mit Anleitungen
 
@@ -33,6 +33,7 @@ import shutil
 
 import unittest
 import json
+import numpy as np
 
 import time
 from datetime import datetime
@@ -2033,11 +2034,800 @@ class ispTest( testBase ):
         # .. todo:: test_dicom_base  
         print("TODO: test_dicom")
         pass
-    
+
+    def test_dicom_association( self ):
+        from isp.dicom import ispDicom
+
+        config = ispConfig( basedir=ABSPATH )
+        server = "TESTDICOM"
+        # ohne Server auf Port 1
+        config.set( [ "dicom", server ], DotMap( {
+            "aec": "VMSDBD",
+            "aet": "GQA",
+            "server_ip": "127.0.0.1",
+            "server_port": 1,
+            "listen_port": 50300,
+            "local_dir": osp.join( FILESPATH, "dicom" ),
+            "idle_timeout": 0.2
+        } ) )
+
+        dicom = ispDicom( server, config )
+        self.assertEqual( dicom.idleTimeout, 0.2, "ispDicom idle_timeout nicht übernommen" )
+
+        # ohne Server keine Verbindung, das Application Entity bleibt für einen neuen Versuch
+        self.assertEqual( dicom.openAssociation(), 0xC0FF, "ispDicom openAssociation ohne Server" )
+        self.assertIsNone( dicom.assoc, "ispDicom assoc ohne Server" )
+        self.assertEqual( dicom.associationStats["opened"], 0, "ispDicom associationStats opened ohne Server" )
+
+        self.assertEqual( dicom.openAssociation(), 0xC0FF, "ispDicom openAssociation ohne Server" )
+        # nur erfolgreich neu ausgehandelte zählen, die Versuche ohne Server als failed
+        self.assertEqual( dicom.associationStats["renegotiated"], 0, "ispDicom associationStats renegotiated ohne Server" )
+        self.assertEqual( dicom.associationStats["failed"], 2, "ispDicom associationStats failed" )
+        self.assertEqual( dicom.getInfo()["association_stats"], dicom.associationStats, "ispDicom getInfo association_stats" )
+
+        # nach idle_timeout wird geschlossen
+        dicom._touch()
+        time.sleep( 0.5 )
+        self.assertIsNone( dicom.ae, "ispDicom idle_timeout nicht geschlossen" )
+        self.assertEqual( dicom.associationStats["idle_closed"], 1, "ispDicom associationStats idle_closed" )
+
+        # vorübergehende Fehler werden von retrieveMany wiederholt
+        self.assertEqual( [ dicom._isTransient( status ) for status in [ 0xA702, 0xC512, 0xC5F2, 0xC0FF, 0x0000, 0xB000 ] ],
+            [ True, True, True, False, False, False ], "ispDicom _isTransient"
+        )
+
+    def test_dicom_retrieveMany( self ):
+        from isp.dicom import ispDicom
+        from pydicom.dataset import Dataset, FileMetaDataset
+        from pydicom.uid import generate_uid, ImplicitVRLittleEndian, RTImageStorage
+
+        config = ispConfig( basedir=ABSPATH )
+        server = "TESTDICOM"
+        # ohne Server auf Port 1
+        config.set( [ "dicom", server ], DotMap( {
+            "aec": "VMSDBD",
+            "aet": "GQA",
+            "server_ip": "127.0.0.1",
+            "server_port": 1,
+            "listen_port": 50300,
+            "local_dir": osp.join( FILESPATH, "dicom" )
+        } ) )
+        dicom = ispDicom( server, config )
+
+        # eine Aufnahme im Archiv ablegen
+        ds = Dataset()
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+        ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID = RTImageStorage
+        ds.SOPInstanceUID = generate_uid()
+        ds.SeriesInstanceUID = generate_uid()
+        # im Verzeichnis pro Jahr ohne Eintrag im Index
+        os.makedirs( osp.join( dicom.dicomPath, "retrieveMany" ), exist_ok=True )
+        filename = osp.join( dicom.dicomPath, "retrieveMany", ds.SOPInstanceUID + ".dcm" )
+        ds.save_as( filename, write_like_original=False )
+
+        missing = generate_uid()
+        counts = []
+        instances, signals = dicom.retrieveMany( {
+            ds.SOPInstanceUID: { "PatientID": "_QA", "SeriesInstanceUID": ds.SeriesInstanceUID },
+            missing: { "PatientID": "_QA", "SeriesInstanceUID": ds.SeriesInstanceUID }
+        }, subPath="retrieveMany", progress=counts.append )
+
+        # einzelne Abfragen über retrieveAsync, jede mit ihrem eigenen Ergebnis
+        archived = dicom.retrieveAsync( { "SOPInstanceUID": ds.SOPInstanceUID, "subPath": "retrieveMany" } )
+        failed = dicom.retrieveAsync( { "SOPInstanceUID": missing, "subPath": "retrieveMany" } )
+        found, found_signals = archived.result( timeout=30 )
+        self.assertEqual( [ instance.SOPInstanceUID for instance in found ], [ ds.SOPInstanceUID ], "retrieveAsync aus dem Archiv" )
+        self.assertEqual( found_signals, [ { "name": "archive", "status": 0x0000, "msg": "load archive", "count": 1 } ], "retrieveAsync signals" )
+        self.assertEqual( failed.result( timeout=30 )[0], [], "retrieveAsync ohne Server" )
+        self.assertEqual( failed.status, 0xC0FF, "retrieveAsync status ohne Server" )
+        self.assertTrue( failed.done(), "retrieveAsync done" )
+
+        os.remove( filename )
+        dicom.closeAE()
+
+        self.assertEqual( list( instances.keys() ), [ ds.SOPInstanceUID ], "retrieveMany nicht aus dem Archiv gelesen" )
+        self.assertEqual( signals[0]["count"], 1, "retrieveMany archive count" )
+        # ohne Server: eine Abfrage für die Serie und eine für die einzelne Aufnahme
+        self.assertEqual( [ signal["status"] for signal in signals[1:] ], [ 0xC0FF, 0xC0FF ], "retrieveMany status ohne Server" )
+        self.assertEqual( counts, [ 1, 1 ], "retrieveMany progress" )
+        self.assertEqual( dicom._pending, {}, "retrieveMany wartende Abfragen nicht entfernt" )
+        self.assertEqual( dicom.associationStats["renegotiated"], 0, "retrieveMany renegotiated ohne Server" )
+        self.assertGreater( dicom.associationStats["failed"], 0, "retrieveMany failed ohne Server" )
+
+    def test_dicom_scheduleRetrieve( self ):
+        import queue
+        import threading
+        import time
+        from types import SimpleNamespace
+        from isp.dicom import ispDicom
+        from pydicom.dataset import Dataset
+
+        config = ispConfig( basedir=ABSPATH )
+        server = "TESTDICOM"
+        config.set( [ "dicom", server ], DotMap( {
+            "aec": "VMSDBD",
+            "aet": "GQA",
+            "server_ip": "127.0.0.1",
+            "server_port": 1,
+            "listen_port": 50300,
+            "local_dir": osp.join( FILESPATH, "dicom" ),
+            "parallel": 3,
+            "retries": 2,
+            "retry_backoff": 0.05
+        } ) )
+        dicom = ispDicom( server, config )
+
+        class fakeAssoc( ):
+            # Verbindung ohne Server, die Antworten auf C-MOVE kommen erst nach abort()
+            def __init__( self ):
+                self.is_established = True
+                self.dimse = SimpleNamespace( msg_queue=queue.Queue() )
+
+            def send_c_move( self, ds, aet, query_model=None, msg_id=None ):
+                def responses():
+                    self.dimse.msg_queue.get()
+                    yield None, None
+                return responses()
+
+            def abort( self ):
+                self.is_established = False
+
+            def release( self ):
+                self.is_established = False
+
+        # nach timeout wird die Verbindung abgebrochen
+        assoc = fakeAssoc()
+        start = time.monotonic()
+        status, i = dicom._sendRetrieve( assoc, Dataset(), timeout=0.2 )
+        self.assertEqual( status, 0xC5F2, "_sendRetrieve timeout status" )
+        self.assertFalse( assoc.is_established, "_sendRetrieve timeout ohne abort" )
+        self.assertLess( time.monotonic() - start, 5, "_sendRetrieve timeout nicht beendet" )
+
+        # Verbindungen und C-MOVE ohne Server
+        created = []
+        def newAssociation():
+            assoc = fakeAssoc()
+            created.append( assoc )
+            return assoc
+        dicom._newAssociation = newAssociation
+        dicom._start_server = lambda evt_name="EVT_C_STORE": 0x0000
+        dicom.ae = SimpleNamespace( maximum_associations=1, shutdown=lambda: None )
+        dicom.assoc = newAssociation()
+
+        # pro Serie: Pause in s, Status und Anzahl der gelieferten SOPInstanceUIDs pro Versuch
+        behaviour = {
+            "1": [ ( 0.3, 0x0000, 3 ) ],
+            "2": [ ( 0.1, 0x0000, 3 ) ],
+            "3": [ ( 0.1, 0xC5F2, 1 ), ( 0.1, 0x0000, 3 ) ],
+            "4": [ ( 0.1, 0xA701, 0 ), ( 0.1, 0xA701, 0 ), ( 0.1, 0xA701, 0 ) ],
+            "5": [ ( 0.1, 0xC0FF, 1 ) ],
+        }
+        calls = []
+        running = { "now": 0, "max": 0 }
+        lock = threading.Lock()
+        def sendRetrieve( assoc, ds, timeout=None, request=None, received=None ):
+            uids = ds.SOPInstanceUID
+            uids = [ uids ] if isinstance( uids, str ) else list( uids )
+            series = uids[0].split( "." )[0]
+            # _assocLock ist während der Abfragen frei
+            locked = not dicom._assocLock.acquire( blocking=False )
+            if not locked:
+                dicom._assocLock.release()
+            with lock:
+                attempt = len( [ call for call in calls if call["series"] == series ] )
+                calls.append( { "series": series, "uids": uids, "assoc": assoc, "time": time.monotonic(), "locked": locked,
+                    "thread": threading.current_thread().name, "subPath": received.subPath, "override": received.override
+                } )
+                running["now"] += 1
+                running["max"] = max( running["max"], running["now"] )
+            pause, status, count = behaviour[ series ][ attempt ]
+            time.sleep( pause )
+            for uid in uids[ :count ]:
+                received[ uid ] = Dataset()
+            if status == 0xC5F2:
+                assoc.abort()
+            with lock:
+                running["now"] -= 1
+            return status, count
+        dicom._sendRetrieve = sendRetrieve
+
+        requests = []
+        for series in behaviour.keys():
+            ds = Dataset()
+            ds.QueryRetrieveLevel = "IMAGE"
+            uids = [ "{}.{}".format( series, i ) for i in range( 3 ) ]
+            ds.SOPInstanceUID = uids
+            requests.append( ( ds, uids, series ) )
+
+        delivered = []
+        def deliver( request, status, received ):
+            delivered.append( ( request[2], status, sorted( received.keys() ) ) )
+
+        dicom._scheduleRetrieve( requests, deliver, override=True, subPath="schedule" )
+
+        # ohne _assocLock im gemeinsamen Pool, subPath und override pro Abfrage
+        self.assertEqual( [ call["locked"] for call in calls ], [ False ] * len( calls ), "_scheduleRetrieve hält _assocLock" )
+        self.assertTrue( all( call["thread"].startswith( "dicom-assoc" ) for call in calls ), "_scheduleRetrieve Pool threads" )
+        self.assertEqual( set( ( call["subPath"], call["override"] ) for call in calls ), { ( "schedule", True ) }, "_scheduleRetrieve subPath und override" )
+        self.assertEqual( ( dicom.subPath, dicom.override ), ( "", False ), "_scheduleRetrieve ändert subPath und override der Instanz" )
+        schedulePool = ispDicom._schedulePool
+        self.assertEqual( dicom._running, 0, "_scheduleRetrieve _running" )
+
+        # bis zu parallel gleichzeitige Abfragen auf eigenen Verbindungen
+        self.assertEqual( running["max"], 3, "_scheduleRetrieve gleichzeitige Abfragen" )
+        self.assertEqual( len( set( id( call["assoc"] ) for call in calls[ :3 ] ) ), 3, "_scheduleRetrieve Verbindungen" )
+
+        # in der Reihenfolge der Abfragen geliefert, auch wenn 1 später fertig wird
+        self.assertEqual( [ ( series, status, len( received ) ) for series, status, received in delivered ], [
+            ( "1", 0x0000, 3 ), ( "2", 0x0000, 3 ), ( "3", 0x0000, 3 ), ( "4", 0xA701, 0 ), ( "5", 0xC0FF, 1 )
+        ], "_scheduleRetrieve Reihenfolge" )
+
+        # nach timeout neue Verbindung und bei IMAGE nur die fehlenden SOPInstanceUIDs
+        retried = [ call for call in calls if call["series"] == "3" ]
+        self.assertEqual( [ call["uids"] for call in retried ], [ [ "3.0", "3.1", "3.2" ], [ "3.1", "3.2" ] ], "_runRequest fehlende SOPInstanceUIDs" )
+        self.assertIsNot( retried[1]["assoc"], retried[0]["assoc"], "_runRequest neue Verbindung nach timeout" )
+        self.assertEqual( dicom.associationStats["renegotiated"], 1, "_runRequest renegotiated" )
+        self.assertNotIn( retried[0]["assoc"], [ dicom.assoc ] + dicom._extraAssocs, "_replaceAssociation abgebrochene Verbindung" )
+
+        # Wiederholung nach retry_backoff, verdoppelt bei jeder weiteren
+        backoff = [ call for call in calls if call["series"] == "4" ]
+        self.assertEqual( len( backoff ), 3, "_runRequest Anzahl der Wiederholungen" )
+        self.assertGreaterEqual( backoff[1]["time"] - backoff[0]["time"], 0.1 + 0.05, "_runRequest erste Wiederholung" )
+        self.assertGreaterEqual( backoff[2]["time"] - backoff[1]["time"], 0.1 + 0.1, "_runRequest zweite Wiederholung" )
+        # kein vorübergehender Fehler
+        self.assertEqual( len( [ call for call in calls if call["series"] == "5" ] ), 1, "_runRequest ohne Wiederholung" )
+        self.assertEqual( dicom._pending, {}, "_scheduleRetrieve wartende Abfragen nicht entfernt" )
+
+        # nach einer Exception wird die Verbindung für die übrigen Abfragen zurückgegeben
+        dicom.parallel = 2
+        def failRetrieve( assoc, ds, timeout=None, request=None, received=None ):
+            calls.append( { "series": str( ds.SOPInstanceUID ), "assoc": assoc } )
+            if str( ds.SOPInstanceUID ).startswith( "fail" ):
+                raise ValueError( "failRetrieve" )
+            time.sleep( 0.1 )
+            return 0x0000, 0
+        dicom._sendRetrieve = failRetrieve
+        requests = []
+        for uid in [ "fail.1", "fail.2", "ok.1" ]:
+            ds = Dataset()
+            ds.QueryRetrieveLevel = "IMAGE"
+            ds.SOPInstanceUID = uid
+            requests.append( ( ds, [ uid ], uid ) )
+
+        calls = []
+        thread = threading.Thread( target=lambda: self.assertRaises( ValueError, dicom._scheduleRetrieve, requests, deliver ), daemon=True )
+        thread.start()
+        thread.join( 10 )
+        self.assertFalse( thread.is_alive(), "_scheduleRetrieve wartet nach einer Exception auf eine Verbindung" )
+        self.assertIn( "ok.1", [ call["series"] for call in calls ], "_scheduleRetrieve nach einer Exception" )
+        self.assertEqual( dicom._pending, {}, "_scheduleRetrieve wartende Abfragen nach einer Exception" )
+        self.assertIs( ispDicom._schedulePool, schedulePool, "_scheduleRetrieve verwendet den Pool weiter" )
+        self.assertEqual( ( dicom._running, dicom._busyAssocs ), ( 0, 0 ), "_scheduleRetrieve Verbindungen zurückgegeben" )
+
+        # handle_STORE legt einen Datensatz mit dem subPath der wartenden Abfrage ab
+        from isp.dicom import ispDicomReceived
+        from pydicom.dataset import FileMetaDataset
+        from pydicom.uid import generate_uid, RTImageStorage
+        ds = Dataset()
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID = RTImageStorage
+        ds.SOPInstanceUID = generate_uid()
+        received = ispDicomReceived( "2023", False )
+        dicom._pending[ ds.SOPInstanceUID ] = received
+        event = SimpleNamespace( event=SimpleNamespace( name="EVT_C_STORE" ), dataset=ds, context=None, assoc=None,
+            request=SimpleNamespace( MoveOriginatorMessageID=None ), file_meta=ds.file_meta
+        )
+        self.assertEqual( dicom.handle_STORE( event ), 0x0000, "handle_STORE status" )
+        dicom._pending.pop( ds.SOPInstanceUID )
+        self.assertIs( received[ ds.SOPInstanceUID ], ds, "handle_STORE an die wartende Abfrage" )
+        dicom.writer.flush( 30 )
+        self.assertEqual( dicom.archive.get( ds.SOPInstanceUID )["AcquisitionYear"], 2023, "handle_STORE subPath der Abfrage" )
+        dicom.archive_deleteSOPInstanceUID( ds.SOPInstanceUID )
+
+        dicom.closeAE()
+
+    def test_dicom_archive( self ):
+        from isp.dicomarchive import ispDicomArchive
+        from pydicom.dataset import Dataset, FileMetaDataset
+        from pydicom.uid import generate_uid, ImplicitVRLittleEndian, RTImageStorage
+
+        path = osp.join( FILESPATH, "dicomarchive" )
+        if osp.isdir( path ):
+            shutil.rmtree( path )
+
+        # bisheriges Archiv mit einem Verzeichnis pro Jahr, eine Aufnahme doppelt
+        uids = []
+        for year in [ "2021", "2022" ]:
+            os.makedirs( osp.join( path, year ) )
+            for i in range( 3 ):
+                ds = Dataset()
+                ds.file_meta = FileMetaDataset()
+                ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+                ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID = RTImageStorage
+                ds.SOPInstanceUID = uids[0] if year == "2022" and i == 0 else generate_uid()
+                ds.SeriesInstanceUID = "1.2.3"
+                ds.save_as( osp.join( path, year, ds.SOPInstanceUID + ".dcm" ), write_like_original=False )
+                if not ds.SOPInstanceUID in uids:
+                    uids.append( ds.SOPInstanceUID )
+
+        archive = ispDicomArchive( path )
+        result = archive.migrate()
+        self.assertEqual( result, { "moved": 5, "duplicate": 1, "indexed": 0, "failed": 0 }, "ispDicomArchive migrate" )
+        self.assertEqual( archive.migrate(), { "moved": 0, "duplicate": 0, "indexed": 0, "failed": 0 }, "ispDicomArchive migrate wiederholt" )
+
+        # verteiltes Verzeichnis und Angaben im Index
+        entry = archive.get( uids[1] )
+        self.assertEqual( entry["path"], archive.shardPath( uids[1] ), "ispDicomArchive path" )
+        self.assertEqual( len( entry["path"].split( os.sep ) ), 3, "ispDicomArchive verteiltes Verzeichnis" )
+        self.assertEqual( ( entry["SeriesInstanceUID"], entry["AcquisitionYear"] ), ( "1.2.3", 2021 ), "ispDicomArchive Angaben" )
+        self.assertTrue( archive.verify( uids[1] ), "ispDicomArchive verify" )
+        self.assertFalse( osp.exists( osp.join( path, "2021", uids[1] + ".dcm" ) ), "ispDicomArchive migrate verschoben" )
+
+        self.assertEqual( archive.cached( uids + [ "9.9.9" ] ), set( uids ), "ispDicomArchive cached" )
+        self.assertEqual( archive.getStats()["years"], { 2021: 3, 2022: 2 }, "ispDicomArchive getStats" )
+
+        # geänderte Datei
+        with open( archive.path( uids[2] ), "ab" ) as f:
+            f.write( b"0" )
+        self.assertFalse( archive.verify( uids[2] ), "ispDicomArchive verify geändert" )
+
+        archive.remove( uids[2] )
+        self.assertIsNone( archive.path( uids[2] ), "ispDicomArchive remove" )
+        archive.close()
+
+    def test_dicom_readMode( self ):
+        from isp.dicomarchive import readDataset, pixelDataDeferred, loadPixelData, releasePixelData, PIXEL_DATA
+        from pydicom.dataset import Dataset, FileMetaDataset
+        from pydicom.uid import generate_uid, ImplicitVRLittleEndian, RTImageStorage
+
+        path = osp.join( FILESPATH, "dicomread" )
+        os.makedirs( path, exist_ok=True )
+
+        ds = Dataset()
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+        ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID = RTImageStorage
+        ds.SOPInstanceUID = generate_uid()
+        ds.Rows = ds.Columns = 256
+        ds.BitsAllocated = ds.BitsStored = 16
+        ds.HighBit = 15
+        ds.PixelRepresentation = 0
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = "MONOCHROME2"
+        ds.PixelData = np.arange( 256 * 256, dtype=np.uint16 ).tobytes()
+        filename = osp.join( path, ds.SOPInstanceUID + ".dcm" )
+        ds.save_as( filename, write_like_original=False )
+
+        # header ohne PixelData, nachladen erst beim Zugriff
+        header = readDataset( filename, "header" )
+        self.assertFalse( PIXEL_DATA in header, "readDataset header ohne PixelData" )
+        self.assertEqual( header.Rows, 256, "readDataset header Angaben" )
+        self.assertTrue( loadPixelData( header ), "loadPixelData" )
+        self.assertTrue( pixelDataDeferred( header ), "loadPixelData verzögert" )
+        self.assertEqual( int( header.pixel_array[1, 0] ), 256, "loadPixelData pixel_array" )
+
+        # lazy liest PixelData beim Zugriff und kann sie wieder freigeben
+        lazy = readDataset( filename, "lazy" )
+        self.assertTrue( pixelDataDeferred( lazy ), "readDataset lazy" )
+        raw = lazy._dict[ PIXEL_DATA ]
+        self.assertEqual( lazy.pixel_array.shape, ( 256, 256 ), "readDataset lazy pixel_array" )
+        self.assertFalse( pixelDataDeferred( lazy ), "readDataset lazy gelesen" )
+        releasePixelData( lazy, raw )
+        self.assertTrue( pixelDataDeferred( lazy ), "releasePixelData" )
+        self.assertEqual( int( lazy.pixel_array.sum() ), int( ds.pixel_array.sum() ), "releasePixelData erneut lesen" )
+
+        self.assertFalse( pixelDataDeferred( readDataset( filename, "full" ) ), "readDataset full" )
+
+        # aufbereitete Bilddaten als .npy neben der Datei
+        from isp.dicomarchive import savePixelCache, loadPixelCache, removePixelCache, pixelCacheFilename
+        array = lazy.pixel_array.astype( np.float32 ) * 0.5
+        self.assertEqual( savePixelCache( filename, array, { "dtype": "uint16" } ), pixelCacheFilename( filename ), "savePixelCache" )
+        cached, meta = loadPixelCache( filename )
+        self.assertIsInstance( cached, np.memmap, "loadPixelCache memmap" )
+        self.assertFalse( cached.flags.writeable, "loadPixelCache nur lesbar" )
+        self.assertTrue( np.array_equal( cached, array ), "loadPixelCache array" )
+        self.assertEqual( meta["dtype"], "uint16", "loadPixelCache meta" )
+        del cached
+
+        # nach einer Änderung der DICOM Datei nicht mehr verwenden
+        os.utime( filename, ns=( 0, 0 ) )
+        self.assertEqual( loadPixelCache( filename ), ( None, None ), "loadPixelCache veraltet" )
+        removePixelCache( filename )
+        self.assertFalse( osp.exists( pixelCacheFilename( filename ) ), "removePixelCache" )
+
+    def test_dicom_writer( self ):
+        from isp.dicomarchive import ispDicomArchive, ispDicomWriter
+        from pydicom.dataset import Dataset, FileMetaDataset
+        from pydicom.uid import generate_uid, ImplicitVRLittleEndian, RTImageStorage
+
+        path = osp.join( FILESPATH, "dicomwriter" )
+        if osp.isdir( path ):
+            shutil.rmtree( path )
+        archive = ispDicomArchive( path )
+
+        datasets = []
+        for i in range( 5 ):
+            ds = Dataset()
+            ds.file_meta = FileMetaDataset()
+            ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+            ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID = RTImageStorage
+            ds.SOPInstanceUID = generate_uid()
+            ds.is_little_endian = True
+            ds.is_implicit_VR = True
+            datasets.append( ds )
+
+        # im Hintergrund mit fsync für je 2 Dateien
+        writer = ispDicomWriter( archive, maxsize=2, fsyncBatch=2 )
+        for ds in datasets[:4]:
+            self.assertTrue( writer.put( ds, archive.shardFilename( ds.SOPInstanceUID ), "1.2.3", 2024 ), "ispDicomWriter put" )
+        self.assertTrue( writer.flush( 30 ), "ispDicomWriter flush" )
+        self.assertEqual( archive.cached( [ ds.SOPInstanceUID for ds in datasets ] ), set( ds.SOPInstanceUID for ds in datasets[:4] ), "ispDicomWriter Index" )
+        self.assertEqual( ( writer.stats["queued"], writer.stats["written"], writer.stats["failed"] ), ( 4, 4, 0 ), "ispDicomWriter stats" )
+
+        # bis zum Schreiben sind die eingereihten über pending() und cached() verfügbar
+        release = threading.Event()
+        writeBatch = writer._writeBatch
+        def blockedBatch( batch ):
+            release.wait( 30 )
+            return writeBatch( batch )
+        writer._writeBatch = blockedBatch
+        ds = datasets[4]
+        writer.put( ds, archive.shardFilename( ds.SOPInstanceUID ) )
+        self.assertIs( writer.pending( ds.SOPInstanceUID ), ds, "ispDicomWriter pending" )
+        self.assertIn( ds.SOPInstanceUID, writer.cached( [ ds.SOPInstanceUID, datasets[0].SOPInstanceUID ] ), "ispDicomWriter cached eingereiht" )
+        self.assertEqual( archive.cached( [ ds.SOPInstanceUID ] ), set(), "ispDicomWriter noch nicht im Index" )
+
+        # ispDicom liefert den eingereihten Datensatz ohne zu warten, archive_hasSOPInstanceUID wartet auf die Datei
+        from isp.dicom import ispDicom
+        config = ispConfig( basedir=ABSPATH )
+        config.set( [ "dicom", "TESTDICOM" ], DotMap( { "aec": "VMSDBD", "aet": "GQA", "server_ip": "127.0.0.1", "server_port": 1,
+            "listen_port": 50300, "local_dir": osp.join( FILESPATH, "dicom" )
+        } ) )
+        dicom = ispDicom( "TESTDICOM", config )
+        dicom.archive = archive
+        dicom.writer = writer
+        self.assertIs( dicom.archive_loadSOPInstanceUID( ds.SOPInstanceUID ), ds, "ispDicom archive_loadSOPInstanceUID eingereiht" )
+        self.assertFalse( writer.wait( ds.SOPInstanceUID, 0.1 ), "ispDicomWriter wait vor dem Schreiben" )
+        threading.Timer( 0.2, release.set ).start()
+        exists, filename = dicom.archive_hasSOPInstanceUID( ds.SOPInstanceUID )
+        self.assertTrue( exists and osp.isfile( filename ), "ispDicom archive_hasSOPInstanceUID nach dem Schreiben" )
+        self.assertIsNone( writer.pending( ds.SOPInstanceUID ), "ispDicomWriter pending nach dem Schreiben" )
+        self.assertEqual( writer.cached( [ ds.SOPInstanceUID ] ), { ds.SOPInstanceUID }, "ispDicomWriter cached aus dem Index" )
+        os.remove( filename )
+        archive.remove( ds.SOPInstanceUID )
+
+        # ohne Warteschlange sofort, ein nicht anlegbares Verzeichnis ist ein Fehler
+        writer = ispDicomWriter( archive, maxsize=0 )
+        blocked = osp.join( path, "blocked" )
+        with open( blocked, "w" ) as f:
+            f.write( "" )
+        self.assertFalse( writer.put( datasets[4], osp.join( blocked, "x.dcm" ) ), "ispDicomWriter Fehler" )
+        self.assertTrue( writer.put( datasets[4], archive.shardFilename( datasets[4].SOPInstanceUID ) ), "ispDicomWriter sofort" )
+        self.assertTrue( osp.isfile( archive.path( datasets[4].SOPInstanceUID ) ), "ispDicomWriter sofort geschrieben" )
+        self.assertEqual( writer.stats["failed"], 1, "ispDicomWriter failed" )
+
+        # keine temporären Dateien übrig
+        tmpfiles = [ name for root, dirs, files in os.walk( path ) for name in files if name.endswith( ".tmp" ) ]
+        self.assertEqual( tmpfiles, [], "ispDicomWriter temporäre Dateien" )
+        archive.close()
+
+    def test_dicom_datasetCache( self ):
+        from isp.dicomarchive import ispDicomDatasetCache, datasetSize
+        from pydicom.dataset import Dataset
+        from pydicom.uid import generate_uid
+
+        datasets = []
+        for i in range( 3 ):
+            ds = Dataset()
+            ds.SOPInstanceUID = generate_uid()
+            ds.PixelData = bytes( 1000 )
+            datasets.append( ds )
+        size = datasetSize( datasets[0] )
+
+        # nur zwei passen hinein, der am längsten nicht verwendete wird entfernt
+        cache = ispDicomDatasetCache( "test", maxBytes=2 * size + 100 )
+        cache.putDataset( datasets[0].SOPInstanceUID, datasets[0] )
+        cache.putDataset( datasets[1].SOPInstanceUID, datasets[1] )
+        self.assertIsNotNone( cache.getDataset( datasets[0].SOPInstanceUID ), "datasetCache hit" )
+        cache.putDataset( datasets[2].SOPInstanceUID, datasets[2] )
+        self.assertIsNone( cache.getDataset( datasets[1].SOPInstanceUID ), "datasetCache evicted" )
+
+        # eine Kopie, ersetzen von Elementen ändert den Cache nicht
+        ds = cache.getDataset( datasets[0].SOPInstanceUID )
+        ds.PixelData = bytes( 10 )
+        self.assertEqual( len( cache.getDataset( datasets[0].SOPInstanceUID ).PixelData ), 1000, "datasetCache Kopie" )
+
+        # Bilddaten schreibgeschützt, discard entfernt Dataset und Bilddaten
+        cache.putPixels( datasets[2].SOPInstanceUID, np.zeros( ( 4, 4 ), dtype=np.float32 ), { "dtype": "uint16" } )
+        array, meta = cache.getPixels( datasets[2].SOPInstanceUID )
+        self.assertFalse( array.flags.writeable, "datasetCache Bilddaten nur lesbar" )
+        self.assertTrue( cache.hasPixels( datasets[2].SOPInstanceUID ), "datasetCache hasPixels" )
+        cache.discard( datasets[2].SOPInstanceUID )
+        self.assertEqual( cache.getPixels( datasets[2].SOPInstanceUID ), ( None, None ), "datasetCache discard" )
+
+        stats = cache.getStats()
+        self.assertEqual( ( stats["hits"], stats["misses"], stats["evicted"], stats["entries"] ), ( 4, 2, 1, 1 ), "datasetCache stats" )
+
+        # ispDicom liest eine Datei nur einmal, auch über mehrere Instanzen
+        from isp.dicom import ispDicom
+
+        config = ispConfig( basedir=ABSPATH )
+        server = "TESTDICOM"
+        config.set( [ "dicom", server ], DotMap( {
+            "local_dir": osp.join( FILESPATH, "dicomcache" ),
+            "archive_index": False,
+            "dataset_cache": { "max_bytes": 1024 * 1024 }
+        } ) )
+        ispDicomDatasetCache.invalidateCaches()
+        adc = ispDicom( server, config )
+        cache = adc.datasetCache
+        self.assertIsInstance( cache, ispDicomDatasetCache, "ispDicom datasetCache" )
+        self.assertEqual( cache.maxBytes, 1024 * 1024, "ispDicom dataset_cache max_bytes" )
+        ds = datasets[0]
+        ds.file_meta = Dataset()
+        ds.is_little_endian = True
+        ds.is_implicit_VR = True
+        filename = osp.join( adc.dicomPath, ds.SOPInstanceUID + ".dcm" )
+        ds.save_as( filename )
+        self.assertIsNotNone( adc.archive_loadSOPInstanceUID( ds.SOPInstanceUID ), "ispDicom archive_loadSOPInstanceUID" )
+        os.remove( filename )
+        self.assertIsNotNone( ispDicom( server, config ).archive_loadSOPInstanceUID( ds.SOPInstanceUID ), "ispDicom datasetCache hit" )
+        self.assertEqual( adc.getInfo()["dataset_cache"]["hits"], 1, "ispDicom getInfo dataset_cache" )
+        adc.archive_deleteSOPInstanceUID( ds.SOPInstanceUID )
+        self.assertIsNone( adc.archive_loadSOPInstanceUID( ds.SOPInstanceUID ), "ispDicom datasetCache discard" )
+        adc.closeAE()
+
     def test_mssql_base( self ):   
         # .. todo:: test_mssql_base 
         print("TODO: test_mssql")
         pass
+
+    def test_mssql_query( self ):
+        from isp.mssql import ispMssqlQuery
+
+        query = ispMssqlQuery( "[Slice] [Slice]" )
+        query.select( "[Slice].[SliceUID]", "[Slice].[AcquisitionDateTime]", "[Slice].[SliceUID]" )
+        query.whereIn( "[Slice].[PatientId]", ["_QA Linac1", "_QA Linac2"] )
+        query.whereDate( "[Slice].[AcquisitionDateTime]", year=2021, month=12 )
+        sql, params = query.build()
+
+        self.assertEqual( sql,
+            "SELECT\n  [Slice].[SliceUID]\n  , [Slice].[AcquisitionDateTime]\nFROM [Slice] [Slice]"
+            "\nWHERE [Slice].[PatientId] IN (?, ?)"
+            "\n  AND [Slice].[AcquisitionDateTime] >= ?\n  AND [Slice].[AcquisitionDateTime] < ?",
+            "ispMssqlQuery sql ist falsch"
+        )
+        self.assertEqual( params,
+            [ "_QA Linac1", "_QA Linac2", datetime(2021, 12, 1), datetime(2022, 1, 1) ],
+            "ispMssqlQuery params sind falsch"
+        )
+
+        # tags als ganze Wörter, LIKE Sonderzeichen maskiert
+        sql, params = ispMssqlQuery( "[Radiation]" ).whereTokens( "[Radiation].[Comment]", ["JT-10_3"] ).build()
+        self.assertEqual( params, [ "% JT-10\\_3 %" ], "ispMssqlQuery whereTokens params sind falsch" )
+
+    def test_mssql_pool( self ):
+        import sqlite3
+        from isp.mssql import ispMssqlPool, ispMssql
+
+        filename = osp.join( FILESPATH, "pool.sqlite" )
+        if osp.isfile( filename ):
+            os.remove( filename )
+        connect = sqlite3.connect( filename )
+        connect.execute( "CREATE TABLE [Slice] ( [SliceSer] INTEGER PRIMARY KEY, [SliceUID] TEXT )" )
+        connect.executemany( "INSERT INTO [Slice] ( [SliceUID] ) VALUES ( ? )", [ ( "1.2.3", ), ( "1.2.4", ) ] )
+        connect.commit()
+        connect.close()
+
+        config = ispConfig( basedir=ABSPATH )
+        config.database["pooltest"] = { "engine": "sqlite", "dbname": "VARIAN", "path": filename, "result_cache": False }
+
+        # maxSize und timeout von checkout
+        pool = ispMssqlPool( "pooltest", config, minSize=1, maxSize=2, idleTimeout=300, timeout=0.05, checkAfter=300 )
+        first = pool.checkout()
+        second = pool.checkout()
+        self.assertIsNotNone( second, "ispMssqlPool checkout bis maxSize" )
+        self.assertIsNone( pool.checkout(), "ispMssqlPool checkout über maxSize ohne timeout" )
+        self.assertEqual( pool.getStats()["timeouts"], 1, "ispMssqlPool timeouts" )
+
+        # eine zurückgegebene Verbindung wird wiederverwendet
+        pool.checkin( second )
+        self.assertIs( pool.checkout(), second, "ispMssqlPool checkout verwendet die freie Verbindung" )
+        pool.checkin( first )
+        pool.checkin( second )
+        stats = pool.getStats()
+        self.assertEqual( ( stats["created"], stats["reused"], stats["idle"], stats["in_use"] ), ( 2, 1, 2, 0 ), "ispMssqlPool stats" )
+
+        # idle eviction bis auf minSize
+        pool.idleTimeout = 0.01
+        time.sleep( 0.05 )
+        connection = pool.checkout()
+        self.assertEqual( pool.getStats()["evicted"], 1, "ispMssqlPool idle eviction bis minSize" )
+        self.assertIs( connection, second, "ispMssqlPool idle eviction behält die zuletzt verwendete" )
+        pool.checkin( connection )
+        pool.idleTimeout = 300
+
+        # ping vor checkout, eine unterbrochene Verbindung wird ersetzt
+        pool.checkAfter = 0
+        second.connect.close()
+        connection = pool.checkout()
+        self.assertIsNot( connection, second, "ispMssqlPool checkout ersetzt die unterbrochene Verbindung" )
+        self.assertTrue( connection.ping(), "ispMssqlPool checkout neue Verbindung" )
+        stats = pool.getStats()
+        self.assertEqual( ( stats["checked"], stats["broken"], stats["created"] ), ( 1, 1, 3 ), "ispMssqlPool ping stats" )
+        pool.checkin( connection )
+        pool.close()
+
+        # execute wiederholt die Abfrage einmal mit einer neuen Verbindung
+        db = ispMssql( "pooltest", config )
+        db.usePool = True
+        pool = db.getPool()
+        self.assertIs( pool, ispMssqlPool.getPool( "pooltest", config ), "ispMssql getPool prozessweit" )
+        self.assertEqual( len( db.execute( "SELECT [SliceUID] FROM [Slice]" ) ), 2, "ispMssql execute mit pool" )
+        pool._idle[0].connect.close()
+        self.assertEqual( len( db.execute( "SELECT [SliceUID] FROM [Slice]" ) ), 2, "ispMssql execute nach unterbrochener Verbindung" )
+        stats = pool.getStats()
+        self.assertEqual( ( stats["created"], stats["broken"], stats["in_use"] ), ( 2, 1, 0 ), "ispMssql execute retry stats" )
+        pool.close()
+
+    def test_mssql_stream( self ):
+        import sqlite3
+        import types
+        from collections import OrderedDict
+        from isp.mssql import ispMssql
+
+        filename = osp.join( FILESPATH, "stream.sqlite" )
+        if osp.isfile( filename ):
+            os.remove( filename )
+        connect = sqlite3.connect( filename )
+        connect.execute( "CREATE TABLE [Slice] ( [SliceSer] INTEGER PRIMARY KEY, [SliceUID] TEXT )" )
+        connect.executemany( "INSERT INTO [Slice] ( [SliceUID] ) VALUES ( ? )", [ ( "1.2.{}".format( i ), ) for i in range( 5 ) ] )
+        connect.commit()
+        connect.close()
+
+        config = ispConfig( basedir=ABSPATH )
+        config.database["streamtest"] = { "engine": "sqlite", "dbname": "VARIAN", "path": filename, "fetch_size": 2 }
+        sql = "SELECT [SliceSer], [SliceUID] FROM [Slice] ORDER BY [SliceSer]"
+
+        db = ispMssql( "streamtest", config )
+        db.usePool = True
+        pool = db.getPool()
+
+        # fetchmany der Cursor mitzählen, bei failAt einen Fehler auslösen
+        batches = []
+        failAt = []
+        cursor = db._cursor
+        def countingCursor( self, connection, sql, params ):
+            cur, close = cursor( connection, sql, params )
+            fetchmany = cur.fetchmany
+            class Counting():
+                description = cur.description
+                def fetchmany( self, size ):
+                    if len( batches ) + 1 in failAt:
+                        raise sqlite3.OperationalError( "fetchmany" )
+                    rows = fetchmany( size )
+                    batches.append( ( size, len( rows ) ) )
+                    return rows
+                def fetchall( self ):
+                    if failAt:
+                        raise sqlite3.OperationalError( "fetchall" )
+                    return cur.fetchall()
+                def close( self ):
+                    cur.close()
+            return Counting(), close
+        db._cursor = types.MethodType( countingCursor, db )
+
+        # komplett gelesen, Verbindung zurück in den pool
+        rows = list( db.execute( sql, mode="stream" ) )
+        self.assertEqual( [ row["SliceUID"] for row in rows ], [ "1.2.{}".format( i ) for i in range( 5 ) ], "execute stream Zeilen" )
+        self.assertEqual( batches, [ ( 2, 2 ), ( 2, 2 ), ( 2, 1 ), ( 2, 0 ) ], "execute stream fetch_size" )
+        stats = pool.getStats()
+        self.assertEqual( ( stats["in_use"], stats["idle"], stats["broken"] ), ( 0, 1, 0 ), "execute stream checkin nach vollständigem Lesen" )
+
+        # nur teilweise gelesen, die Verbindung wird verworfen
+        batches.clear()
+        stream = db.iterate( sql, batchSize=3 )
+        self.assertEqual( next( stream )["SliceSer"], 1, "iterate erste Zeile" )
+        self.assertEqual( pool.getStats()["in_use"], 1, "iterate hält die Verbindung" )
+        stream.close()
+        self.assertEqual( batches, [ ( 3, 3 ) ], "iterate batchSize" )
+        stats = pool.getStats()
+        self.assertEqual( ( stats["in_use"], stats["idle"], stats["broken"] ), ( 0, 0, 1 ), "iterate GeneratorExit verwirft die Verbindung" )
+
+        # Fehler beim zweiten fetchmany, nach den gelieferten Zeilen wird der Fehler weitergegeben
+        batches.clear()
+        failAt.append( 2 )
+        received = []
+        with self.assertRaises( sqlite3.OperationalError, msg="execute stream Fehler nicht weitergegeben" ):
+            for row in db.execute( sql, mode="stream" ):
+                received.append( row["SliceSer"] )
+        self.assertEqual( received, [ 1, 2 ], "execute stream Zeilen vor dem Fehler" )
+        stats = pool.getStats()
+        self.assertEqual( ( stats["in_use"], stats["broken"] ), ( 0, 2 ), "execute stream Fehler verwirft die Verbindung" )
+
+        # auch mit result cache kein leeres Ergebnis
+        with self.assertRaises( sqlite3.OperationalError, msg="execute stream mit cache Fehler nicht weitergegeben" ):
+            db.execute( sql, mode="stream", cache="images" )
+        self.assertEqual( db.execute( sql, cache="images" ), [], "execute list Fehler als leeres Ergebnis" )
+        failAt.clear()
+
+        # keine freie Verbindung
+        pool.timeout = 0.1
+        held = [ pool.checkout() for i in range( pool.maxSize ) ]
+        with self.assertRaises( ConnectionError, msg="iterate ohne Verbindung" ):
+            next( db.iterate( sql ) )
+        for connection in held:
+            pool.checkin( connection )
+
+        # mit result cache wird aus dem stream ein iterator über die Zeilen
+        db.invalidateCache( "images" )
+        stream = db.execute( sql, mode="stream", cache="images" )
+        self.assertNotIsInstance( stream, types.GeneratorType, "execute stream mit cache" )
+        self.assertEqual( list( stream ), rows, "execute stream mit cache Zeilen" )
+        batches.clear()
+        self.assertEqual( list( db.execute( sql, mode="stream", cache="images" ) ), rows, "execute stream aus dem cache" )
+        self.assertEqual( batches, [], "execute stream aus dem cache ohne Abfrage" )
+        self.assertEqual( pool.getStats()["in_use"], 0, "execute stream mit cache checkin" )
+        db.invalidateCache()
+        pool.close()
+
+        # pytds: nur ? außerhalb von Literalen, Bezeichnern und Kommentaren sind Platzhalter
+        db.engine = "pytds"
+        statement = db.prepare(
+            "SELECT [a?] FROM [Slice] WHERE [SliceUID] = ? AND [Comment] LIKE 'x?%' -- wer?\n"
+            "AND \"b?\" = N'it''s?' /* ? */ AND [SliceSer] > ?",
+            connection=types.SimpleNamespace( statements=OrderedDict() )
+        )
+        self.assertEqual( statement["sql"],
+            "SELECT [a?] FROM [Slice] WHERE [SliceUID] = %s AND [Comment] LIKE 'x?%%' -- wer?\n"
+            "AND \"b?\" = N'it''s?' /* ? */ AND [SliceSer] > %s",
+            "prepare pytds Platzhalter"
+        )
+
+    def test_mssql_resultCache( self ):
+        from isp.mssql import ispMssqlResultCache
+
+        cache = ispMssqlResultCache( "test", maxBytes=100000, ttl={ "short": 0.05, "off": 0 } )
+        columns = { "SliceUID": [ "1.2.3", "1.2.4" ], "AcquisitionYear": [ 2021, 2022 ] }
+
+        # gleiche Abfrage mit anderem Layout ergibt den gleichen key
+        key = cache.key( "SELECT *\n  FROM [Slice] WHERE [Year] = ?", [ 2021 ] )
+        self.assertEqual( key, cache.key( "SELECT * FROM [Slice]   WHERE [Year] = ?", [ 2021 ] ), "ispMssqlResultCache key nicht normalisiert" )
+        self.assertNotEqual( key, cache.key( "SELECT * FROM [Slice] WHERE [Year] = ?", [ 2022 ] ), "ispMssqlResultCache key ohne params" )
+
+        self.assertIsNone( cache.get( key ), "ispMssqlResultCache leerer Cache" )
+        cache.put( key, "images", columns )
+        self.assertEqual( cache.convert( cache.get( key ), "list" ),
+            [ { "SliceUID": "1.2.3", "AcquisitionYear": 2021 }, { "SliceUID": "1.2.4", "AcquisitionYear": 2022 } ],
+            "ispMssqlResultCache list ist falsch"
+        )
+        self.assertEqual( list( cache.convert( columns, "frame" ).columns ), [ "SliceUID", "AcquisitionYear" ], "ispMssqlResultCache frame ist falsch" )
+
+        # time to live pro query class
+        cache.put( "short", "short", columns )
+        cache.put( "off", "off", columns )
+        time.sleep( 0.1 )
+        self.assertIsNone( cache.get( "short" ), "ispMssqlResultCache ttl abgelaufen" )
+        self.assertIsNone( cache.get( "off" ), "ispMssqlResultCache ttl 0 wird gespeichert" )
+
+        # LRU: der zuletzt verwendete key bleibt erhalten
+        size = cache.sizeOf( columns )
+        cache.maxBytes = size * 2
+        cache.put( "second", "images", columns )
+        cache.get( key )
+        cache.put( "third", "images", columns )
+        self.assertIsNotNone( cache.get( key ), "ispMssqlResultCache LRU hat den falschen Eintrag entfernt" )
+        self.assertIsNone( cache.get( "second" ), "ispMssqlResultCache LRU hat nichts entfernt" )
+
+        cache.invalidate( "images" )
+        self.assertIsNone( cache.get( key ), "ispMssqlResultCache invalidate" )
+
+        stats = cache.getStats()
+        self.assertEqual( stats["entries"], 0, "ispMssqlResultCache entries" )
+        self.assertEqual( stats["bytes"], 0, "ispMssqlResultCache bytes" )
+        self.assertEqual( stats["hits"], 3, "ispMssqlResultCache hits" )
+        self.assertEqual( stats["evicted"], 1, "ispMssqlResultCache evicted" )
         
           
 def suite( testClass:None ):